@@ -298,6 +298,58 @@ describe("DefaultStreamlitEndpoints", () => {
     })
   })
 
+  describe("fetchDataframePage()", () => {
+    let axiosMock: MockAdapter
+    let endpoints: DefaultStreamlitEndpoints
+
+    beforeEach(() => {
+      axiosMock = new MockAdapter(axios)
+      endpoints = new DefaultStreamlitEndpoints({
+        getServerUri: () => MOCK_SERVER_URI,
+        csrfEnabled: false,
+      })
+    })
+
+    afterEach(() => {
+      axiosMock.restore()
+    })
+
+    it("calls the appropriate endpoint", async () => {
+      const mockPageBytes = new Uint8Array([1, 2, 3])
+
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/dataframe/mockId",
+          { params: { offset: 1000, limit: 1000, sort: "a", order: "desc" } }
+        )
+        .reply(() => [200, mockPageBytes, { "x-streamlit-num-rows": "5000" }])
+
+      await expect(
+        endpoints.fetchDataframePage("/_stcore/dataframe/mockId", {
+          offset: 1000,
+          limit: 1000,
+          sort: "a",
+          order: "desc",
+        })
+      ).resolves.toEqual({ data: mockPageBytes, numRows: 5000 })
+    })
+
+    it("errors on bad status", async () => {
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/dataframe/mockId"
+        )
+        .reply(() => [404])
+
+      await expect(
+        endpoints.fetchDataframePage("/_stcore/dataframe/mockId", {
+          offset: 0,
+          limit: 1000,
+        })
+      ).rejects.toEqual(new Error("Request failed with status code 404"))
+    })
+  })
+
   // Test our private csrfRequest() API, which is responsible for setting
   // the "X-Xsrftoken" header.
   describe("csrfRequest()", () => {
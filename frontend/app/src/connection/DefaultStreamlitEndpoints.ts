@@ -18,6 +18,8 @@ import axios, { AxiosRequestConfig, AxiosResponse, CancelToken } from "axios"
 import {
   BaseUriParts,
   buildHttpUri,
+  DataframePage,
+  DataframePageRequest,
   StreamlitEndpoints,
   getCookie,
   IAppPage,
@@ -149,6 +151,23 @@ export class DefaultStreamlitEndpoints implements StreamlitEndpoints {
     return new Uint8Array(rsp.data)
   }
 
+  public async fetchDataframePage(
+    dataUrl: string,
+    request: DataframePageRequest
+  ): Promise<DataframePage> {
+    const rsp = await axios.request({
+      url: buildHttpUri(this.requireServerUri(), dataUrl),
+      method: "GET",
+      params: request,
+      responseType: "arraybuffer",
+    })
+
+    return {
+      data: new Uint8Array(rsp.data),
+      numRows: Number(rsp.headers["x-streamlit-num-rows"]),
+    }
+  }
+
   /**
    * Fetch the server URI. If our server is disconnected, default to the most
    * recent cached value of the URI. If we're disconnected and have no cached
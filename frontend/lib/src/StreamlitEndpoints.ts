@@ -17,6 +17,30 @@
 import { CancelToken } from "axios"
 import { IAppPage } from "./proto"
 
+/** The rows of a dataframe whose data is served in pages. */
+export interface DataframePageRequest {
+  /** The index of the first row, in the sorted view. */
+  offset: number
+
+  /** The maximum number of rows. */
+  limit: number
+
+  /** The name of the Arrow field to sort the rows by. */
+  sort?: string
+
+  /** The sort direction. Defaults to ascending. */
+  order?: "asc" | "desc"
+}
+
+/** A page of rows of a dataframe. */
+export interface DataframePage {
+  /** The rows, serialized as an Arrow IPC stream. */
+  data: Uint8Array
+
+  /** The number of rows of the whole (sorted) dataframe. */
+  numRows: number
+}
+
 /** Exposes non-websocket endpoints used by the frontend. */
 export interface StreamlitEndpoints {
   /**
@@ -94,4 +118,18 @@ export interface StreamlitEndpoints {
    * from the server. Callers can use `ForwardMsg.decode` to deserialize the data.
    */
   fetchCachedForwardMsg(hash: string): Promise<Uint8Array>
+
+  /**
+   * Fetch a page of rows of a dataframe whose remaining rows were left on
+   * the server.
+   *
+   * @param dataUrl the dataframe's `dataUrl`, from its Arrow proto.
+   * @param request the rows to fetch.
+   *
+   * @return a Promise that resolves with the page.
+   */
+  fetchDataframePage?(
+    dataUrl: string,
+    request: DataframePageRequest
+  ): Promise<DataframePage>
 }
@@ -15,6 +15,17 @@
  */
 
 import React from "react"
+import {
+  Field,
+  FixedSizeList,
+  Float64,
+  List,
+  Table,
+  tableFromArrays,
+  tableToIPC,
+  Uint8,
+  vectorFromArray,
+} from "apache-arrow"
 import JSON5 from "json5"
 import { render } from "@streamlit/lib/src/test_util"
 
@@ -22,7 +33,14 @@ import { DeckGlJsonChart as DeckGlJsonChartProto } from "@streamlit/lib/src/prot
 import { screen } from "@testing-library/react"
 import "@testing-library/jest-dom"
 import { mockTheme } from "@streamlit/lib/src/mocks/mockTheme"
-import { DeckGlJsonChart, PropsWithHeight, State } from "./DeckGlJsonChart"
+import {
+  arrowToLayerData,
+  DeckGlJsonChart,
+  getLayerData,
+  PropsWithHeight,
+  setLayerData,
+  State,
+} from "./DeckGlJsonChart"
 
 const mockInitialViewState = {
   bearing: -27.36,
@@ -167,6 +185,7 @@ describe("DeckGlJsonChart element", () => {
 
     const originalState: State = {
       pydeckJson: newJson,
+      layerData: new Map(),
       isFullScreen: false,
       viewState: {},
       initialized: false,
@@ -218,4 +237,216 @@ describe("DeckGlJsonChart element", () => {
       isLightTheme: true,
     })
   })
+
+  describe("layer data", () => {
+    const data = tableToIPC(
+      new Table({
+        lat: vectorFromArray([1, 2], new Float64()),
+        lon: vectorFromArray([3, 4], new Float64()),
+        size: vectorFromArray([5, 6], new Float64()),
+        color: vectorFromArray(
+          [
+            [255, 0, 0, 255],
+            [0, 255, 0, 255],
+          ],
+          new List(new Field("item", new Uint8()))
+        ),
+        normal: vectorFromArray(
+          [
+            [0, 0, 1],
+            [0, 1, 0],
+          ],
+          new FixedSizeList(3, new Field("item", new Float64()))
+        ),
+        name: vectorFromArray(["a", "b"]),
+      })
+    )
+
+    const scatterplotLayer = {
+      "@@type": "ScatterplotLayer",
+      id: "scatterplot",
+      getPosition: "@@=[lon, lat]",
+      getRadius: "@@=size",
+      getFillColor: "@@=color",
+      radiusMinPixels: 3,
+    }
+
+    it("should convert Arrow tables to binary attributes", () => {
+      expect(arrowToLayerData(data, scatterplotLayer, false)).toEqual({
+        length: 2,
+        attributes: {
+          getPosition: { value: Float64Array.from([3, 1, 4, 2]), size: 2 },
+          getRadius: { value: Float32Array.from([5, 6]), size: 1 },
+          getFillColor: {
+            value: Uint8ClampedArray.from([255, 0, 0, 255, 0, 255, 0, 255]),
+            size: 4,
+          },
+        },
+      })
+    })
+
+    it("should read fixed size lists as binary attributes", () => {
+      const layer = {
+        "@@type": "PointCloudLayer",
+        getPosition: "@@=[lon, lat, size]",
+        getNormal: "@@=normal",
+      }
+      expect(arrowToLayerData(data, layer, false)).toEqual({
+        length: 2,
+        attributes: {
+          getPosition: {
+            value: Float64Array.from([3, 1, 5, 4, 2, 6]),
+            size: 3,
+          },
+          getNormal: { value: Float32Array.from([0, 0, 1, 0, 1, 0]), size: 3 },
+        },
+      })
+    })
+
+    const rows = [
+      {
+        lat: 1,
+        lon: 3,
+        size: 5,
+        color: [255, 0, 0, 255],
+        normal: [0, 0, 1],
+        name: "a",
+      },
+      {
+        lat: 2,
+        lon: 4,
+        size: 6,
+        color: [0, 255, 0, 255],
+        normal: [0, 1, 0],
+        name: "b",
+      },
+    ]
+
+    it.each([
+      ["layers that read objects", { "@@type": "HexagonLayer" }],
+      [
+        "layers without a position",
+        { "@@type": "ScatterplotLayer", getRadius: "@@=size" },
+      ],
+      [
+        "accessors that aren't columns",
+        { ...scatterplotLayer, getRadius: "@@=size * 2" },
+      ],
+      [
+        "accessors that read strings",
+        { ...scatterplotLayer, getRadius: "@@=name" },
+      ],
+    ])("should convert Arrow tables to rows for %s", (_, layer) => {
+      expect(arrowToLayerData(data, layer, false)).toEqual(rows)
+    })
+
+    it("should convert Arrow tables to rows for charts with tooltips", () => {
+      expect(arrowToLayerData(data, scatterplotLayer, true)).toEqual(rows)
+    })
+
+    it("should read tables with several record batches as binary attributes", () => {
+      const table = new Table({
+        lon: vectorFromArray([3], new Float64()),
+        color: vectorFromArray(
+          [[255, 0, 0, 255]],
+          new List(new Field("item", new Uint8()))
+        ),
+      }).concat(
+        new Table({
+          lon: vectorFromArray([4], new Float64()),
+          color: vectorFromArray(
+            [[0, 255, 0, 255]],
+            new List(new Field("item", new Uint8()))
+          ),
+        })
+      )
+      const layer = {
+        "@@type": "ScatterplotLayer",
+        getPosition: "@@=[lon, lon]",
+        getFillColor: "@@=color",
+      }
+      expect(arrowToLayerData(tableToIPC(table), layer, false)).toEqual({
+        length: 2,
+        attributes: {
+          getPosition: { value: Float64Array.from([3, 3, 4, 4]), size: 2 },
+          getFillColor: {
+            value: Uint8ClampedArray.from([255, 0, 0, 255, 0, 255, 0, 255]),
+            size: 4,
+          },
+        },
+      })
+    })
+
+    it("should convert lists of different lengths to rows", () => {
+      const dataWithLists = tableToIPC(
+        new Table({
+          lon: vectorFromArray([3, 4], new Float64()),
+          color: vectorFromArray(
+            [
+              [255, 0, 0],
+              [0, 255, 0, 255],
+            ],
+            new List(new Field("item", new Uint8()))
+          ),
+        })
+      )
+      const layer = {
+        "@@type": "ScatterplotLayer",
+        getPosition: "@@=[lon, lon]",
+        getFillColor: "@@=color",
+      }
+      expect(arrowToLayerData(dataWithLists, layer, false)).toEqual([
+        { lon: 3, color: [255, 0, 0] },
+        { lon: 4, color: [0, 255, 0, 255] },
+      ])
+    })
+
+    it("should convert columns with nulls to rows", () => {
+      const dataWithNulls = tableToIPC(
+        tableFromArrays({ lat: [1, null], lon: [3, 4] })
+      )
+      const layer = {
+        "@@type": "ScatterplotLayer",
+        getPosition: "@@=[lon, lat]",
+      }
+      expect(arrowToLayerData(dataWithNulls, layer, false)).toEqual([
+        { lat: 1, lon: 3 },
+        { lat: null, lon: 4 },
+      ])
+    })
+
+    it("should get the data of the layers with datasets", () => {
+      const json = {
+        layers: [scatterplotLayer, { id: "without-data", data: "url" }],
+      }
+      const layerData = getLayerData(
+        json,
+        [{ name: "scatterplot", data: { data } }],
+        false
+      )
+
+      expect([...layerData.keys()]).toEqual(["scatterplot"])
+      expect(layerData.get("scatterplot")).toEqual(
+        arrowToLayerData(data, scatterplotLayer, false)
+      )
+      // The data isn't put in the JSON, which the converter would walk.
+      expect(json.layers[0]).not.toHaveProperty("data")
+    })
+
+    it("should set the data of the converted layers", () => {
+      const layerWithData = { id: "with-data", clone: jest.fn(() => "clone") }
+      const layerWithoutData = { id: "without-data", clone: jest.fn() }
+      const deck = {
+        initialViewState: { height: 500, width: 500 },
+        layers: [layerWithData, layerWithoutData],
+      }
+      const layerData = { length: 2, attributes: {} }
+
+      setLayerData(deck, new Map([["with-data", layerData]]))
+
+      expect(layerWithData.clone).toHaveBeenCalledWith({ data: layerData })
+      expect(layerWithoutData.clone).not.toHaveBeenCalled()
+      expect(deck.layers).toEqual(["clone", layerWithoutData])
+    })
+  })
 })
@@ -15,6 +15,7 @@
  */
 
 import React, { PureComponent, ReactNode } from "react"
+import { DataType, Precision, Table, tableFromIPC, Vector } from "apache-arrow"
 import { DeckGL } from "deck.gl"
 import JSON5 from "json5"
 import isEqual from "lodash/isEqual"
@@ -39,8 +40,12 @@ import { registerLoaders } from "@loaders.gl/core"
 
 import withFullScreenWrapper from "@streamlit/lib/src/hocs/withFullScreenWrapper"
 import withMapboxToken from "@streamlit/lib/src/hocs/withMapboxToken"
+import { decompressArrowIPC } from "@streamlit/lib/src/dataframes/arrowCompression"
 
-import { DeckGlJsonChart as DeckGlJsonChartProto } from "@streamlit/lib/src/proto"
+import {
+  DeckGlJsonChart as DeckGlJsonChartProto,
+  IArrowNamedDataSet,
+} from "@streamlit/lib/src/proto"
 import {
   StyledDeckGlChart,
   StyledNavigationControlContainer,
@@ -89,12 +94,278 @@ export interface State {
   initialViewState: Record<string, unknown>
   id: string | undefined
   pydeckJson: any
+  layerData: Map<string, LayerData>
   isFullScreen: boolean
   isLightTheme: boolean
 }
 
 export const DEFAULT_DECK_GL_HEIGHT = 500
 
+/**
+ * The data of a layer as binary attributes, which deck.gl reads without
+ * calling accessors on every row.
+ * https://deck.gl/docs/developer-guide/performance#supply-attributes-directly
+ */
+export interface BinaryLayerData {
+  length: number
+  attributes: Record<string, { value: ArrayLike<number>; size: number }>
+}
+
+export type LayerData = BinaryLayerData | Record<string, unknown>[]
+
+/**
+ * The position accessors of the layers that can be given binary attributes.
+ * Their other accessors default to constants, so these are all they need.
+ * Aggregation and composite layers read objects, and are given rows.
+ */
+const BINARY_LAYER_POSITIONS: Record<string, string[]> = {
+  ScatterplotLayer: ["getPosition"],
+  ColumnLayer: ["getPosition"],
+  PointCloudLayer: ["getPosition"],
+  LineLayer: ["getSourcePosition", "getTargetPosition"],
+  ArcLayer: ["getSourcePosition", "getTargetPosition"],
+}
+
+// Accessors that read a column, e.g. "@@=size", or a list of columns,
+// e.g. "@@=[lon, lat]".
+const COLUMN_ACCESSOR = /^@@=\s*(\w+)\s*$/
+const COLUMNS_ACCESSOR = /^@@=\s*\[\s*(\w+(?:\s*,\s*\w+)*)\s*\]\s*$/
+
+interface BinaryColumn {
+  // The values of the rows, one after the other.
+  values: ArrayLike<number>
+  // The number of values in each row.
+  size: number
+}
+
+function isNumberType(type: DataType): boolean {
+  return (
+    (DataType.isInt(type) && type.bitWidth < 64) ||
+    (DataType.isFloat(type) && type.precision !== Precision.HALF)
+  )
+}
+
+/**
+ * Returns the values of a column of numbers, or of lists of numbers that
+ * all have the same length. Returns undefined for other columns, and for
+ * columns with nulls.
+ */
+function getBinaryColumn(vector: Vector | null): BinaryColumn | undefined {
+  if (!vector || vector.nullCount > 0) {
+    return undefined
+  }
+
+  const { type } = vector
+  if (isNumberType(type)) {
+    return { values: vector.toArray(), size: 1 }
+  }
+  if (
+    !(DataType.isList(type) || DataType.isFixedSizeList(type)) ||
+    !isNumberType(type.valueType)
+  ) {
+    return undefined
+  }
+
+  const isFixedSize = DataType.isFixedSizeList(type)
+  let size: number | undefined = isFixedSize ? type.listSize : undefined
+  const chunks: ArrayLike<number>[] = []
+  for (const data of vector.data) {
+    const child = data.children[0]
+    if (child.nullCount > 0) {
+      return undefined
+    }
+
+    let start = data.offset
+    let end = data.offset + data.length
+    if (isFixedSize) {
+      start *= size as number
+      end *= size as number
+    } else {
+      const offsets = data.valueOffsets
+      for (let row = start; row < end; row++) {
+        const rowSize = offsets[row + 1] - offsets[row]
+        size = size ?? rowSize
+        if (rowSize !== size) {
+          return undefined
+        }
+      }
+      start = offsets[start]
+      end = offsets[end]
+    }
+    chunks.push(child.values.subarray(child.offset + start, child.offset + end))
+  }
+  if (!size) {
+    return undefined
+  }
+
+  const values = new Float64Array(vector.length * size)
+  let index = 0
+  chunks.forEach(chunk => {
+    values.set(chunk, index)
+    index += chunk.length
+  })
+  return { values, size }
+}
+
+/**
+ * Returns the values that an accessor expression reads from the table, or
+ * undefined if it isn't a column or a list of columns of numbers.
+ */
+function getAccessorColumn(
+  table: Table,
+  expression: string
+): BinaryColumn | undefined {
+  const columnMatch = COLUMN_ACCESSOR.exec(expression)
+  if (columnMatch) {
+    return getBinaryColumn(table.getChild(columnMatch[1]))
+  }
+
+  const columnsMatch = COLUMNS_ACCESSOR.exec(expression)
+  if (!columnsMatch) {
+    return undefined
+  }
+  const columns = columnsMatch[1]
+    .split(",")
+    .map(name => getBinaryColumn(table.getChild(name.trim())))
+  if (columns.some(column => column?.size !== 1)) {
+    return undefined
+  }
+
+  // Interleave the columns, so each row's values are next to each other.
+  const size = columns.length
+  const values = new Float64Array(table.numRows * size)
+  columns.forEach((column, columnIndex) => {
+    const columnValues = (column as BinaryColumn).values
+    for (let row = 0; row < table.numRows; row++) {
+      values[row * size + columnIndex] = columnValues[row]
+    }
+  })
+  return { values, size }
+}
+
+/**
+ * Converts a layer's Arrow table into binary attributes, one for each of the
+ * layer's accessors. Returns undefined if the layer can't read them.
+ */
+function toBinaryLayerData(
+  table: Table,
+  layer: Record<string, unknown>
+): BinaryLayerData | undefined {
+  const positions = BINARY_LAYER_POSITIONS[layer["@@type"] as string]
+  if (!positions || positions.some(accessor => !(accessor in layer))) {
+    return undefined
+  }
+
+  const attributes: BinaryLayerData["attributes"] = {}
+  for (const [accessor, expression] of Object.entries(layer)) {
+    if (typeof expression !== "string" || !expression.startsWith("@@=")) {
+      continue
+    }
+    const column = getAccessorColumn(table, expression)
+    if (!column) {
+      return undefined
+    }
+
+    // Positions keep their 64-bit precision, and colors are bytes, which is
+    // how deck.gl stores them.
+    let value: ArrayLike<number>
+    if (positions.includes(accessor)) {
+      value = Float64Array.from(column.values)
+    } else if (accessor.endsWith("Color")) {
+      value = Uint8ClampedArray.from(column.values)
+    } else {
+      value = Float32Array.from(column.values)
+    }
+    attributes[accessor] = { value, size: column.size }
+  }
+
+  return { length: table.numRows, attributes }
+}
+
+/**
+ * Converts an Arrow table into the row objects that deck.gl's accessors read.
+ * List values are converted to arrays.
+ */
+function toLayerRows(table: Table): Record<string, unknown>[] {
+  const columns = table.schema.fields.map((field, index) => ({
+    name: field.name,
+    vector: table.getChildAt(index),
+  }))
+
+  const rows = new Array(table.numRows)
+  for (let rowIndex = 0; rowIndex < table.numRows; rowIndex++) {
+    const row: Record<string, unknown> = {}
+    columns.forEach(({ name, vector }) => {
+      const value = vector?.get(rowIndex)
+      row[name] = value instanceof Vector ? Array.from(value.toArray()) : value
+    })
+    rows[rowIndex] = row
+  }
+  return rows
+}
+
+/**
+ * Converts a layer's Arrow table into binary attributes if the layer can
+ * read them, and into row objects otherwise. Tooltips are given the picked
+ * row, so layers of charts with tooltips always get rows.
+ */
+export function arrowToLayerData(
+  data: Uint8Array,
+  layer: Record<string, unknown>,
+  hasTooltip: boolean
+): LayerData {
+  const table = tableFromIPC(decompressArrowIPC(data))
+  return (!hasTooltip && toBinaryLayerData(table, layer)) || toLayerRows(table)
+}
+
+/**
+ * Returns the data of the layers whose data was sent as Arrow tables instead
+ * of inside the JSON, by layer id. The tables are named after the ids of
+ * their layers.
+ */
+export function getLayerData(
+  pydeckJson: any,
+  datasets: IArrowNamedDataSet[],
+  hasTooltip: boolean
+): Map<string, LayerData> {
+  const layerData = new Map<string, LayerData>()
+  if (datasets.length === 0 || !Array.isArray(pydeckJson?.layers)) {
+    return layerData
+  }
+
+  const dataByLayerId = new Map(
+    datasets.map(dataset => [dataset.name, dataset.data?.data])
+  )
+  pydeckJson.layers.forEach((layer: Record<string, unknown>) => {
+    const data = dataByLayerId.get(layer.id as string)
+    if (data) {
+      layerData.set(
+        layer.id as string,
+        arrowToLayerData(data, layer, hasTooltip)
+      )
+    }
+  })
+  return layerData
+}
+
+/**
+ * Sets the data of the deck's layers. This is done after the JSON is
+ * converted, so that the converter doesn't walk through the data.
+ */
+export function setLayerData(
+  deck: DeckObject,
+  layerData: Map<string, LayerData>
+): void {
+  if (layerData.size === 0) {
+    return
+  }
+
+  deck.layers = deck.layers.map((layer: any) => {
+    const data = layerData.get(layer.id)
+    return data ? layer.clone({ data }) : layer
+  })
+}
+
 export class DeckGlJsonChart extends PureComponent<PropsWithHeight, State> {
   readonly state = {
     viewState: {
@@ -106,6 +377,7 @@ export class DeckGlJsonChart extends PureComponent<PropsWithHeight, State> {
     initialViewState: {},
     id: undefined,
     pydeckJson: undefined,
+    layerData: new Map(),
     isFullScreen: false,
     isLightTheme: hasLightBackgroundColor(this.props.theme),
   }
@@ -167,6 +439,11 @@ export class DeckGlJsonChart extends PureComponent<PropsWithHeight, State> {
       state.isLightTheme !== hasLightBackgroundColor(theme)
     ) {
       state.pydeckJson = JSON5.parse(element.json)
+      state.layerData = getLayerData(
+        state.pydeckJson,
+        element.datasets,
+        Boolean(element.tooltip)
+      )
       state.id = element.id
     }
 
@@ -195,7 +472,9 @@ export class DeckGlJsonChart extends PureComponent<PropsWithHeight, State> {
 
     delete state.pydeckJson?.views // We are not using views. This avoids a console warning.
 
-    return jsonConverter.convert(state.pydeckJson)
+    const deck = jsonConverter.convert(state.pydeckJson)
+    setLayerData(deck, state.layerData ?? new Map())
+    return deck
   }
 
   createTooltip = (info: PickingInfo): Record<string, unknown> | boolean => {
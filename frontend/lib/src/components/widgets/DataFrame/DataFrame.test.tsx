@@ -20,7 +20,7 @@ import { TEN_BY_TEN } from "@streamlit/lib/src/mocks/arrow"
 import { render } from "@streamlit/lib/src/test_util"
 import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
 import { Arrow as ArrowProto } from "@streamlit/lib/src/proto"
-import { screen } from "@testing-library/react"
+import { act, screen } from "@testing-library/react"
 import "@testing-library/jest-dom"
 import * as glideDataGridModule from "@glideapps/glide-data-grid"
 
@@ -125,4 +125,111 @@ describe("DataFrame widget", () => {
       {}
     )
   })
+
+  describe("edits version", () => {
+    // Data editors keep their editing states by ID, so every test uses
+    // its own ID.
+    const getEditorProps = (
+      id: string,
+      editsVersion: number
+    ): DataFrameProps & { widgetMgr: any } => ({
+      ...getProps(
+        new Quiver({ data: TEN_BY_TEN }),
+        false,
+        ArrowProto.EditingMode.FIXED
+      ),
+      element: ArrowProto.create({
+        id,
+        data: new Uint8Array(),
+        width: 400,
+        height: 400,
+        editingMode: ArrowProto.EditingMode.FIXED,
+        editsVersion,
+      }),
+      widgetMgr: {
+        getStringValue: jest.fn(),
+        setStringValue: jest.fn(),
+      },
+    })
+
+    // Edits the first data column of the given row, like the user does.
+    const editCell = (row: number, value: number): void => {
+      const dataEditorMock = glideDataGridModule.DataEditor as jest.Mock
+      const { onCellEdited } =
+        dataEditorMock.mock.calls[dataEditorMock.mock.calls.length - 1][0]
+      const cell: glideDataGridModule.NumberCell = {
+        kind: glideDataGridModule.GridCellKind.Number,
+        data: value,
+        displayData: String(value),
+        allowOverlay: true,
+      }
+      act(() => {
+        onCellEdited([1, row], cell)
+        jest.runAllTimers()
+      })
+    }
+
+    const getLastWidgetValue = (widgetMgr: any): Record<string, any> => {
+      const { calls } = widgetMgr.setStringValue.mock
+      return JSON.parse(calls[calls.length - 1][1])
+    }
+
+    beforeEach(() => {
+      jest.useFakeTimers()
+    })
+
+    afterEach(() => {
+      jest.useRealTimers()
+    })
+
+    it("only sends the edits that the server hasn't applied", () => {
+      const props = getEditorProps("applied_edits", 0)
+      const { rerender } = render(<DataFrame {...props} />)
+
+      editCell(0, 42)
+      expect(getLastWidgetValue(props.widgetMgr)).toEqual({
+        edited_rows: { 0: { 0: 42 } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 1,
+        base_version: 0,
+      })
+
+      // The server has applied the first edit:
+      const appliedProps = getEditorProps("applied_edits", 1)
+      rerender(<DataFrame {...appliedProps} />)
+      editCell(1, 43)
+      expect(getLastWidgetValue(appliedProps.widgetMgr)).toEqual({
+        edited_rows: { 1: { 0: 43 } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 2,
+        base_version: 1,
+      })
+    })
+
+    it("sends all edits again if the server lost them", () => {
+      const props = getEditorProps("lost_edits", 0)
+      const { rerender } = render(<DataFrame {...props} />)
+      editCell(0, 42)
+
+      const appliedProps = getEditorProps("lost_edits", 1)
+      rerender(<DataFrame {...appliedProps} />)
+      editCell(1, 43)
+
+      // The server restarted, so it doesn't have any edits anymore:
+      const restartedProps = getEditorProps("lost_edits", 0)
+      rerender(<DataFrame {...restartedProps} />)
+      act(() => {
+        jest.runAllTimers()
+      })
+      expect(getLastWidgetValue(restartedProps.widgetMgr)).toEqual({
+        edited_rows: { 0: { 0: 42 }, 1: { 0: 43 } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 3,
+        base_version: 0,
+      })
+    })
+  })
 })
@@ -29,6 +29,7 @@ import { FormClearHelper } from "@streamlit/lib/src/components/widgets/Form"
 import withFullScreenWrapper from "@streamlit/lib/src/hocs/withFullScreenWrapper"
 import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
 import { Arrow as ArrowProto } from "@streamlit/lib/src/proto"
+import { StreamlitEndpoints } from "@streamlit/lib/src/StreamlitEndpoints"
 import {
   WidgetInfo,
   WidgetStateManager,
@@ -40,6 +41,8 @@ import {
   useCustomTheme,
   useTableSizer,
   useDataLoader,
+  useDataPager,
+  hasDataPages,
   useDataEditor,
   useColumnSizer,
   useColumnSort,
@@ -71,6 +74,28 @@ const DEBOUNCE_TIME_MS = 100
 // Number of rows that triggers some optimization features
 // for large tables.
 const LARGE_TABLE_ROWS_THRESHOLD = 150000
+// Max number of editing states that are kept for data editors
+// that might be mounted again.
+const MAX_KEPT_EDITING_STATES = 100
+
+// The editing states of data editors by widget ID. Widget values only
+// contain the edits that the server hasn't applied yet, so the editing
+// states are kept here to restore all edits if a data editor is mounted
+// again (e.g. if other elements are inserted before it).
+const keptEditingStates = new Map<string, EditingState>()
+
+function keepEditingState(widgetId: string, editingState: EditingState): void {
+  // Maps are iterated in insertion order, so the first entry is the one
+  // that was kept the longest time ago.
+  keptEditingStates.delete(widgetId)
+  keptEditingStates.set(widgetId, editingState)
+  if (keptEditingStates.size > MAX_KEPT_EDITING_STATES) {
+    const oldestWidgetId = keptEditingStates.keys().next().value
+    if (oldestWidgetId !== undefined) {
+      keptEditingStates.delete(oldestWidgetId)
+    }
+  }
+}
 
 export interface DataFrameProps {
   element: ArrowProto
@@ -79,6 +104,7 @@ export interface DataFrameProps {
   height?: number
   disabled: boolean
   widgetMgr: WidgetStateManager
+  endpoints?: StreamlitEndpoints
   isFullScreen?: boolean
 }
 
@@ -91,6 +117,7 @@ export interface DataFrameProps {
  * @param height - The height of the container
  * @param disabled - Whether the widget is disabled
  * @param widgetMgr - The widget manager
+ * @param endpoints - The endpoints to fetch rows that were left on the server
  * @param isFullScreen - Whether the widget is in full screen mode
  */
 function DataFrame({
@@ -100,6 +127,7 @@ function DataFrame({
   height: containerHeight,
   disabled,
   widgetMgr,
+  endpoints,
   isFullScreen,
 }: DataFrameProps): ReactElement {
   const resizableRef = React.useRef<Resizable>(null)
@@ -152,9 +180,15 @@ function DataFrame({
 
   const { READ_ONLY, DYNAMIC } = ArrowProto.EditingMode
 
+  // Large dataframes are only sent with their first rows. The remaining
+  // rows are fetched from the server in pages.
+  const isPaged = hasDataPages(element, endpoints)
+
   // Number of rows of the table minus 1 for the header row:
   const dataDimensions = data.dimensions
-  const originalNumRows = Math.max(0, dataDimensions.rows - 1)
+  const originalNumRows = isPaged
+    ? element.numRows
+    : Math.max(0, dataDimensions.rows - 1)
 
   // For empty tables, we show an extra row that
   // contains "empty" as a way to indicate that the table is empty.
@@ -193,8 +227,12 @@ function DataFrame({
   React.useEffect(
     () => {
       if (element.editingMode !== READ_ONLY) {
+        const keptEditingState = keptEditingStates.get(element.id)
         const initialWidgetValue = widgetMgr.getStringValue(element)
-        if (initialWidgetValue) {
+        if (keptEditingState) {
+          editingState.current = keptEditingState
+          setNumRows(editingState.current.getNumRows())
+        } else if (initialWidgetValue) {
           editingState.current.fromJson(initialWidgetValue, originalColumns)
           setNumRows(editingState.current.getNumRows())
         }
@@ -212,8 +250,29 @@ function DataFrame({
     editingState
   )
 
-  const { columns, sortColumn, getOriginalIndex, getCellContent } =
-    useColumnSort(originalNumRows, originalColumns, getOriginalCellContent)
+  const {
+    columns,
+    sort,
+    sortColumn,
+    getOriginalIndex,
+    getCellContent: getSortedCellContent,
+  } = useColumnSort(
+    originalNumRows,
+    originalColumns,
+    getOriginalCellContent,
+    // The rows of paged dataframes are sorted by the server:
+    isPaged
+  )
+
+  const { getCellContent } = useDataPager(
+    element,
+    data,
+    columns,
+    sort,
+    getSortedCellContent,
+    refreshCells,
+    endpoints
+  )
 
   /**
    * This callback should be called after any edits have been applied to the data.
@@ -236,14 +295,16 @@ function DataFrame({
 
       // Use debounce to prevent rapid updates to the widget state.
       debounce(DEBOUNCE_TIME_MS, () => {
-        const currentEditingState = editingState.current.toJson(columns)
+        keepEditingState(element.id, editingState.current)
+        // Only the edits that the server hasn't applied yet are sent.
+        const currentEditingState = editingState.current.toUpdateJson(columns)
         let currentWidgetState = widgetMgr.getStringValue(
           element as WidgetInfo
         )
 
         if (currentWidgetState === undefined) {
           // Create an empty widget state
-          currentWidgetState = new EditingState(0).toJson([])
+          currentWidgetState = new EditingState(0).toUpdateJson([])
         }
 
         // Only update if there is actually a difference between editing and widget state
@@ -261,6 +322,30 @@ function DataFrame({
     [widgetMgr, element, numRows, clearSelection, columns]
   )
 
+  // The ID of the widget that the editing state was last applied to.
+  const appliedWidgetId = React.useRef(element.id)
+
+  // Keep track of the version of the edits that the server has applied,
+  // so that only newer edits are sent with the widget value.
+  React.useEffect(() => {
+    if (element.editingMode === READ_ONLY) {
+      return
+    }
+
+    if (appliedWidgetId.current !== element.id) {
+      // The data or the configuration changed, so none of the edits
+      // are applied to the new widget yet.
+      appliedWidgetId.current = element.id
+      editingState.current.resetAppliedVersion()
+      return
+    }
+
+    if (editingState.current.setAppliedVersion(element.editsVersion)) {
+      // The server doesn't have the edits anymore, so all edits are sent.
+      applyEdits()
+    }
+  }, [element.id, element.editsVersion, element.editingMode, applyEdits])
+
   const { onCellEdited, onPaste, onRowAppended, onDelete, validateCell } =
     useDataEditor(
       columns,
@@ -430,8 +515,9 @@ function DataFrame({
           keybindings={{ search: true, downFill: true }}
           // Header click is used for column sorting:
           onHeaderClicked={
-            // Deactivate sorting for empty state and for large dataframes:
-            isEmptyTable || isLargeTable ? undefined : sortColumn
+            // Deactivate sorting for empty state and for large dataframes,
+            // unless the server sorts them:
+            isEmptyTable || (isLargeTable && !isPaged) ? undefined : sortColumn
           }
           gridSelection={gridSelection}
           onGridSelectionChange={(newSelection: GridSelection) => {
@@ -300,4 +300,145 @@ describe("EditingState class", () => {
     // Test again if the edits were applied correctly:
     expect(editingState.toJson(MOCK_COLUMNS)).toEqual(editingStateJson)
   })
+
+  it("only sends the edits that the server hasn't applied", () => {
+    const editingState = new EditingState(3)
+    const columns = [
+      TextColumn({
+        id: "column_1",
+        name: "column_1",
+        title: "column_1",
+        indexNumber: 0,
+        arrowType: {
+          pandas_type: "unicode",
+          numpy_type: "object",
+        },
+        isEditable: true,
+        isHidden: false,
+        isIndex: false,
+        isStretched: false,
+      } as BaseColumnProps),
+    ]
+
+    editingState.setCell(0, 0, MOCK_TEXT_CELL_1)
+    expect(editingState.toUpdateJson(columns)).toEqual(
+      '{"edited_rows":{"0":{"column_1":"foo"}},"added_rows":[],"deleted_rows":[],"version":1,"base_version":0}'
+    )
+
+    // The server has applied the first edit:
+    expect(editingState.setAppliedVersion(1)).toBe(false)
+    editingState.setCell(0, 1, MOCK_TEXT_CELL_2)
+    editingState.deleteRow(2)
+    expect(editingState.toUpdateJson(columns)).toEqual(
+      '{"edited_rows":{"1":{"column_1":"foo"}},"added_rows":[],"deleted_rows":[2],"version":3,"base_version":1}'
+    )
+
+    // The server lost the applied edits, so all edits are sent again:
+    expect(editingState.setAppliedVersion(0)).toBe(true)
+    expect(editingState.toUpdateJson(columns)).toEqual(
+      '{"edited_rows":{"0":{"column_1":"foo"},"1":{"column_1":"foo"}},"added_rows":[],"deleted_rows":[2],"version":4,"base_version":0}'
+    )
+  })
+
+  describe("edits version", () => {
+    const columns = [
+      TextColumn({
+        id: "column_1",
+        name: "column_1",
+        title: "column_1",
+        indexNumber: 0,
+        arrowType: {
+          pandas_type: "unicode",
+          numpy_type: "object",
+        },
+        isEditable: true,
+        isHidden: false,
+        isIndex: false,
+        isStretched: false,
+      } as BaseColumnProps),
+    ]
+
+    const getUpdate = (editingState: EditingState): Record<string, any> =>
+      JSON.parse(editingState.toUpdateJson(columns))
+
+    it("sends cells that were edited again after the applied version", () => {
+      const editingState = new EditingState(3)
+      editingState.setCell(0, 0, MOCK_TEXT_CELL_1)
+      editingState.setCell(0, 0, MOCK_TEXT_CELL_2)
+
+      // The server has only applied the first of the two edits:
+      expect(editingState.setAppliedVersion(1)).toBe(false)
+      expect(getUpdate(editingState)).toEqual({
+        edited_rows: { 0: { column_1: "foo" } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 2,
+        base_version: 1,
+      })
+
+      expect(editingState.setAppliedVersion(2)).toBe(false)
+      expect(getUpdate(editingState).edited_rows).toEqual({})
+    })
+
+    it("always sends all added rows", () => {
+      const editingState = new EditingState(3)
+      editingState.addRow(new Map([[0, MOCK_TEXT_CELL_1]]))
+      expect(editingState.setAppliedVersion(1)).toBe(false)
+
+      expect(getUpdate(editingState)).toEqual({
+        edited_rows: {},
+        added_rows: [{ column_1: "foo" }],
+        deleted_rows: [],
+        version: 1,
+        base_version: 1,
+      })
+    })
+
+    it("sends all edits again if the server has an unknown version", () => {
+      const editingState = new EditingState(3)
+      editingState.setCell(0, 0, MOCK_TEXT_CELL_1)
+
+      // e.g. the editing state was created again in the meantime:
+      expect(editingState.setAppliedVersion(5)).toBe(true)
+      expect(getUpdate(editingState)).toEqual({
+        edited_rows: { 0: { column_1: "foo" } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 6,
+        base_version: 0,
+      })
+    })
+
+    it("sends all edits again after the applied version is reset", () => {
+      const editingState = new EditingState(3)
+      editingState.setCell(0, 0, MOCK_TEXT_CELL_1)
+      editingState.setAppliedVersion(1)
+      editingState.setCell(0, 1, MOCK_TEXT_CELL_2)
+
+      editingState.resetAppliedVersion()
+      expect(getUpdate(editingState)).toEqual({
+        edited_rows: { 0: { column_1: "foo" }, 1: { column_1: "foo" } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 2,
+        base_version: 0,
+      })
+    })
+
+    it("sends all edits again after loading them from JSON", () => {
+      const editingState = new EditingState(3)
+      editingState.fromJson(
+        '{"edited_rows":{"0":{"column_1":"foo"}},"added_rows":[],"deleted_rows":[],"version":4,"base_version":2}',
+        columns
+      )
+
+      expect(getUpdate(editingState)).toEqual({
+        edited_rows: { 0: { column_1: "foo" } },
+        added_rows: [],
+        deleted_rows: [],
+        version: 5,
+        base_version: 0,
+      })
+    })
+  })
 })
@@ -37,6 +37,15 @@ function getColumnName(column: BaseColumn): string {
     : column.name
 }
 
+/**
+ * Convert a widget state to a JSON string.
+ */
+function toJsonString(widgetState: Record<string, any>): string {
+  // Convert undefined values to null, otherwise this is removed here since
+  // undefined does not exist in JSON.
+  return JSON.stringify(widgetState, (_k, v) => (v === undefined ? null : v))
+}
+
 /**
  * The editing state keeps track of all table edits applied by the user.
  */
@@ -54,6 +63,15 @@ class EditingState {
   // The original number of rows in the table (without potential additions & deletions)
   private numRows = 0
 
+  // The version of the editing state, which is increased with every edit
+  private version = 0
+
+  // The version of the editing state that the server has applied
+  private appliedVersion = 0
+
+  // row -> column -> version of the cells edited after the applied version
+  private unappliedCells: Map<number, Map<number, number>> = new Map()
+
   constructor(numRows: number) {
     this.numRows = numRows
   }
@@ -65,6 +83,99 @@ class EditingState {
    * @returns JSON string
    */
   toJson(columns: BaseColumn[]): string {
+    return toJsonString(this.toWidgetState(columns, this.editedCells))
+  }
+
+  /**
+   * Convert the edits that the server hasn't applied yet to a JSON string.
+   * This contains the cells that were edited after the applied version,
+   * and all added and deleted rows.
+   *
+   * @param columns - The columns of the table
+   * @returns JSON string
+   */
+  toUpdateJson(columns: BaseColumn[]): string {
+    const editedCells =
+      this.appliedVersion === 0 ? this.editedCells : this.getUnappliedCells()
+    return toJsonString({
+      ...this.toWidgetState(columns, editedCells),
+      version: this.version,
+      base_version: this.appliedVersion,
+    })
+  }
+
+  /**
+   * Sets the version of the editing state that the server has applied, so
+   * that the edits up to this version aren't sent again.
+   *
+   * @param version - The version that the server has applied
+   * @returns True if the server doesn't have the edits it applied before
+   * (e.g. because it restarted), so that all edits need to be sent again.
+   */
+  setAppliedVersion(version: number): boolean {
+    if (version < this.appliedVersion || version > this.version) {
+      // Send all edits with a version that the server hasn't applied yet.
+      this.appliedVersion = 0
+      this.version = Math.max(this.version, version) + 1
+      return true
+    }
+
+    this.appliedVersion = version
+    this.unappliedCells.forEach(
+      (row: Map<number, number>, rowIndex: number) => {
+        row.forEach((cellVersion: number, colIndex: number) => {
+          if (cellVersion <= version) {
+            row.delete(colIndex)
+          }
+        })
+        if (row.size === 0) {
+          this.unappliedCells.delete(rowIndex)
+        }
+      }
+    )
+    return false
+  }
+
+  /**
+   * Marks all edits as not applied by the server, e.g. because the data of
+   * the table has changed.
+   */
+  resetAppliedVersion(): void {
+    this.appliedVersion = 0
+  }
+
+  /**
+   * Returns the edited cells that the server hasn't applied yet.
+   */
+  private getUnappliedCells(): Map<number, Map<number, GridCell>> {
+    const unappliedCells = new Map<number, Map<number, GridCell>>()
+    this.unappliedCells.forEach(
+      (row: Map<number, number>, rowIndex: number) => {
+        const editedRow = this.editedCells.get(rowIndex)
+        if (editedRow === undefined) {
+          return
+        }
+        const unappliedRow = new Map<number, GridCell>()
+        row.forEach((_version: number, colIndex: number) => {
+          const cell = editedRow.get(colIndex)
+          if (cell !== undefined) {
+            unappliedRow.set(colIndex, cell)
+          }
+        })
+        unappliedCells.set(rowIndex, unappliedRow)
+      }
+    )
+    return unappliedCells
+  }
+
+  /**
+   * Convert the given edited cells and all added & deleted rows to the
+   * JSON-compatible widget state.
+   */
+  private toWidgetState(
+    columns: BaseColumn[],
+    editedCells: Map<number, Map<number, GridCell>>
+  ): Record<string, any> {
     const columnsByIndex = new Map<number, BaseColumn>()
     columns.forEach(column => {
       columnsByIndex.set(column.indexNumber, column)
@@ -82,7 +193,7 @@ class EditingState {
     // Loop through all edited cells and transform into the structure
     // we use for the JSON-compatible widget state:
     // row position -> column name -> edited value
-    this.editedCells.forEach(
+    editedCells.forEach(
       (row: Map<number, GridCell>, rowIndex: number, _map) => {
         const editedRow: Record<string, any> = {}
         row.forEach((cell: GridCell, colIndex: number, _map) => {
@@ -131,12 +242,7 @@ class EditingState {
     // The deleted rows don't need to be transformed
     currentState.deleted_rows = this.deletedRows
 
-    // Convert undefined values to null, otherwise this is removed here since
-    // undefined does not exist in JSON.
-    const json = JSON.stringify(currentState, (_k, v) =>
-      v === undefined ? null : v
-    )
-    return json
+    return currentState
   }
 
   /**
@@ -210,6 +316,11 @@ class EditingState {
 
     // The deleted rows don't need to be transformed
     this.deletedRows = editingState.deleted_rows
+
+    // All edits are sent to the server again.
+    this.version = Math.max(this.version, editingState.version ?? 0) + 1
+    this.appliedVersion = 0
+    this.unappliedCells = new Map()
   }
 
   /**
@@ -258,6 +369,7 @@ class EditingState {
       }
       // Added rows have their own editing state
       this.addedRows[row - this.numRows].set(col, cell)
+      this.version += 1
     } else {
       if (this.editedCells.get(row) === undefined) {
         this.editedCells.set(row, new Map())
@@ -265,6 +377,12 @@ class EditingState {
 
       const rowCache = this.editedCells.get(row) as Map<number, GridCell>
       rowCache.set(col, cell)
+
+      this.version += 1
+      if (this.unappliedCells.get(row) === undefined) {
+        this.unappliedCells.set(row, new Map())
+      }
+      this.unappliedCells.get(row)?.set(col, this.version)
     }
   }
 
@@ -275,6 +393,7 @@ class EditingState {
    */
   addRow(rowCells: Map<number, GridCell>): void {
     this.addedRows.push(rowCells)
+    this.version += 1
   }
 
   /**
@@ -305,6 +424,7 @@ class EditingState {
     if (this.isAddedRow(row)) {
       // Remove from added rows:
       this.addedRows.splice(row - this.numRows, 1)
+      this.version += 1
       // there is nothing more we have to do
       return
     }
@@ -318,6 +438,8 @@ class EditingState {
 
     // Remove all cells from cell state associated with this row:
     this.editedCells.delete(row)
+    this.unappliedCells.delete(row)
+    this.version += 1
   }
 
   /**
@@ -16,6 +16,7 @@
 
 export { default as useCustomTheme } from "./useCustomTheme"
 export { default as useDataLoader } from "./useDataLoader"
+export { default as useDataPager, hasDataPages } from "./useDataPager"
 export { default as useTableSizer } from "./useTableSizer"
 export { default as useDataEditor } from "./useDataEditor"
 export { default as useColumnSizer } from "./useColumnSizer"
@@ -204,4 +204,41 @@ describe("useColumnSort hook", () => {
       Array.from(sortedDataDesc).sort().reverse()
     )
   })
+
+  it("should only keep track of the sort if the server sorts", () => {
+    const { result } = renderHook(() =>
+      useColumnSort(
+        MOCK_PROPS.numRows,
+        MOCK_PROPS.columns,
+        MOCK_PROPS.getCellContent,
+        true
+      )
+    )
+
+    act(() => {
+      const { sortColumn } = result.current
+      sortColumn?.(0)
+    })
+
+    // The header shows the sort, but the rows keep their order:
+    expect(result.current.columns[0].title).toContain("↑")
+    expect(result.current.sort?.column.id).toBe("column_1")
+    expect(result.current.sort?.direction).toBe("asc")
+    expect(
+      (result.current.getCellContent([0, 0]) as NumberCell).data
+    ).toEqual(90)
+    expect(result.current.getOriginalIndex(2)).toEqual(2)
+
+    act(() => {
+      const { sortColumn } = result.current
+      sortColumn?.(0)
+    })
+    expect(result.current.sort?.direction).toBe("desc")
+
+    act(() => {
+      const { sortColumn } = result.current
+      sortColumn?.(0)
+    })
+    expect(result.current.sort).toBeUndefined()
+  })
 })
@@ -31,7 +31,7 @@ import {
 /**
  * Configuration type for column sorting hook.
  */
-type ColumnSortConfig = {
+export type ColumnSortConfig = {
   column: GridColumn
   mode?: "default" | "raw" | "smart"
   direction?: "asc" | "desc"
@@ -66,6 +66,7 @@ function updateSortingHeader(
 
 type ColumnSortReturn = {
   columns: BaseColumn[]
+  sort: ColumnSortConfig | undefined
   sortColumn: (index: number) => void
   getOriginalIndex: (index: number) => number
 } & Pick<DataEditorProps, "getCellContent">
@@ -75,9 +76,13 @@ type ColumnSortReturn = {
  *
  * @param numRows - The number of rows in the table.
  * @param columns - The columns of the table.
+ * @param getCellContent - The function that returns the content of the cell at the given column and row indices.
+ * @param sortOnServer - If true, the rows aren't sorted here, since they are
+ * requested from the server in sorted order instead.
  *
  * @returns An object containing the following properties:
  * - `columns`: The updated list of columns.
+ * - `sort`: The current sorting configuration.
  * - `sortColumn`: A function that sorts the column at the given index.
  * - `getOriginalIndex`: A function that returns the original index of the row at the given index.
  * - `getCellContent`: An updated function that returns the content of the cell at the given column and row indices.
@@ -85,7 +90,8 @@ type ColumnSortReturn = {
 function useColumnSort(
   numRows: number,
   columns: BaseColumn[],
-  getCellContent: ([col, row]: readonly [number, number]) => GridCell
+  getCellContent: ([col, row]: readonly [number, number]) => GridCell,
+  sortOnServer = false
 ): ColumnSortReturn {
   const [sort, setSort] = React.useState<ColumnSortConfig>()
 
@@ -94,7 +100,7 @@ function useColumnSort(
       columns: columns.map(column => toGlideColumn(column)),
       getCellContent,
       rows: numRows,
-      sort,
+      sort: sortOnServer ? undefined : sort,
     })
 
   const updatedColumns = updateSortingHeader(columns, sort)
@@ -127,6 +133,7 @@ function useColumnSort(
 
   return {
     columns: updatedColumns,
+    sort,
     sortColumn,
     getOriginalIndex,
     getCellContent: getCellContentSorted,
@@ -0,0 +1,236 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { renderHook } from "@testing-library/react-hooks"
+import { GridCell, GridCellKind } from "@glideapps/glide-data-grid"
+
+import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
+import { Arrow as ArrowProto } from "@streamlit/lib/src/proto"
+import { UNICODE } from "@streamlit/lib/src/mocks/arrow"
+import { mockEndpoints } from "@streamlit/lib/src/mocks/mocks"
+import {
+  BaseColumn,
+  TextColumn,
+  isErrorCell,
+  toGlideColumn,
+} from "@streamlit/lib/src/components/widgets/DataFrame/columns"
+
+import useDataPager, { hasDataPages, PAGE_SIZE } from "./useDataPager"
+
+// These columns are based on the UNICODE mock arrow table:
+const MOCK_COLUMNS: BaseColumn[] = [
+  TextColumn({
+    arrowType: { meta: null, numpy_type: "object", pandas_type: "unicode" },
+    id: "index-0",
+    name: "",
+    indexNumber: 0,
+    isEditable: false,
+    isHidden: false,
+    isIndex: true,
+    isStretched: false,
+    title: "",
+  }),
+  TextColumn({
+    arrowType: { meta: null, numpy_type: "object", pandas_type: "unicode" },
+    id: "column-c1-0",
+    name: "c1",
+    indexNumber: 1,
+    isEditable: false,
+    isHidden: false,
+    isIndex: false,
+    isStretched: false,
+    title: "c1",
+  }),
+]
+
+const DATA_URL = "/_stcore/dataframe/mockId"
+
+const PREVIEW_CELL: GridCell = {
+  kind: GridCellKind.Text,
+  data: "preview",
+  displayData: "preview",
+  allowOverlay: false,
+}
+
+function getPreviewCellContent(): GridCell {
+  return PREVIEW_CELL
+}
+
+function getCellValue(cell: GridCell, col = 1): any {
+  return MOCK_COLUMNS[col].getCellValue(cell)
+}
+
+describe("useDataPager hook", () => {
+  const element = ArrowProto.create({
+    data: UNICODE,
+    dataUrl: DATA_URL,
+    numRows: 3 * PAGE_SIZE,
+  })
+  const data = new Quiver(element)
+
+  it("uses the given getter for dataframes that were sent whole", () => {
+    const endpoints = mockEndpoints()
+    const wholeElement = ArrowProto.create({ data: UNICODE })
+    expect(hasDataPages(wholeElement, endpoints)).toBe(false)
+
+    const { result } = renderHook(() =>
+      useDataPager(
+        wholeElement,
+        data,
+        MOCK_COLUMNS,
+        undefined,
+        getPreviewCellContent,
+        jest.fn(),
+        endpoints
+      )
+    )
+
+    expect(result.current.getCellContent).toBe(getPreviewCellContent)
+    expect(endpoints.fetchDataframePage).not.toHaveBeenCalled()
+  })
+
+  it("needs endpoints that can fetch pages", () => {
+    expect(hasDataPages(element, undefined)).toBe(false)
+    expect(
+      hasDataPages(element, mockEndpoints({ fetchDataframePage: undefined }))
+    ).toBe(false)
+    expect(hasDataPages(element, mockEndpoints())).toBe(true)
+  })
+
+  it("uses the first rows of the element and fetches the others", async () => {
+    const endpoints = mockEndpoints({
+      fetchDataframePage: jest
+        .fn()
+        .mockResolvedValue({ data: UNICODE, numRows: 3 * PAGE_SIZE }),
+    })
+    const refreshCells = jest.fn()
+
+    const { result, waitFor } = renderHook(() =>
+      useDataPager(
+        element,
+        data,
+        MOCK_COLUMNS,
+        undefined,
+        getPreviewCellContent,
+        refreshCells,
+        endpoints
+      )
+    )
+
+    const { getCellContent } = result.current
+    expect(getCellContent([1, 0])).toBe(PREVIEW_CELL)
+    expect(getCellContent([1, 1])).toBe(PREVIEW_CELL)
+
+    // The row is shown as loading until its page is fetched:
+    expect(getCellContent([1, PAGE_SIZE + 1]).kind).toBe(GridCellKind.Loading)
+    expect(getCellContent([0, PAGE_SIZE]).kind).toBe(GridCellKind.Loading)
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledTimes(1)
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledWith(DATA_URL, {
+      offset: PAGE_SIZE,
+      limit: PAGE_SIZE,
+    })
+
+    await waitFor(() => expect(refreshCells).toHaveBeenCalled())
+
+    expect(refreshCells).toHaveBeenCalledTimes(1)
+    expect(refreshCells.mock.calls[0][0]).toHaveLength(
+      PAGE_SIZE * MOCK_COLUMNS.length
+    )
+    expect(refreshCells.mock.calls[0][0][0]).toEqual({ cell: [0, PAGE_SIZE] })
+
+    expect(getCellValue(getCellContent([0, PAGE_SIZE]), 0)).toBe("i1")
+    expect(getCellValue(getCellContent([1, PAGE_SIZE]))).toBe("foo")
+    expect(getCellValue(getCellContent([1, PAGE_SIZE + 1]))).toBe("bar")
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledTimes(1)
+  })
+
+  it("fetches all rows from the server if the table is sorted", async () => {
+    const endpoints = mockEndpoints({
+      fetchDataframePage: jest
+        .fn()
+        .mockResolvedValue({ data: UNICODE, numRows: 3 * PAGE_SIZE }),
+    })
+
+    const refreshCells = jest.fn()
+
+    const { result, rerender, waitFor } = renderHook(
+      ({ direction }: { direction: "asc" | "desc" }) =>
+        useDataPager(
+          element,
+          data,
+          MOCK_COLUMNS,
+          { column: toGlideColumn(MOCK_COLUMNS[1]), direction },
+          getPreviewCellContent,
+          refreshCells,
+          endpoints
+        ),
+      { initialProps: { direction: "asc" } }
+    )
+
+    expect(result.current.getCellContent([1, 0]).kind).toBe(
+      GridCellKind.Loading
+    )
+    expect(endpoints.fetchDataframePage).toHaveBeenLastCalledWith(DATA_URL, {
+      offset: 0,
+      limit: PAGE_SIZE,
+      sort: "c1",
+      order: "asc",
+    })
+
+    await waitFor(() => expect(refreshCells).toHaveBeenCalled())
+    expect(getCellValue(result.current.getCellContent([1, 0]))).toBe("foo")
+
+    // A different sort order needs other pages:
+    rerender({ direction: "desc" })
+    expect(result.current.getCellContent([1, 0]).kind).toBe(
+      GridCellKind.Loading
+    )
+    expect(endpoints.fetchDataframePage).toHaveBeenLastCalledWith(DATA_URL, {
+      offset: 0,
+      limit: PAGE_SIZE,
+      sort: "c1",
+      order: "desc",
+    })
+  })
+
+  it("shows an error for rows that can't be fetched", async () => {
+    const endpoints = mockEndpoints({
+      fetchDataframePage: jest.fn().mockRejectedValue(new Error("not found")),
+    })
+    const refreshCells = jest.fn()
+
+    const { result, waitFor } = renderHook(() =>
+      useDataPager(
+        element,
+        data,
+        MOCK_COLUMNS,
+        undefined,
+        getPreviewCellContent,
+        refreshCells,
+        endpoints
+      )
+    )
+
+    result.current.getCellContent([1, PAGE_SIZE])
+    await waitFor(() => expect(refreshCells).toHaveBeenCalled())
+
+    expect(isErrorCell(result.current.getCellContent([1, PAGE_SIZE]))).toBe(
+      true
+    )
+    // Failed pages aren't fetched again and again:
+    expect(endpoints.fetchDataframePage).toHaveBeenCalledTimes(1)
+  })
+})
@@ -0,0 +1,203 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import React from "react"
+
+import { GridCell, DataEditorProps } from "@glideapps/glide-data-grid"
+
+import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
+import { Arrow as ArrowProto } from "@streamlit/lib/src/proto"
+import { StreamlitEndpoints } from "@streamlit/lib/src/StreamlitEndpoints"
+import { logError } from "@streamlit/lib/src/util/log"
+
+import { getCellFromArrow } from "@streamlit/lib/src/components/widgets/DataFrame/arrowUtils"
+import {
+  BaseColumn,
+  getEmptyCell,
+  getErrorCell,
+} from "@streamlit/lib/src/components/widgets/DataFrame/columns"
+
+import { ColumnSortConfig } from "./useColumnSort"
+
+// The number of rows that are fetched from the server at once.
+export const PAGE_SIZE = 1000
+
+// A fetched page, the error that fetching it failed with,
+// or null while it's being fetched.
+type Page = Quiver | Error | null
+
+type DataPagerReturn = Pick<DataEditorProps, "getCellContent">
+
+/**
+ * Returns true if only the first rows of the dataframe were sent, and the
+ * remaining rows can be fetched from the server.
+ *
+ * @param element - The element's proto message
+ * @param endpoints - The endpoints to fetch the rows with
+ */
+export function hasDataPages(
+  element: ArrowProto,
+  endpoints: StreamlitEndpoints | undefined
+): boolean {
+  return (
+    Boolean(element.dataUrl) && endpoints?.fetchDataframePage !== undefined
+  )
+}
+
+/**
+ * Custom hook that loads the rows of a dataframe that were left on the server
+ * in pages, as they are displayed. If the table is sorted, all rows are
+ * loaded from the server in sorted order.
+ *
+ * Dataframes that were sent whole use the given cell content getter as-is.
+ *
+ * @param element - The element's proto message
+ * @param data - The Arrow data extracted from the proto message (the first rows)
+ * @param columns - The columns of the table
+ * @param sort - The current sorting configuration
+ * @param getCellContent - The cell content getter for the first rows
+ * @param refreshCells - Callback to redraw cells once their page is loaded
+ * @param endpoints - The endpoints to fetch the rows with
+ *
+ * @returns the cell content getter compatible with glide-data-grid.
+ */
+function useDataPager(
+  element: ArrowProto,
+  data: Quiver,
+  columns: BaseColumn[],
+  sort: ColumnSortConfig | undefined,
+  getCellContent: ([col, row]: readonly [number, number]) => GridCell,
+  refreshCells: (cells: { cell: [number, number] }[]) => void,
+  endpoints: StreamlitEndpoints | undefined
+): DataPagerReturn {
+  const isPaged = hasDataPages(element, endpoints)
+  const numPreviewRows = Math.max(0, data.dimensions.rows - 1)
+  const numRows = element.numRows
+  const { dataUrl } = element
+
+  // The server sorts by Arrow field name:
+  const sortedColumn = sort
+    ? columns.find(column => column.id === sort.column.id)
+    : undefined
+  const sortField = sortedColumn
+    ? data.fieldNames[sortedColumn.indexNumber] || undefined
+    : undefined
+  const sortOrder = sortField ? sort?.direction : undefined
+
+  // The pages of the current sort order, by page number.
+  const pages = React.useMemo(
+    () => new Map<number, Page>(),
+    // The pages need to be fetched again for a new dataframe or sort order.
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [dataUrl, sortField, sortOrder]
+  )
+
+  const fetchPage = React.useCallback(
+    (pageNumber: number) => {
+      if (!endpoints?.fetchDataframePage) {
+        return
+      }
+
+      pages.set(pageNumber, null)
+      const offset = pageNumber * PAGE_SIZE
+      endpoints
+        .fetchDataframePage(dataUrl, {
+          offset,
+          limit: PAGE_SIZE,
+          ...(sortField && { sort: sortField, order: sortOrder }),
+        })
+        .then(page => {
+          pages.set(pageNumber, new Quiver({ data: page.data }))
+        })
+        .catch(error => {
+          logError(error)
+          pages.set(
+            pageNumber,
+            error instanceof Error ? error : new Error(String(error))
+          )
+        })
+        .finally(() => {
+          // Only the cells that are currently visible are redrawn.
+          const cells: { cell: [number, number] }[] = []
+          const endRow = Math.min(offset + PAGE_SIZE, numRows)
+          for (let row = offset; row < endRow; row++) {
+            for (let col = 0; col < columns.length; col++) {
+              cells.push({ cell: [col, row] })
+            }
+          }
+          refreshCells(cells)
+        })
+    },
+    [
+      endpoints,
+      pages,
+      dataUrl,
+      sortField,
+      sortOrder,
+      numRows,
+      columns.length,
+      refreshCells,
+    ]
+  )
+
+  const getPagedCellContent = React.useCallback(
+    ([col, row]: readonly [number, number]): GridCell => {
+      // The first rows are part of the element, unless the table is sorted.
+      if (
+        (row < numPreviewRows && sortField === undefined) ||
+        col > columns.length - 1
+      ) {
+        return getCellContent([col, row])
+      }
+
+      const pageNumber = Math.floor(row / PAGE_SIZE)
+      const page = pages.get(pageNumber)
+      if (page === undefined) {
+        fetchPage(pageNumber)
+        return getEmptyCell()
+      }
+      if (page === null) {
+        return getEmptyCell()
+      }
+      if (page instanceof Error) {
+        return getErrorCell("Error during row loading.", page.message)
+      }
+
+      try {
+        const column = columns[col]
+        // Arrow has the header in first row
+        const arrowCell = page.getCell(
+          (row % PAGE_SIZE) + 1,
+          column.indexNumber
+        )
+        return getCellFromArrow(column, arrowCell)
+      } catch (error) {
+        logError(error)
+        return getErrorCell(
+          "Error during cell creation.",
+          `This should never happen. Please report this bug. \nError: ${error}`
+        )
+      }
+    },
+    [numPreviewRows, sortField, columns, pages, fetchPage, getCellContent]
+  )
+
+  return {
+    getCellContent: isPaged ? getPagedCellContent : getCellContent,
+  }
+}
+
+export default useDataPager
@@ -36,6 +36,7 @@ import {
   UINT64,
   UNICODE,
   // Special cases
+  COMPRESSED,
   EMPTY,
   MULTI,
   STYLER,
@@ -80,6 +81,22 @@ describe("Quiver", () => {
         const q = new Quiver(mockElement)
         expect(q.indexNames).toStrictEqual(["INDEX"])
       })
+
+      test("compressed data", () => {
+        const q = new Quiver({ data: COMPRESSED })
+        expect(q.getCell(1, 1).content).toBe("foo")
+        expect(q.getCell(2, 2).content).toBe("y")
+      })
+
+      test("fieldNames", () => {
+        expect(q.fieldNames).toStrictEqual(["__index_level_0__", "c1", "c2"])
+      })
+
+      test("fieldNames with a range index", () => {
+        const mockElement = { data: NAMED_INDEX }
+        const q = new Quiver(mockElement)
+        expect(q.fieldNames).toStrictEqual(["", "c1", "c2"])
+      })
     })
 
     describe("With Styler", () => {
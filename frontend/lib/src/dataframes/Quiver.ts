@@ -36,6 +36,7 @@ import numbro from "numbro"
 
 import { IArrow, Styler as StylerProto } from "@streamlit/lib/src/proto"
 import { notNullOrUndefined } from "@streamlit/lib/src/util/utils"
+import { decompressArrowIPC } from "@streamlit/lib/src/dataframes/arrowCompression"
 
 /** Data types used by ArrowJS. */
 export type DataType =
@@ -372,6 +373,9 @@ export class Quiver {
   /** DataFrame's index names. */
   private _indexNames: string[]
 
+  /** Arrow field names of DataFrame's index and data columns. */
+  private _fieldNames: string[]
+
   /** DataFrame's data. */
   private _data: Data
 
@@ -385,7 +389,7 @@ export class Quiver {
   private readonly _styler?: Styler
 
   constructor(element: IArrow) {
-    const table = tableFromIPC(element.data)
+    const table = tableFromIPC(decompressArrowIPC(element.data as Uint8Array))
     const schema = Quiver.parseSchema(table)
     const rawColumns = Quiver.getRawColumns(schema)
     const fields = Quiver.parseFields(table.schema)
@@ -393,6 +397,7 @@ export class Quiver {
     const index = Quiver.parseIndex(table, schema)
     const columns = Quiver.parseColumns(schema)
     const indexNames = Quiver.parseIndexNames(schema)
+    const fieldNames = Quiver.parseFieldNames(table, schema)
     const data = Quiver.parseData(table, columns, rawColumns)
     const types = Quiver.parseTypes(table, schema)
     const styler = element.styler
@@ -408,6 +413,7 @@ export class Quiver {
     this._fields = fields
     this._styler = styler
     this._indexNames = indexNames
+    this._fieldNames = fieldNames
   }
 
   /** Parse Arrow table's schema from a JSON string to an object. */
@@ -471,6 +477,32 @@ export class Quiver {
     })
   }
 
+  /**
+   * Parse the Arrow field names of DataFrame's index and data columns, in
+   * the same order as the index and data columns themselves. Range indices
+   * aren't stored in a field, so their field name is empty.
+   */
+  private static parseFieldNames(table: Table, schema: Schema): string[] {
+    const indexFieldNames = schema.index_columns
+      .map(indexName => {
+        if (Quiver.isRangeIndex(indexName)) {
+          return ""
+        }
+
+        // Null indices are skipped, like in parseIndex.
+        const column = table.getChild(indexName as string)
+        if (column instanceof Vector && column.type instanceof Null) {
+          return null
+        }
+        return indexName as string
+      })
+      .filter((fieldName: string | null): fieldName is string => {
+        return fieldName !== null
+      })
+
+    return [...indexFieldNames, ...Quiver.getRawColumns(schema)]
+  }
+
   /** Parse DataFrame's column header values. */
   private static parseColumns(schema: Schema): Columns {
     // If DataFrame `columns` has multi-level indexing, the length of
@@ -1090,6 +1122,14 @@ but was expecting \`${JSON.stringify(expectedIndexTypes)}\`.
     return this._indexNames
   }
 
+  /**
+   * Arrow field names of DataFrame's index and data columns, in the order of
+   * the columns' position. Range indices have an empty field name.
+   */
+  public get fieldNames(): string[] {
+    return this._fieldNames
+  }
+
   /** DataFrame's column labels (matrix of column names). */
   public get columns(): Columns {
     return this._columns
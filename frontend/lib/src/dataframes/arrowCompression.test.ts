@@ -0,0 +1,52 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { tableFromIPC } from "apache-arrow"
+
+import { COMPRESSED, UNICODE } from "@streamlit/lib/src/mocks/arrow"
+
+import { decompressArrowIPC } from "./arrowCompression"
+
+describe("decompressArrowIPC", () => {
+  it("returns uncompressed streams as they are", () => {
+    expect(decompressArrowIPC(UNICODE)).toBe(UNICODE)
+  })
+
+  it("decompresses record batches and dictionaries", () => {
+    // apache-arrow can't read compressed buffers itself:
+    expect(() => tableFromIPC(COMPRESSED)).toThrow()
+
+    const table = tableFromIPC(decompressArrowIPC(COMPRESSED))
+    expect(table.numRows).toBe(2)
+    expect(table.getChild("c1")?.get(0)).toBe("foo")
+    expect(table.getChild("c1")?.get(1)).toBe("bar")
+    expect(table.getChild("c2")?.get(0)).toBe("x")
+    expect(table.getChild("c2")?.get(1)).toBe("y")
+    expect(table.getChild("__index_level_0__")?.get(1)).toBe("i2")
+  })
+
+  it("removes the compression from the stream", () => {
+    const decompressed = decompressArrowIPC(COMPRESSED)
+    expect(decompressArrowIPC(decompressed)).toBe(decompressed)
+  })
+
+  it("decompresses streams that are part of a larger buffer", () => {
+    const buffer = new Uint8Array(COMPRESSED.length + 16)
+    buffer.set(COMPRESSED, 8)
+    const data = buffer.subarray(8, 8 + COMPRESSED.length)
+    expect(decompressArrowIPC(data)).toEqual(decompressArrowIPC(COMPRESSED))
+  })
+})
@@ -0,0 +1,266 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { decompressLz4Frame } from "@streamlit/lib/src/dataframes/lz4"
+
+// apache-arrow can't read IPC streams with compressed buffers (which the
+// server sends if `server.arrowCompression` is set), so their record batches
+// are decompressed into an uncompressed stream first. The message metadata
+// is read and rewritten in place, as flatbuffers. See
+// https://arrow.apache.org/docs/format/Columnar.html#serialization-and-interprocess-communication-ipc
+// and https://github.com/apache/arrow/blob/main/format/Message.fbs
+
+const CONTINUATION_MARKER = 0xffffffff
+
+// Message fields (a union takes two fields: its type and its value):
+const MESSAGE_HEADER_TYPE = 1
+const MESSAGE_HEADER = 2
+const MESSAGE_BODY_LENGTH = 3
+
+// MessageHeader union types:
+const DICTIONARY_BATCH = 2
+const RECORD_BATCH = 3
+
+// DictionaryBatch fields:
+const DICTIONARY_BATCH_DATA = 1
+
+// RecordBatch fields:
+const RECORD_BATCH_BUFFERS = 2
+const RECORD_BATCH_COMPRESSION = 3
+
+// BodyCompression fields and codecs:
+const BODY_COMPRESSION_CODEC = 0
+const LZ4_FRAME = 0
+
+// Buffer structs are an offset and a length, both 64-bit.
+const BUFFER_SIZE = 16
+
+// Compressed buffers start with their uncompressed length, which is -1 if
+// the buffer was left uncompressed.
+const UNCOMPRESSED_LENGTH_SIZE = 8
+const NOT_COMPRESSED = -1
+
+// Message metadata and body buffers are padded to multiples of 8 bytes.
+const ALIGNMENT = 8
+
+function align(value: number, alignment: number): number {
+  return Math.ceil(value / alignment) * alignment
+}
+
+function getDataView(data: Uint8Array): DataView {
+  return new DataView(data.buffer, data.byteOffset, data.byteLength)
+}
+
+// 64-bit integers are read into numbers, since no buffer is anywhere near
+// 2^53 bytes long.
+function getInt64(view: DataView, pos: number): number {
+  return view.getInt32(pos + 4, true) * 2 ** 32 + view.getUint32(pos, true)
+}
+
+function setInt64(view: DataView, pos: number, value: number): void {
+  view.setUint32(pos, value % 2 ** 32, true)
+  view.setInt32(pos + 4, Math.floor(value / 2 ** 32), true)
+}
+
+/** Return the position of a flatbuffer table's field, or 0 if it isn't set. */
+function getField(view: DataView, table: number, field: number): number {
+  const vtable = table - view.getInt32(table, true)
+  const slot = 4 + 2 * field
+  if (slot >= view.getUint16(vtable, true)) {
+    return 0
+  }
+  const offset = view.getUint16(vtable + slot, true)
+  return offset === 0 ? 0 : table + offset
+}
+
+/** Return the position of the table or vector that a field refers to. */
+function getIndirect(view: DataView, pos: number): number {
+  return pos + view.getUint32(pos, true)
+}
+
+/** Return the position of the RecordBatch table of a message, if it has one. */
+function getRecordBatch(view: DataView, message: number): number | undefined {
+  const headerTypePos = getField(view, message, MESSAGE_HEADER_TYPE)
+  const headerPos = getField(view, message, MESSAGE_HEADER)
+  if (headerTypePos === 0 || headerPos === 0) {
+    return undefined
+  }
+
+  const headerType = view.getUint8(headerTypePos)
+  if (headerType === RECORD_BATCH) {
+    return getIndirect(view, headerPos)
+  }
+  if (headerType === DICTIONARY_BATCH) {
+    const dataPos = getField(
+      view,
+      getIndirect(view, headerPos),
+      DICTIONARY_BATCH_DATA
+    )
+    return dataPos === 0 ? undefined : getIndirect(view, dataPos)
+  }
+  return undefined
+}
+
+/**
+ * Decompress the buffers of a message with a compressed record batch.
+ *
+ * @return the new message, or undefined if the message isn't compressed.
+ */
+function decompressMessage(
+  metadata: Uint8Array,
+  body: Uint8Array
+): Uint8Array[] | undefined {
+  const view = getDataView(metadata)
+  const message = view.getUint32(0, true)
+  const recordBatch = getRecordBatch(view, message)
+  if (recordBatch === undefined) {
+    return undefined
+  }
+  const compressionPos = getField(view, recordBatch, RECORD_BATCH_COMPRESSION)
+  if (compressionPos === 0) {
+    return undefined
+  }
+
+  const codecPos = getField(
+    view,
+    getIndirect(view, compressionPos),
+    BODY_COMPRESSION_CODEC
+  )
+  if (codecPos !== 0 && view.getInt8(codecPos) !== LZ4_FRAME) {
+    throw new Error("Only LZ4 compressed Arrow data is supported.")
+  }
+
+  // The record batch gets a copy of its vtable without the compression
+  // field, since vtables can be shared by several tables.
+  const vtable = recordBatch - view.getInt32(recordBatch, true)
+  const vtableSize = view.getUint16(vtable, true)
+  const newVtable = align(metadata.length, 2)
+  const newMetadata = new Uint8Array(align(newVtable + vtableSize, ALIGNMENT))
+  newMetadata.set(metadata)
+  newMetadata.set(metadata.subarray(vtable, vtable + vtableSize), newVtable)
+  const newView = getDataView(newMetadata)
+  newView.setUint16(newVtable + 4 + 2 * RECORD_BATCH_COMPRESSION, 0, true)
+  newView.setInt32(recordBatch, recordBatch - newVtable, true)
+
+  const buffersPos = getField(view, recordBatch, RECORD_BATCH_BUFFERS)
+  const buffers = buffersPos === 0 ? 0 : getIndirect(view, buffersPos)
+  const numBuffers = buffers === 0 ? 0 : view.getUint32(buffers, true)
+
+  const bodyView = getDataView(body)
+  const decompressedBuffers: Uint8Array[] = []
+  const offsets: number[] = []
+  let bodyLength = 0
+  for (let i = 0; i < numBuffers; i++) {
+    const bufferPos = buffers + 4 + i * BUFFER_SIZE
+    const offset = getInt64(view, bufferPos)
+    const length = getInt64(view, bufferPos + 8)
+
+    let buffer = body.subarray(offset, offset + length)
+    if (length > 0) {
+      const uncompressedLength = getInt64(bodyView, offset)
+      buffer = buffer.subarray(UNCOMPRESSED_LENGTH_SIZE)
+      if (uncompressedLength !== NOT_COMPRESSED) {
+        buffer = decompressLz4Frame(buffer, uncompressedLength)
+      }
+    }
+
+    setInt64(newView, bufferPos, bodyLength)
+    setInt64(newView, bufferPos + 8, buffer.length)
+    decompressedBuffers.push(buffer)
+    offsets.push(bodyLength)
+    bodyLength = align(bodyLength + buffer.length, ALIGNMENT)
+  }
+
+  const newBody = new Uint8Array(bodyLength)
+  decompressedBuffers.forEach((buffer, i) => newBody.set(buffer, offsets[i]))
+
+  const bodyLengthPos = getField(view, message, MESSAGE_BODY_LENGTH)
+  if (bodyLengthPos !== 0) {
+    setInt64(newView, bodyLengthPos, bodyLength)
+  }
+
+  const prefix = new Uint8Array(8)
+  const prefixView = getDataView(prefix)
+  prefixView.setUint32(0, CONTINUATION_MARKER, true)
+  prefixView.setInt32(4, newMetadata.length, true)
+  return [prefix, newMetadata, newBody]
+}
+
+/**
+ * Decompress the buffers of an Arrow IPC stream, so that apache-arrow can
+ * read it. Streams without compressed buffers are returned as they are.
+ *
+ * @param data The Arrow IPC stream.
+ *
+ * @return the IPC stream without compressed buffers.
+ */
+export function decompressArrowIPC(data: Uint8Array): Uint8Array {
+  const view = getDataView(data)
+  const messages: Uint8Array[] = []
+  let isCompressed = false
+
+  let pos = 0
+  while (pos + 4 <= data.length) {
+    const start = pos
+    // Messages start with a continuation marker, except in streams that
+    // were written before Arrow 0.15.
+    if (view.getUint32(pos, true) === CONTINUATION_MARKER) {
+      pos += 4
+    }
+    const metadataLength = pos + 4 <= data.length ? view.getInt32(pos, true) : 0
+    pos += 4
+    if (metadataLength <= 0) {
+      // End of the stream.
+      messages.push(data.subarray(start))
+      break
+    }
+
+    const metadata = data.subarray(pos, pos + metadataLength)
+    pos += metadataLength
+    const metadataView = getDataView(metadata)
+    const bodyLengthPos = getField(
+      metadataView,
+      metadataView.getUint32(0, true),
+      MESSAGE_BODY_LENGTH
+    )
+    const bodyLength =
+      bodyLengthPos === 0 ? 0 : getInt64(metadataView, bodyLengthPos)
+    const body = data.subarray(pos, pos + bodyLength)
+    pos += bodyLength
+
+    const decompressedMessage = decompressMessage(metadata, body)
+    if (decompressedMessage === undefined) {
+      messages.push(data.subarray(start, pos))
+    } else {
+      messages.push(...decompressedMessage)
+      isCompressed = true
+    }
+  }
+
+  if (!isCompressed) {
+    return data
+  }
+
+  const result = new Uint8Array(
+    messages.reduce((length, message) => length + message.length, 0)
+  )
+  let resultPos = 0
+  messages.forEach(message => {
+    result.set(message, resultPos)
+    resultPos += message.length
+  })
+  return result
+}
@@ -0,0 +1,134 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { decompressLz4Frame } from "./lz4"
+
+// LZ4 frames, as compressed by pyarrow.compress(data, codec="lz4").
+
+// b"ab" * 50, which is compressed to a match that overlaps itself.
+const REPEATED = new Uint8Array([
+  4, 34, 77, 24, 96, 64, 130, 12, 0, 0, 0, 47, 97, 98, 2, 0, 74, 80, 98, 97, 98,
+  97, 98, 0, 0, 0, 0,
+])
+
+// b"hello", which is stored in an uncompressed block.
+const SHORT = new Uint8Array([
+  4, 34, 77, 24, 96, 64, 130, 5, 0, 0, 128, 104, 101, 108, 108, 111, 0, 0, 0, 0,
+])
+
+// Random bytes, which are stored in an uncompressed block.
+const RANDOM_DATA = new Uint8Array([
+  68, 32, 130, 60, 253, 230, 241, 194, 107, 48, 249, 14, 199, 221, 1, 228, 136,
+  117, 52, 162, 15, 11, 13, 4, 195, 110, 216, 14, 113, 224, 253, 119, 176, 118,
+  112, 235, 148, 11, 213, 51,
+])
+const RANDOM = new Uint8Array([
+  4, 34, 77, 24, 96, 64, 130, 40, 0, 0, 128, 68, 32, 130, 60, 253, 230, 241,
+  194, 107, 48, 249, 14, 199, 221, 1, 228, 136, 117, 52, 162, 15, 11, 13, 4,
+  195, 110, 216, 14, 113, 224, 253, 119, 176, 118, 112, 235, 148, 11, 213, 51,
+  0, 0, 0, 0,
+])
+
+// bytes(i % 251 for i in range(70_000)), which takes two blocks. The second
+// one refers to the first one.
+const BLOCKS = new Uint8Array([
+  4, 34, 77, 24, 64, 64, 192, 5, 2, 0, 0, 255, 236, 0, 1, 2, 3, 4, 5, 6, 7, 8,
+  9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28,
+  29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47,
+  48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66,
+  67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+  86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103,
+  104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118,
+  119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133,
+  134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148,
+  149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163,
+  164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+  179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193,
+  194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208,
+  209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223,
+  224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234, 235, 236, 237, 238,
+  239, 240, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 0, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 236, 80, 20,
+  21, 22, 23, 24, 27, 0, 0, 0, 15, 231, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 105, 80, 217, 218, 219, 220,
+  221, 0, 0, 0, 0,
+])
+
+describe("decompressLz4Frame", () => {
+  it("decompresses matches", () => {
+    expect(decompressLz4Frame(REPEATED, 100)).toEqual(
+      new TextEncoder().encode("ab".repeat(50))
+    )
+  })
+
+  it("decompresses uncompressed blocks", () => {
+    expect(decompressLz4Frame(SHORT, 5)).toEqual(
+      new TextEncoder().encode("hello")
+    )
+    expect(decompressLz4Frame(RANDOM, 40)).toEqual(RANDOM_DATA)
+  })
+
+  it("decompresses linked blocks", () => {
+    expect(decompressLz4Frame(BLOCKS, 70000)).toEqual(
+      Uint8Array.from({ length: 70000 }, (_, i) => i % 251)
+    )
+  })
+
+  it("decompresses a frame that is part of a larger buffer", () => {
+    const buffer = new Uint8Array(REPEATED.length + 16)
+    buffer.set(REPEATED, 8)
+    expect(
+      decompressLz4Frame(buffer.subarray(8, 8 + REPEATED.length), 100)
+    ).toEqual(new TextEncoder().encode("ab".repeat(50)))
+  })
+
+  it("throws for data that isn't an LZ4 frame", () => {
+    expect(() => decompressLz4Frame(new Uint8Array(16), 0)).toThrow(
+      "The data isn't an LZ4 frame."
+    )
+  })
+
+  it("throws if the size doesn't match", () => {
+    expect(() => decompressLz4Frame(REPEATED, 99)).toThrow(
+      "The LZ4 frame is corrupt."
+    )
+    expect(() => decompressLz4Frame(REPEATED, 101)).toThrow(
+      "The LZ4 frame is corrupt."
+    )
+  })
+
+  it("throws for truncated frames", () => {
+    expect(() =>
+      decompressLz4Frame(BLOCKS.subarray(0, BLOCKS.length - 20), 70000)
+    ).toThrow("The LZ4 frame is corrupt.")
+  })
+})
@@ -0,0 +1,182 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Decoder for the LZ4 frame format, which Arrow IPC buffers are compressed
+// with. See https://github.com/lz4/lz4/blob/dev/doc/lz4_Frame_format.md
+// and https://github.com/lz4/lz4/blob/dev/doc/lz4_Block_format.md
+
+const FRAME_MAGIC_NUMBER = 0x184d2204
+
+// Frame descriptor flags:
+const FLAG_VERSION_SHIFT = 6
+const FLAG_BLOCK_CHECKSUM = 0x10
+const FLAG_CONTENT_SIZE = 0x08
+const FLAG_DICTIONARY_ID = 0x01
+
+// The highest bit of a block's size is set if the block isn't compressed.
+const BLOCK_UNCOMPRESSED = 0x80000000
+
+const MIN_MATCH_LENGTH = 4
+
+function corruptFrameError(): Error {
+  return new Error("The LZ4 frame is corrupt.")
+}
+
+/**
+ * Decompress the LZ4 block between `start` and `end` of `input`, into
+ * `output` from `outputPos` on. Matches can refer to the output of
+ * earlier blocks of the same frame.
+ *
+ * @return the position in `output` after the block.
+ */
+function decompressBlock(
+  input: Uint8Array,
+  start: number,
+  end: number,
+  output: Uint8Array,
+  outputPos: number
+): number {
+  let pos = start
+
+  // Lengths of 15 continue in the following bytes, as long as they are 255.
+  const readLength = (length: number): number => {
+    if (length !== 15) {
+      return length
+    }
+
+    let byte
+    do {
+      if (pos >= end) {
+        throw corruptFrameError()
+      }
+      byte = input[pos++]
+      length += byte
+    } while (byte === 255)
+    return length
+  }
+
+  while (pos < end) {
+    const token = input[pos++]
+
+    const literalLength = readLength(token >> 4)
+    if (
+      pos + literalLength > end ||
+      outputPos + literalLength > output.length
+    ) {
+      throw corruptFrameError()
+    }
+    output.set(input.subarray(pos, pos + literalLength), outputPos)
+    pos += literalLength
+    outputPos += literalLength
+
+    if (pos === end) {
+      // The last sequence of a block only has literals.
+      break
+    }
+
+    if (pos + 2 > end) {
+      throw corruptFrameError()
+    }
+    const offset = input[pos] | (input[pos + 1] << 8)
+    pos += 2
+
+    const matchLength = readLength(token & 0x0f) + MIN_MATCH_LENGTH
+    if (
+      offset === 0 ||
+      offset > outputPos ||
+      outputPos + matchLength > output.length
+    ) {
+      throw corruptFrameError()
+    }
+
+    let matchPos = outputPos - offset
+    if (offset >= matchLength) {
+      output.copyWithin(outputPos, matchPos, matchPos + matchLength)
+      outputPos += matchLength
+    } else {
+      // The match overlaps the bytes that it's copied to, which repeats them.
+      for (let i = 0; i < matchLength; i++) {
+        output[outputPos++] = output[matchPos++]
+      }
+    }
+  }
+  return outputPos
+}
+
+/**
+ * Decompress an LZ4 frame. Checksums aren't verified.
+ *
+ * @param input The LZ4 frame.
+ * @param size The size of the decompressed data.
+ *
+ * @return the decompressed data.
+ */
+export function decompressLz4Frame(
+  input: Uint8Array,
+  size: number
+): Uint8Array {
+  const view = new DataView(input.buffer, input.byteOffset, input.byteLength)
+  if (input.length < 7 || view.getUint32(0, true) !== FRAME_MAGIC_NUMBER) {
+    throw new Error("The data isn't an LZ4 frame.")
+  }
+
+  const flags = input[4]
+  if (flags >> FLAG_VERSION_SHIFT !== 1) {
+    throw new Error("The LZ4 frame has an unsupported version.")
+  }
+  if (flags & FLAG_DICTIONARY_ID) {
+    throw new Error("LZ4 frames with dictionaries aren't supported.")
+  }
+
+  // Skip the magic number, the flags, the block descriptor, the optional
+  // content size and the header checksum.
+  let pos = 7 + (flags & FLAG_CONTENT_SIZE ? 8 : 0)
+  const blockChecksumSize = flags & FLAG_BLOCK_CHECKSUM ? 4 : 0
+
+  const output = new Uint8Array(size)
+  let outputPos = 0
+  for (;;) {
+    if (pos + 4 > input.length) {
+      throw corruptFrameError()
+    }
+    const blockSize = view.getUint32(pos, true)
+    pos += 4
+    if (blockSize === 0) {
+      // End mark, which is followed by the optional content checksum.
+      break
+    }
+
+    const length = blockSize & ~BLOCK_UNCOMPRESSED
+    if (pos + length > input.length) {
+      throw corruptFrameError()
+    }
+    if (blockSize & BLOCK_UNCOMPRESSED) {
+      if (outputPos + length > size) {
+        throw corruptFrameError()
+      }
+      output.set(input.subarray(pos, pos + length), outputPos)
+      outputPos += length
+    } else {
+      outputPos = decompressBlock(input, pos, pos + length, output, outputPos)
+    }
+    pos += length + blockChecksumSize
+  }
+
+  if (outputPos !== size) {
+    throw corruptFrameError()
+  }
+  return output
+}
@@ -24,7 +24,11 @@ export { default as VerticalBlock } from "./components/core/Block"
 export { default as ElementNodeRenderer } from "./components/core/Block/ElementNodeRenderer"
 export type { ElementNodeRendererProps } from "./components/core/Block/ElementNodeRenderer"
 export type { BlockPropsWithoutWidth } from "./components/core/Block"
-export type { StreamlitEndpoints } from "./StreamlitEndpoints"
+export type {
+  StreamlitEndpoints,
+  DataframePage,
+  DataframePageRequest,
+} from "./StreamlitEndpoints"
 export { SessionInfo } from "./SessionInfo"
 export { ScriptRunState } from "./ScriptRunState"
 export { WidgetStateManager, createFormsData } from "./WidgetStateManager"
@@ -31,6 +31,7 @@ import { RANGE } from "./types/range"
 import { UINT64 } from "./types/uint64"
 import { UNICODE } from "./types/unicode"
 import { EMPTY } from "./empty"
+import { COMPRESSED } from "./compressed"
 import { MULTI } from "./multi"
 import { NAMED_INDEX } from "./namedIndex"
 import { STYLER, DISPLAY_VALUES } from "./styler"
@@ -61,6 +62,7 @@ export {
   UNICODE,
   // Special cases
   EMPTY,
+  COMPRESSED,
   MULTI,
   STYLER,
   DISPLAY_VALUES,
@@ -65,6 +65,9 @@ export function mockEndpoints(
     fetchCachedForwardMsg: jest
       .fn()
       .mockRejectedValue(new Error("unimplemented mock endpoint")),
+    fetchDataframePage: jest
+      .fn()
+      .mockRejectedValue(new Error("unimplemented mock endpoint")),
     ...overrides,
   }
 }
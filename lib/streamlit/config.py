@@ -525,6 +525,22 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "runner.asyncInterrupt",
+    description="""
+        Interrupt a running script as soon as it's stopped or rerun, by
+        raising an exception in the script's thread. Without this, a script
+        is only interrupted when it next calls a Streamlit command (unless
+        runner.installTracer is set). Unlike runner.installTracer, this
+        doesn't slow down your script's execution.
+
+        Calls into native code, such as time.sleep, are not interrupted.
+        Requires CPython.
+        """,
+    default_val=False,
+    type_=bool,
+)
+
 _create_option(
     "runner.fixMatplotlib",
     description="""
@@ -567,11 +583,80 @@ _create_option(
         Some execution environments may require serializing all data in Session
         State, so it may be useful to detect incompatibility during development,
         or when the execution environment will stop supporting it in the future.
+        Values are checked when they're assigned, so a value that's mutated in
+        place is checked again the next time it's assigned to Session State.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
+_create_option(
+    "runner.workerProcesses",
+    description="""
+        Number of worker processes to run app scripts in. When set to 0, all
+        scripts run in threads of the server process, which means that a
+        CPU-bound app can use at most one CPU core. When greater than 0, each
+        session is assigned to one of this many worker processes, which holds
+        its Session State and runs its script. Note that st.cache_data and
+        st.cache_resource caches are not shared between worker processes.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.traceSampleRate",
+    description="""
+        The fraction of reruns to trace, between 0.0 and 1.0. Each traced
+        rerun records how long it was queued, ran, and took to send its
+        messages, with its st commands and cached function calls. Traces are
+        exported to runner.traceExportTarget, in the OpenTelemetry (OTLP)
+        JSON format. Set to 0.0 to disable tracing.
+    """,
+    default_val=0.0,
+    type_=float,
+)
+
+_create_option(
+    "runner.traceExportTarget",
+    description="""
+        Where to export traces to: the path of a file that each trace is
+        appended to as a line of OTLP JSON, or the http(s) URL of an OTLP/HTTP
+        collector (e.g. "http://localhost:4318/v1/traces"). Tracing is
+        disabled if this isn't set.
+    """,
+    default_val="",
+)
+
+_create_option(
+    "runner.profile",
+    description="""
+        Profile each script run with a sampling profiler. The profiles of a
+        session's latest runs, with the time spent in each st command, are
+        served on /_stcore/profile/<session_id>, and can be downloaded as
+        speedscope or collapsed-stack flamegraphs. This slows down scripts
+        a little, so it's meant to be used only while developing an app.
+        Scripts that run in worker processes aren't profiled.
     """,
     default_val=False,
     type_=bool,
 )
 
+_create_option(
+    "runner.rerunDebounceDelay",
+    description="""
+        The minimum time between the reruns that a session's widget changes
+        request, in seconds. Rerun requests that arrive sooner are held, and
+        are coalesced with the requests that follow them, so that a burst of
+        widget changes reruns the script once, with the latest widget values.
+        Requests that press a button or don't change any widget's value are
+        never held. Sliders can override this with their `debounce`
+        argument. Set to 0.0 to rerun on every request.
+    """,
+    default_val=0.0,
+    type_=float,
+)
+
 # Config Section: Server #
 
 _create_section("server", "Settings for the Streamlit server")
@@ -734,6 +819,66 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.maxSessionUploadSize",
+    description="""
+        Max total size, in megabytes, of the files that a single session can
+        have uploaded with the file_uploader and camera_input at a time.
+
+        When uploaded files are stored in memory, uploads that would go over
+        it fail. When they're stored on disk (see
+        server.uploadedFileStorage), the session's least recently used files
+        are removed to make room for new ones.
+
+        Set to 0 for no limit.
+        """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "server.uploadedFileStorage",
+    description="""
+        Where to store the files uploaded with the file_uploader and
+        camera_input.
+
+        Allowed values:
+        * "memory" : Keep files in memory, or in temporary files for large
+                     ones.
+        * "disk"   : Write files to disk. The least recently used files are
+                     removed when server.maxUploadedFileStorageSize or
+                     server.maxSessionUploadSize is reached.
+        """,
+    default_val="memory",
+    type_=str,
+)
+
+_create_option(
+    "server.uploadedFileDirectory",
+    description="""
+        The directory to store uploaded files in when
+        server.uploadedFileStorage is "disk". Each server creates its own
+        subdirectory in it, and removes it on shutdown.
+
+        Defaults to the system's temporary directory.
+        """,
+    default_val=None,
+    type_=str,
+)
+
+_create_option(
+    "server.maxUploadedFileStorageSize",
+    description="""
+        Max total size, in megabytes, of the uploaded files of all sessions
+        when server.uploadedFileStorage is "disk". The least recently used
+        files are removed to make room for new ones.
+
+        Set to 0 for no limit.
+        """,
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "server.maxMessageSize",
     description="""
@@ -743,6 +888,60 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.mediaFileStorage",
+    description="""
+        Where to store the media files (images, audio, video and files for
+        st.download_button) that apps display.
+
+        Allowed values:
+        * "memory" : Keep files in memory.
+        * "disk"   : Write files to disk, and serve them from memory-mapped
+                     files. Use this to keep the memory usage of apps that
+                     display large videos or downloads low.
+        """,
+    default_val="memory",
+    type_=str,
+)
+
+_create_option(
+    "server.mediaFileDirectory",
+    description="""
+        The directory to store media files in when server.mediaFileStorage
+        is "disk". Each server creates its own subdirectory in it, and
+        removes it on shutdown.
+
+        Defaults to the system's temporary directory.
+        """,
+    default_val=None,
+    type_=str,
+)
+
+_create_option(
+    "server.mediaFileMemoryCacheSize",
+    description="""
+        Max size, in megabytes, of the recently added media files that are
+        also kept in memory when server.mediaFileStorage is "disk".
+
+        Set to 0 to always serve media files from disk.
+        """,
+    default_val=50,
+    type_=int,
+)
+
+_create_option(
+    "server.dataframePreviewRows",
+    description="""
+        Send only this many rows of a larger dataframe displayed with
+        st.dataframe. The remaining rows stay on the server and are fetched
+        in pages as the table is scrolled.
+
+        Set to 0 to always send whole dataframes.
+        """,
+    default_val=0,
+    type_=int,
+)
+
 _create_option(
     "server.enableWebsocketCompression",
     description="""
@@ -752,6 +951,34 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.messageOffloadSize",
+    description="""
+        Messages that are at least this large, in megabytes, are hashed on a
+        thread pool rather than on the server's event loop, so that sending
+        them holds up other sessions less.
+
+        Set to 0 to hash all messages on the event loop.
+        """,
+    default_val=1.0,
+    type_=float,
+)
+
+_create_option(
+    "server.arrowCompression",
+    description="""
+        Compress the buffers of the Arrow data that dataframes, tables and
+        charts are sent with. Small tables are always sent uncompressed.
+
+        Allowed values:
+        * "none" : Don't compress Arrow data.
+        * "lz4"  : Compress Arrow data with LZ4 (frame format). Fast, with a
+                   moderate compression ratio.
+        """,
+    default_val="none",
+    type_=str,
+)
+
 _create_option(
     "server.enableStaticServing",
     description="""
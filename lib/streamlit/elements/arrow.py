@@ -19,7 +19,7 @@ from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union, ca
 import pyarrow as pa
 from typing_extensions import TypeAlias
 
-from streamlit import type_util
+from streamlit import config, runtime, type_util
 from streamlit.elements.lib.column_config_utils import (
     INDEX_IDENTIFIER,
     ColumnConfigMappingInput,
@@ -30,6 +30,7 @@ from streamlit.elements.lib.column_config_utils import (
 )
 from streamlit.elements.lib.pandas_styler_utils import marshall_styler
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+from streamlit.runtime.dataframe_window_manager import materialize_range_index
 from streamlit.runtime.metrics_util import gather_metrics
 
 if TYPE_CHECKING:
@@ -203,7 +204,7 @@ class ArrowMixin:
 
         if isinstance(data, pa.Table):
             # For pyarrow tables, we can just serialize the table directly
-            proto.data = type_util.pyarrow_table_to_bytes(data)
+            _marshall_table(proto, data, self.dg._get_delta_path_str())
         else:
             # For all other data formats, we need to convert them to a pandas.DataFrame
             # thereby, we also apply some data specific configs
@@ -228,7 +229,16 @@ class ArrowMixin:
                 check_arrow_compatibility=False,
             )
             # Serialize the data to bytes:
-            proto.data = type_util.data_frame_to_bytes(data_df)
+            if type_util.is_pandas_styler(data):
+                # The Styler's display values and styles cover all rows, so
+                # a styled dataframe is always sent whole.
+                proto.data = type_util.data_frame_to_bytes(data_df)
+            else:
+                _marshall_table(
+                    proto,
+                    type_util.data_frame_to_arrow_table(data_df),
+                    self.dg._get_delta_path_str(),
+                )
 
         if hide_index is not None:
             update_column_config(
@@ -373,3 +383,23 @@ def marshall(proto: ArrowProto, data: Data, default_uuid: Optional[str] = None)
     else:
         df = type_util.convert_anything_to_df(data)
         proto.data = type_util.data_frame_to_bytes(df)
+
+
+def _marshall_table(proto: ArrowProto, table: pa.Table, coordinates: str) -> None:
+    """Serialize a table into an Arrow proto.
+
+    If the table has more rows than `server.dataframePreviewRows`, only its
+    first rows are serialized, and the whole table is left with the Runtime's
+    DataframeWindowManager, which serves the remaining rows in pages.
+    """
+    preview_rows = config.get_option("server.dataframePreviewRows")
+    dataframe_window_mgr = (
+        runtime.get_instance().dataframe_window_mgr if runtime.exists() else None
+    )
+    if 0 < preview_rows < table.num_rows and dataframe_window_mgr is not None:
+        table = materialize_range_index(table)
+        proto.data_url = dataframe_window_mgr.add(table, coordinates)
+        proto.num_rows = table.num_rows
+        table = table.slice(0, preview_rows)
+
+    proto.data = type_util.pyarrow_table_to_bytes(table)
@@ -34,7 +34,9 @@ from typing import (
     cast,
 )
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pandas.api.types import infer_dtype, is_integer_dtype
 from typing_extensions import Literal
 
@@ -49,6 +51,11 @@ from streamlit.color_util import (
 )
 from streamlit.elements.altair_utils import AddRowsMetadata
 from streamlit.elements.arrow import Data
+from streamlit.elements.lib.downsampling import (
+    DOWNSAMPLE_METHODS,
+    DownsampleMethod,
+    downsample_series,
+)
 from streamlit.elements.utils import last_index_for_melted_dataframes
 from streamlit.errors import Error, StreamlitAPIException
 from streamlit.proto.ArrowVegaLiteChart_pb2 import (
@@ -58,6 +65,7 @@ from streamlit.runtime.metrics_util import gather_metrics
 
 if TYPE_CHECKING:
     import altair as alt
+    import numpy.typing as npt
 
     from streamlit.delta_generator import DeltaGenerator
 
@@ -99,6 +107,17 @@ SEPARATED_INDEX_COLUMN_NAME = SEPARATED_INDEX_COLUMN_TITLE + PROTECTION_SUFFIX
 MELTED_Y_COLUMN_NAME = MELTED_Y_COLUMN_TITLE + PROTECTION_SUFFIX
 MELTED_COLOR_COLUMN_NAME = MELTED_COLOR_COLUMN_TITLE + PROTECTION_SUFFIX
 
+# The number of pixels that downsampled charts without an explicit width are
+# assumed to be wide.
+DOWNSAMPLE_DEFAULT_WIDTH = 1000
+
+# The number of rows of a pyarrow table that chart encodings are inferred from.
+_ARROW_ENCODING_SAMPLE_ROWS = 1000
+
+# If the rows of a color column's series are split into more runs than this,
+# the rows are grouped by color instead of by run.
+_MAX_CONSECUTIVE_SERIES_RUNS = 100
+
 # Name we use for a column we know doesn't exist in the data, to address a Vega-Lite rendering bug
 # where empty charts need x, y encodings set in order to take up space.
 NON_EXISTENT_COLUMN_NAME = "DOES_NOT_EXIST" + PROTECTION_SUFFIX
@@ -116,6 +135,7 @@ class ArrowAltairMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        downsample: DownsampleMethod | None = None,
     ) -> DeltaGenerator:
         """Display a line chart.
 
@@ -197,6 +217,24 @@ class ArrowAltairMixin:
             precedence over the width argument.
             This argument can only be supplied by keyword.
 
+        downsample : "lttb", "minmax", or None
+            How to reduce each series with many more points than the chart is
+            pixels wide before sending it to the browser. This argument can
+            only be supplied by keyword.
+
+            This can be:
+
+            * None (default), to draw every point.
+            * "lttb", to pick about one point per pixel with the
+              Largest-Triangle-Three-Buckets algorithm, which keeps the shape
+              of the series.
+            * "minmax", to keep the smallest and largest value of every
+              pixel's worth of points, which keeps all spikes.
+
+            Either way, the first and last points and the smallest and
+            largest value of each series are kept. The number of points
+            depends on ``width``, or a typical container width if it's 0.
+
         Examples
         --------
         >>> import streamlit as st
@@ -262,6 +300,7 @@ class ArrowAltairMixin:
             size_from_user=None,
             width=width,
             height=height,
+            downsample=downsample,
         )
         marshall(proto, chart, use_container_width, theme="streamlit")
 
@@ -280,6 +319,7 @@ class ArrowAltairMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        downsample: DownsampleMethod | None = None,
     ) -> DeltaGenerator:
         """Display an area chart.
 
@@ -361,6 +401,24 @@ class ArrowAltairMixin:
             precedence over the width argument.
             This argument can only be supplied by keyword.
 
+        downsample : "lttb", "minmax", or None
+            How to reduce each series with many more points than the chart is
+            pixels wide before sending it to the browser. This argument can
+            only be supplied by keyword.
+
+            This can be:
+
+            * None (default), to draw every point.
+            * "lttb", to pick about one point per pixel with the
+              Largest-Triangle-Three-Buckets algorithm, which keeps the shape
+              of the series.
+            * "minmax", to keep the smallest and largest value of every
+              pixel's worth of points, which keeps all spikes.
+
+            Either way, the first and last points and the smallest and
+            largest value of each series are kept. The number of points
+            depends on ``width``, or a typical container width if it's 0.
+
         Examples
         --------
         >>> import streamlit as st
@@ -427,6 +485,7 @@ class ArrowAltairMixin:
             size_from_user=None,
             width=width,
             height=height,
+            downsample=downsample,
         )
         marshall(proto, chart, use_container_width, theme="streamlit")
 
@@ -613,6 +672,7 @@ class ArrowAltairMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        downsample: DownsampleMethod | None = None,
     ) -> "DeltaGenerator":
         """Display a scatterplot chart.
 
@@ -704,6 +764,24 @@ class ArrowAltairMixin:
             precedence over the width argument.
             This argument can only be supplied by keyword.
 
+        downsample : "lttb", "minmax", or None
+            How to reduce each series with many more points than the chart is
+            pixels wide before sending it to the browser. This argument can
+            only be supplied by keyword.
+
+            This can be:
+
+            * None (default), to draw every point.
+            * "lttb", to pick about one point per pixel with the
+              Largest-Triangle-Three-Buckets algorithm, which keeps the shape
+              of the series.
+            * "minmax", to keep the smallest and largest value of every
+              pixel's worth of points, which keeps all spikes.
+
+            Either way, the first and last points and the smallest and
+            largest value of each series are kept. The number of points
+            depends on ``width``, or a typical container width if it's 0.
+
         Examples
         --------
         >>> import streamlit as st
@@ -774,6 +852,7 @@ class ArrowAltairMixin:
             size_from_user=size,
             width=width,
             height=height,
+            downsample=downsample,
         )
         marshall(proto, chart, use_container_width, theme="streamlit")
 
@@ -927,16 +1006,13 @@ def prep_data(
     """Prepares the data for charting. This is also used in add_rows.
 
     Returns the prepared dataframe and the new names of the x column (taking the index reset into
-    consideration) and y, color, and size columns.
+    consideration) and y, color, and size columns. The given dataframe isn't modified.
     """
 
-    # If y is provided, but x is not, we'll use the index as x.
-    # So we need to pull the index into its own column.
-    x_column = _maybe_reset_index_in_place(df, x_column, y_column_list)
-
-    # Drop columns we're not using.
-    selected_data = _drop_unused_columns(
-        df, x_column, color_column, size_column, *y_column_list
+    # Select the columns we're using, which copies only their data. The
+    # selected data can then be modified in place.
+    selected_data, x_column = _select_used_columns(
+        df, x_column, y_column_list, color_column, size_column
     )
 
     # Maybe convert color to Vega colors.
@@ -970,13 +1046,30 @@ def _generate_chart(
     size_from_user: Union[str, float, None] = None,
     width: int = 0,
     height: int = 0,
+    downsample: Optional[DownsampleMethod] = None,
 ) -> alt.Chart:
     """Function to use the chart's type, data columns and indices to figure out the chart's spec."""
     import altair as alt
 
-    df = type_util.convert_anything_to_df(data, ensure_copy=True)
+    if downsample is not None and downsample not in DOWNSAMPLE_METHODS:
+        raise StreamlitAPIException(
+            f'Invalid downsample method "{downsample}". '
+            f"It must be one of {', '.join(DOWNSAMPLE_METHODS)} or None."
+        )
+
+    # The input is never modified, so it doesn't need to be copied: prep_data
+    # only copies the columns that the chart uses.
+    table: Optional[pa.Table] = None
+    if _is_arrow_chart_data(data) and downsample is None:
+        # pyarrow tables are prepared without converting them to pandas, so
+        # only their column names are needed to parse the arguments.
+        table = cast(pa.Table, data)
+        df = table.schema.empty_table().to_pandas()
+    else:
+        df = type_util.convert_anything_to_df(data)
 
-    # From now on, use "df" instead of "data". Deleting "data" to guarantee we follow this.
+    # From now on, use "df" (or "table") instead of "data". Deleting "data" to
+    # guarantee we follow this.
     del data
 
     # Convert arguments received from the user to things Vega-Lite understands.
@@ -992,7 +1085,12 @@ def _generate_chart(
     # Store some info so we can use it in add_rows.
     add_rows_metadata = AddRowsMetadata(
         # The last index of df so we can adjust the input df in add_rows:
-        last_index=last_index_for_melted_dataframes(df),
+        last_index=(
+            last_index_for_melted_dataframes(df)
+            if table is None
+            # Tables without pandas index metadata have a RangeIndex.
+            else (table.num_rows - 1 if table.num_rows > 0 else None)
+        ),
         # This is the input to prep_data (except for the df):
         columns=dict(
             x_column=x_column,
@@ -1005,15 +1103,39 @@ def _generate_chart(
     # At this point, all foo_column variables are either None/empty or contain actual
     # columns that are guaranteed to exist.
 
-    df, x_column, y_column, color_column, size_column = prep_data(
-        df, x_column, y_column_list, color_column, size_column
-    )
+    chart_data: Union[pd.DataFrame, pa.Table, None] = None
+    if table is not None:
+        prepared_table = _prep_arrow_data(
+            table, x_column, y_column_list, color_column, size_column
+        )
+        if prepared_table is not None:
+            chart_data, x_column, y_column, color_column, size_column = prepared_table
+            # The encodings are inferred from the first rows, since the
+            # columns of an Arrow table each have a single type.
+            df = chart_data.slice(0, _ARROW_ENCODING_SAMPLE_ROWS).to_pandas()
+        else:
+            # Only convert the columns that the chart uses.
+            df = table.select(
+                _get_used_columns(x_column, color_column, size_column, *y_column_list)
+            ).to_pandas()
+
+    if chart_data is None:
+        df, x_column, y_column, color_column, size_column = prep_data(
+            df, x_column, y_column_list, color_column, size_column
+        )
+        if downsample is not None:
+            df = _downsample(df, downsample, x_column, y_column, color_column, width)
+        chart_data = df
+
+    if isinstance(chart_data, pa.Table) and type_util.is_altair_version_less_than("5"):
+        # Altair 4 only takes pandas dataframes as inline data.
+        chart_data = chart_data.to_pandas()
 
     # At this point, x_column is only None if user did not provide one AND df is empty.
 
     # Create a Chart with x and y encodings.
     chart = alt.Chart(
-        data=df,
+        data=chart_data,
         mark=chart_type.value["mark_type"],
         width=width,
         height=height,
@@ -1054,9 +1176,71 @@ def _generate_chart(
     return chart.interactive(), add_rows_metadata
 
 
-def _maybe_reset_index_in_place(
-    df: pd.DataFrame, x_column: Optional[str], y_column_list: List[str]
-) -> Optional[str]:
+def _downsample(
+    df: pd.DataFrame,
+    method: DownsampleMethod,
+    x_column: Optional[str],
+    y_column: Optional[str],
+    color_column: Optional[str],
+    width: int,
+) -> pd.DataFrame:
+    """Keep only the rows of each series that are worth drawing at the
+    chart's width.
+
+    This runs after melting, so every series is either a value of the color
+    column or the whole dataframe.
+    """
+    if x_column is None or y_column is None:
+        return df
+
+    num_buckets = width if width > 0 else DOWNSAMPLE_DEFAULT_WIDTH
+
+    x = df[x_column]
+    y = df[y_column]
+    if color_column is None or color_column not in df.columns:
+        series_positions = [np.arange(len(df))]
+    else:
+        series_positions = _get_series_positions(df[color_column])
+
+    keep = [
+        positions[
+            downsample_series(x.iloc[positions], y.iloc[positions], method, num_buckets)
+        ]
+        for positions in series_positions
+    ]
+    return df.iloc[np.sort(np.concatenate(keep))]
+
+
+def _get_series_positions(color: pd.Series) -> List[npt.NDArray[Any]]:
+    """Return the row positions of each series, given the color column."""
+    values = color.to_numpy()
+    run_starts = np.flatnonzero(values[1:] != values[:-1]) + 1
+
+    if len(run_starts) >= _MAX_CONSECUTIVE_SERIES_RUNS:
+        return list(color.groupby(color, sort=False, dropna=False).indices.values())
+
+    # Melted dataframes have their series one after another, and finding
+    # where they start is much faster than grouping rows by their color.
+    run_bounds = zip(np.append(0, run_starts), np.append(run_starts, len(values)))
+    positions_by_color: Dict[Any, List[npt.NDArray[Any]]] = {}
+    for start, end in run_bounds:
+        positions_by_color.setdefault(values[start], []).append(np.arange(start, end))
+    return [np.concatenate(positions) for positions in positions_by_color.values()]
+
+
+def _select_used_columns(
+    df: pd.DataFrame,
+    x_column: Optional[str],
+    y_column_list: List[str],
+    color_column: Optional[str],
+    size_column: Optional[str],
+) -> Tuple[pd.DataFrame, Optional[str]]:
+    """Returns a copy of the columns of df that the chart uses, and the name of
+    the x column.
+
+    If y is provided, but x is not, the index is used as x, so it's pulled
+    into its own column.
+    """
     if x_column is None and len(y_column_list) > 0:
         if df.index.name is None:
             # Pick column name that is unlikely to collide with user-given names.
@@ -1065,16 +1249,19 @@ def _maybe_reset_index_in_place(
             # Reuse index's name for the new column.
             x_column = df.index.name
 
-        df.index.name = x_column
-        df.reset_index(inplace=True)
+        selected_data = df[_get_used_columns(color_column, size_column, *y_column_list)]
+        selected_data.insert(0, x_column, df.index)
+        selected_data.index = pd.RangeIndex(len(selected_data))
+    else:
+        selected_data = df[
+            _get_used_columns(x_column, color_column, size_column, *y_column_list)
+        ]
 
-    return x_column
+    return selected_data, x_column
 
 
-def _drop_unused_columns(
-    df: pd.DataFrame, *column_names: Optional[str]
-) -> pd.DataFrame:
-    """Returns a subset of df, selecting only column_names that aren't None."""
+def _get_used_columns(*column_names: Optional[str]) -> List[str]:
+    """Returns the column_names that aren't None, without duplicates."""
 
     # We can't just call set(col_names) because sets don't have stable ordering,
     # which means tests that depend on ordering will fail.
@@ -1091,7 +1278,92 @@ def _drop_unused_columns(
         seen.add(x)
         keep.append(x)
 
-    return df[keep]
+    return keep
+
+
+def _is_arrow_chart_data(data: Any) -> bool:
+    """True if data is a pyarrow table that can be charted as-is.
+
+    Tables with a pandas index other than the default one are converted to
+    pandas, so that the index can be used as x.
+    """
+    if not isinstance(data, pa.Table):
+        return False
+
+    pandas_metadata = data.schema.pandas_metadata or {}
+    return all(
+        isinstance(index, dict)
+        and index.get("kind") == "range"
+        and index.get("name") is None
+        and index.get("start") == 0
+        and index.get("step") == 1
+        for index in pandas_metadata.get("index_columns", [])
+    )
+
+
+def _prep_arrow_data(
+    table: pa.Table,
+    x_column: Optional[str],
+    y_column_list: List[str],
+    color_column: Optional[str],
+    size_column: Optional[str],
+) -> Optional[
+    Tuple[pa.Table, Optional[str], Optional[str], Optional[str], Optional[str]]
+]:
+    """Prepares a pyarrow table for charting, like prep_data does for a
+    dataframe, but without copying the table's data.
+
+    Returns None if the table needs to be prepared as a dataframe instead.
+    """
+    if color_column is not None and table.num_rows > 0:
+        # Color values need to be converted and listed, which is done in pandas.
+        if is_color_like(table.column(color_column)[0].as_py()):
+            return None
+
+    columns: Dict[str, pa.ChunkedArray] = {}
+    if x_column is None and len(y_column_list) > 0:
+        x_column = SEPARATED_INDEX_COLUMN_NAME
+        columns[x_column] = pa.chunked_array([np.arange(table.num_rows)])
+
+    for name in _get_used_columns(x_column, color_column, size_column, *y_column_list):
+        if name not in columns:
+            columns[name] = table.column(name)
+
+    if len(y_column_list) <= 1 or x_column is None:
+        y_column = y_column_list[0] if y_column_list else None
+        return pa.table(columns), x_column, y_column, color_column, size_column
+
+    columns_to_leave_alone = _get_used_columns(x_column, size_column)
+    y_columns = [columns[name] for name in y_column_list]
+    y_type = y_columns[0].type
+    if any(y.type != y_type for y in y_columns):
+        # Melting columns of different types needs pandas' type conversions.
+        return None
+    if any(name in columns_to_leave_alone for name in y_column_list):
+        # pandas doesn't melt the columns that are left alone.
+        return None
+
+    # Build the long-format table from the columns' chunks: the columns that
+    # are left alone are repeated once per melted column, and the melted
+    # columns are stacked.
+    melted: Dict[str, pa.ChunkedArray] = {}
+    for name in columns_to_leave_alone:
+        column = columns[name]
+        melted[name] = pa.chunked_array(column.chunks * len(y_columns), column.type)
+    melted[MELTED_COLOR_COLUMN_NAME] = pa.chunked_array(
+        [pa.repeat(name, table.num_rows) for name in y_column_list], pa.string()
+    )
+    melted[MELTED_Y_COLUMN_NAME] = pa.chunked_array(
+        [chunk for y in y_columns for chunk in y.chunks], y_type
+    )
+
+    return (
+        pa.table(melted),
+        x_column,
+        MELTED_Y_COLUMN_NAME,
+        MELTED_COLOR_COLUMN_NAME,
+        size_column,
+    )
 
 
 def _maybe_convert_color_column_in_place(df: pd.DataFrame, color_column: Optional[str]):
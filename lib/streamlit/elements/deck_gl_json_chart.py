@@ -12,16 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import hashlib
 import json
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, cast
 
+import pyarrow as pa
 from typing_extensions import Final
 
+from streamlit import type_util
 from streamlit.proto.DeckGlJsonChart_pb2 import DeckGlJsonChart as PydeckProto
 from streamlit.runtime.metrics_util import gather_metrics
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from pydeck import Deck
 
     from streamlit.delta_generator import DeltaGenerator
@@ -157,18 +161,176 @@ def marshall(
 ) -> None:
     if pydeck_obj is None:
         spec = json.dumps(EMPTY_MAP)
-        id = ""
+        layer_data: Dict[str, pa.Table] = {}
     else:
+        pydeck_obj, layer_data = _extract_layer_data(pydeck_obj)
         spec = pydeck_obj.to_json()
-        json_string = json.dumps(spec)
-        json_bytes = json_string.encode("utf-8")
-        id = hashlib.md5(json_bytes).hexdigest()
 
-    pydeck_proto.json = spec
-    pydeck_proto.use_container_width = use_container_width
-
-    pydeck_proto.id = id
+    marshall_spec(pydeck_proto, spec, layer_data, use_container_width)
 
     tooltip = _get_pydeck_tooltip(pydeck_obj)
     if tooltip:
         pydeck_proto.tooltip = json.dumps(tooltip)
+
+
+def marshall_spec(
+    pydeck_proto: PydeckProto,
+    spec: str,
+    layer_data: Dict[str, pa.Table],
+    use_container_width: bool,
+) -> None:
+    """Marshall a deck.gl JSON spec and the data of its layers.
+
+    Parameters
+    ----------
+    pydeck_proto : DeckGlJsonChartProto
+        The proto to fill.
+    spec : str
+        The deck.gl JSON spec.
+    layer_data : dict of str to pyarrow.Table
+        The data of the spec's layers that aren't given their data in the
+        spec, by layer id.
+    use_container_width : bool
+        Whether to fit the chart to its container's width.
+    """
+    pydeck_proto.json = spec
+    pydeck_proto.use_container_width = use_container_width
+
+    # The id tells the frontend whether the spec or the data changed, so
+    # it can skip parsing them when they didn't. Empty maps are no
+    # exception.
+    spec_hash = hashlib.md5(spec.encode("utf-8"))
+    for layer_id, table in layer_data.items():
+        dataset = pydeck_proto.datasets.add()
+        dataset.name = layer_id
+        dataset.has_name = True
+        dataset.data.data = type_util.pyarrow_table_to_bytes(table)
+        spec_hash.update(dataset.data.data)
+
+    pydeck_proto.id = spec_hash.hexdigest()
+
+
+def to_layer_table(table: pa.Table) -> Optional[pa.Table]:
+    """Convert a table of layer data into one whose values the frontend reads
+    as the same values that JSON would give it.
+
+    64-bit integers and decimals are converted to floats, since JavaScript
+    numbers are floats. Returns None if the table has columns of other types
+    than numbers, booleans, strings and lists of numbers.
+    """
+    columns = []
+    for column in table.columns:
+        column_type = _to_layer_type(column.type)
+        if column_type is None:
+            return None
+        columns.append(column.cast(column_type))
+
+    return pa.table(columns, names=table.column_names)
+
+
+def _to_layer_type(arrow_type: pa.DataType) -> Optional[pa.DataType]:
+    if (
+        pa.types.is_int64(arrow_type)
+        or pa.types.is_uint64(arrow_type)
+        or pa.types.is_decimal(arrow_type)
+    ):
+        return pa.float64()
+    if (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+        or pa.types.is_string(arrow_type)
+        or pa.types.is_null(arrow_type)
+    ):
+        return arrow_type
+    if pa.types.is_list(arrow_type) or pa.types.is_fixed_size_list(arrow_type):
+        value_type = arrow_type.value_type
+        if pa.types.is_string(value_type) or pa.types.is_list(value_type):
+            return None
+        value_type = _to_layer_type(value_type)
+        if value_type is None:
+            return None
+        if pa.types.is_fixed_size_list(arrow_type):
+            return pa.list_(value_type, arrow_type.list_size)
+        return pa.list_(value_type)
+    return None
+
+
+def _extract_layer_data(pydeck_obj: "Deck") -> Tuple["Deck", Dict[str, pa.Table]]:
+    """Move the data of the deck's layers into Arrow tables.
+
+    Returns a copy of the deck whose layers don't hold the data that was
+    moved, and the tables by layer id. The given deck isn't modified.
+    """
+    layers = getattr(pydeck_obj, "layers", None)
+    if not isinstance(layers, list):
+        return pydeck_obj, {}
+
+    layer_data: Dict[str, pa.Table] = {}
+    new_layers = []
+    for layer in layers:
+        table, accessors = _get_layer_table(layer)
+        layer_id = getattr(layer, "id", None)
+        if table is None or not isinstance(layer_id, str) or layer_id in layer_data:
+            new_layers.append(layer)
+            continue
+
+        layer = copy.copy(layer)
+        # pydeck serializes a layer's _data attribute as its data.
+        layer._data = None
+        # Binary data is passed to deck.gl in place of accessors, which are
+        # replaced with accessors that read the table's columns instead.
+        layer.__dict__.update(accessors)
+        layer_data[layer_id] = table
+        new_layers.append(layer)
+
+    if not layer_data:
+        return pydeck_obj, {}
+
+    pydeck_obj = copy.copy(pydeck_obj)
+    pydeck_obj.layers = new_layers
+    return pydeck_obj, layer_data
+
+
+def _get_layer_table(layer: Any) -> Tuple[Optional[pa.Table], Dict[str, str]]:
+    """Returns the data of a pydeck layer as a table, if it's a list of
+    records or binary data, and the accessors that read the table's columns.
+    """
+    if getattr(layer, "use_binary_transport", False):
+        binary_data: List[Dict[str, Any]] = layer.get_binary_data() or []
+        columns = {}
+        accessors = {}
+        for entry in binary_data:
+            name = str(entry["column_name"])
+            columns[name] = _numpy_to_arrow(entry["np_data"])
+            accessors[entry["accessor"]] = f"@@={name}"
+        if not columns:
+            return None, {}
+        return to_layer_table(pa.table(columns)), accessors
+
+    data = getattr(layer, "data", None)
+    if not isinstance(data, list) or len(data) == 0 or not isinstance(data[0], dict):
+        return None, {}
+
+    # Records that don't all have the same keys stay in the spec, since the
+    # table's columns are the keys of the first record.
+    keys = data[0].keys()
+    if not all(isinstance(key, str) for key in keys) or not all(
+        isinstance(row, dict) and row.keys() == keys for row in data
+    ):
+        return None, {}
+
+    try:
+        table = pa.Table.from_pylist(data)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None, {}
+    return to_layer_table(table), {}
+
+
+def _numpy_to_arrow(values: "npt.NDArray[Any]") -> pa.Array:
+    """Convert a 1D array, or a 2D array of fixed size rows, to Arrow."""
+    if values.ndim == 2:
+        return pa.FixedSizeListArray.from_arrays(
+            pa.array(values.ravel()), values.shape[1]
+        )
+    return pa.array(values)
@@ -20,14 +20,30 @@
 """Image marshalling."""
 
 import base64
+import hashlib
 import io
 import mimetypes
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from urllib.parse import urlparse
 
 import numpy as np
+from cachetools import LRUCache
 from PIL import GifImagePlugin, Image, ImageFile
 from typing_extensions import Final, Literal, TypeAlias
 
@@ -53,6 +69,15 @@ LOGGER: Final = get_logger(__name__)
 # DPI.
 MAXIMUM_CONTENT_WIDTH: Final[int] = 2 * 730
 
+# The total size of the transcoded images that are kept in memory, so that
+# images that are shown again with the same width and format aren't decoded,
+# resized and encoded again on every rerun.
+_TRANSCODE_CACHE_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+
+# The number of threads that transcode the images of a list of images. PIL
+# releases the GIL while it decodes, resizes and encodes images.
+_MAX_TRANSCODE_WORKERS: Final[int] = 4
+
 PILImage: TypeAlias = Union[
     ImageFile.ImageFile, Image.Image, GifImagePlugin.GifImageFile
 ]
@@ -64,6 +89,25 @@ ImageFormat: TypeAlias = Literal["JPEG", "PNG", "GIF"]
 ImageFormatOrAuto: TypeAlias = Literal[ImageFormat, "auto"]
 
 
+class _ImageMedia(NamedTuple):
+    """An image to add to the MediaFileManager: its bytes, or the path of a
+    file that Streamlit couldn't open."""
+
+    data: Union[bytes, str]
+    mimetype: str
+
+
+# Transcoded images and their mimetypes, keyed by a hash of the input image
+# and the arguments it was transcoded with.
+_transcode_cache: "LRUCache[Hashable, Tuple[bytes, str]]" = LRUCache(
+    maxsize=_TRANSCODE_CACHE_MAX_BYTES, getsizeof=lambda value: len(value[0])
+)
+_transcode_cache_lock = threading.Lock()
+_transcode_executor = ThreadPoolExecutor(
+    max_workers=_MAX_TRANSCODE_WORKERS, thread_name_prefix="ImageTranscoder"
+)
+
+
 class WidthBehaviour(IntEnum):
     """
     Special values that are recognized by the frontend and allow us to change the
@@ -297,6 +341,11 @@ def _ensure_image_size_and_format(
     if width > 0 and actual_width > width:
         # We need to resize the image.
         new_height = int(1.0 * actual_height * width / actual_width)
+        # JPEG images can be scaled down by a power of two while they're
+        # decoded, which is much faster than decoding them at full size. The
+        # decoded image is still at least as large as the new size. This is
+        # a no-op for other formats.
+        pil_image.draft(pil_image.mode, (width, new_height))
         pil_image = pil_image.resize((width, new_height), resample=Image.BILINEAR)
         return _PIL_to_bytes(pil_image, format=image_format, quality=90)
 
@@ -326,20 +375,92 @@ def _clip_image(image: "npt.NDArray[Any]", clamp: bool) -> "npt.NDArray[Any]":
     return data
 
 
-def image_to_url(
+def _get_digest(data: Union[bytes, memoryview]) -> str:
+    # MD5 is good enough for what we need, which is uniqueness.
+    if sys.version_info >= (3, 9):
+        hasher = hashlib.md5(usedforsecurity=False)
+    else:
+        hasher = hashlib.md5()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def _transcode_cached(
+    key: Optional[Hashable], transcode: Callable[[], Tuple[bytes, str]]
+) -> Tuple[bytes, str]:
+    """Return the transcoded image and its mimetype for the given cache key,
+    calling `transcode` to create them if they aren't cached.
+
+    If `key` is None, the image isn't cached.
+    """
+    if key is None:
+        return transcode()
+
+    cached: Optional[Tuple[bytes, str]]
+    with _transcode_cache_lock:
+        cached = _transcode_cache.get(key)
+    if cached is not None:
+        return cached
+
+    transcoded = transcode()
+    if len(transcoded[0]) <= _transcode_cache.maxsize:
+        with _transcode_cache_lock:
+            _transcode_cache[key] = transcoded
+    return transcoded
+
+
+def _transcode_image_data(
+    image_data: bytes, width: int, output_format: ImageFormatOrAuto
+) -> Tuple[bytes, str]:
+    """Determine the image's format, resize it, and get its mimetype."""
+    image_format = _validate_image_format_string(image_data, output_format)
+    image_data = _ensure_image_size_and_format(image_data, width, image_format)
+    return image_data, _get_image_format_mimetype(image_format)
+
+
+def _transcode_np_array(
+    image: "npt.NDArray[Any]",
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+) -> Tuple[bytes, str]:
+    image = _clip_image(
+        _verify_np_shape(image),
+        clamp,
+    )
+
+    if channels == "BGR":
+        if len(image.shape) == 3:
+            image = image[:, :, [2, 1, 0]]
+        else:
+            raise StreamlitAPIException(
+                'When using `channels="BGR"`, the input image should '
+                "have exactly 3 color channels"
+            )
+
+    # Depending on the version of numpy that the user has installed, the
+    # typechecker may not be able to deduce that indexing into a
+    # `npt.NDArray[Any]` returns a `npt.NDArray[Any]`, so we need to
+    # ignore redundant casts below.
+    image_data = _np_array_to_bytes(
+        array=cast("npt.NDArray[Any]", image),  # type: ignore[redundant-cast]
+        output_format=output_format,
+    )
+    return _transcode_image_data(image_data, width, output_format)
+
+
+def _prepare_image(
     image: AtomicImage,
     width: int,
     clamp: bool,
     channels: Channels,
     output_format: ImageFormatOrAuto,
-    image_id: str,
-) -> str:
-    """Return a URL that an image can be served from.
-    If `image` is already a URL, return it unmodified.
-    Otherwise, add the image to the MediaFileManager and return the URL.
+) -> Union[str, _ImageMedia]:
+    """Return the URL of an image that doesn't need to be served by
+    Streamlit, or the media to add to the MediaFileManager.
 
-    (When running in "raw" mode, we won't actually load data into the
-    MediaFileManager, and we'll return an empty URL.)
+    This doesn't use the runtime, so it can be called from any thread.
     """
 
     image_data: bytes
@@ -386,9 +507,7 @@ def image_to_url(
             if mimetype is None:
                 mimetype = "application/octet-stream"
 
-            url = runtime.get_instance().media_file_mgr.add(image, mimetype, image_id)
-            caching.save_media_data(image, mimetype, image_id)
-            return url
+            return _ImageMedia(image, mimetype)
 
     # PIL Images
     elif isinstance(image, (ImageFile.ImageFile, Image.Image)):
@@ -403,46 +522,81 @@ def image_to_url(
 
     # Numpy Arrays (ie opencv)
     elif isinstance(image, np.ndarray):
-        image = _clip_image(
-            _verify_np_shape(image),
-            clamp,
-        )
-
-        if channels == "BGR":
-            if len(image.shape) == 3:
-                image = image[:, :, [2, 1, 0]]
-            else:
-                raise StreamlitAPIException(
-                    'When using `channels="BGR"`, the input image should '
-                    "have exactly 3 color channels"
-                )
-
-        # Depending on the version of numpy that the user has installed, the
-        # typechecker may not be able to deduce that indexing into a
-        # `npt.NDArray[Any]` returns a `npt.NDArray[Any]`, so we need to
-        # ignore redundant casts below.
-        image_data = _np_array_to_bytes(
-            array=cast("npt.NDArray[Any]", image),  # type: ignore[redundant-cast]
-            output_format=output_format,
+        array = image
+        array_key: Optional[Hashable] = None
+        if not array.dtype.hasobject:
+            array_key = (
+                "array",
+                _get_digest(
+                    np.ascontiguousarray(array).reshape(-1).view(np.uint8).data
+                ),
+                array.shape,
+                array.dtype.str,
+                width,
+                clamp,
+                channels,
+                output_format,
+            )
+        return _ImageMedia(
+            *_transcode_cached(
+                array_key,
+                lambda: _transcode_np_array(
+                    array, width, clamp, channels, output_format
+                ),
+            )
         )
 
     # Raw bytes
     else:
         image_data = image
 
-    # Determine the image's format, resize it, and get its mimetype
-    image_format = _validate_image_format_string(image_data, output_format)
-    image_data = _ensure_image_size_and_format(image_data, width, image_format)
-    mimetype = _get_image_format_mimetype(image_format)
+    return _ImageMedia(
+        *_transcode_cached(
+            ("bytes", _get_digest(image_data), width, output_format),
+            lambda: _transcode_image_data(image_data, width, output_format),
+        )
+    )
 
-    if runtime.exists():
-        url = runtime.get_instance().media_file_mgr.add(image_data, mimetype, image_id)
-        caching.save_media_data(image_data, mimetype, image_id)
-        return url
-    else:
+
+def _add_image_media(image: Union[str, _ImageMedia], image_id: str) -> str:
+    """Return the URL of an image prepared by _prepare_image, adding it to the
+    MediaFileManager if it needs to be served by Streamlit."""
+    if isinstance(image, str):
+        return image
+
+    if isinstance(image.data, bytes) and not runtime.exists():
         # When running in "raw mode", we can't access the MediaFileManager.
         return ""
 
+    url = runtime.get_instance().media_file_mgr.add(
+        image.data, image.mimetype, image_id
+    )
+    caching.save_media_data(image.data, image.mimetype, image_id)
+    return url
+
+
+def image_to_url(
+    image: AtomicImage,
+    width: int,
+    clamp: bool,
+    channels: Channels,
+    output_format: ImageFormatOrAuto,
+    image_id: str,
+) -> str:
+    """Return a URL that an image can be served from.
+    If `image` is already a URL, return it unmodified.
+    Otherwise, add the image to the MediaFileManager and return the URL.
+
+    Images are only transcoded once for as long as the result is cached, and
+    then reused whenever the same image is shown with the same arguments.
+
+    (When running in "raw" mode, we won't actually load data into the
+    MediaFileManager, and we'll return an empty URL.)
+    """
+    return _add_image_media(
+        _prepare_image(image, width, clamp, channels, output_format), image_id
+    )
+
 
 def marshall_images(
     coordinates: str,
@@ -525,8 +679,22 @@ def marshall_images(
     )
 
     proto_imgs.width = int(width)
+
+    # Transcode the images in parallel. They're added to the MediaFileManager
+    # from this thread, since that also records them for st.cache_data.
+    def prepare(image: AtomicImage) -> Union[str, _ImageMedia]:
+        return _prepare_image(image, width, clamp, channels, output_format)
+
+    prepared_images: Sequence[Union[str, _ImageMedia]]
+    if len(images) > 1:
+        prepared_images = list(_transcode_executor.map(prepare, images))
+    else:
+        prepared_images = [prepare(image) for image in images]
+
     # Each image in an image list needs to be kept track of at its own coordinates.
-    for coord_suffix, (image, caption) in enumerate(zip(images, captions)):
+    for coord_suffix, (prepared_image, caption) in enumerate(
+        zip(prepared_images, captions)
+    ):
         proto_img = proto_imgs.imgs.add()
         if caption is not None:
             proto_img.caption = str(caption)
@@ -535,6 +703,4 @@ def marshall_images(
         # MediaFileManager. For this, we just add the index to the image's "coordinates".
         image_id = "%s-%i" % (coordinates, coord_suffix)
 
-        proto_img.url = image_to_url(
-            image, width, clamp, channels, output_format, image_id
-        )
+        proto_img.url = _add_image_media(prepared_image, image_id)
@@ -0,0 +1,183 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Algorithms that pick the points of a large series that are worth drawing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+from typing_extensions import Final, Literal
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+DOWNSAMPLE_METHODS: Final = ("lttb", "minmax")
+
+
+def lttb_indices(
+    x: npt.NDArray[Any], y: npt.NDArray[Any], num_buckets: int
+) -> npt.NDArray[Any]:
+    """Return the indices of the points that the Largest-Triangle-Three-Buckets
+    algorithm picks from a series sorted by x.
+
+    The first and last points are always kept, and one point is picked from
+    each of the `num_buckets` buckets in between: the one that forms the
+    largest triangle with the point picked from the previous bucket and the
+    average of the next bucket. The points with the smallest and largest y
+    are kept too, so that the series' extent is preserved.
+    """
+    num_points = len(x)
+    if num_buckets + 2 >= num_points or num_buckets < 1:
+        return np.arange(num_points)
+
+    # The buckets split the points between the first and the last one.
+    # Since there are fewer buckets than points, none of them is empty.
+    edges = np.linspace(1, num_points - 1, num_buckets + 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # The "next bucket" of the last bucket is the last point.
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    indices = np.empty(num_buckets + 2, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = num_points - 1
+
+    # Each pick depends on the previous one, so buckets are processed in
+    # order, and the points in each bucket all at once.
+    a = 0
+    for i in range(num_buckets):
+        start, end = edges[i], edges[i + 1]
+        # Twice the triangle areas, which doesn't change their order.
+        areas = np.abs(
+            (x[a] - next_x[i]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y[i] - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+
+    return np.union1d(indices, [np.argmin(y), np.argmax(y)])
+
+
+def minmax_indices(y: npt.NDArray[Any], num_buckets: int) -> npt.NDArray[Any]:
+    """Return the indices of the points with the smallest and largest y in
+    each of `num_buckets` equally sized buckets of a series, plus its first
+    and last points.
+    """
+    num_points = len(y)
+    if 2 * num_buckets + 2 >= num_points or num_buckets < 1:
+        return np.arange(num_points)
+
+    buckets = np.arange(num_points) * num_buckets // num_points
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(buckets)) + 1])
+    counts = np.diff(np.append(starts, num_points))
+
+    picked: List[npt.NDArray[Any]] = [np.array([0, num_points - 1])]
+    reducers: List[np.ufunc] = [np.minimum, np.maximum]
+    for reduce in reducers:
+        extremes = np.repeat(reduce.reduceat(y, starts), counts)
+        # The first point of each bucket that has the bucket's extreme value.
+        candidates = np.flatnonzero(y == extremes)
+        candidate_buckets = buckets[candidates]
+        is_first = np.concatenate([[True], np.diff(candidate_buckets) > 0])
+        picked.append(candidates[is_first])
+
+    indices: npt.NDArray[Any] = np.unique(np.concatenate(picked))
+    return indices
+
+
+def downsample_series(
+    x: pd.Series, y: pd.Series, method: DownsampleMethod, num_buckets: int
+) -> npt.NDArray[Any]:
+    """Return the positions of the points to draw of a single series.
+
+    Points are picked in the order of their x values, and the positions are
+    returned in their original order. Points whose y is missing break the
+    series' line, so the first one of each such gap is kept, together with the
+    points on either side of it. Points whose x is missing, and series with
+    non-numeric y values, are kept as they are.
+
+    Parameters
+    ----------
+    x : pandas.Series
+        The series' x values. If they're neither numbers nor datetimes, the
+        points are assumed to be evenly spaced.
+    y : pandas.Series
+        The series' y values.
+    method : "lttb" or "minmax"
+        The downsampling algorithm.
+    num_buckets : int
+        The number of buckets to pick points from. The number of points
+        returned is at most about `num_buckets` for "lttb" and twice that for
+        "minmax", plus three for each gap.
+    """
+    if not is_numeric_dtype(y) or y.dtype == bool:
+        return np.arange(len(y))
+
+    x_values = _to_float_array(x)
+    y_values = y.to_numpy(dtype=float, na_value=np.nan)
+
+    missing_x = np.isnan(x_values)
+    positions = np.flatnonzero(~missing_x)
+    if np.any(np.diff(x_values[positions]) < 0):
+        order = np.argsort(x_values[positions], kind="stable")
+        positions = positions[order]
+    is_gap = np.isnan(y_values[positions])
+    points = positions[~is_gap]
+
+    if method == "lttb":
+        indices = lttb_indices(x_values[points], y_values[points], num_buckets)
+    else:
+        indices = minmax_indices(y_values[points], num_buckets)
+
+    picked = [
+        points[indices],
+        positions[_gap_bounds(is_gap)],
+        np.flatnonzero(missing_x),
+    ]
+    kept: npt.NDArray[Any] = np.unique(np.concatenate(picked))
+    return kept
+
+
+def _gap_bounds(is_gap: npt.NDArray[np.bool_]) -> npt.NDArray[Any]:
+    """Return the indices of the first point of each run of gap points, and of
+    the points right before and after each run.
+    """
+    starts = np.flatnonzero(is_gap & ~np.append(False, is_gap[:-1]))
+    ends = np.flatnonzero(is_gap & ~np.append(is_gap[1:], False))
+    indices = np.concatenate([starts - 1, starts, ends + 1])
+    in_bounds: npt.NDArray[Any] = indices[(indices >= 0) & (indices < len(is_gap))]
+    return in_bounds
+
+
+def _to_float_array(series: pd.Series) -> npt.NDArray[Any]:
+    """Convert a series to floats that have the same order as its values."""
+    if is_datetime64_any_dtype(series):
+        datetimes = series.to_numpy(dtype="datetime64[ns]")
+        values: npt.NDArray[Any] = datetimes.astype(np.int64).astype(float)
+        values[np.isnat(datetimes)] = np.nan
+        return values
+
+    if is_numeric_dtype(series):
+        numbers: npt.NDArray[Any] = series.to_numpy(dtype=float, na_value=np.nan)
+        return numbers
+
+    return np.arange(len(series), dtype=float)
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Any, List, Mapping, TypeVar
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Tuple, TypeVar
 
+import numpy as np
 import pandas as pd
 
 from streamlit import type_util
@@ -21,6 +23,7 @@ from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from pandas.io.formats.style import Styler
 
 
@@ -54,13 +57,16 @@ def marshall_styler(proto: ArrowProto, styler: "Styler", default_uuid: str) -> N
 
     # We're using protected members of pandas.Styler to get styles,
     # which is not ideal and could break if the interface changes.
+    # Rather than translating the Styler into its (per-cell) HTML render
+    # context, styles and display values are read from the computed
+    # styles (`ctx`) and formatters (`_display_funcs`) directly.
     styler._compute()
 
-    pandas_styles = styler._translate(False, False)
+    rows, columns = _get_rendered_cells(styler)
 
     _marshall_caption(proto, styler)
-    _marshall_styles(proto, styler, pandas_styles)
-    _marshall_display_values(proto, styler_data_df, pandas_styles)
+    _marshall_styles(proto, styler, rows, columns)
+    _marshall_display_values(proto, styler, rows, columns)
 
 
 def _marshall_uuid(proto: ArrowProto, styler: "Styler", default_uuid: str) -> None:
@@ -101,7 +107,10 @@ def _marshall_caption(proto: ArrowProto, styler: "Styler") -> None:
 
 
 def _marshall_styles(
-    proto: ArrowProto, styler: "Styler", styles: Mapping[str, Any]
+    proto: ArrowProto,
+    styler: "Styler",
+    rows: "npt.NDArray[Any]",
+    columns: "npt.NDArray[Any]",
 ) -> None:
     """Marshall pandas.Styler styles into an Arrow proto.
 
@@ -113,29 +122,57 @@ def _marshall_styles(
     styler : pandas.Styler
         Helps style a DataFrame or Series according to the data with HTML and CSS.
 
-    styles : dict
-        pandas.Styler translated styles.
+    rows : numpy.ndarray
+        Whether each row of the styler's data is rendered.
+
+    columns : numpy.ndarray
+        Whether each column of the styler's data is rendered.
 
     """
     css_rules = []
+    table_selector = f"#T_{styler.uuid}"
+
+    # Table styles can have several comma-separated selectors, and
+    # each of them is prefixed with the table selector.
+    table_styles = [
+        {"selector": selector, "props": style["props"]}
+        for style in styler.table_styles or []
+        for selector in style["selector"].split(",")
+    ]
+    for style in _trim_pandas_styles(table_styles):
+        # styles in "table_styles" have a space
+        # between the uuid and selector.
+        css_rules.append(
+            f"{table_selector} {style['selector']} "
+            f"{{ {_css_declarations(style['props'])} }}"
+        )
 
-    if "table_styles" in styles:
-        table_styles = styles["table_styles"]
-        table_styles = _trim_pandas_styles(table_styles)
-        for style in table_styles:
-            # styles in "table_styles" have a space
-            # between the uuid and selector.
-            rule = _pandas_style_to_css(
-                "table_styles", style, styler.uuid, separator=" "
+    # Cells with the same declarations share a single rule, whose selector
+    # lists all of them. Hidden cells aren't styled.
+    hidden_columns = set(getattr(styler, "hidden_columns", []))
+    visible_rows = rows.tolist()
+    visible_columns = [
+        rendered and c not in hidden_columns
+        for c, rendered in enumerate(columns.tolist())
+    ]
+    declarations_by_props: Dict[Tuple[Any, ...], str] = {}
+    selectors_by_declarations: Dict[str, List[str]] = defaultdict(list)
+    for (r, c), props in styler.ctx.items():
+        if not props or not (visible_rows[r] and visible_columns[c]):
+            continue
+        props = tuple(props)
+        declarations = declarations_by_props.get(props)
+        if declarations is None:
+            declarations = declarations_by_props[props] = (
+                _css_declarations(props) if any(any(p) for p in props) else ""
+            )
+        if declarations:
+            selectors_by_declarations[declarations].append(
+                f"{table_selector}row{r}_col{c}"
             )
-            css_rules.append(rule)
 
-    if "cellstyle" in styles:
-        cellstyle = styles["cellstyle"]
-        cellstyle = _trim_pandas_styles(cellstyle)
-        for style in cellstyle:
-            rule = _pandas_style_to_css("cell_style", style, styler.uuid)
-            css_rules.append(rule)
+    for declarations, selectors in selectors_by_declarations.items():
+        css_rules.append(f"{', '.join(selectors)} {{ {declarations} }}")
 
     if len(css_rules) > 0:
         proto.styler.styles = "\n".join(css_rules)
@@ -159,63 +196,63 @@ def _trim_pandas_styles(styles: List[M]) -> List[M]:
     return [x for x in styles if any(any(y) for y in x["props"])]
 
 
-def _pandas_style_to_css(
-    style_type: str,
-    style: Mapping[str, Any],
-    uuid: str,
-    separator: str = "",
-) -> str:
-    """Convert pandas.Styler translated style to CSS.
+def _css_declarations(props: Any) -> str:
+    """Convert pandas.Styler CSS properties to a CSS declaration block.
 
     Parameters
     ----------
-    style_type : str
-        Either "table_styles" or "cell_style".
+    props : list
+        (property, value) pairs, e.g. [("color", " black"), ("font-size", "1em")].
+
+    """
+    return "; ".join(
+        css_property.strip() + ": " + css_value.strip()
+        for css_property, css_value in props
+    )
+
+
+def _get_rendered_cells(
+    styler: "Styler",
+) -> Tuple["npt.NDArray[Any]", "npt.NDArray[Any]"]:
+    """Return which rows and columns of the styler's data pandas.Styler would
+    render, as boolean masks.
+
+    Rows hidden with `Styler.hide` aren't rendered, and neither are the rows
+    and columns beyond the `styler.render.max_rows` and
+    `styler.render.max_columns` pandas options.
+    Hidden columns are rendered, but not styled.
+    """
+    num_rows, num_columns = styler.data.shape
 
-    style : dict
-        pandas.Styler translated style.
+    rows: "npt.NDArray[Any]" = np.ones(num_rows, dtype=bool)
+    rows[list(getattr(styler, "hidden_rows", []))] = False
+    max_rows = _get_render_option("styler.render.max_rows")
+    if max_rows is not None:
+        rows &= np.cumsum(rows) <= max_rows
 
-    uuid : str
-        pandas.Styler uuid.
+    columns: "npt.NDArray[Any]" = np.ones(num_columns, dtype=bool)
+    max_columns = _get_render_option("styler.render.max_columns")
+    if max_columns is not None:
+        visible_columns: "npt.NDArray[Any]" = np.ones(num_columns, dtype=bool)
+        visible_columns[list(getattr(styler, "hidden_columns", []))] = False
+        columns &= np.cumsum(visible_columns) <= max_columns
 
-    separator : str
-        A string separator used between table and cell selectors.
+    return rows, columns
 
-    """
-    declarations = []
-    for css_property, css_value in style["props"]:
-        declaration = css_property.strip() + ": " + css_value.strip()
-        declarations.append(declaration)
-
-    table_selector = f"#T_{uuid}"
-
-    # In pandas >= 1.1.0
-    # translated_style["cellstyle"] has the following shape:
-    # [
-    #   {
-    #       "props": [("color", " black"), ("background-color", "orange"), ("", "")],
-    #       "selectors": ["row0_col0"]
-    #   }
-    #   ...
-    # ]
-    if style_type == "table_styles":
-        cell_selectors = [style["selector"]]
-    else:
-        cell_selectors = style["selectors"]
-
-    selectors = []
-    for cell_selector in cell_selectors:
-        selectors.append(table_selector + separator + cell_selector)
-    selector = ", ".join(selectors)
-
-    declaration_block = "; ".join(declarations)
-    rule_set = selector + " { " + declaration_block + " }"
-
-    return rule_set
+
+def _get_render_option(key: str) -> Any:
+    try:
+        return pd.get_option(key)
+    except KeyError:
+        # This option doesn't exist in older pandas versions.
+        return None
 
 
 def _marshall_display_values(
-    proto: ArrowProto, df: pd.DataFrame, styles: Mapping[str, Any]
+    proto: ArrowProto,
+    styler: "Styler",
+    rows: "npt.NDArray[Any]",
+    columns: "npt.NDArray[Any]",
 ) -> None:
     """Marshall pandas.Styler display values into an Arrow proto.
 
@@ -224,44 +261,85 @@ def _marshall_display_values(
     proto : proto.Arrow
         Output. The protobuf for Streamlit Arrow proto.
 
-    df : pandas.DataFrame
-        A dataframe with original values.
+    styler : pandas.Styler
+        Helps style a DataFrame or Series according to the data with HTML and CSS.
 
-    styles : dict
-        pandas.Styler translated styles.
+    rows : numpy.ndarray
+        Whether each row of the styler's data is rendered.
+
+    columns : numpy.ndarray
+        Whether each column of the styler's data is rendered.
 
     """
-    new_df = _use_display_values(df, styles)
+    new_df = _use_display_values(styler, rows, columns)
     proto.styler.display_values = type_util.data_frame_to_bytes(new_df)
 
 
-def _use_display_values(df: pd.DataFrame, styles: Mapping[str, Any]) -> pd.DataFrame:
+def _use_display_values(
+    styler: "Styler", rows: "npt.NDArray[Any]", columns: "npt.NDArray[Any]"
+) -> pd.DataFrame:
     """Create a new pandas.DataFrame where display values are used instead of original ones.
 
+    The display values are computed column by column: the cells of a column
+    that share a formatter are formatted together.
+
     Parameters
     ----------
-    df : pandas.DataFrame
-        A dataframe with original values.
+    styler : pandas.Styler
+        Helps style a DataFrame or Series according to the data with HTML and CSS.
 
-    styles : dict
-        pandas.Styler translated styles.
+    rows : numpy.ndarray
+        Whether each row of the styler's data is rendered.
 
-    """
-    import re
-
-    # If values in a column are not of the same type, Arrow
-    # serialization would fail. Thus, we need to cast all values
-    # of the dataframe to strings before assigning them display values.
-    new_df = df.astype(str)
-
-    cell_selector_regex = re.compile(r"row(\d+)_col(\d+)")
-    if "body" in styles:
-        rows = styles["body"]
-        for row in rows:
-            for cell in row:
-                if "id" in cell:
-                    if match := cell_selector_regex.match(cell["id"]):
-                        r, c = map(int, match.groups())
-                        new_df.iat[r, c] = str(cell["display_value"])
+    columns : numpy.ndarray
+        Whether each column of the styler's data is rendered.
 
+    """
+    df: pd.DataFrame = styler.data
+
+    # Formatters set with `Styler.format` are stored per cell, and cells
+    # without one use the default formatter.
+    display_funcs = styler._display_funcs
+    default_func = display_funcs.default_factory()
+    rows_by_column_and_func: Dict[
+        int, Dict[Callable[..., Any], List[int]]
+    ] = defaultdict(lambda: defaultdict(list))
+    for (r, c), func in display_funcs.items():
+        rows_by_column_and_func[c][func].append(r)
+
+    display_columns = {}
+    for c in range(df.shape[1]):
+        values = df.iloc[:, c]
+
+        # The index of each cell's formatter in `funcs`. Cells that aren't
+        # rendered keep their original value.
+        funcs: List[Any] = [None, default_func]
+        func_indices: "npt.NDArray[Any]" = np.zeros(len(values), dtype=np.intp)
+        if columns[c]:
+            func_indices[rows] = 1
+            for func, func_rows in rows_by_column_and_func[c].items():
+                func_rows_array = np.asarray(func_rows, dtype=np.intp)
+                func_indices[func_rows_array[rows[func_rows_array]]] = len(funcs)
+                funcs.append(func)
+
+        display_values: "npt.NDArray[Any]" = np.empty(len(values), dtype=object)
+        for i, func in enumerate(funcs):
+            mask = func_indices == i
+            if not mask.any():
+                continue
+            # If values in a column are not of the same type, Arrow
+            # serialization would fail. Thus, display values are strings.
+            # The default formatter leaves integers and booleans as they are,
+            # so their string values can be used as-is.
+            if func is None or (func is default_func and values.dtype.kind in "iub"):
+                display_values[mask] = values[mask].astype(str).to_numpy()
+            else:
+                cell_values = values[mask].to_numpy(dtype=object)
+                display_values[mask] = np.frompyfunc(func, 1, 1)(cell_values).astype(
+                    str
+                )
+        display_columns[c] = display_values
+
+    new_df = pd.DataFrame(display_columns, index=df.index)
+    new_df.columns = df.columns
     return new_df
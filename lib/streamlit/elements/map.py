@@ -15,7 +15,6 @@
 """A wrapper for simple PyDeck scatter charts."""
 
 import copy
-import hashlib
 import json
 from typing import (
     TYPE_CHECKING,
@@ -30,7 +29,9 @@ from typing import (
     cast,
 )
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing_extensions import Final, TypeAlias
 
 import streamlit.elements.deck_gl_json_chart as deck_gl_json_chart
@@ -63,6 +64,8 @@ _DEFAULT_LON_COL_NAMES: Final = {"lon", "longitude", "LON", "LONGITUDE"}
 _DEFAULT_COLOR: Final = (200, 30, 0, 160)
 _DEFAULT_SIZE: Final = 100
 _DEFAULT_ZOOM_LEVEL: Final = 12
+# The id of the scatterplot layer, which its data in the proto is named after.
+_MAP_LAYER_ID: Final = "st-map-layer"
 _ZOOM_LEVELS: Final = [
     360,
     180,
@@ -240,10 +243,12 @@ class MapMixin:
         #
         map_style = None
         map_proto = DeckGlJsonChartProto()
-        deck_gl_json = to_deckgl_json(
+        deck_gl_json, layer_data = to_deckgl_json(
             data, latitude, longitude, size, color, map_style, zoom
         )
-        marshall(map_proto, deck_gl_json, use_container_width)
+        deck_gl_json_chart.marshall_spec(
+            map_proto, deck_gl_json, layer_data, use_container_width
+        )
         return self.dg._enqueue("deck_gl_json_chart", map_proto)
 
     @property
@@ -260,15 +265,20 @@ def to_deckgl_json(
     color: Union[None, str, Collection[float]],
     map_style: Optional[str],
     zoom: Optional[int],
-) -> str:
+) -> Tuple[str, Dict[str, pa.Table]]:
+    """Returns the deck.gl JSON spec of the map, and the data of its layer as
+    an Arrow table keyed by the layer's id.
+
+    The data is only put into the spec itself if it can't be sent as Arrow.
+    """
     if data is None:
-        return json.dumps(_DEFAULT_MAP)
+        return json.dumps(_DEFAULT_MAP), {}
 
     # TODO(harahu): iterables don't have the empty attribute. This is either
     # a bug, or the documented data type is too broad. One or the other
     # should be addressed
     if hasattr(data, "empty") and data.empty:
-        return json.dumps(_DEFAULT_MAP)
+        return json.dumps(_DEFAULT_MAP), {}
 
     df = type_util.convert_anything_to_df(data)
 
@@ -300,17 +310,23 @@ def to_deckgl_json(
     default["initialViewState"]["latitude"] = center_lat
     default["initialViewState"]["longitude"] = center_lon
     default["initialViewState"]["zoom"] = zoom
-    default["layers"] = [
-        {
-            "@@type": "ScatterplotLayer",
-            "getPosition": f"@@=[{lon_col_name}, {lat_col_name}]",
-            "getRadius": size_arg,
-            "radiusMinPixels": 3,
-            "radiusUnits": "meters",
-            "getFillColor": color_arg,
-            "data": df.to_dict("records"),
-        }
-    ]
+    layer = {
+        "@@type": "ScatterplotLayer",
+        "id": _MAP_LAYER_ID,
+        "getPosition": f"@@=[{lon_col_name}, {lat_col_name}]",
+        "getRadius": size_arg,
+        "radiusMinPixels": 3,
+        "radiusUnits": "meters",
+        "getFillColor": color_arg,
+    }
+    default["layers"] = [layer]
+
+    layer_table = _to_layer_table(df, color_col_name)
+    if layer_table is None:
+        layer["data"] = df.to_dict("records")
+        layer_data = {}
+    else:
+        layer_data = {_MAP_LAYER_ID: layer_table}
 
     if map_style:
         if not config.get_option("mapbox.token"):
@@ -320,7 +336,28 @@ def to_deckgl_json(
             )
         default["mapStyle"] = map_style
 
-    return json.dumps(default)
+    return json.dumps(default), layer_data
+
+
+def _to_layer_table(
+    df: pd.DataFrame, color_col_name: Optional[str]
+) -> Optional[pa.Table]:
+    """Convert the map's data to the Arrow table of its layer, or return None
+    if it has columns that can't be sent as Arrow."""
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+    if color_col_name is not None:
+        # Colors were converted to tuples of ints from 0 to 255.
+        table = table.set_column(
+            table.column_names.index(color_col_name),
+            color_col_name,
+            table.column(color_col_name).cast(pa.list_(pa.uint8())),
+        )
+
+    return deck_gl_json_chart.to_layer_table(table)
 
 
 def _get_lat_or_lon_col_name(
@@ -358,9 +395,9 @@ def _get_lat_or_lon_col_name(
     # IMPLEMENTATION NOTE: We can't use isnull().values.any() because .values can return
     # ExtensionArrays, which don't have a .any() method.
     # (Read about ExtensionArrays here: # https://pandas.pydata.org/community/blog/extension-arrays.html)
-    # However, after a performance test I found the solution below runs basically as
-    # fast as .values.any().
-    if any(data[col_name].isnull().array):
+    # Converting to a boolean numpy array first avoids that, without iterating
+    # over the values in Python, which is slow for large maps.
+    if data[col_name].isnull().to_numpy(dtype=bool).any():
         raise StreamlitAPIException(
             f"Column {col_name} is not allowed to contain null values, such "
             "as NaN, NaT, or None."
@@ -422,8 +459,8 @@ def _convert_color_arg_or_column(
         # Convert color column to the right format.
         if len(data[color_col_name]) > 0 and is_color_like(data[color_col_name][0]):
             # Use .loc[] to avoid a SettingWithCopyWarning in some cases.
-            data.loc[:, color_col_name] = data.loc[:, color_col_name].map(
-                to_int_color_tuple
+            data.loc[:, color_col_name] = _to_int_color_tuples(
+                data.loc[:, color_col_name]
             )
         else:
             raise StreamlitAPIException(
@@ -440,6 +477,24 @@ def _convert_color_arg_or_column(
     return color_arg_out
 
 
+def _to_int_color_tuples(colors: pd.Series) -> pd.Series:
+    """Convert a column of colors to int color tuples, converting each
+    distinct color only once."""
+    try:
+        codes, uniques = pd.factorize(colors)
+    except TypeError:
+        # Colors like lists aren't hashable.
+        return colors.map(to_int_color_tuple)
+
+    if (codes < 0).any():
+        # Let missing colors raise the same error as other invalid colors.
+        return colors.map(to_int_color_tuple)
+
+    converted = np.empty(len(uniques), dtype=object)
+    converted[:] = [to_int_color_tuple(color) for color in uniques]
+    return pd.Series(converted[codes], index=colors.index)
+
+
 def _get_viewport_details(data, lat_col_name, lon_col_name, zoom):
     """Auto-set viewport when not fully specified by user."""
     min_lat = data[lat_col_name].min()
@@ -483,17 +538,3 @@ def _get_zoom_level(distance: float) -> int:
 
     # For small number of points the default zoom level will be used.
     return _DEFAULT_ZOOM_LEVEL
-
-
-def marshall(
-    pydeck_proto: DeckGlJsonChartProto,
-    pydeck_json: str,
-    use_container_width: bool,
-) -> None:
-    json_bytes = pydeck_json.encode("utf-8")
-    id = hashlib.md5(json_bytes).hexdigest()
-
-    pydeck_proto.json = pydeck_json
-    pydeck_proto.use_container_width = use_container_width
-
-    pydeck_proto.id = id
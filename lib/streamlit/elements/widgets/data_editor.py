@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import (
     TYPE_CHECKING,
@@ -33,9 +33,11 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
-from typing_extensions import Literal, TypeAlias, TypedDict
+from pandas.api.types import is_datetime64_any_dtype, is_scalar
+from typing_extensions import Final, Literal, TypeAlias, TypedDict
 
 from streamlit import logger as _logger
 from streamlit import type_util
@@ -71,7 +73,6 @@ from streamlit.type_util import DataFormat, DataFrameGenericAlias, Key, is_type,
 from streamlit.util import calc_md5
 
 if TYPE_CHECKING:
-    import numpy as np
     from pandas.io.formats.style import Styler
 
     from streamlit.delta_generator import DeltaGenerator
@@ -133,20 +134,97 @@ class EditingState(TypedDict, total=False):
     deleted_rows: List[int]
 
 
+def _empty_editing_state() -> EditingState:
+    return {"edited_rows": {}, "added_rows": [], "deleted_rows": []}
+
+
+@dataclass
+class AppliedEdits:
+    """The edits of a data editor that the server has applied.
+
+    They're kept between script runs, so that the frontend only needs to send
+    the cells that were edited since the version the server has applied, and
+    only those cells need to be applied to the data again.
+    """
+
+    # The version of the frontend's edits that were applied. The frontend
+    # increases it with every edit.
+    version: int = 0
+
+    # All edits that were applied.
+    editing_state: EditingState = field(default_factory=_empty_editing_state)
+
+    # The data of the data editor with all cell edits applied, but without
+    # added and deleted rows. None if it still needs to be computed.
+    cells_df: Optional[pd.DataFrame] = None
+
+    # Cell edits that haven't been applied to `cells_df` yet.
+    pending_cell_edits: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    def replace(self, editing_state: EditingState, version: int) -> None:
+        """Replace all applied edits."""
+        self.version = version
+        self.editing_state = editing_state
+        self.cells_df = None
+        self.pending_cell_edits = {}
+
+    def update(self, editing_state: EditingState, version: int) -> None:
+        """Apply the edits made since the applied version.
+
+        `editing_state` contains the cells that were edited since the applied
+        version, and all added and deleted rows.
+        """
+        edited_rows = dict(self.editing_state["edited_rows"])
+        for row_pos, row_changes in editing_state["edited_rows"].items():
+            edited_rows[row_pos] = {**edited_rows.get(row_pos, {}), **row_changes}
+            self.pending_cell_edits.setdefault(row_pos, {}).update(row_changes)
+
+        # The edits of deleted rows are discarded, like in the frontend.
+        previously_deleted_rows = set(self.editing_state["deleted_rows"])
+        for row_pos in editing_state["deleted_rows"]:
+            if row_pos not in previously_deleted_rows:
+                edited_rows.pop(row_pos, None)
+
+        # A new dict is used, so that previously returned states don't change.
+        self.editing_state = {
+            "edited_rows": edited_rows,
+            "added_rows": editing_state["added_rows"],
+            "deleted_rows": editing_state["deleted_rows"],
+        }
+        self.version = version
+
+
 @dataclass
 class DataEditorSerde:
-    """DataEditorSerde is used to serialize and deserialize the data editor state."""
+    """DataEditorSerde is used to serialize and deserialize the data editor state.
+
+    The frontend sends the edits made since the version of its edits that the
+    server has applied (`base_version`), which are applied to `applied_edits`.
+    A widget value without a version is a complete editing state.
+    """
+
+    applied_edits: AppliedEdits = field(default_factory=AppliedEdits)
 
     def deserialize(self, ui_value: Optional[str], widget_id: str = "") -> EditingState:
-        data_editor_state: EditingState = (
-            {
-                "edited_rows": {},
-                "added_rows": [],
-                "deleted_rows": [],
-            }
-            if ui_value is None
-            else json.loads(ui_value)
-        )
+        applied_edits = self.applied_edits
+        if ui_value is None:
+            applied_edits.replace(_empty_editing_state(), 0)
+            return applied_edits.editing_state
+
+        data_editor_state = json.loads(ui_value)
+        version: Optional[int] = data_editor_state.pop("version", None)
+        base_version: int = data_editor_state.pop("base_version", 0)
+
+        if version is not None and version <= applied_edits.version:
+            # The edits were already applied, e.g. because another widget
+            # triggered the rerun.
+            return applied_edits.editing_state
+
+        if base_version > applied_edits.version:
+            # The edits the frontend's update is based on are unknown, e.g.
+            # because the server restarted. The frontend sends all edits again
+            # once it gets the version that's actually applied.
+            return applied_edits.editing_state
 
         # Make sure that all editing state keys are present:
         if "edited_rows" not in data_editor_state:
@@ -163,10 +241,17 @@ class DataEditorSerde:
         data_editor_state["edited_rows"] = {
             int(k): v for k, v in data_editor_state["edited_rows"].items()
         }
-        return data_editor_state
+
+        if base_version == 0:
+            applied_edits.replace(data_editor_state, version or 0)
+        else:
+            applied_edits.update(data_editor_state, cast(int, version))
+        return applied_edits.editing_state
 
     def serialize(self, editing_state: EditingState) -> str:
-        return json.dumps(editing_state, default=str)
+        return json.dumps(
+            {**editing_state, "version": self.applied_edits.version}, default=str
+        )
 
 
 def _parse_value(
@@ -237,6 +322,46 @@ def _parse_value(
     return value
 
 
+def _parse_values(
+    values: List[str | int | float | bool | None],
+    column_data_kind: ColumnDataKind,
+) -> List[Any]:
+    """Convert the values of a column to the correct type.
+
+    Values that are already of the column's type, which is how the frontend
+    sends most of them, are kept as they are. Datetime strings are parsed
+    together.
+    """
+    value_type = _PARSED_VALUE_TYPES.get(column_data_kind)
+    if value_type is not None and all(
+        value is None or type(value) is value_type for value in values
+    ):
+        return values
+
+    if column_data_kind == ColumnDataKind.DATETIME and all(
+        type(value) is str for value in values
+    ):
+        try:
+            parsed = pd.to_datetime(pd.Series(values, dtype=object))
+        except (ValueError, TypeError, pd.errors.ParserError):
+            # Mixed formats are parsed one by one below.
+            pass
+        else:
+            if is_datetime64_any_dtype(parsed):
+                return [None if value is pd.NaT else value for value in parsed.tolist()]
+
+    return [_parse_value(value, column_data_kind) for value in values]
+
+
+# The types that the values of columns of each data kind are parsed into.
+_PARSED_VALUE_TYPES: Final = {
+    ColumnDataKind.STRING: str,
+    ColumnDataKind.INTEGER: int,
+    ColumnDataKind.FLOAT: float,
+    ColumnDataKind.BOOLEAN: bool,
+}
+
+
 def _apply_cell_edits(
     df: pd.DataFrame,
     edited_rows: Mapping[int, Mapping[str, str | int | float | bool | None]],
@@ -244,6 +369,8 @@ def _apply_cell_edits(
 ) -> None:
     """Apply cell edits to the provided dataframe (inplace).
 
+    The edits are grouped by column, so that each column is only written once.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -255,29 +382,51 @@ def _apply_cell_edits(
     dataframe_schema: DataframeSchema
         The schema of the dataframe.
     """
+    # Column name -> (row positions, values)
+    column_edits: Dict[str, Tuple[List[int], List[Any]]] = {}
     for row_id, row_changes in edited_rows.items():
         row_pos = int(row_id)
         for col_name, value in row_changes.items():
-            if col_name == INDEX_IDENTIFIER:
-                # The edited cell is part of the index
-                # TODO(lukasmasuch): To support multi-index in the future:
-                # use a tuple of values here instead of a single value
-                df.index.values[row_pos] = _parse_value(
-                    value, dataframe_schema[INDEX_IDENTIFIER]
-                )
-            else:
-                col_pos = df.columns.get_loc(col_name)
-                df.iat[row_pos, col_pos] = _parse_value(
-                    value, dataframe_schema[col_name]
-                )
+            positions, values = column_edits.setdefault(col_name, ([], []))
+            positions.append(row_pos)
+            values.append(value)
+
+    for col_name, (positions, values) in column_edits.items():
+        parsed_values = _parse_values(values, dataframe_schema[col_name])
+        if col_name == INDEX_IDENTIFIER:
+            # The edited cells are part of the index
+            # TODO(lukasmasuch): To support multi-index in the future:
+            # use a tuple of values here instead of a single value
+            index_values = df.index.values
+            for row_pos, value in zip(positions, parsed_values):
+                index_values[row_pos] = value
+        else:
+            col_pos = df.columns.get_loc(col_name)
+            if not all(is_scalar(value) for value in parsed_values):
+                # Values like lists can't be set together with other values.
+                for row_pos, value in zip(positions, parsed_values):
+                    df.iat[row_pos, col_pos] = value
+                continue
+
+            column_dtype = df.dtypes.iloc[col_pos]
+            if isinstance(column_dtype, np.dtype) and column_dtype.kind in "iuf":
+                # None would make pandas convert the column to objects, but
+                # it's a missing number here, like when editing single cells.
+                parsed_values = [
+                    np.nan if value is None else value for value in parsed_values
+                ]
+            df.iloc[positions, col_pos] = parsed_values
 
 
 def _apply_row_additions(
     df: pd.DataFrame,
     added_rows: List[Dict[str, Any]],
     dataframe_schema: DataframeSchema,
-) -> None:
-    """Apply row additions to the provided dataframe (inplace).
+) -> pd.DataFrame:
+    """Apply row additions to the provided dataframe.
+
+    All added rows are concatenated to the dataframe at once, except for rows
+    whose index value already exists, which overwrite the existing rows.
 
     Parameters
     ----------
@@ -290,43 +439,81 @@ def _apply_row_additions(
 
     dataframe_schema: DataframeSchema
         The schema of the dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataframe with the added rows. This is a new dataframe if any
+        rows were added.
     """
     if not added_rows:
-        return
-
-    # This is only used if the dataframe has a range index:
-    # There seems to be a bug in older pandas versions with RangeIndex in
-    # combination with loc. As a workaround, we manually track the values here:
-    range_index_stop = None
-    range_index_step = None
+        return df
+
+    # Parse the values of each column at once.
+    columns: Dict[str, List[Any]] = {
+        col_name: [row.get(col_name) for row in added_rows]
+        for col_name in {col_name for row in added_rows for col_name in row}
+    }
+    parsed_columns = {
+        col_name: _parse_values(values, dataframe_schema[col_name])
+        for col_name, values in columns.items()
+    }
+    index_values = parsed_columns.pop(INDEX_IDENTIFIER, [None] * len(added_rows))
+
+    rows: List[List[Any]] = []
+    labels: List[Any] = []
     if isinstance(df.index, pd.RangeIndex):
-        range_index_stop = df.index.stop
-        range_index_step = df.index.step
-
-    for added_row in added_rows:
-        index_value = None
-        new_row: List[Any] = [None for _ in range(df.shape[1])]
-        for col_name in added_row.keys():
-            value = added_row[col_name]
-            if col_name == INDEX_IDENTIFIER:
-                # TODO(lukasmasuch): To support multi-index in the future:
-                # use a tuple of values here instead of a single value
-                index_value = _parse_value(value, dataframe_schema[INDEX_IDENTIFIER])
+        # Rows are added after the last index value of the range.
+        rows = [
+            [
+                parsed_columns[col_name][i] if col_name in parsed_columns else None
+                for col_name in df.columns
+            ]
+            for i in range(len(added_rows))
+        ]
+        new_index: pd.Index = pd.RangeIndex(
+            df.index.stop,
+            df.index.stop + len(rows) * df.index.step,
+            df.index.step,
+        )
+    else:
+        # TODO(lukasmasuch): we are only adding rows that have a non-None index
+        # value to prevent issues in the frontend component. Also, it just overwrites
+        # the row in case the index value already exists in the dataframe.
+        # In the future, it would be better to require users to provide unique
+        # non-None values for the index with some kind of visual indications.
+        rows_by_label: Dict[Any, List[Any]] = {}
+        for i, index_value in enumerate(index_values):
+            if index_value is None:
+                continue
+            rows_by_label[index_value] = [
+                parsed_columns[col_name][i] if col_name in parsed_columns else None
+                for col_name in df.columns
+            ]
+
+        for label, row in rows_by_label.items():
+            if label in df.index:
+                df.loc[label, :] = row
             else:
-                col_pos = df.columns.get_loc(col_name)
-                new_row[col_pos] = _parse_value(value, dataframe_schema[col_name])
-        # Append the new row to the dataframe
-        if range_index_stop is not None:
-            df.loc[range_index_stop, :] = new_row
-            # Increment to the next range index value
-            range_index_stop += range_index_step
-        elif index_value is not None:
-            # TODO(lukasmasuch): we are only adding rows that have a non-None index
-            # value to prevent issues in the frontend component. Also, it just overwrites
-            # the row in case the index value already exists in the dataframe.
-            # In the future, it would be better to require users to provide unique
-            # non-None values for the index with some kind of visual indications.
-            df.loc[index_value, :] = new_row
+                labels.append(label)
+                rows.append(row)
+        new_index = pd.Index(labels, dtype=df.index.dtype if labels else None)
+
+    if not rows:
+        return df
+
+    new_rows = pd.DataFrame(rows, columns=df.columns, index=new_index)
+    # The new rows' columns have numpy dtypes inferred from their values, so
+    # extension dtypes (e.g. Int64) are restored to keep them when concatenating.
+    dtypes = {
+        col_name: dtype
+        for col_name, dtype in df.dtypes.items()
+        if df.empty or not isinstance(dtype, np.dtype)
+    }
+    new_rows = new_rows.astype(dtypes, errors="ignore")
+    if df.empty:
+        return new_rows
+    return pd.concat([df, new_rows])
 
 
 def _apply_row_deletions(df: pd.DataFrame, deleted_rows: List[int]) -> None:
@@ -348,10 +535,12 @@ def _apply_dataframe_edits(
     df: pd.DataFrame,
     data_editor_state: EditingState,
     dataframe_schema: DataframeSchema,
-) -> None:
-    """Apply edits to the provided dataframe (inplace).
+) -> pd.DataFrame:
+    """Apply edits to the provided dataframe.
 
-    This includes cell edits, row additions and row deletions.
+    This includes cell edits, row additions and row deletions. Cell edits and
+    row deletions are applied inplace, while row additions create a new
+    dataframe.
 
     Parameters
     ----------
@@ -363,16 +552,80 @@ def _apply_dataframe_edits(
 
     dataframe_schema: DataframeSchema
         The schema of the dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The edited dataframe.
     """
     if data_editor_state.get("edited_rows"):
         _apply_cell_edits(df, data_editor_state["edited_rows"], dataframe_schema)
 
     if data_editor_state.get("added_rows"):
-        _apply_row_additions(df, data_editor_state["added_rows"], dataframe_schema)
+        df = _apply_row_additions(df, data_editor_state["added_rows"], dataframe_schema)
 
     if data_editor_state.get("deleted_rows"):
         _apply_row_deletions(df, data_editor_state["deleted_rows"])
 
+    return df
+
+
+def _get_edited_dataframe(
+    applied_edits: AppliedEdits,
+    df: pd.DataFrame,
+    dataframe_schema: DataframeSchema,
+) -> pd.DataFrame:
+    """Return the provided dataframe with the applied edits of a data editor.
+
+    The dataframe with all cell edits is kept between script runs, so that only
+    the cells edited since the last script run need to be applied to it. Added
+    and deleted rows are applied to a copy of it.
+
+    Parameters
+    ----------
+    applied_edits : AppliedEdits
+        The edits that the server has applied.
+
+    df : pd.DataFrame
+        The dataframe to apply the edits to. Might be changed inplace.
+
+    dataframe_schema: DataframeSchema
+        The schema of the dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The edited dataframe.
+    """
+    editing_state = applied_edits.editing_state
+    if not (
+        editing_state["edited_rows"]
+        or editing_state["added_rows"]
+        or editing_state["deleted_rows"]
+    ):
+        applied_edits.cells_df = None
+        applied_edits.pending_cell_edits = {}
+        return df
+
+    if applied_edits.cells_df is None:
+        _apply_cell_edits(df, editing_state["edited_rows"], dataframe_schema)
+        applied_edits.cells_df = df
+    elif applied_edits.pending_cell_edits:
+        _apply_cell_edits(
+            applied_edits.cells_df, applied_edits.pending_cell_edits, dataframe_schema
+        )
+    applied_edits.pending_cell_edits = {}
+
+    # The kept dataframe must not be changed by the user.
+    df = applied_edits.cells_df.copy()
+    if editing_state["added_rows"]:
+        df = _apply_row_additions(df, editing_state["added_rows"], dataframe_schema)
+
+    if editing_state["deleted_rows"]:
+        _apply_row_deletions(df, editing_state["deleted_rows"])
+
+    return df
+
 
 def _is_supported_index(df_index: pd.Index) -> bool:
     """Check if the index is supported by the data editor component.
@@ -895,9 +1148,16 @@ class DataEditorMixin:
 
         marshall_column_config(proto, column_config_mapping)
 
-        serde = DataEditorSerde()
+        # The edits are kept for as long as the data editor is shown in the
+        # session, and are discarded when its data or configuration change.
+        applied_edits = (
+            ctx.session_state.get_widget_server_state(id, AppliedEdits)
+            if ctx
+            else AppliedEdits()
+        )
+        serde = DataEditorSerde(applied_edits)
 
-        widget_state = register_widget(
+        register_widget(
             "data_editor",
             proto,
             user_key=key,
@@ -909,7 +1169,8 @@ class DataEditorMixin:
             ctx=ctx,
         )
 
-        _apply_dataframe_edits(data_df, widget_state.value, dataframe_schema)
+        data_df = _get_edited_dataframe(applied_edits, data_df, dataframe_schema)
+        proto.edits_version = applied_edits.version
         self.dg._enqueue("arrow_data_frame", proto)
         return type_util.convert_df_to_data_format(data_df, data_format)
 
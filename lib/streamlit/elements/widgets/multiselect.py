@@ -43,7 +43,7 @@ from streamlit.runtime.state import (
     WidgetKwargs,
     register_widget,
 )
-from streamlit.runtime.state.common import compute_widget_id
+from streamlit.runtime.state.common import compute_widget_id, format_options
 from streamlit.type_util import (
     Key,
     LabelVisibility,
@@ -298,11 +298,12 @@ class MultiSelectMixin:
 
         indices = _check_and_convert_to_indices(opt, default)
 
+        formatted_options = format_options(opt, format_func)
         id = compute_widget_id(
             "multiselect",
             user_key=key,
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             default=indices,
             key=key,
             help=help,
@@ -318,7 +319,7 @@ class MultiSelectMixin:
         multiselect_proto.id = id
         multiselect_proto.label = label
         multiselect_proto.default[:] = default_value
-        multiselect_proto.options[:] = [str(format_func(option)) for option in opt]
+        multiselect_proto.options[:] = formatted_options
         multiselect_proto.form_id = current_form_id(self.dg)
         multiselect_proto.max_selections = max_selections or 0
         multiselect_proto.placeholder = placeholder
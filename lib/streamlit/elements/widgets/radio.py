@@ -34,7 +34,7 @@ from streamlit.runtime.state import (
     WidgetKwargs,
     register_widget,
 )
-from streamlit.runtime.state.common import compute_widget_id
+from streamlit.runtime.state.common import compute_widget_id, format_options
 from streamlit.type_util import (
     Key,
     LabelVisibility,
@@ -254,11 +254,12 @@ class RadioMixin:
         maybe_raise_label_warnings(label, label_visibility)
         opt = ensure_indexable(options)
 
+        formatted_options = format_options(opt, format_func)
         id = compute_widget_id(
             "radio",
             user_key=key,
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             index=index,
             key=key,
             help=help,
@@ -293,7 +294,7 @@ class RadioMixin:
         radio_proto.label = label
         if index is not None:
             radio_proto.default = index
-        radio_proto.options[:] = [str(format_func(option)) for option in opt]
+        radio_proto.options[:] = formatted_options
         radio_proto.form_id = current_form_id(self.dg)
         radio_proto.horizontal = horizontal
         radio_proto.disabled = disabled
@@ -45,7 +45,7 @@ from streamlit.runtime.state import (
     WidgetKwargs,
     register_widget,
 )
-from streamlit.runtime.state.common import compute_widget_id
+from streamlit.runtime.state.common import compute_widget_id, format_options
 from streamlit.type_util import (
     Key,
     LabelVisibility,
@@ -119,6 +119,7 @@ class SelectSliderMixin:
         *,  # keyword-only arguments:
         disabled: bool = False,
         label_visibility: LabelVisibility = "visible",
+        debounce: Optional[float] = None,
     ) -> Union[T, Tuple[T, T]]:
         r"""
         Display a slider widget to select items from a list.
@@ -195,6 +196,12 @@ class SelectSliderMixin:
             is still empty space for it above the widget (equivalent to label="").
             If "collapsed", both the label and the space are removed. Default is
             "visible". This argument can only be supplied by keyword.
+        debounce : float or None
+            How long the reruns that changes to this select slider's value request are
+            held for, in seconds, so that the changes made while dragging it
+            are coalesced into fewer reruns. If None (default), the
+            ``runner.rerunDebounceDelay`` config option is used. This argument
+            can only be supplied by keyword.
 
         Returns
         -------
@@ -239,6 +246,7 @@ class SelectSliderMixin:
             kwargs=kwargs,
             disabled=disabled,
             label_visibility=label_visibility,
+            debounce=debounce,
             ctx=ctx,
         )
 
@@ -255,6 +263,7 @@ class SelectSliderMixin:
         kwargs: Optional[WidgetKwargs] = None,
         disabled: bool = False,
         label_visibility: LabelVisibility = "visible",
+        debounce: Optional[float] = None,
         ctx: Optional[ScriptRunContext] = None,
     ) -> Union[T, Tuple[T, T]]:
         key = to_key(key)
@@ -286,11 +295,12 @@ class SelectSliderMixin:
         # Convert element to index of the elements
         slider_value = as_index_list(value)
 
+        formatted_options = format_options(opt, format_func)
         id = compute_widget_id(
             "select_slider",
             user_key=key,
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             value=slider_value,
             key=key,
             help=help,
@@ -308,7 +318,7 @@ class SelectSliderMixin:
         slider_proto.max = len(opt) - 1
         slider_proto.step = 1  # default for index changes
         slider_proto.data_type = SliderProto.INT
-        slider_proto.options[:] = [str(format_func(option)) for option in opt]
+        slider_proto.options[:] = formatted_options
         slider_proto.form_id = current_form_id(self.dg)
         slider_proto.disabled = disabled
         slider_proto.label_visibility.value = get_label_visibility_proto_value(
@@ -329,6 +339,7 @@ class SelectSliderMixin:
             deserializer=serde.deserialize,
             serializer=serde.serialize,
             ctx=ctx,
+            debounce=debounce,
         )
 
         if widget_state.value_changed:
@@ -33,7 +33,7 @@ from streamlit.runtime.state import (
     WidgetKwargs,
     register_widget,
 )
-from streamlit.runtime.state.common import compute_widget_id
+from streamlit.runtime.state.common import compute_widget_id, format_options
 from streamlit.type_util import (
     Key,
     LabelVisibility,
@@ -234,11 +234,12 @@ class SelectboxMixin:
 
         opt = ensure_indexable(options)
 
+        formatted_options = format_options(opt, format_func)
         id = compute_widget_id(
             "selectbox",
             user_key=key,
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             index=index,
             key=key,
             help=help,
@@ -262,7 +263,7 @@ class SelectboxMixin:
         selectbox_proto.label = label
         if index is not None:
             selectbox_proto.default = index
-        selectbox_proto.options[:] = [str(format_func(option)) for option in opt]
+        selectbox_proto.options[:] = formatted_options
         selectbox_proto.form_id = current_form_id(self.dg)
         selectbox_proto.placeholder = placeholder
         selectbox_proto.disabled = disabled
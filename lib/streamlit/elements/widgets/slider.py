@@ -187,6 +187,7 @@ class SliderMixin:
         *,  # keyword-only arguments:
         disabled: bool = False,
         label_visibility: LabelVisibility = "visible",
+        debounce: Optional[float] = None,
         # TODO(harahu): Add overload definitions. The return type is
         #  `SliderReturn`, in reality, but the return type is left as `Any`
         #  until we have proper overload definitions in place. Otherwise the
@@ -285,6 +286,12 @@ class SliderMixin:
             is still empty space for it above the widget (equivalent to label="").
             If "collapsed", both the label and the space are removed. Default is
             "visible". This argument can only be supplied by keyword.
+        debounce : float or None
+            How long the reruns that changes to this slider's value request are
+            held for, in seconds, so that the changes made while dragging it
+            are coalesced into fewer reruns. If None (default), the
+            ``runner.rerunDebounceDelay`` config option is used. This argument
+            can only be supplied by keyword.
 
 
         Returns
@@ -350,6 +357,7 @@ class SliderMixin:
             kwargs=kwargs,
             disabled=disabled,
             label_visibility=label_visibility,
+            debounce=debounce,
             ctx=ctx,
         )
 
@@ -369,6 +377,7 @@ class SliderMixin:
         *,  # keyword-only arguments:
         disabled: bool = False,
         label_visibility: LabelVisibility = "visible",
+        debounce: Optional[float] = None,
         ctx: Optional[ScriptRunContext] = None,
     ) -> SliderReturn:
         key = to_key(key)
@@ -663,6 +672,7 @@ class SliderMixin:
             deserializer=serde.deserialize,
             serializer=serde.serialize,
             ctx=ctx,
+            debounce=debounce,
         )
 
         if widget_state.value_changed:
@@ -0,0 +1,53 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+*!
+Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import builtins
+import google.protobuf.descriptor
+import google.protobuf.message
+import sys
+
+if sys.version_info >= (3, 8):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+class AppPage(google.protobuf.message.Message):
+    """A page in the app. Includes both the name of the page as well as the full
+    path to the corresponding script file.
+    """
+
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PAGE_SCRIPT_HASH_FIELD_NUMBER: builtins.int
+    PAGE_NAME_FIELD_NUMBER: builtins.int
+    ICON_FIELD_NUMBER: builtins.int
+    page_script_hash: builtins.str
+    page_name: builtins.str
+    icon: builtins.str
+    def __init__(
+        self,
+        *,
+        page_script_hash: builtins.str = ...,
+        page_name: builtins.str = ...,
+        icon: builtins.str = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["icon", b"icon", "page_name", b"page_name", "page_script_hash", b"page_script_hash"]) -> None: ...
+
+global___AppPage = AppPage
@@ -0,0 +1,65 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+*!
+Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import builtins
+import collections.abc
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import streamlit.proto.ArrowNamedDataSet_pb2
+import sys
+
+if sys.version_info >= (3, 8):
+    import typing as typing_extensions
+else:
+    import typing_extensions
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+class DeckGlJsonChart(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    JSON_FIELD_NUMBER: builtins.int
+    TOOLTIP_FIELD_NUMBER: builtins.int
+    USE_CONTAINER_WIDTH_FIELD_NUMBER: builtins.int
+    ID_FIELD_NUMBER: builtins.int
+    DATASETS_FIELD_NUMBER: builtins.int
+    json: builtins.str
+    """The json of the pydeck object (https://deckgl.readthedocs.io/en/latest/deck.html)"""
+    tooltip: builtins.str
+    use_container_width: builtins.bool
+    """If True, will overwrite the chart width spec to fit to container."""
+    id: builtins.str
+    """the hash of the json so the the frontend doesn't always have to parse the pydeck json object"""
+    @property
+    def datasets(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[streamlit.proto.ArrowNamedDataSet_pb2.ArrowNamedDataSet]:
+        """The data of the layers that is sent as Arrow tables instead of inside the
+        json. Each dataset is named after the id of the layer it belongs to.
+        """
+    def __init__(
+        self,
+        *,
+        json: builtins.str = ...,
+        tooltip: builtins.str = ...,
+        use_container_width: builtins.bool = ...,
+        id: builtins.str = ...,
+        datasets: collections.abc.Iterable[streamlit.proto.ArrowNamedDataSet_pb2.ArrowNamedDataSet] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["datasets", b"datasets", "id", b"id", "json", b"json", "tooltip", b"tooltip", "use_container_width", b"use_container_width"]) -> None: ...
+
+global___DeckGlJsonChart = DeckGlJsonChart
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import math
 import sys
 import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
+from typing_extensions import Final
+
 import streamlit.elements.exception as exception_utils
 from streamlit import config, runtime, source_util
 from streamlit.case_converters import to_snake_case
@@ -33,22 +36,36 @@ from streamlit.proto.NewSession_pb2 import (
     UserInfo,
 )
 from streamlit.proto.PagesChanged_pb2 import PagesChanged
-from streamlit.runtime import caching, legacy_caching
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from streamlit.runtime import caching, legacy_caching, tracing
 from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 from streamlit.runtime.metrics_util import Installation
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
 from streamlit.runtime.secrets import secrets_singleton
+from streamlit.runtime.state.widgets import coalesce_widget_states
+from streamlit.runtime.stats import get_metrics_registry
 from streamlit.runtime.uploaded_file_manager import UploadedFileManager
 from streamlit.version import STREAMLIT_VERSION_STRING
 from streamlit.watcher import LocalSourcesWatcher
 
 LOGGER = get_logger(__name__)
 if TYPE_CHECKING:
+    from streamlit.runtime.scriptrunner.worker_pool import (
+        ScriptWorkerPool,
+        WorkerScriptRunner,
+    )
     from streamlit.runtime.state import SessionState
 
 
+_COALESCED_RERUN_REQUESTS: Final = get_metrics_registry().counter(
+    "coalesced_rerun_requests",
+    "Rerun requests that were held by the rerun debounce delay, and were "
+    "replaced by a later request before they ran.",
+)
+
+
 class AppSessionState(Enum):
     APP_NOT_RUNNING = "APP_NOT_RUNNING"
     APP_IS_RUNNING = "APP_IS_RUNNING"
@@ -144,7 +161,7 @@ class AppSession:
 
         self._run_on_save = config.get_option("server.runOnSave")
 
-        self._scriptrunner: Optional[ScriptRunner] = None
+        self._scriptrunner: Optional[Union[ScriptRunner, "WorkerScriptRunner"]] = None
 
         # This needs to be lazily imported to avoid a dependency cycle.
         from streamlit.runtime.state import SessionState
@@ -154,6 +171,15 @@ class AppSession:
 
         self._debug_last_backmsg_id: Optional[str] = None
 
+        # The widget states of the latest rerun request, which the next
+        # request's widget states are compared to.
+        self._requested_widget_states: Dict[str, WidgetState] = {}
+        # The rerun request that's held until its debounce delay is over, and
+        # the timer that requests it then.
+        self._debounced_client_state: Optional[ClientState] = None
+        self._debounced_rerun_timer: Optional[asyncio.TimerHandle] = None
+        self._last_debounced_rerun_time = -math.inf
+
         LOGGER.debug("AppSession initialized (id=%s)", self.id)
 
     def __del__(self) -> None:
@@ -205,6 +231,11 @@ class AppSession:
         self._stop_config_listener = None
         self._stop_pages_listener = None
 
+    @property
+    def browser_queue_size(self) -> int:
+        """The number of ForwardMsgs waiting to be delivered to the browser."""
+        return len(self._browser_queue)
+
     def flush_browser_queue(self) -> List[ForwardMsg]:
         """Clear the forward message queue and return the messages it contained.
 
@@ -236,11 +267,24 @@ class AppSession:
                 rt = runtime.get_instance()
                 rt.media_file_mgr.clear_session_refs(self.id)
                 rt.media_file_mgr.remove_orphaned_files()
+                rt.script_profile_store.clear_session(self.id)
+                if rt.dataframe_window_mgr is not None:
+                    rt.dataframe_window_mgr.clear_session_refs(self.id)
+                    rt.dataframe_window_mgr.remove_orphaned_windows()
+
+            script_worker_pool = _get_script_worker_pool()
+            if script_worker_pool is not None:
+                script_worker_pool.close_session(self.id)
 
             # Shut down the ScriptRunner, if one is active.
             # self._state must not be set to SHUTDOWN_REQUESTED until
             # *after* this is called.
             self.request_script_stop()
+            self._cancel_debounced_rerun()
+
+            tracer = tracing.get_tracer()
+            if tracer is not None:
+                tracer.on_session_closed(self.id)
 
             self._state = AppSessionState.SHUTDOWN_REQUESTED
 
@@ -343,6 +387,10 @@ class AppSession:
             LOGGER.warning("Discarding rerun request after shutdown")
             return
 
+        tracer = tracing.get_tracer()
+        if tracer is not None:
+            tracer.on_rerun_requested(self.id)
+
         if client_state:
             rerun_data = RerunData(
                 client_state.query_string,
@@ -383,17 +431,31 @@ class AppSession:
 
     def _create_scriptrunner(self, initial_rerun_data: RerunData) -> None:
         """Create and run a new ScriptRunner with the given RerunData."""
-        self._scriptrunner = ScriptRunner(
-            session_id=self.id,
-            main_script_path=self._script_data.main_script_path,
-            session_state=self._session_state,
-            uploaded_file_mgr=self._uploaded_file_mgr,
-            script_cache=self._script_cache,
-            initial_rerun_data=initial_rerun_data,
-            user_info=self._user_info,
-        )
-        self._scriptrunner.on_event.connect(self._on_scriptrunner_event)
-        self._scriptrunner.start()
+        scriptrunner: Union[ScriptRunner, "WorkerScriptRunner"]
+        script_worker_pool = _get_script_worker_pool()
+        if script_worker_pool is not None:
+            # The script runs in a worker process, which holds the actual
+            # ScriptRunner (and our session_state).
+            scriptrunner = script_worker_pool.create_scriptrunner(
+                session_id=self.id,
+                main_script_path=self._script_data.main_script_path,
+                session_state=self._session_state,
+                initial_rerun_data=initial_rerun_data,
+                user_info=self._user_info,
+            )
+        else:
+            scriptrunner = ScriptRunner(
+                session_id=self.id,
+                main_script_path=self._script_data.main_script_path,
+                session_state=self._session_state,
+                uploaded_file_mgr=self._uploaded_file_mgr,
+                script_cache=self._script_cache,
+                initial_rerun_data=initial_rerun_data,
+                user_info=self._user_info,
+            )
+        self._scriptrunner = scriptrunner
+        scriptrunner.on_event.connect(self._on_scriptrunner_event)
+        scriptrunner.start()
 
     @property
     def session_state(self) -> "SessionState":
@@ -418,6 +480,10 @@ class AppSession:
         """One of our source files changed. Clear the cache and schedule a rerun if appropriate."""
         self._script_cache.clear()
 
+        script_worker_pool = _get_script_worker_pool()
+        if script_worker_pool is not None:
+            script_worker_pool.invalidate_sources()
+
         if filepath is not None and not self._should_rerun_on_file_change(filepath):
             return
 
@@ -446,7 +512,7 @@ class AppSession:
 
     def _on_scriptrunner_event(
         self,
-        sender: Optional[ScriptRunner],
+        sender: Optional[Union[ScriptRunner, "WorkerScriptRunner"]],
         event: ScriptRunnerEvent,
         forward_msg: Optional[ForwardMsg] = None,
         exception: Optional[BaseException] = None,
@@ -467,7 +533,7 @@ class AppSession:
 
     def _handle_scriptrunner_event_on_event_loop(
         self,
-        sender: Optional[ScriptRunner],
+        sender: Optional[Union[ScriptRunner, "WorkerScriptRunner"]],
         event: ScriptRunnerEvent,
         forward_msg: Optional[ForwardMsg] = None,
         exception: Optional[BaseException] = None,
@@ -708,6 +774,11 @@ class AppSession:
     ) -> None:
         """Tell the ScriptRunner to re-run its script.
 
+        Requests that change widget values are debounced: if one arrives less
+        than its debounce delay after the previous debounced rerun, it's held
+        until the delay is over, and the requests that arrive in the meantime
+        are coalesced into it.
+
         Parameters
         ----------
         client_state : streamlit.proto.ClientState_pb2.ClientState | None
@@ -715,10 +786,82 @@ class AppSession:
             to use previous client state.
 
         """
+        delay = self._get_rerun_debounce_delay(client_state)
+        if client_state is not None:
+            self._requested_widget_states = {
+                widget_state.id: widget_state
+                for widget_state in client_state.widget_states.widgets
+            }
+
+        if self._debounced_client_state is not None:
+            # This request replaces the one that's being held.
+            _COALESCED_RERUN_REQUESTS.inc()
+            client_state = _coalesce_client_states(
+                self._debounced_client_state, client_state
+            )
+            self._debounced_client_state = None
+
+        if delay > 0:
+            now = self._event_loop.time()
+            wait = self._last_debounced_rerun_time + delay - now
+            if wait > 0:
+                self._debounced_client_state = client_state
+                if self._debounced_rerun_timer is None:
+                    self._debounced_rerun_timer = self._event_loop.call_later(
+                        wait, self._request_debounced_rerun
+                    )
+                return
+            self._last_debounced_rerun_time = now
+
+        self._cancel_debounced_rerun()
         self.request_rerun(client_state)
 
+    def _get_rerun_debounce_delay(self, client_state: Optional[ClientState]) -> float:
+        """Return how long a rerun request's debounce delay is, in seconds.
+
+        The delay is the largest one of the widgets whose values the request
+        changes. Requests that press a button, or that don't change any
+        widget's value, aren't debounced.
+        """
+        if client_state is None:
+            return 0.0
+
+        default_delay = float(config.get_option("runner.rerunDebounceDelay"))
+        delay = 0.0
+        for widget_state in client_state.widget_states.widgets:
+            value_type = widget_state.WhichOneof("value")
+            if value_type == "trigger_value":
+                if widget_state.trigger_value:
+                    return 0.0
+            elif value_type == "string_trigger_value":
+                if widget_state.string_trigger_value.HasField("data"):
+                    return 0.0
+            elif self._requested_widget_states.get(widget_state.id) != widget_state:
+                widget_delay = self._session_state.get_widget_debounce(widget_state.id)
+                delay = max(
+                    delay, default_delay if widget_delay is None else widget_delay
+                )
+        return delay
+
+    def _request_debounced_rerun(self) -> None:
+        """Request the rerun that's held, once its debounce delay is over."""
+        self._debounced_rerun_timer = None
+        client_state = self._debounced_client_state
+        self._debounced_client_state = None
+        if client_state is not None:
+            self._last_debounced_rerun_time = self._event_loop.time()
+            self.request_rerun(client_state)
+
+    def _cancel_debounced_rerun(self) -> None:
+        """Drop the rerun request that's held, if there is one."""
+        if self._debounced_rerun_timer is not None:
+            self._debounced_rerun_timer.cancel()
+            self._debounced_rerun_timer = None
+        self._debounced_client_state = None
+
     def _handle_stop_script_request(self) -> None:
         """Tell the ScriptRunner to stop running its script."""
+        self._cancel_debounced_rerun()
         self.request_script_stop()
 
     def _handle_clear_cache_request(self) -> None:
@@ -732,6 +875,10 @@ class AppSession:
         caching.cache_resource.clear()
         self._session_state.clear()
 
+        script_worker_pool = _get_script_worker_pool()
+        if script_worker_pool is not None:
+            script_worker_pool.clear_caches(self.id)
+
     def _handle_set_run_on_save_request(self, new_value: bool) -> None:
         """Change our run_on_save flag to the given value.
 
@@ -767,6 +914,15 @@ class AppSession:
         self._enqueue_forward_msg(msg)
 
 
+def _get_script_worker_pool() -> Optional["ScriptWorkerPool"]:
+    """Return the Runtime's ScriptWorkerPool, or None if scripts run in
+    this process.
+    """
+    if config.get_option("runner.workerProcesses") <= 0 or not runtime.exists():
+        return None
+    return runtime.get_instance().script_worker_pool
+
+
 # Config.ToolbarMode.ValueType does not exist at runtime (only in the pyi stubs), so
 # we need to use quotes.
 # This field will be available at runtime as of protobuf 3.20.1, but
@@ -859,3 +1015,20 @@ def _populate_app_pages(
         page_proto.page_script_hash = page_script_hash
         page_proto.page_name = page_info["page_name"]
         page_proto.icon = page_info["icon"]
+
+
+def _coalesce_client_states(
+    old_state: ClientState, new_state: Optional[ClientState]
+) -> ClientState:
+    """Coalesce an older ClientState into a newer one, keeping the button
+    presses of the older one. See `coalesce_widget_states`.
+    """
+    if new_state is None:
+        return old_state
+
+    coalesced = ClientState()
+    coalesced.CopyFrom(new_state)
+    coalesced.widget_states.CopyFrom(
+        coalesce_widget_states(old_state.widget_states, new_state.widget_states)
+    )
+    return coalesced
@@ -33,6 +33,7 @@ from typing_extensions import Literal
 from streamlit import type_util
 from streamlit.elements.spinner import spinner
 from streamlit.logger import get_logger
+from streamlit.runtime import tracing
 from streamlit.runtime.caching.cache_errors import (
     BadTTLStringError,
     CacheError,
@@ -43,7 +44,7 @@ from streamlit.runtime.caching.cache_errors import (
     UnserializableReturnValueError,
     get_cached_func_name_md,
 )
-from streamlit.runtime.caching.cache_type import CacheType
+from streamlit.runtime.caching.cache_type import CacheType, get_decorator_api_name
 from streamlit.runtime.caching.cached_message_replay import (
     CachedMessageReplayContext,
     CachedResult,
@@ -51,6 +52,7 @@ from streamlit.runtime.caching.cached_message_replay import (
     replay_cached_messages,
 )
 from streamlit.runtime.caching.hashing import HashFuncsDict, update_hash
+from streamlit.runtime.stats import get_metrics_registry
 
 _LOGGER = get_logger(__name__)
 
@@ -58,6 +60,26 @@ _LOGGER = get_logger(__name__)
 # is exposed here as a constant so that it can be patched in unit tests.
 TTLCACHE_TIMER = time.monotonic
 
+# Labels of the cached function metrics. "cache_type" and "cache" have the
+# same values as in the cache_memory_bytes metric.
+_CACHED_FUNC_LABELS = ("cache_type", "cache")
+_CACHED_FUNC_HITS = get_metrics_registry().counter(
+    "cached_func_hits",
+    "Calls of cached functions that returned a cached value.",
+    labelnames=_CACHED_FUNC_LABELS,
+)
+_CACHED_FUNC_MISSES = get_metrics_registry().counter(
+    "cached_func_misses",
+    "Calls of cached functions that computed a new value.",
+    labelnames=_CACHED_FUNC_LABELS,
+)
+_CACHED_FUNC_COMPUTE_DURATION = get_metrics_registry().histogram(
+    "cached_func_compute_duration_seconds",
+    "Time taken by cached functions to compute new values.",
+    unit="seconds",
+    labelnames=_CACHED_FUNC_LABELS,
+)
+
 
 @overload
 def ttl_to_seconds(
@@ -221,6 +243,11 @@ class CachedFunc:
     def __init__(self, info: CachedFuncInfo):
         self._info = info
         self._function_key = _make_function_key(info.cache_type, info.func)
+        self._display_name = f"{info.func.__module__}.{info.func.__qualname__}"
+        self._metric_labels = (
+            f"st_{get_decorator_api_name(info.cache_type)}",
+            self._display_name,
+        )
 
     def __call__(self, *args, **kwargs) -> Any:
         """The wrapper. We'll only call our underlying function on a cache miss."""
@@ -259,14 +286,20 @@ class CachedFunc:
             hash_funcs=self._info.hash_funcs,
         )
 
-        try:
-            cached_result = cache.read_result(value_key)
-            return self._handle_cache_hit(cached_result)
-        except CacheKeyNotFoundError:
-            return self._handle_cache_miss(cache, value_key, func_args, func_kwargs)
+        with tracing.span("cache_lookup", {"cache": self._display_name}) as span:
+            try:
+                cached_result = cache.read_result(value_key)
+                if span is not None:
+                    span.set_attribute("hit", True)
+                return self._handle_cache_hit(cached_result)
+            except CacheKeyNotFoundError:
+                if span is not None:
+                    span.set_attribute("hit", False)
+                return self._handle_cache_miss(cache, value_key, func_args, func_kwargs)
 
     def _handle_cache_hit(self, result: CachedResult) -> Any:
         """Handle a cache hit: replay the result's cached messages, and return its value."""
+        _CACHED_FUNC_HITS.inc(*self._metric_labels)
         replay_cached_messages(
             result,
             self._info.cache_type,
@@ -314,10 +347,17 @@ class CachedFunc:
 
             except CacheKeyNotFoundError:
                 # We acquired the lock before any other thread. Compute the value!
-                with self._info.cached_message_replay_ctx.calling_cached_function(
+                _CACHED_FUNC_MISSES.inc(*self._metric_labels)
+                start_time = time.perf_counter()
+                with tracing.span(
+                    "cache_compute"
+                ), self._info.cached_message_replay_ctx.calling_cached_function(
                     self._info.func, self._info.allow_widgets
                 ):
                     computed_value = self._info.func(*func_args, **func_kwargs)
+                _CACHED_FUNC_COMPUTE_DURATION.observe(
+                    time.perf_counter() - start_time, *self._metric_labels
+                )
 
                 # We've computed our value, and now we need to write it back to the cache
                 # along with any "replay messages" that were generated during value computation.
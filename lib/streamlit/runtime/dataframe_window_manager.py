@@ -0,0 +1,314 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keeps the rows of large dataframes server-side, and serves them in pages."""
+
+from __future__ import annotations
+
+import collections
+import json
+import threading
+import uuid
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing_extensions import Final
+
+from streamlit import type_util
+from streamlit.logger import get_logger
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider
+
+LOGGER: Final = get_logger(__name__)
+
+# The maximum number of rows that a single page request can return.
+MAX_PAGE_ROWS: Final = 100_000
+
+
+class DataframeWindowNotFoundError(Exception):
+    """Raised when a window is requested that doesn't exist (anymore)."""
+
+
+class DataframePage(NamedTuple):
+    """A page of rows of a windowed dataframe."""
+
+    # The rows, as a serialized Arrow table with the dataframe's schema.
+    data: bytes
+
+    # The number of rows in the sorted and filtered view that the page
+    # belongs to.
+    num_rows: int
+
+
+class _ViewKey(NamedTuple):
+    sort_column: Optional[str]
+    ascending: bool
+    filter_column: Optional[str]
+    filter_value: Optional[str]
+
+
+class _DataframeWindow:
+    """A dataframe whose rows are served in pages, with the row order of its
+    most recently requested sorted and/or filtered view.
+    """
+
+    def __init__(self, table: pa.Table):
+        self.table = table
+        self._lock = threading.Lock()
+        self._view_key = _ViewKey(None, True, None, None)
+        # The table's row indices in view order, or None for all rows in
+        # their original order.
+        self._view_indices: Optional[pa.Array] = None
+
+    def get_page(self, offset: int, limit: int, view_key: _ViewKey) -> DataframePage:
+        with self._lock:
+            if view_key != self._view_key:
+                # Grids page through the same view while scrolling, so only
+                # the indices of the latest view are kept.
+                self._view_indices = self._compute_view_indices(view_key)
+                self._view_key = view_key
+            indices = self._view_indices
+
+        if indices is None:
+            num_rows = self.table.num_rows
+            page = self.table.slice(offset, limit)
+        else:
+            num_rows = len(indices)
+            page = self.table.take(indices[offset : offset + limit])
+
+        return DataframePage(type_util.pyarrow_table_to_bytes(page), num_rows)
+
+    def _compute_view_indices(self, view_key: _ViewKey) -> Optional[pa.Array]:
+        indices: Optional[pa.Array] = None
+
+        if view_key.filter_column is not None and view_key.filter_value:
+            column = pc.cast(self.table.column(view_key.filter_column), pa.string())
+            mask = pc.match_substring(column, view_key.filter_value, ignore_case=True)
+            # Rows with null values don't match.
+            mask = pc.fill_null(mask, False)
+            indices = pa.array(np.flatnonzero(mask.to_numpy(zero_copy_only=False)))
+
+        if view_key.sort_column is not None:
+            column = self.table.column(view_key.sort_column)
+            if indices is not None:
+                column = column.take(indices)
+            order = pc.sort_indices(
+                pa.table({"column": column}),
+                sort_keys=[
+                    ("column", "ascending" if view_key.ascending else "descending")
+                ],
+            )
+            indices = order if indices is None else indices.take(order)
+
+        return indices
+
+
+class DataframeWindowManager(CacheStatsProvider):
+    """Stores the tables of windowed dataframes so that their rows can be
+    served in pages.
+
+    Like the MediaFileManager, this keeps track of which windows are used by
+    which session, and at which coordinates, so that windows can be removed
+    once no session displays them anymore.
+    """
+
+    def __init__(self, endpoint: str):
+        """Create a new DataframeWindowManager.
+
+        Parameters
+        ----------
+        endpoint
+            The name of the local endpoint that pages are served from.
+            This endpoint should start with a forward-slash
+            (e.g. "/_stcore/dataframe").
+        """
+        self._endpoint = endpoint
+
+        # Dict of [window_id -> _DataframeWindow]
+        self._windows: Dict[str, _DataframeWindow] = {}
+
+        # Dict[session ID][coordinates] -> window_id.
+        self._windows_by_session_and_coord: Dict[
+            str, Dict[str, str]
+        ] = collections.defaultdict(dict)
+
+        self._lock = threading.Lock()
+
+    def add(
+        self, table: pa.Table, coordinates: str, session_id: Optional[str] = None
+    ) -> str:
+        """Add a table and return the URL that its pages are served from.
+
+        Safe to call from any thread.
+
+        Parameters
+        ----------
+        table : pyarrow.Table
+            The dataframe's data. Pages are taken from it as-is, so a pandas
+            RangeIndex must have been materialized with
+            `materialize_range_index` first.
+        coordinates : str
+            Unique string identifying the element's location.
+        session_id : str or None
+            The session that displays the dataframe. Defaults to the session
+            of the current script run.
+        """
+        if session_id is None:
+            session_id = _get_session_id()
+
+        window = _DataframeWindow(table)
+        window_id = uuid.uuid4().hex
+
+        with self._lock:
+            self._windows[window_id] = window
+            self._windows_by_session_and_coord[session_id][coordinates] = window_id
+
+        return f"{self._endpoint}/{window_id}"
+
+    def get_page(
+        self,
+        window_id: str,
+        offset: int,
+        limit: int,
+        sort_column: Optional[str] = None,
+        ascending: bool = True,
+        filter_column: Optional[str] = None,
+        filter_value: Optional[str] = None,
+    ) -> DataframePage:
+        """Return `limit` rows of a window, starting at `offset`.
+
+        Rows are taken from the window's table after keeping only the rows
+        whose `filter_column` contains `filter_value` (case-insensitively),
+        and sorting them by `sort_column`.
+
+        Safe to call from any thread.
+
+        Raises
+        ------
+        DataframeWindowNotFoundError
+            If there's no window with the given ID.
+        KeyError
+            If a column doesn't exist.
+        ValueError
+            If offset or limit are negative.
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+
+        with self._lock:
+            window = self._windows.get(window_id)
+        if window is None:
+            raise DataframeWindowNotFoundError(window_id)
+
+        return window.get_page(
+            offset,
+            min(limit, MAX_PAGE_ROWS),
+            _ViewKey(sort_column, ascending, filter_column, filter_value),
+        )
+
+    def clear_session_refs(self, session_id: Optional[str] = None) -> None:
+        """Remove the given session's window references.
+
+        (This does not remove any windows from the manager - you must call
+        `remove_orphaned_windows` for that.)
+
+        Safe to call from any thread.
+        """
+        if session_id is None:
+            session_id = _get_session_id()
+
+        with self._lock:
+            self._windows_by_session_and_coord.pop(session_id, None)
+
+    def remove_orphaned_windows(self) -> None:
+        """Remove all windows that are no longer referenced by any session.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            window_ids = set(self._windows.keys())
+            for window_ids_by_coord in self._windows_by_session_and_coord.values():
+                window_ids.difference_update(window_ids_by_coord.values())
+
+            for window_id in window_ids:
+                LOGGER.debug("Removing dataframe window %s", window_id)
+                del self._windows[window_id]
+
+    def get_stats(self) -> List[CacheStat]:
+        with self._lock:
+            windows = list(self._windows.values())
+
+        return [
+            CacheStat(
+                category_name="st_dataframe_windows",
+                cache_name="",
+                byte_length=window.table.nbytes,
+            )
+            for window in windows
+        ]
+
+
+def _get_session_id() -> str:
+    """Get the active AppSession's session_id."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        # See media_file_manager._get_session_id.
+        return "dontcare"
+    else:
+        return ctx.session_id
+
+
+def materialize_range_index(table: pa.Table) -> pa.Table:
+    """Replace pandas RangeIndex metadata with an actual index column.
+
+    Pandas stores a RangeIndex as start/stop/step metadata, which only
+    describes the table's rows in their original order and number. Slices
+    and pages of the table need the index labels as a column.
+    """
+    pandas_metadata = table.schema.pandas_metadata
+    if not pandas_metadata:
+        return table
+
+    index_columns = pandas_metadata.get("index_columns", [])
+    if not any(isinstance(index, dict) for index in index_columns):
+        return table
+
+    for i, index in enumerate(index_columns):
+        if not isinstance(index, dict) or index.get("kind") != "range":
+            continue
+        field_name = f"__index_level_{i}__"
+        table = table.append_column(
+            field_name,
+            pa.array(
+                np.arange(index["start"], index["stop"], index["step"]),
+                type=pa.int64(),
+            ),
+        )
+        index_columns[i] = field_name
+        pandas_metadata["columns"].append(
+            {
+                "name": index.get("name"),
+                "field_name": field_name,
+                "pandas_type": "int64",
+                "numpy_type": "int64",
+                "metadata": None,
+            }
+        )
+
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[b"pandas"] = json.dumps(pandas_metadata).encode("utf-8")
+    return table.replace_schema_metadata(schema_metadata)
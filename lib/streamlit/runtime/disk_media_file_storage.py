@@ -0,0 +1,373 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""MediaFileStorage implementation that stores files on disk."""
+
+import contextlib
+import gzip
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union
+
+from cachetools import LRUCache
+
+from streamlit.logger import get_logger
+from streamlit.runtime.media_file_storage import (
+    MediaFileKind,
+    MediaFileStorage,
+    MediaFileStorageError,
+)
+from streamlit.runtime.memory_media_file_storage import (
+    COMPRESSION_LEVEL,
+    CONTENT_CHUNK_SIZE,
+    MediaFileCompressor,
+    _calculate_file_id,
+    get_extension_for_mimetype,
+    is_compressible_file,
+    iter_content_chunks,
+)
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider
+
+LOGGER = get_logger(__name__)
+
+
+class DiskFile(NamedTuple):
+    """A MediaFile stored on disk."""
+
+    path: str
+    mimetype: str
+    kind: MediaFileKind
+    filename: Optional[str]
+    content_size: int
+    # The size of the gzip-compressed copy of text-like files, once it's been
+    # stored next to the file, with a ".gz" extension.
+    compressed_size: Optional[int] = None
+
+    @property
+    def compressed_path(self) -> str:
+        return self.path + ".gz"
+
+
+class DiskMediaFileStorage(MediaFileStorage, CacheStatsProvider):
+    def __init__(
+        self,
+        media_endpoint: str,
+        directory: Optional[str] = None,
+        memory_cache_max_size: int = 0,
+    ):
+        """Create a new DiskMediaFileStorage instance.
+
+        Files are written to a new directory that is removed along with the
+        storage. Each file is named by its ID, which is a hash of its content,
+        so a file that is added again is stored only once.
+
+        Parameters
+        ----------
+        media_endpoint
+            The name of the local endpoint that media is served from.
+            This endpoint should start with a forward-slash (e.g. "/media").
+        directory
+            The directory to create the storage's directory in. If None, the
+            system's temporary directory is used.
+        memory_cache_max_size
+            The maximum total size, in bytes, of the recently added files that
+            are also kept in memory, and served from there. If 0, files are
+            always served from disk.
+        """
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._directory = tempfile.mkdtemp(prefix="streamlit-media-", dir=directory)
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self._directory, ignore_errors=True
+        )
+
+        self._media_endpoint = media_endpoint
+        self._files_by_id: Dict[str, DiskFile] = {}
+        self._memory_cache: Optional["LRUCache[str, bytes]"] = (
+            LRUCache(maxsize=memory_cache_max_size, getsizeof=len)
+            if memory_cache_max_size > 0
+            else None
+        )
+        self._compressor = MediaFileCompressor()
+        # Files are added from script threads, served and deleted from the
+        # server's event loop, and compressed on the compressor's thread.
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        """The directory that the files are stored in."""
+        return self._directory
+
+    def load_and_get_id(
+        self,
+        path_or_data: Union[str, bytes],
+        mimetype: str,
+        kind: MediaFileKind,
+        filename: Optional[str] = None,
+    ) -> str:
+        """Add a file to the storage and return its ID."""
+        if isinstance(path_or_data, bytes):
+            # Because our file_ids are stable, if we already have a file with
+            # the given ID, we don't need to store it again.
+            file_id = _calculate_file_id(path_or_data, mimetype, filename)
+            with self._lock:
+                if file_id in self._files_by_id:
+                    return file_id
+
+        # Files are written to a temporary path first, so that a file is
+        # never served before it's complete.
+        fd, temp_path = tempfile.mkstemp(prefix=".", dir=self._directory)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                if isinstance(path_or_data, str):
+                    file_id = self._copy_file(
+                        path_or_data, temp_file, mimetype, filename
+                    )
+                    file_data = None
+                else:
+                    temp_file.write(path_or_data)
+                    file_data = path_or_data
+                content_size = temp_file.tell()
+
+            with self._lock:
+                if file_id not in self._files_by_id:
+                    LOGGER.debug("Adding media file %s", file_id)
+                    media_file = DiskFile(
+                        path=os.path.join(self._directory, file_id),
+                        mimetype=mimetype,
+                        kind=kind,
+                        filename=filename,
+                        content_size=content_size,
+                    )
+                    os.replace(temp_path, media_file.path)
+                    self._files_by_id[file_id] = media_file
+                    if (
+                        file_data is not None
+                        and self._memory_cache is not None
+                        and content_size <= self._memory_cache.maxsize
+                    ):
+                        self._memory_cache[file_id] = file_data
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+
+        return file_id
+
+    def get_file(self, filename: str) -> DiskFile:
+        """Return the DiskFile with the given filename. Filenames are of the
+        form "file_id.extension". (Note that this is *not* the optional
+        user-specified filename for download files.)
+
+        Raises a MediaFileStorageError if no such file exists.
+        """
+        file_id = os.path.splitext(filename)[0]
+        try:
+            return self._files_by_id[file_id]
+        except KeyError as e:
+            raise MediaFileStorageError(
+                f"Bad filename '{filename}'. (No media file with id '{file_id}')"
+            ) from e
+
+    def get_content(
+        self,
+        filename: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        compressed: bool = False,
+    ) -> Union[bytes, Iterator[bytes]]:
+        """Return the content of the file with the given filename, or the
+        part of it between `start` and `end`.
+
+        Files that are in the memory cache are served from there; all others
+        are memory-mapped and returned in chunks, so that neither the whole
+        file nor the whole requested range is ever read into memory at once.
+
+        If `compressed` is True, the file's gzip-compressed copy is returned
+        instead. It's only stored once `compress_in_background` has compressed
+        the file.
+
+        Raises a MediaFileStorageError if no such file (or no compressed copy
+        of it) exists.
+        """
+        file_id = os.path.splitext(filename)[0]
+        content: Optional[bytes] = None
+        with self._lock:
+            media_file = self.get_file(filename)
+            if self._memory_cache is not None and not compressed:
+                content = self._memory_cache.get(file_id)
+        if content is not None:
+            if start is None and end is None:
+                return content
+            return iter_content_chunks(content, start, end)
+
+        path = media_file.path
+        if compressed:
+            if media_file.compressed_size is None:
+                raise MediaFileStorageError(f"'{filename}' isn't compressed")
+            path = media_file.compressed_path
+        elif media_file.content_size == 0:
+            # Empty files can't be memory-mapped.
+            return b""
+
+        try:
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as ex:
+            raise MediaFileStorageError(f"Error opening '{filename}'") from ex
+
+        return self._iter_mapped_chunks(mapped, start, end)
+
+    @staticmethod
+    def _iter_mapped_chunks(
+        mapped: mmap.mmap, start: Optional[int], end: Optional[int]
+    ) -> Iterator[bytes]:
+        with mapped:
+            yield from iter_content_chunks(mapped, start, end)
+
+    def get_url(self, file_id: str) -> str:
+        """Get a URL for a given media file. Raise a MediaFileStorageError if
+        no such file exists.
+        """
+        media_file = self.get_file(file_id)
+        extension = get_extension_for_mimetype(media_file.mimetype)
+        return f"{self._media_endpoint}/{file_id}{extension}"
+
+    def delete_file(self, file_id: str) -> None:
+        """Delete the file with the given ID."""
+        with self._lock:
+            # It's not an error to delete a file that doesn't exist.
+            media_file = self._files_by_id.pop(file_id, None)
+            if self._memory_cache is not None:
+                self._memory_cache.pop(file_id, None)
+            if media_file is None:
+                return
+
+            # Files that are being served stay readable until they're closed
+            # (on POSIX systems; elsewhere, removing them fails).
+            paths = [media_file.path]
+            if media_file.compressed_size is not None:
+                paths.append(media_file.compressed_path)
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    LOGGER.warning("Failed to remove media file %s", path)
+        self._compressor.forget(file_id)
+
+    def compress_in_background(self, filename: str) -> Optional["Future[None]"]:
+        """Start storing a gzip-compressed copy of the file with the given
+        filename, so that it can be served compressed from then on.
+
+        Only text-like files are compressed, on a background thread, and each
+        of them only once. Return the compression's future, or None if it
+        wasn't started.
+
+        Raises a MediaFileStorageError if no such file exists.
+        """
+        media_file = self.get_file(filename)
+        if media_file.compressed_size is not None or not is_compressible_file(
+            media_file.content_size, media_file.mimetype
+        ):
+            return None
+        return self._compressor.submit(
+            os.path.splitext(filename)[0], self._store_compressed_copy
+        )
+
+    def _copy_file(
+        self,
+        source_path: str,
+        dest_file,
+        mimetype: str,
+        filename: Optional[str],
+    ) -> str:
+        """Copy a file to dest_file in chunks, and return its ID, as
+        `_calculate_file_id` would. Raise MediaFileStorageError if we can't
+        read it.
+        """
+        filehash = hashlib.new("sha224")
+        try:
+            with open(source_path, "rb") as f:
+                for chunk in iter(lambda: f.read(CONTENT_CHUNK_SIZE), b""):
+                    filehash.update(chunk)
+                    dest_file.write(chunk)
+        except Exception as ex:
+            raise MediaFileStorageError(f"Error opening '{source_path}'") from ex
+
+        filehash.update(bytes(mimetype.encode()))
+        if filename is not None:
+            filehash.update(bytes(filename.encode()))
+
+        return filehash.hexdigest()
+
+    def _store_compressed_copy(self, file_id: str) -> None:
+        """Write the gzip-compressed content of a file next to it, in chunks,
+        unless compressing doesn't make it smaller.
+        """
+        media_file = self._files_by_id.get(file_id)
+        if media_file is None:
+            return
+
+        fd, temp_path = tempfile.mkstemp(prefix=".", suffix=".gz", dir=self._directory)
+        try:
+            with os.fdopen(fd, "wb") as dest, open(media_file.path, "rb") as source:
+                # An empty filename and a fixed mtime keep the compressed
+                # content of a file stable.
+                with gzip.GzipFile(
+                    filename="",
+                    mode="wb",
+                    fileobj=dest,
+                    compresslevel=COMPRESSION_LEVEL,
+                    mtime=0,
+                ) as f:
+                    shutil.copyfileobj(source, f, CONTENT_CHUNK_SIZE)
+                compressed_size = dest.tell()
+
+            if compressed_size >= media_file.content_size:
+                return
+            with self._lock:
+                # The file may have been deleted while it was compressed.
+                if self._files_by_id.get(file_id) is media_file:
+                    os.replace(temp_path, media_file.compressed_path)
+                    self._files_by_id[file_id] = media_file._replace(
+                        compressed_size=compressed_size
+                    )
+        except FileNotFoundError:
+            # The file was deleted before it was compressed.
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+
+    def get_stats(self) -> List[CacheStat]:
+        # Only the files in the memory cache take up memory.
+        if self._memory_cache is None:
+            return []
+
+        with self._lock:
+            sizes = [len(content) for content in self._memory_cache.values()]
+
+        return [
+            CacheStat(
+                category_name="st_disk_media_file_storage",
+                cache_name="",
+                byte_length=size,
+            )
+            for size in sizes
+        ]
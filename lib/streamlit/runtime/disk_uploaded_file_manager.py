@@ -0,0 +1,337 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import weakref
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from streamlit import util
+from streamlit.logger import get_logger
+from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.uploaded_file_manager import (
+    UploadedFileManager,
+    UploadedFileRec,
+    UploadFileUrlInfo,
+)
+
+LOGGER = get_logger(__name__)
+
+
+class _StoredFile(NamedTuple):
+    """The metadata of an uploaded file stored on disk."""
+
+    file_id: str
+    name: str
+    type: str
+    path: str
+    size: int
+
+
+class DiskUploadedFileManager(UploadedFileManager):
+    """Holds files uploaded by users of the running Streamlit app in a local
+    directory.
+
+    The total size of the stored files, and of each session's files, can be
+    limited. When a new file goes over a limit, the least recently used files
+    are removed until it's met again. Removed files are treated like files
+    that their users deleted.
+
+    This class can be used safely from multiple threads simultaneously.
+    """
+
+    def __init__(
+        self,
+        upload_endpoint: str,
+        directory: Optional[str] = None,
+        max_size: int = 0,
+        max_session_size: int = 0,
+    ):
+        """Create a new DiskUploadedFileManager.
+
+        Files are written to a new directory that is removed along with the
+        manager.
+
+        Parameters
+        ----------
+        upload_endpoint
+            The name of the local endpoint that files are uploaded to.
+        directory
+            The directory to create the manager's directory in. If None, the
+            system's temporary directory is used.
+        max_size
+            The max total size, in bytes, of all stored files. 0 means no
+            limit.
+        max_session_size
+            The max total size, in bytes, of the files of a single session.
+            0 means no limit.
+        """
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._directory = tempfile.mkdtemp(prefix="streamlit-uploads-", dir=directory)
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self._directory, ignore_errors=True
+        )
+
+        self.endpoint = upload_endpoint
+        self._max_size = max_size
+        self._max_session_size = max_session_size
+
+        # All stored files, by session ID and file ID, from the least to the
+        # most recently used.
+        self._files: "OrderedDict[Tuple[str, str], _StoredFile]" = OrderedDict()
+        self._session_sizes: Dict[str, int] = defaultdict(int)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> str:
+        """The directory that the files are stored in."""
+        return self._directory
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def get_files(
+        self, session_id: str, file_ids: Sequence[str]
+    ) -> List[UploadedFileRec]:
+        """Return a  list of UploadedFileRec for a given sequence of file_ids.
+
+        The content of each file is a read-only memory map of the file it's
+        stored in.
+
+        Parameters
+        ----------
+        session_id
+            The ID of the session that owns the files.
+        file_ids
+            The sequence of ids associated with files to retrieve.
+
+        Returns
+        -------
+        List[UploadedFileRec]
+            A list of URL UploadedFileRec instances, each instance contains information
+            about uploaded file.
+        """
+        file_recs = []
+        with self._lock:
+            for file_id in file_ids:
+                key = (session_id, file_id)
+                stored_file = self._files.get(key)
+                if stored_file is None:
+                    continue
+
+                self._files.move_to_end(key)
+                file_recs.append(
+                    UploadedFileRec(
+                        file_id=stored_file.file_id,
+                        name=stored_file.name,
+                        type=stored_file.type,
+                        data=self._map_file(stored_file),
+                    )
+                )
+
+        return file_recs
+
+    def add_file(self, session_id: str, file: UploadedFileRec) -> None:
+        """Write a file to disk, and remove the least recently used files if
+        that goes over the manager's limits.
+
+        Safe to call from any thread.
+
+        Parameters
+        ----------
+        session_id
+            The ID of the session that owns the file.
+        file
+            The file to add.
+        """
+        path = self._new_file_path()
+        with open(path, "wb") as f:
+            f.write(file.data)
+        self._add_stored_file(
+            session_id,
+            _StoredFile(
+                file_id=file.file_id,
+                name=file.name,
+                type=file.type,
+                path=path,
+                size=len(file.data),
+            ),
+        )
+
+    def move_file(
+        self, session_id: str, file_id: str, name: str, type: str, path: str
+    ) -> None:
+        """Add the file at the given path by moving it into the manager's
+        directory, rather than copying its content like `add_file` does, and
+        remove the least recently used files if that goes over the manager's
+        limits.
+
+        The file must be on the same file system as the manager's directory,
+        which it is if it was created in that directory.
+
+        Safe to call from any thread.
+
+        Parameters
+        ----------
+        session_id
+            The ID of the session that owns the file.
+        file_id
+            The file's ID.
+        name
+            The file's name.
+        type
+            The file's MIME type.
+        path
+            The path of the file to move.
+        """
+        stored_path = self._new_file_path()
+        os.replace(path, stored_path)
+        self._add_stored_file(
+            session_id,
+            _StoredFile(
+                file_id=file_id,
+                name=name,
+                type=type,
+                path=stored_path,
+                size=os.path.getsize(stored_path),
+            ),
+        )
+
+    def remove_file(self, session_id: str, file_id: str) -> None:
+        """Remove file with given file_id associated with a given session."""
+        with self._lock:
+            self._remove_file(session_id, file_id)
+
+    def remove_session_files(self, session_id: str) -> None:
+        """Remove all files associated with a given session."""
+        with self._lock:
+            for key in [key for key in self._files if key[0] == session_id]:
+                self._remove_file(*key)
+
+    def get_session_size(self, session_id: str) -> int:
+        """Return the total size, in bytes, of the files that a session has
+        uploaded.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            return self._session_sizes.get(session_id, 0)
+
+    def get_max_upload_size(self, session_id: str) -> Optional[int]:
+        """Return the max size, in bytes, of a new file of the given session,
+        or None if there's no limit.
+
+        Since older files are removed to make room for new ones, this is the
+        largest file that can be stored at all.
+        """
+        limits = [limit for limit in (self._max_size, self._max_session_size) if limit]
+        return min(limits) if limits else None
+
+    def get_upload_urls(
+        self, session_id: str, file_names: Sequence[str]
+    ) -> List[UploadFileUrlInfo]:
+        """Return a list of UploadFileUrlInfo for a given sequence of file_names."""
+        result = []
+        for _ in file_names:
+            file_id = str(uuid.uuid4())
+            result.append(
+                UploadFileUrlInfo(
+                    file_id=file_id,
+                    upload_url=f"{self.endpoint}/{session_id}/{file_id}",
+                    delete_url=f"{self.endpoint}/{session_id}/{file_id}",
+                )
+            )
+        return result
+
+    def get_stats(self) -> List[CacheStat]:
+        """Return the manager's CacheStats, from the sizes of the stored files.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            sizes = [stored_file.size for stored_file in self._files.values()]
+
+        return [
+            CacheStat(
+                category_name="DiskUploadedFileManager",
+                cache_name="",
+                byte_length=size,
+            )
+            for size in sizes
+        ]
+
+    def _new_file_path(self) -> str:
+        return os.path.join(self._directory, uuid.uuid4().hex)
+
+    def _add_stored_file(self, session_id: str, stored_file: _StoredFile) -> None:
+        file_id = stored_file.file_id
+        with self._lock:
+            self._remove_file(session_id, file_id)
+
+            self._files[(session_id, file_id)] = stored_file
+            self._session_sizes[session_id] += stored_file.size
+            self._size += stored_file.size
+
+            self._evict(session_id)
+
+    def _evict(self, session_id: str) -> None:
+        """Remove the least recently used files until the total size, and the
+        size of the given session's files, are within their limits.
+        """
+        if self._max_session_size:
+            session_keys = (key for key in list(self._files) if key[0] == session_id)
+            while self._session_sizes[session_id] > self._max_session_size:
+                self._remove_file(*next(session_keys), evicted=True)
+
+        if self._max_size:
+            while self._size > self._max_size:
+                self._remove_file(*next(iter(self._files)), evicted=True)
+
+    def _remove_file(
+        self, session_id: str, file_id: str, evicted: bool = False
+    ) -> None:
+        """Remove a file. Must be called with the lock held."""
+        stored_file = self._files.pop((session_id, file_id), None)
+        if stored_file is None:
+            return
+
+        if evicted:
+            LOGGER.debug("Evicting uploaded file %s", file_id)
+
+        self._size -= stored_file.size
+        self._session_sizes[session_id] -= stored_file.size
+        if not self._session_sizes[session_id]:
+            del self._session_sizes[session_id]
+
+        # Files that scripts are reading stay readable until they're closed
+        # (on POSIX systems; elsewhere, removing them fails).
+        try:
+            os.remove(stored_file.path)
+        except OSError:
+            LOGGER.warning("Failed to remove uploaded file %s", stored_file.path)
+
+    @staticmethod
+    def _map_file(stored_file: _StoredFile) -> Union[bytes, mmap.mmap]:
+        if stored_file.size == 0:
+            # Empty files can't be memory-mapped.
+            return b""
+        with open(stored_file.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
@@ -52,6 +52,9 @@ class ForwardMsgQueue:
     def is_empty(self) -> bool:
         return len(self._queue) == 0
 
+    def __len__(self) -> int:
+        return len(self._queue)
+
     def enqueue(self, msg: ForwardMsg) -> None:
         """Add message into queue, possibly composing it with another message."""
         if not _is_composable_message(msg):
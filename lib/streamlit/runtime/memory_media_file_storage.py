@@ -15,10 +15,14 @@
 """MediaFileStorage implementation that stores files in memory."""
 
 import contextlib
+import gzip
 import hashlib
 import mimetypes
+import mmap
 import os.path
-from typing import Dict, List, NamedTuple, Optional, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Union
 
 from typing_extensions import Final
 
@@ -40,6 +44,34 @@ PREFERRED_MIMETYPE_EXTENSION_MAP: Final = {
     "audio/wav": ".wav",
 }
 
+# The size of the chunks that parts of files are served in.
+CONTENT_CHUNK_SIZE: Final = 64 * 1024
+
+# Mimetypes, besides "text/*", of the files that are also stored
+# gzip-compressed once they're first requested, so that they can be served
+# compressed without compressing them on every request.
+COMPRESSIBLE_MIMETYPES: Final = frozenset(
+    [
+        "application/javascript",
+        "application/json",
+        "application/xml",
+        "application/xhtml+xml",
+        "image/svg+xml",
+    ]
+)
+
+# Smaller files aren't worth compressing.
+MIN_COMPRESSED_FILE_SIZE: Final = 1024
+
+# Larger files aren't stored compressed in memory, since their compressed
+# content would take up too much of it. Tornado still compresses their
+# responses on the fly.
+MAX_COMPRESSED_MEMORY_FILE_SIZE: Final = 32 * 1024 * 1024
+
+# The gzip level of the stored compressed files. It's the level that Tornado
+# compresses responses with, which is much faster than the max level.
+COMPRESSION_LEVEL: Final = 6
+
 
 def _calculate_file_id(
     data: bytes, mimetype: str, filename: Optional[str] = None
@@ -76,6 +108,103 @@ def get_extension_for_mimetype(mimetype: str) -> str:
     return extension
 
 
+def is_compressible_mimetype(mimetype: str) -> bool:
+    """True if files of the given mimetype are worth storing compressed."""
+    mimetype = mimetype.split(";")[0].strip().lower()
+    return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def is_compressible_file(size: int, mimetype: str) -> bool:
+    """True if a file of the given size and mimetype is worth storing
+    compressed.
+    """
+    return size >= MIN_COMPRESSED_FILE_SIZE and is_compressible_mimetype(mimetype)
+
+
+def compress_content(data: bytes, mimetype: str) -> Optional[bytes]:
+    """Return the gzip-compressed content of a text-like file, or None if
+    it's not worth compressing.
+    """
+    if not is_compressible_file(len(data), mimetype):
+        return None
+    # A fixed mtime keeps the compressed content of a file stable.
+    compressed = gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+    return compressed if len(compressed) < len(data) else None
+
+
+class MediaFileCompressor:
+    """Stores the compressed content of media files on a background thread,
+    so that neither adding a file nor serving it waits for that.
+
+    Each file is compressed at most once, until it's forgotten.
+
+    This class can be used safely from multiple threads simultaneously.
+    """
+
+    def __init__(self) -> None:
+        self._file_ids: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self, file_id: str, compress_file: Callable[[str], None]
+    ) -> Optional["Future[None]"]:
+        """Start compressing the file with the given ID, unless that's been
+        started before. Return the compression's future, or None if it wasn't
+        started.
+
+        Parameters
+        ----------
+        file_id
+            The ID of the file.
+        compress_file
+            The function that stores the compressed content of the file with
+            the given ID. It's called on the compressor's thread.
+        """
+        with self._lock:
+            if file_id in self._file_ids:
+                return None
+            self._file_ids.add(file_id)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="MediaFileCompressor"
+                )
+            return self._executor.submit(self._run, file_id, compress_file)
+
+    def forget(self, file_id: str) -> None:
+        """Allow the file with the given ID to be compressed again. Called
+        when the file is deleted, since a file with the same ID may be added
+        again.
+        """
+        with self._lock:
+            self._file_ids.discard(file_id)
+
+    @staticmethod
+    def _run(file_id: str, compress_file: Callable[[str], None]) -> None:
+        try:
+            compress_file(file_id)
+        except Exception:
+            LOGGER.exception("Failed to compress media file %s", file_id)
+
+
+def iter_content_chunks(
+    content: Union[bytes, mmap.mmap],
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Return the part of a file's content between `start` and `end`, in
+    chunks of at most CONTENT_CHUNK_SIZE bytes, so that the part is never
+    copied as a whole.
+    """
+    if start is None:
+        start = 0
+    if end is None:
+        end = len(content)
+
+    for chunk_start in range(start, end, CONTENT_CHUNK_SIZE):
+        yield content[chunk_start : min(chunk_start + CONTENT_CHUNK_SIZE, end)]
+
+
 class MemoryFile(NamedTuple):
     """A MediaFile stored in memory."""
 
@@ -83,11 +212,19 @@ class MemoryFile(NamedTuple):
     mimetype: str
     kind: MediaFileKind
     filename: Optional[str]
+    # The gzip-compressed content of text-like files, once it's been stored.
+    compressed_content: Optional[bytes] = None
 
     @property
     def content_size(self) -> int:
         return len(self.content)
 
+    @property
+    def compressed_size(self) -> Optional[int]:
+        if self.compressed_content is None:
+            return None
+        return len(self.compressed_content)
+
 
 class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
     def __init__(self, media_endpoint: str):
@@ -101,6 +238,10 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         """
         self._files_by_id: Dict[str, MemoryFile] = {}
         self._media_endpoint = media_endpoint
+        self._compressor = MediaFileCompressor()
+        # Files are compressed on the compressor's thread, while they may be
+        # deleted on another one.
+        self._lock = threading.Lock()
 
     def load_and_get_id(
         self,
@@ -122,7 +263,10 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         if file_id not in self._files_by_id:
             LOGGER.debug("Adding media file %s", file_id)
             media_file = MemoryFile(
-                content=file_data, mimetype=mimetype, kind=kind, filename=filename
+                content=file_data,
+                mimetype=mimetype,
+                kind=kind,
+                filename=filename,
             )
             self._files_by_id[file_id] = media_file
 
@@ -143,6 +287,34 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
                 f"Bad filename '{filename}'. (No media file with id '{file_id}')"
             ) from e
 
+    def get_content(
+        self,
+        filename: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        compressed: bool = False,
+    ) -> Union[bytes, Iterator[bytes]]:
+        """Return the content of the file with the given filename, or the
+        part of it between `start` and `end`, in chunks.
+
+        If `compressed` is True, the file's gzip-compressed content is
+        returned instead. It's only stored once `compress_in_background` has
+        compressed the file.
+
+        Raises a MediaFileStorageError if no such file (or no compressed
+        content of it) exists.
+        """
+        media_file = self.get_file(filename)
+        content = media_file.content
+        if compressed:
+            if media_file.compressed_content is None:
+                raise MediaFileStorageError(f"'{filename}' isn't compressed")
+            content = media_file.compressed_content
+
+        if start is None and end is None:
+            return content
+        return iter_content_chunks(content, start, end)
+
     def get_url(self, file_id: str) -> str:
         """Get a URL for a given media file. Raise a MediaFileStorageError if
         no such file exists.
@@ -155,8 +327,44 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
         """Delete the file with the given ID."""
         # We swallow KeyErrors here - it's not an error to delete a file
         # that doesn't exist.
-        with contextlib.suppress(KeyError):
+        with self._lock, contextlib.suppress(KeyError):
             del self._files_by_id[file_id]
+        self._compressor.forget(file_id)
+
+    def compress_in_background(self, filename: str) -> Optional["Future[None]"]:
+        """Start storing the gzip-compressed content of the file with the
+        given filename, so that it can be served compressed from then on.
+
+        Only text-like files up to MAX_COMPRESSED_MEMORY_FILE_SIZE are
+        compressed, on a background thread, and each of them only once.
+        Return the compression's future, or None if it wasn't started.
+
+        Raises a MediaFileStorageError if no such file exists.
+        """
+        media_file = self.get_file(filename)
+        if (
+            media_file.compressed_content is not None
+            or media_file.content_size > MAX_COMPRESSED_MEMORY_FILE_SIZE
+            or not is_compressible_file(media_file.content_size, media_file.mimetype)
+        ):
+            return None
+        return self._compressor.submit(
+            os.path.splitext(filename)[0], self._store_compressed_content
+        )
+
+    def _store_compressed_content(self, file_id: str) -> None:
+        media_file = self._files_by_id.get(file_id)
+        if media_file is None:
+            return
+        compressed_content = compress_content(media_file.content, media_file.mimetype)
+        if compressed_content is None:
+            return
+        with self._lock:
+            # The file may have been deleted while it was compressed.
+            if self._files_by_id.get(file_id) is media_file:
+                self._files_by_id[file_id] = media_file._replace(
+                    compressed_content=compressed_content
+                )
 
     def _read_file(self, filename: str) -> bytes:
         """Read a file into memory. Raise MediaFileStorageError if we can't."""
@@ -177,7 +385,7 @@ class MemoryMediaFileStorage(MediaFileStorage, CacheStatsProvider):
                 CacheStat(
                     category_name="st_memory_media_file_storage",
                     cache_name="",
-                    byte_length=len(file.content),
+                    byte_length=len(file.content) + (file.compressed_size or 0),
                 )
             )
         return stats
@@ -14,7 +14,7 @@
 
 import uuid
 from collections import defaultdict
-from typing import Dict, List, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from streamlit import util
 from streamlit.logger import get_logger
@@ -33,9 +33,19 @@ class MemoryUploadedFileManager(UploadedFileManager):
     This class can be used safely from multiple threads simultaneously.
     """
 
-    def __init__(self, upload_endpoint: str):
+    def __init__(self, upload_endpoint: str, max_session_size: int = 0):
+        """
+        Parameters
+        ----------
+        upload_endpoint
+            The name of the local endpoint that files are uploaded to.
+        max_session_size
+            The max total size, in bytes, of the files of a single session.
+            Uploads that would go over it fail. 0 means no limit.
+        """
         self.file_storage: Dict[str, Dict[str, UploadedFileRec]] = defaultdict(dict)
         self.endpoint = upload_endpoint
+        self._max_session_size = max_session_size
 
     def get_files(
         self, session_id: str, file_ids: Sequence[str]
@@ -65,6 +75,23 @@ class MemoryUploadedFileManager(UploadedFileManager):
 
         return file_recs
 
+    def get_session_size(self, session_id: str) -> int:
+        """Return the total size, in bytes, of the files that a session has
+        uploaded.
+
+        Safe to call from any thread.
+        """
+        session_storage = self.file_storage.get(session_id, {}).copy()
+        return sum(len(file.data) for file in session_storage.values())
+
+    def get_max_upload_size(self, session_id: str) -> Optional[int]:
+        """Return the max size, in bytes, of a new file of the given session,
+        or None if there's no limit.
+        """
+        if not self._max_session_size:
+            return None
+        return max(0, self._max_session_size - self.get_session_size(session_id))
+
     def remove_session_files(self, session_id: str) -> None:
         """Remove all files associated with a given session."""
         self.file_storage.pop(session_id, None)
@@ -30,6 +30,7 @@ from streamlit import config, util
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.proto.PageProfile_pb2 import Argument, Command
+from streamlit.runtime import tracing
 
 _LOGGER = get_logger(__name__)
 
@@ -363,8 +364,13 @@ def gather_metrics(name: str, func: Optional[F] = None) -> Union[Callable[[F], F
                 # Always capture all exceptions since we want to make sure that
                 # the telemetry never causes any issues.
                 _LOGGER.debug("Failed to collect command telemetry", exc_info=ex)
+
+        profiler = ctx.script_profiler if ctx else None
+        if profiler is not None:
+            profiler.start_command()
         try:
-            result = non_optional_func(*args, **kwargs)
+            with tracing.span(name):
+                result = non_optional_func(*args, **kwargs)
         except RerunException as ex:
             # Duplicated from below, because static analysis tools get confused
             # by deferring the rethrow.
@@ -375,6 +381,8 @@ def gather_metrics(name: str, func: Optional[F] = None) -> Union[Callable[[F], F
             # Activate tracking again if command executes without any exceptions
             if ctx:
                 ctx.command_tracking_deactivated = False
+            if profiler is not None:
+                profiler.end_command(name, timer() - exec_start)
 
         if tracking_activated and command_telemetry:
             # Set the execution time to the measured value
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 import traceback
 from dataclasses import dataclass, field
@@ -27,6 +28,7 @@ from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime import tracing
 from streamlit.runtime.app_session import AppSession
 from streamlit.runtime.caching import (
     get_data_cache_stats_provider,
@@ -35,6 +37,7 @@ from streamlit.runtime.caching import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.dataframe_window_manager import DataframeWindowManager
 from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
@@ -44,9 +47,15 @@ from streamlit.runtime.legacy_caching.caching import _mem_caches
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.media_file_storage import MediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
-from streamlit.runtime.runtime_util import is_cacheable_msg
+from streamlit.runtime.runtime_util import (
+    get_message_executor,
+    is_cacheable_msg,
+    is_offloaded_msg,
+)
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_profiler import ScriptProfileStore
+from streamlit.runtime.scriptrunner.script_runner import SCRIPT_THREAD_NAME
 from streamlit.runtime.session_manager import (
     ActiveSessionInfo,
     SessionClient,
@@ -58,19 +67,29 @@ from streamlit.runtime.state import (
     SCRIPT_RUN_WITHOUT_ERRORS_KEY,
     SessionStateStatProvider,
 )
-from streamlit.runtime.stats import StatsManager
+from streamlit.runtime.stats import Gauge, StatsManager, get_metrics_registry
 from streamlit.runtime.uploaded_file_manager import UploadedFileManager
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
 from streamlit.watcher import LocalSourcesWatcher
 
 if TYPE_CHECKING:
     from streamlit.runtime.caching.storage import CacheStorageManager
+    from streamlit.runtime.scriptrunner.worker_pool import ScriptWorkerPool
 
 # Wait for the script run result for 60s and if no result is available give up
 SCRIPT_RUN_CHECK_TIMEOUT: Final = 60
 
 LOGGER: Final = get_logger(__name__)
 
+_FORWARD_MSG_CACHE_HITS: Final = get_metrics_registry().counter(
+    "forward_msg_cache_hits",
+    "Cacheable ForwardMsgs that were sent as references to cached messages.",
+)
+_FORWARD_MSG_CACHE_MISSES: Final = get_metrics_registry().counter(
+    "forward_msg_cache_misses",
+    "Cacheable ForwardMsgs that were sent in full.",
+)
+
 
 class RuntimeStoppedError(Exception):
     """Raised by operations on a Runtime instance that is stopped."""
@@ -104,6 +123,10 @@ class RuntimeConfig:
     # The SessionStorage instance for the SessionManager to use.
     session_storage: SessionStorage = field(default_factory=MemorySessionStorage)
 
+    # The manager that serves the rows of large dataframes in pages. If None,
+    # dataframes are always sent whole.
+    dataframe_window_manager: Optional[DataframeWindowManager] = None
+
 
 class RuntimeState(Enum):
     INITIAL = "INITIAL"
@@ -191,8 +214,10 @@ class Runtime:
         self._message_cache = ForwardMsgCache()
         self._uploaded_file_mgr = config.uploaded_file_manager
         self._media_file_mgr = MediaFileManager(storage=config.media_file_storage)
+        self._dataframe_window_mgr = config.dataframe_window_manager
         self._cache_storage_manager = config.cache_storage_manager
         self._script_cache = ScriptCache()
+        self._script_profile_store = ScriptProfileStore()
 
         self._session_mgr = config.session_manager_class(
             session_storage=config.session_storage,
@@ -201,6 +226,22 @@ class Runtime:
             message_enqueued_callback=self._enqueued_some_message,
         )
 
+        # Created only if scripts should run in worker processes; started
+        # along with the Runtime.
+        self._script_worker_pool: Optional[ScriptWorkerPool] = None
+        num_worker_processes = _get_num_worker_processes()
+        if num_worker_processes > 0:
+            from streamlit.runtime.scriptrunner.worker_pool import ScriptWorkerPool
+
+            self._script_worker_pool = ScriptWorkerPool(
+                num_workers=num_worker_processes,
+                main_script_path=self._main_script_path,
+                command_line=self._command_line,
+                media_file_storage=config.media_file_storage,
+                uploaded_file_manager=self._uploaded_file_mgr,
+                dataframe_window_manager=self._dataframe_window_mgr,
+            )
+
         self._stats_mgr = StatsManager()
         self._stats_mgr.register_provider(get_data_cache_stats_provider())
         self._stats_mgr.register_provider(get_resource_cache_stats_provider())
@@ -208,6 +249,30 @@ class Runtime:
         self._stats_mgr.register_provider(self._message_cache)
         self._stats_mgr.register_provider(self._uploaded_file_mgr)
         self._stats_mgr.register_provider(SessionStateStatProvider(self._session_mgr))
+        if self._dataframe_window_mgr is not None:
+            self._stats_mgr.register_provider(self._dataframe_window_mgr)
+
+        self._stats_mgr.register_metric(
+            Gauge(
+                "active_sessions",
+                "Sessions that are connected to a browser.",
+                callback=self._session_mgr.num_active_sessions,
+            )
+        )
+        self._stats_mgr.register_metric(
+            Gauge(
+                "forward_msg_queue_depth",
+                "ForwardMsgs that are waiting to be sent, in all sessions.",
+                callback=self._get_forward_msg_queue_depth,
+            )
+        )
+        self._stats_mgr.register_metric(
+            Gauge(
+                "script_threads",
+                "Threads that are running scripts.",
+                callback=_count_script_threads,
+            )
+        )
 
     @property
     def state(self) -> RuntimeState:
@@ -229,10 +294,25 @@ class Runtime:
     def media_file_mgr(self) -> MediaFileManager:
         return self._media_file_mgr
 
+    @property
+    def dataframe_window_mgr(self) -> Optional[DataframeWindowManager]:
+        return self._dataframe_window_mgr
+
+    @property
+    def script_profile_store(self) -> ScriptProfileStore:
+        return self._script_profile_store
+
     @property
     def stats_mgr(self) -> StatsManager:
         return self._stats_mgr
 
+    @property
+    def script_worker_pool(self) -> Optional[ScriptWorkerPool]:
+        """The pool of worker processes that app scripts run in, or None if
+        scripts run in the server process (`runner.workerProcesses` is 0).
+        """
+        return self._script_worker_pool
+
     @property
     def stopped(self) -> Awaitable[None]:
         """A Future that completes when the Runtime's run loop has exited."""
@@ -280,6 +360,9 @@ class Runtime:
         )
         self._async_objs = async_objs
 
+        if self._script_worker_pool is not None:
+            self._script_worker_pool.start()
+
         self._loop_coroutine_task = asyncio.create_task(
             self._loop_coroutine(), name="Runtime.loop_coroutine"
         )
@@ -592,6 +675,14 @@ class Runtime:
                     for active_session_info in self._session_mgr.list_active_sessions():
                         msg_list = active_session_info.session.flush_browser_queue()
                         for msg in msg_list:
+                            if is_offloaded_msg(msg):
+                                # Hash large messages on a worker thread.
+                                # Serializing them still holds the GIL, but
+                                # md5 releases it, so the event loop keeps
+                                # running while they're hashed.
+                                await asyncio.get_running_loop().run_in_executor(
+                                    get_message_executor(), populate_hash_if_needed, msg
+                                )
                             try:
                                 self._send_message(active_session_info, msg)
                             except SessionClientDisconnectedError:
@@ -625,6 +716,9 @@ class Runtime:
                 # is no longer so tightly coupled to a browser tab.
                 self._session_mgr.close_session(session_info.session.id)
 
+            if self._script_worker_pool is not None:
+                self._script_worker_pool.shutdown()
+
             self._set_state(RuntimeState.STOPPED)
             async_objs.stopped.set_result(None)
 
@@ -667,6 +761,9 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
                 # a reference instead.
                 LOGGER.debug("Sending cached message ref (hash=%s)", msg.hash)
                 msg_to_send = create_reference_msg(msg)
+                _FORWARD_MSG_CACHE_HITS.inc()
+            else:
+                _FORWARD_MSG_CACHE_MISSES.inc()
 
             # Cache the message so it can be referenced in the future.
             # If the message is already cached, this will reset its
@@ -694,7 +791,20 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             )
 
         # Ship it off!
-        session_info.client.write_forward_msg(msg_to_send)
+        tracer = tracing.get_tracer()
+        if tracer is None:
+            session_info.client.write_forward_msg(msg_to_send)
+            return
+
+        session_id = session_info.session.id
+        msg_type = msg.WhichOneof("type")
+        send_span = tracer.on_message_sent(session_id, msg_type)
+        if send_span is not None:
+            send_span.set_attribute("reference", msg_to_send is not msg)
+        with tracing.use_span(send_span):
+            session_info.client.write_forward_msg(msg_to_send)
+        if msg_type == "script_finished":
+            tracer.on_run_messages_sent(session_id)
 
     def _enqueued_some_message(self) -> None:
         """Callback called by AppSession after the AppSession has enqueued a
@@ -726,3 +836,22 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
         ):
             self._get_async_objs().has_connection.clear()
             self._set_state(RuntimeState.NO_SESSIONS_CONNECTED)
+
+    def _get_forward_msg_queue_depth(self) -> int:
+        """Return the number of ForwardMsgs in all active sessions' queues."""
+        return sum(
+            session_info.session.browser_queue_size
+            for session_info in self._session_mgr.list_active_sessions()
+        )
+
+
+def _count_script_threads() -> int:
+    return sum(
+        1 for thread in threading.enumerate() if thread.name == SCRIPT_THREAD_NAME
+    )
+
+
+def _get_num_worker_processes() -> int:
+    # (Runtime.__init__'s `config` parameter shadows the config module.)
+    num_worker_processes: int = config.get_option("runner.workerProcesses")
+    return num_worker_processes
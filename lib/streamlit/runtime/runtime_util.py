@@ -14,8 +14,12 @@
 
 """Runtime-related utility functions"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
+from typing_extensions import Final
+
 from streamlit import config
 from streamlit.errors import MarkdownFormattedException
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
@@ -60,6 +64,16 @@ def is_cacheable_msg(msg: ForwardMsg) -> bool:
     return msg.ByteSize() >= int(config.get_option("global.minCachedMessageSize"))
 
 
+def is_offloaded_msg(msg: ForwardMsg) -> bool:
+    """True if the given message is large enough to be hashed on the message
+    executor, rather than on the event loop.
+    """
+    offload_size = float(config.get_option("server.messageOffloadSize"))
+    if offload_size <= 0:
+        return False
+    return msg.ByteSize() >= offload_size * 1e6
+
+
 def serialize_forward_msg(msg: ForwardMsg) -> bytes:
     """Serialize a ForwardMsg to send to a client.
 
@@ -96,3 +110,28 @@ def get_max_message_size_bytes() -> int:
         _max_message_size_bytes = config.get_option("server.maxMessageSize") * int(1e6)
 
     return _max_message_size_bytes
+
+
+# Hashing a message serializes it first, which holds the GIL. Only the md5
+# hashing itself releases it, so more threads than this wouldn't help.
+_MAX_MESSAGE_EXECUTOR_WORKERS: Final = 4
+
+# This needs to be initialized lazily, so that no threads are started until
+# a large message is sent.
+_message_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_message_executor() -> ThreadPoolExecutor:
+    """Return the thread pool that large messages are processed on.
+
+    Threading: UNSAFE. Must be called on the eventloop thread.
+    """
+    global _message_executor
+
+    if _message_executor is None:
+        _message_executor = ThreadPoolExecutor(
+            max_workers=min(_MAX_MESSAGE_EXECUTOR_WORKERS, os.cpu_count() or 1),
+            thread_name_prefix="StreamlitMessageWorker",
+        )
+
+    return _message_executor
@@ -0,0 +1,334 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in profiling of script runs.
+
+When "runner.profile" is set, each script run is profiled by a ScriptProfiler,
+whose sampler thread periodically records the script thread's call stack, and
+which times the st commands that the script calls. The profiles of each
+session's latest runs are kept in a ScriptProfileStore, and can be exported as
+speedscope or collapsed-stack ("folded") flamegraphs.
+"""
+
+import collections
+import contextlib
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from timeit import default_timer as timer
+from types import CodeType, FrameType
+from typing import (
+    Any,
+    Counter,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from typing_extensions import Final, TypeAlias
+
+from streamlit.version import STREAMLIT_VERSION_STRING
+
+# How often the script thread's stack is sampled, in seconds.
+SAMPLE_INTERVAL: Final = 0.005
+
+# The max number of profiles that are kept per session.
+MAX_PROFILES_PER_SESSION: Final = 10
+
+_SPEEDSCOPE_SCHEMA: Final = "https://www.speedscope.app/file-format-schema.json"
+
+
+class ProfileFrame(NamedTuple):
+    """A function in a sampled call stack, and the line it was executing."""
+
+    name: str
+    file: str
+    line: int
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.file}:{self.line})"
+
+
+# A call stack, from its outermost frame to its innermost one.
+Stack: TypeAlias = Tuple[ProfileFrame, ...]
+
+
+@dataclass
+class CommandTiming:
+    """The time spent in an st command during a script run, in seconds.
+
+    Only commands that are called by the script itself are timed, and not
+    those that are called by other commands.
+    """
+
+    name: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "totalTime": self.total_time,
+            "maxTime": self.max_time,
+        }
+
+
+@dataclass(frozen=True)
+class ScriptProfile:
+    """The profile of a script run."""
+
+    page_name: str
+    # When the run started, in seconds since the epoch.
+    start_time: float
+    # How long the run took, in seconds.
+    duration: float
+    sample_interval: float
+    # The number of times that each stack was sampled.
+    samples: Dict[Stack, int]
+    # Sorted by their total time, in descending order.
+    command_timings: List[CommandTiming]
+
+    @property
+    def num_samples(self) -> int:
+        return sum(self.samples.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a summary of the profile, without its samples."""
+        return {
+            "pageName": self.page_name,
+            "startTime": self.start_time,
+            "duration": self.duration,
+            "numSamples": self.num_samples,
+            "sampleInterval": self.sample_interval,
+            "commands": [timing.to_dict() for timing in self.command_timings],
+        }
+
+    def to_collapsed(self) -> str:
+        """Return the samples in the collapsed-stack format of flamegraph.pl,
+        which many flamegraph tools read: a line for each stack, with its
+        frames separated by semicolons, followed by its number of samples.
+        """
+        return "".join(
+            ";".join(str(frame) for frame in stack) + f" {count}\n"
+            for stack, count in self.samples.items()
+        )
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """Return the samples as a sampled profile in speedscope's file
+        format, weighted by the time they represent.
+        """
+        frame_indices: Dict[ProfileFrame, int] = {}
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in self.samples.items():
+            samples.append(
+                [frame_indices.setdefault(frame, len(frame_indices)) for frame in stack]
+            )
+            weights.append(count * self.sample_interval)
+
+        name = f"{self.page_name} ({time.ctime(self.start_time)})"
+        return {
+            "$schema": _SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": f"streamlit@{STREAMLIT_VERSION_STRING}",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [frame._asdict() for frame in frame_indices]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class ScriptProfiler:
+    """Profiles a script run.
+
+    While it's active, the profiler's sampler thread records the script
+    thread's call stack every `sample_interval` seconds, and the st commands
+    that the script calls report their timings to it.
+    """
+
+    def __init__(
+        self,
+        page_name: str,
+        root_code: Optional[CodeType] = None,
+        sample_interval: float = SAMPLE_INTERVAL,
+    ):
+        """Create a profiler for a run of a script on the current thread.
+
+        Parameters
+        ----------
+        page_name
+            The name of the page whose script is run.
+        root_code
+            The code of the function that runs the script. Sampled stacks
+            start below its innermost call, so they only contain the
+            script's frames, and stacks that don't contain it aren't
+            recorded. If None, whole stacks are recorded.
+        sample_interval
+            How often the stack is sampled, in seconds.
+        """
+        self._page_name = page_name
+        self._root_code = root_code
+        self._sample_interval = sample_interval
+        self._thread_id = threading.get_ident()
+
+        self._samples: Counter[Stack] = collections.Counter()
+        self._command_timings: Dict[str, CommandTiming] = {}
+        self._command_depth = 0
+
+        self._start_time = 0.0
+        self._start_timer = 0.0
+        self._duration = 0.0
+        self._stop_event = threading.Event()
+        self._sampler_thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling the script thread's stack."""
+        self._start_time = time.time()
+        self._start_timer = timer()
+        self._sampler_thread = threading.Thread(
+            target=self._run_sampler, name="ScriptProfiler.samplerThread", daemon=True
+        )
+        self._sampler_thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling, and wait for the sampler thread to exit."""
+        self._duration = timer() - self._start_timer
+        self._stop_event.set()
+        if self._sampler_thread is not None:
+            self._sampler_thread.join()
+
+    def start_command(self) -> None:
+        """Called when an st command starts."""
+        self._command_depth += 1
+
+    def end_command(self, name: str, duration: float) -> None:
+        """Called when an st command ends, with the time it took, in seconds."""
+        self._command_depth -= 1
+        if self._command_depth > 0:
+            # Commands that are called by other commands are timed as part of
+            # the command that called them.
+            return
+
+        command_timing = self._command_timings.get(name)
+        if command_timing is None:
+            command_timing = self._command_timings[name] = CommandTiming(name)
+        command_timing.count += 1
+        command_timing.total_time += duration
+        command_timing.max_time = max(command_timing.max_time, duration)
+
+    def get_profile(self) -> ScriptProfile:
+        """Return the profile of the run. Must be called after `stop`."""
+        return ScriptProfile(
+            page_name=self._page_name,
+            start_time=self._start_time,
+            duration=self._duration,
+            sample_interval=self._sample_interval,
+            samples=dict(self._samples),
+            command_timings=sorted(
+                self._command_timings.values(),
+                key=lambda timing: timing.total_time,
+                reverse=True,
+            ),
+        )
+
+    def _run_sampler(self) -> None:
+        while not self._stop_event.wait(self._sample_interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                break
+            stack = self._get_stack(frame)
+            if stack:
+                self._samples[stack] += 1
+
+    def _get_stack(self, frame: Optional[FrameType]) -> Stack:
+        frames: List[ProfileFrame] = []
+        while frame is not None and frame.f_code is not self._root_code:
+            frames.append(
+                ProfileFrame(
+                    name=frame.f_code.co_name,
+                    file=frame.f_code.co_filename,
+                    line=frame.f_lineno,
+                )
+            )
+            frame = frame.f_back
+        if frame is None and self._root_code is not None:
+            # The script thread wasn't running the script.
+            return ()
+        frames.reverse()
+        return tuple(frames)
+
+
+@contextlib.contextmanager
+def profile_run(profiler: Optional[ScriptProfiler]) -> Iterator[None]:
+    """Run the profiler, if there is one, while the context is active."""
+    if profiler is None:
+        yield
+        return
+
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+
+
+class ScriptProfileStore:
+    """Keeps the profiles of each session's latest script runs.
+
+    Profiles are added from script threads and read from the server's event
+    loop.
+    """
+
+    def __init__(self, max_profiles_per_session: int = MAX_PROFILES_PER_SESSION):
+        self._max_profiles_per_session = max_profiles_per_session
+        self._profiles: Dict[str, Deque[ScriptProfile]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, session_id: str, profile: ScriptProfile) -> None:
+        """Add the profile of a run, and drop the session's oldest profile if
+        it has too many.
+        """
+        with self._lock:
+            profiles = self._profiles.get(session_id)
+            if profiles is None:
+                profiles = self._profiles[session_id] = collections.deque(
+                    maxlen=self._max_profiles_per_session
+                )
+            profiles.append(profile)
+
+    def get_profiles(self, session_id: str) -> List[ScriptProfile]:
+        """Return the session's profiles, from the oldest to the latest."""
+        with self._lock:
+            return list(self._profiles.get(session_id, ()))
+
+    def clear_session(self, session_id: str) -> None:
+        """Remove the session's profiles."""
+        with self._lock:
+            self._profiles.pop(session_id, None)
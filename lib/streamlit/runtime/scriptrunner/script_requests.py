@@ -78,6 +78,13 @@ class ScriptRequests:
         self._state = ScriptRequestType.CONTINUE
         self._rerun_data = RerunData()
 
+    @property
+    def has_request(self) -> bool:
+        """True if we have a STOP or RERUN request that the ScriptRunner
+        hasn't handled yet.
+        """
+        return self._state != ScriptRequestType.CONTINUE
+
     def request_stop(self) -> None:
         """Request that the ScriptRunner stop running. A stopped ScriptRunner
         can't be used anymore. STOP requests succeed unconditionally.
@@ -24,6 +24,7 @@ from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.proto.PageProfile_pb2 import Command
+from streamlit.runtime.scriptrunner.script_profiler import ScriptProfiler
 from streamlit.runtime.scriptrunner.script_requests import ScriptRequests
 from streamlit.runtime.state import SafeSessionState
 from streamlit.runtime.uploaded_file_manager import UploadedFileManager
@@ -68,6 +69,7 @@ class ScriptRunContext:
         default_factory=list
     )
     script_requests: Optional[ScriptRequests] = None
+    script_profiler: Optional[ScriptProfiler] = None
 
     def reset(self, query_string: str = "", page_script_hash: str = "") -> None:
         self.cursors = {}
@@ -82,6 +84,7 @@ class ScriptRunContext:
         self.command_tracking_deactivated: bool = False
         self.tracked_commands = []
         self.tracked_commands_counter = collections.Counter()
+        self.script_profiler = None
 
     def on_script_start(self) -> None:
         self._has_script_started = True
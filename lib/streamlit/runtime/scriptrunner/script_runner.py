@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ctypes
 import gc
 import sys
 import threading
@@ -19,16 +20,19 @@ import types
 from contextlib import contextmanager
 from enum import Enum
 from timeit import default_timer as timer
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Type
 
 from blinker import Signal
+from typing_extensions import Final
 
 from streamlit import config, runtime, source_util, util
 from streamlit.error_util import handle_uncaught_app_exception
 from streamlit.logger import get_logger
 from streamlit.proto.ClientState_pb2 import ClientState
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime import tracing
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_profiler import ScriptProfiler, profile_run
 from streamlit.runtime.scriptrunner.script_requests import (
     RerunData,
     ScriptRequests,
@@ -44,11 +48,37 @@ from streamlit.runtime.state import (
     SafeSessionState,
     SessionState,
 )
+from streamlit.runtime.stats import get_metrics_registry
 from streamlit.runtime.uploaded_file_manager import UploadedFileManager
 from streamlit.vendor.ipython.modified_sys_path import modified_sys_path
 
 _LOGGER = get_logger(__name__)
 
+# The name of the threads that scripts run on.
+SCRIPT_THREAD_NAME: Final = "ScriptRunner.scriptThread"
+
+_SCRIPT_RUN_DURATION: Final = get_metrics_registry().histogram(
+    "script_run_duration_seconds",
+    "Time taken by script runs, including runs that were interrupted.",
+    unit="seconds",
+    labelnames=("page",),
+)
+_SCRIPT_RERUNS: Final = get_metrics_registry().counter(
+    "script_reruns",
+    "Script runs that were interrupted by a rerun.",
+    labelnames=("page",),
+)
+_WASTED_SCRIPT_RUN_SECONDS: Final = get_metrics_registry().counter(
+    "wasted_script_run_seconds",
+    "Time spent in script runs that were interrupted by a rerun, in seconds.",
+    labelnames=("page",),
+)
+_SCRIPT_STOPS: Final = get_metrics_registry().counter(
+    "script_stops",
+    "Script runs that were stopped early, by st.stop or by a stop request.",
+    labelnames=("page",),
+)
+
 
 class ScriptRunnerEvent(Enum):
     ## "Control" events. These are emitted when the ScriptRunner's state changes.
@@ -180,6 +210,17 @@ class ScriptRunner:
         # _maybe_handle_execution_control_request.
         self._execing = False
 
+        # If true, STOP and RERUN requests interrupt the script thread as soon
+        # as they're made, by raising an InterruptException in it. See
+        # _maybe_interrupt_script.
+        self._async_interrupt = _should_use_async_interrupt()
+
+        # Set while the script thread may receive an InterruptException: that
+        # is, while we're executing and not inside
+        # _maybe_handle_execution_control_request. Guarded by _interrupt_lock.
+        self._interruptible = False
+        self._interrupt_lock = threading.Lock()
+
         # This is initialized in start()
         self._script_thread: Optional[threading.Thread] = None
 
@@ -194,6 +235,7 @@ class ScriptRunner:
         Safe to call from any thread.
         """
         self._requests.request_stop()
+        self._maybe_interrupt_script()
 
     def request_rerun(self, rerun_data: RerunData) -> bool:
         """Request that the ScriptRunner interrupt its currently-running
@@ -207,7 +249,11 @@ class ScriptRunner:
 
         Safe to call from any thread.
         """
-        return self._requests.request_rerun(rerun_data)
+        if not self._requests.request_rerun(rerun_data):
+            return False
+
+        self._maybe_interrupt_script()
+        return True
 
     def start(self) -> None:
         """Start a new thread to process the ScriptEventQueue.
@@ -220,7 +266,7 @@ class ScriptRunner:
 
         self._script_thread = threading.Thread(
             target=self._run_script_thread,
-            name="ScriptRunner.scriptThread",
+            name=SCRIPT_THREAD_NAME,
         )
         self._script_thread.start()
 
@@ -345,7 +391,12 @@ class ScriptRunner:
             # enqueues a new ForwardEvent
             return
 
-        request = self._requests.on_scriptrunner_yield()
+        if self._async_interrupt:
+            with self._mask_interrupts():
+                request = self._requests.on_scriptrunner_yield()
+        else:
+            request = self._requests.on_scriptrunner_yield()
+
         if request is None:
             # No RERUN or STOP request.
             return
@@ -367,6 +418,47 @@ class ScriptRunner:
         if hasattr(sys, "settrace"):
             sys.settrace(trace_calls)
 
+    def _maybe_interrupt_script(self) -> None:
+        """If "runner.asyncInterrupt" is set, make the script thread handle
+        our pending request right away, rather than at its next yield point.
+
+        This raises an InterruptException in the script thread, which happens
+        the next time the thread runs Python bytecode. The script thread
+        handles it like a RerunException or StopException.
+
+        Safe to call from any thread.
+        """
+        if not self._async_interrupt or self._is_in_script_thread():
+            return
+
+        with self._interrupt_lock:
+            if self._interruptible and self._script_thread is not None:
+                _raise_in_thread(self._script_thread, InterruptException)
+
+    @contextmanager
+    def _mask_interrupts(self):
+        """A context in which the script thread won't receive an
+        InterruptException.
+
+        Used by _maybe_handle_execution_control_request so that an
+        InterruptException can't arrive after a request has been taken off
+        our ScriptRequests, which would lose the request.
+        """
+        with self._interrupt_lock:
+            self._interruptible = False
+            # Drop an InterruptException that hasn't been raised yet. Its
+            # request is still pending, and is about to be handled.
+            _drop_pending_interrupt()
+        try:
+            yield
+        finally:
+            with self._interrupt_lock:
+                self._interruptible = self._execing
+                # Requests that came in while we were masked were not
+                # delivered.
+                if self._interruptible and self._requests.has_request:
+                    _raise_in_thread(self._script_thread, InterruptException)
+
     @contextmanager
     def _set_execing_flag(self):
         """A context for setting the ScriptRunner._execing flag.
@@ -378,9 +470,37 @@ class ScriptRunner:
             raise RuntimeError("Nested set_execing_flag call")
         self._execing = True
         try:
+            if self._async_interrupt:
+                # Start interruptible, and handle requests that came in
+                # while we were preparing to run.
+                with self._mask_interrupts():
+                    pass
             yield
         finally:
-            self._execing = False
+            # An InterruptException can land anywhere in here until
+            # interrupts are disabled, so the flags are reset again until
+            # that's done without one. If it was meant to interrupt the
+            # script run that just ended, its request is still pending, and
+            # is handled by on_scriptrunner_ready.
+            while True:
+                try:
+                    self._reset_execing_flag()
+                    break
+                except InterruptException:
+                    pass
+
+    def _reset_execing_flag(self) -> None:
+        """Clear the ScriptRunner._execing flag, and stop interrupting the
+        script thread.
+        """
+        self._execing = False
+        if self._async_interrupt:
+            with self._interrupt_lock:
+                self._execing = False
+                self._interruptible = False
+            # Drop an InterruptException that hasn't been raised yet. No more
+            # can be raised now.
+            _drop_pending_interrupt()
 
     def _run_script(self, rerun_data: RerunData) -> None:
         """Run our script.
@@ -400,6 +520,9 @@ class ScriptRunner:
 
         # Reset DeltaGenerators, widgets, media files.
         runtime.get_instance().media_file_mgr.clear_session_refs()
+        dataframe_window_mgr = runtime.get_instance().dataframe_window_mgr
+        if dataframe_window_mgr is not None:
+            dataframe_window_mgr.clear_session_refs()
 
         main_script_path = self._main_script_path
         pages = source_util.get_pages(main_script_path)
@@ -431,10 +554,17 @@ class ScriptRunner:
             # running the main page.
             current_page_info = main_page_info
 
-        page_script_hash = (
-            current_page_info["page_script_hash"]
-            if current_page_info is not None
-            else main_page_info["page_script_hash"]
+        page_info = (
+            current_page_info if current_page_info is not None else main_page_info
+        )
+        page_script_hash = page_info["page_script_hash"]
+        page_name = page_info["page_name"]
+
+        tracer = tracing.get_tracer()
+        run_span = (
+            tracer.on_script_started(self._session_id, page_name)
+            if tracer is not None
+            else None
         )
 
         ctx = self._get_script_run_ctx()
@@ -442,6 +572,10 @@ class ScriptRunner:
             query_string=rerun_data.query_string,
             page_script_hash=page_script_hash,
         )
+        if config.get_option("runner.profile"):
+            ctx.script_profiler = ScriptProfiler(
+                page_name, root_code=ScriptRunner._run_script.__code__
+            )
 
         self.on_event.send(
             self,
@@ -474,6 +608,9 @@ class ScriptRunner:
         except Exception as ex:
             # We got a compile error. Send an error event and bail immediately.
             _LOGGER.debug("Fatal script error: %s", ex)
+            if run_span is not None:
+                run_span.record_exception(ex)
+                run_span.end()
             self._session_state[SCRIPT_RUN_WITHOUT_ERRORS_KEY] = False
             self.on_event.send(
                 self,
@@ -524,7 +661,13 @@ class ScriptRunner:
             # assume is the main script directory.
             module.__dict__["__file__"] = script_path
 
-            with modified_sys_path(self._main_script_path), self._set_execing_flag():
+            # The run's span ends before the script_finished message is
+            # enqueued, since sending that message ends the run's trace.
+            with modified_sys_path(
+                self._main_script_path
+            ), self._set_execing_flag(), tracing.use_span(run_span), profile_run(
+                ctx.script_profiler
+            ):
                 # Run callbacks for widgets whose values have changed.
                 if rerun_data.widget_states is not None:
                     self._session_state.on_script_will_rerun(rerun_data.widget_states)
@@ -543,6 +686,14 @@ class ScriptRunner:
             # We don't have to do anything here.
             premature_stop = True
 
+        except InterruptException:
+            # This is raised asynchronously by _maybe_interrupt_script. The
+            # request that it was raised for is still pending.
+            request = self._requests.on_scriptrunner_yield()
+            if request is not None and request.type == ScriptRequestType.RERUN:
+                rerun_exception_data = request.rerun_data
+            premature_stop = True
+
         except Exception as ex:
             self._session_state[SCRIPT_RUN_WITHOUT_ERRORS_KEY] = False
             uncaught_exception = ex
@@ -550,10 +701,21 @@ class ScriptRunner:
             premature_stop = True
 
         finally:
+            run_duration = timer() - start_time
             if rerun_exception_data:
                 finished_event = ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN
+                _SCRIPT_RERUNS.inc(page_name)
+                _WASTED_SCRIPT_RUN_SECONDS.inc(page_name, amount=run_duration)
             else:
                 finished_event = ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS
+                if premature_stop and uncaught_exception is None:
+                    _SCRIPT_STOPS.inc(page_name)
+            _SCRIPT_RUN_DURATION.observe(run_duration, page_name)
+
+            if ctx.script_profiler is not None:
+                runtime.get_instance().script_profile_store.add(
+                    self._session_id, ctx.script_profiler.get_profile()
+                )
 
             if ctx.gather_usage_stats:
                 try:
@@ -604,6 +766,9 @@ class ScriptRunner:
         # Remove orphaned files now that the script has run and files in use
         # are marked as active.
         runtime.get_instance().media_file_mgr.remove_orphaned_files()
+        dataframe_window_mgr = runtime.get_instance().dataframe_window_mgr
+        if dataframe_window_mgr is not None:
+            dataframe_window_mgr.remove_orphaned_windows()
 
         # Force garbage collection to run, to help avoid memory use building up
         # This is usually not an issue, but sometimes GC takes time to kick in and
@@ -642,6 +807,61 @@ class RerunException(ScriptControlException):
         return util.repr_(self)
 
 
+class InterruptException(ScriptControlException):
+    """Raised asynchronously in the script thread to make it handle a pending
+    STOP or RERUN request."""
+
+    pass
+
+
+def _should_use_async_interrupt() -> bool:
+    if not config.get_option("runner.asyncInterrupt"):
+        return False
+
+    # Raising exceptions in other threads relies on a CPython API.
+    if not hasattr(ctypes, "pythonapi"):
+        _LOGGER.warning(
+            "runner.asyncInterrupt is not supported by this Python interpreter. "
+            "Scripts will be interrupted at the next Streamlit command instead."
+        )
+        return False
+
+    return True
+
+
+def _raise_in_thread(
+    thread: Optional[threading.Thread], exc_type: Type[BaseException]
+) -> None:
+    """Raise exc_type in the given thread the next time it runs Python
+    bytecode.
+    """
+    if thread is None or thread.ident is None:
+        return
+
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread.ident), ctypes.py_object(exc_type)
+    )
+
+
+def _drop_pending_interrupt() -> None:
+    """Raise and swallow an InterruptException that was set for the current
+    thread but hasn't been raised yet, if there is one.
+
+    (PyThreadState_SetAsyncExc can cancel a pending exception, but on some
+    Python versions that leaves the interpreter checking for it after every
+    few bytecodes, forever.)
+    """
+    try:
+        # CPython raises pending async exceptions when a function is entered.
+        _no_op()
+    except InterruptException:
+        pass
+
+
+def _no_op() -> None:
+    pass
+
+
 def _clean_problem_modules() -> None:
     """Some modules are stateful, so we have to clear their state."""
 
@@ -0,0 +1,1134 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run app scripts in a pool of worker processes.
+
+When `runner.workerProcesses` is greater than zero, the Runtime starts that
+many worker processes and AppSessions use a WorkerScriptRunner instead of a
+ScriptRunner. Each session is pinned to a single worker, which owns the
+session's SessionState and runs a regular ScriptRunner for it. ForwardMsgs are
+streamed back to the server process as serialized protobuf bytes.
+
+The server process remains the owner of everything that's served over HTTP:
+media files and uploaded files are proxied to the server's MediaFileStorage
+and UploadedFileManager, and custom components declared in a worker are
+registered with the server's ComponentRegistry.
+
+Note that every worker has its own st.cache_data / st.cache_resource caches,
+its own secrets and its own copy of any module-level state in the app.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import pickle
+import queue
+import signal
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from multiprocessing.connection import Connection
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from blinker import Signal
+from typing_extensions import Final
+
+from streamlit import config, source_util, util
+from streamlit.components.v1.components import ComponentRegistry, CustomComponent
+from streamlit.config_option import ConfigOption
+from streamlit.logger import get_logger
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetStates
+from streamlit.runtime import tracing
+from streamlit.runtime.dataframe_window_manager import (
+    DataframeWindowManager,
+    _get_session_id,
+)
+from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorage
+from streamlit.runtime.scriptrunner.script_requests import RerunData
+from streamlit.runtime.scriptrunner.script_runner import ScriptRunner, ScriptRunnerEvent
+from streamlit.runtime.state import SCRIPT_RUN_WITHOUT_ERRORS_KEY, SessionState
+from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.uploaded_file_manager import (
+    UploadedFileManager,
+    UploadedFileRec,
+    UploadFileUrlInfo,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    import pyarrow as pa
+
+_LOGGER: Final = get_logger(__name__)
+
+# Seconds to wait for a worker to exit after asking it to shut down.
+_WORKER_SHUTDOWN_TIMEOUT: Final = 5.0
+
+# (query_string, serialized widget_states or None, page_script_hash, page_name)
+_RerunPayload = Tuple[str, Optional[bytes], str, str]
+
+
+def _serialize_rerun_data(rerun_data: RerunData) -> _RerunPayload:
+    widget_states = (
+        rerun_data.widget_states.SerializeToString()
+        if rerun_data.widget_states is not None
+        else None
+    )
+    return (
+        rerun_data.query_string,
+        widget_states,
+        rerun_data.page_script_hash,
+        rerun_data.page_name,
+    )
+
+
+def _deserialize_rerun_data(payload: _RerunPayload) -> RerunData:
+    query_string, widget_states_bytes, page_script_hash, page_name = payload
+    widget_states = None
+    if widget_states_bytes is not None:
+        widget_states = WidgetStates()
+        widget_states.ParseFromString(widget_states_bytes)
+    return RerunData(
+        query_string=query_string,
+        widget_states=widget_states,
+        page_script_hash=page_script_hash,
+        page_name=page_name,
+    )
+
+
+class _Channel:
+    """One end of a worker pipe.
+
+    Messages are written by a dedicated thread, so that neither the pipe
+    reader nor the script threads can deadlock on a full pipe buffer while
+    the other process is itself blocked writing to us.
+    """
+
+    def __init__(self, conn: Connection, name: str):
+        self._conn = conn
+        self._outbox: queue.SimpleQueue[Optional[Tuple[Any, ...]]] = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name=f"{name}.writer", daemon=True
+        )
+        self._writer.start()
+
+    def send(self, *msg: Any) -> None:
+        """Queue a message for the other end. Safe to call from any thread."""
+        self._outbox.put(msg)
+
+    def recv(self) -> Tuple[Any, ...]:
+        """Block until a message arrives. Raises EOFError when the pipe closes."""
+        msg: Tuple[Any, ...] = self._conn.recv()
+        return msg
+
+    def close(self) -> None:
+        self._outbox.put(None)
+
+    def _write_loop(self) -> None:
+        while True:
+            msg = self._outbox.get()
+            if msg is None:
+                break
+            try:
+                self._conn.send(msg)
+            except (OSError, EOFError, ValueError):
+                break
+            except Exception as ex:
+                # Most likely an unpicklable payload. Drop the message rather
+                # than killing the channel.
+                _LOGGER.error("Failed to send %s to worker pipe", msg[0], exc_info=ex)
+        try:
+            self._conn.close()
+        except OSError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Server-process side
+# ---------------------------------------------------------------------------
+
+
+class WorkerScriptRunner:
+    """Stands in for a ScriptRunner whose script executes in a worker process.
+
+    It has the same public interface as ScriptRunner, so that AppSession can
+    use either interchangeably. Events are emitted on a pool reader thread,
+    just as a ScriptRunner emits them on its script thread.
+
+    A worker may have to replace the ScriptRunner behind a WorkerScriptRunner
+    when a rerun request arrives just after the previous one finished. Each
+    replacement bumps a generation counter, and events from an older
+    generation are dropped, the same way AppSession ignores events from a
+    stale ScriptRunner.
+    """
+
+    def __init__(
+        self,
+        pool: "ScriptWorkerPool",
+        worker: "_WorkerHandle",
+        runner_id: int,
+        session_id: str,
+        main_script_path: str,
+        session_state: SessionState,
+        initial_rerun_data: RerunData,
+        user_info: Dict[str, Optional[str]],
+    ):
+        self._pool = pool
+        self._worker = worker
+        self._runner_id = runner_id
+        self._session_id = session_id
+        self._main_script_path = main_script_path
+        self._session_state = session_state
+        self._initial_rerun_data = initial_rerun_data
+        self._user_info = user_info
+
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopped = False
+        self._generation = 0
+        self._unacked_reruns = 0
+
+        self.on_event = Signal(
+            doc="""Emitted when a ScriptRunnerEvent occurs in the worker.
+
+            See ScriptRunner.on_event for the signal's parameters.
+            """
+        )
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def request_stop(self) -> None:
+        """Request that the worker's ScriptRunner stop and shut down.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            self._stopped = True
+        self._worker.channel.send("stop", self._runner_id)
+
+    def request_rerun(self, rerun_data: RerunData) -> bool:
+        """Request that the worker's ScriptRunner restart its script.
+
+        Returns False if this runner has been stopped.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            if self._stopped:
+                return False
+            self._unacked_reruns += 1
+        self._worker.channel.send(
+            "rerun", self._runner_id, _serialize_rerun_data(rerun_data)
+        )
+        return True
+
+    def start(self) -> None:
+        """Start running the script in the worker. Must be called only once."""
+        if self._started:
+            raise Exception("ScriptRunner was already started")
+        self._started = True
+        self._worker.channel.send(
+            "start",
+            self._runner_id,
+            self._session_id,
+            self._main_script_path,
+            self._user_info,
+            _serialize_rerun_data(self._initial_rerun_data),
+        )
+
+    def _on_rerun_ack(self, generation: int) -> None:
+        with self._lock:
+            self._unacked_reruns -= 1
+            self._generation = max(self._generation, generation)
+
+    def _on_worker_event(
+        self, generation: int, event_name: str, payload: Dict[str, Any]
+    ) -> None:
+        """Translate an event sent by the worker and emit it on on_event."""
+        event = ScriptRunnerEvent(event_name)
+
+        with self._lock:
+            if generation < self._generation:
+                return
+            if event == ScriptRunnerEvent.SHUTDOWN:
+                if self._unacked_reruns > 0:
+                    # A rerun request is in flight. The worker will start a
+                    # replacement ScriptRunner for it, so this runner isn't
+                    # really shutting down.
+                    return
+                self._stopped = True
+
+        if "script_run_ok" in payload:
+            # Mirror the flag the worker's ScriptRunner just set, so that
+            # Runtime.does_script_run_without_error keeps working. There's no
+            # ScriptRunContext on this thread, so bypass the widget checks
+            # that SessionState.__setitem__ performs.
+            self._session_state._new_session_state[
+                SCRIPT_RUN_WITHOUT_ERRORS_KEY
+            ] = payload["script_run_ok"]
+
+        kwargs: Dict[str, Any] = {}
+        if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
+            msg = ForwardMsg()
+            msg.ParseFromString(payload["forward_msg"])
+            kwargs["forward_msg"] = msg
+        elif event == ScriptRunnerEvent.SCRIPT_STARTED:
+            kwargs["page_script_hash"] = payload["page_script_hash"]
+        elif event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR:
+            kwargs["exception"] = payload["exception"]
+        elif event == ScriptRunnerEvent.SHUTDOWN:
+            client_state = ClientState()
+            client_state.ParseFromString(payload["client_state"])
+            kwargs["client_state"] = client_state
+
+        self.on_event.send(self, event=event, **kwargs)
+
+        if event == ScriptRunnerEvent.SHUTDOWN:
+            self._pool._release_runner(self._worker, self._runner_id)
+
+    def _on_worker_died(self) -> None:
+        """Emit the events a ScriptRunner would have sent had it stopped."""
+        with self._lock:
+            self._stopped = True
+        self.on_event.send(self, event=ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS)
+        self.on_event.send(
+            self, event=ScriptRunnerEvent.SHUTDOWN, client_state=ClientState()
+        )
+
+
+class _WorkerHandle:
+    """The server-side bookkeeping for one worker process."""
+
+    def __init__(self, index: int, process: "BaseProcess", channel: _Channel):
+        self.index = index
+        self.process = process
+        self.channel = channel
+        self.session_ids: Set[str] = set()
+        self.runners: Dict[int, WorkerScriptRunner] = {}
+        self.alive = True
+        self.reader: Optional[threading.Thread] = None
+
+
+class ScriptWorkerPool:
+    """A pool of worker processes that execute app scripts.
+
+    Sessions are assigned to the least-loaded worker the first time they run
+    their script, and stay on that worker until they're closed, so that their
+    SessionState never has to leave the worker.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        main_script_path: str,
+        command_line: str,
+        media_file_storage: MediaFileStorage,
+        uploaded_file_manager: UploadedFileManager,
+        dataframe_window_manager: Optional[DataframeWindowManager] = None,
+    ):
+        if num_workers < 1:
+            raise ValueError("ScriptWorkerPool needs at least one worker")
+
+        self._num_workers = num_workers
+        self._main_script_path = main_script_path
+        self._command_line = command_line
+        self._media_file_storage = media_file_storage
+        self._uploaded_file_mgr = uploaded_file_manager
+        self._dataframe_window_mgr = dataframe_window_manager
+
+        self._lock = threading.Lock()
+        self._workers: List[_WorkerHandle] = []
+        self._worker_by_session: Dict[str, _WorkerHandle] = {}
+        self._runner_ids = itertools.count()
+        self._is_shut_down = False
+
+        # file_id -> indices of the workers that reference it. Media file IDs
+        # are content hashes, so two workers may add the same file; it's only
+        # deleted from storage once no worker uses it anymore.
+        self._media_holders: Dict[str, Set[int]] = {}
+
+        self._stop_pages_listener: Optional[Callable[[], bool]] = None
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    def start(self) -> None:
+        """Spawn the worker processes.
+
+        Notes
+        -----
+        Threading: UNSAFE. Must be called on the eventloop thread, before
+        any session runs its script.
+        """
+        with self._lock:
+            for index in range(self._num_workers):
+                self._workers.append(self._spawn_worker(index))
+
+        self._stop_pages_listener = source_util.register_pages_changed_callback(
+            lambda _: self._broadcast("invalidate_pages")
+        )
+
+    def shutdown(self) -> None:
+        """Ask every worker to exit, and wait for them to do so.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            if self._is_shut_down:
+                return
+            self._is_shut_down = True
+            workers = list(self._workers)
+
+        if self._stop_pages_listener is not None:
+            self._stop_pages_listener()
+
+        for worker in workers:
+            worker.channel.send("shutdown")
+            worker.channel.close()
+
+        for worker in workers:
+            worker.process.join(_WORKER_SHUTDOWN_TIMEOUT)
+            if worker.process.is_alive():
+                _LOGGER.warning(
+                    "Script worker %s did not exit; terminating it", worker.index
+                )
+                worker.process.terminate()
+
+    def create_scriptrunner(
+        self,
+        session_id: str,
+        main_script_path: str,
+        session_state: SessionState,
+        initial_rerun_data: RerunData,
+        user_info: Dict[str, Optional[str]],
+    ) -> WorkerScriptRunner:
+        """Create a WorkerScriptRunner for the given session.
+
+        The runner won't do anything until its start() method is called.
+        """
+        with self._lock:
+            worker = self._get_worker_for_session(session_id)
+            runner = WorkerScriptRunner(
+                pool=self,
+                worker=worker,
+                runner_id=next(self._runner_ids),
+                session_id=session_id,
+                main_script_path=main_script_path,
+                session_state=session_state,
+                initial_rerun_data=initial_rerun_data,
+                user_info=user_info,
+            )
+            worker.runners[runner._runner_id] = runner
+        return runner
+
+    def close_session(self, session_id: str) -> None:
+        """Drop the state a worker holds for the given session."""
+        with self._lock:
+            worker = self._worker_by_session.pop(session_id, None)
+            if worker is None:
+                return
+            worker.session_ids.discard(session_id)
+        worker.channel.send("close_session", session_id)
+
+    def clear_caches(self, session_id: str) -> None:
+        """Clear the st.cache_* caches in every worker, and the session_state
+        of the given session.
+        """
+        with self._lock:
+            session_worker = self._worker_by_session.get(session_id)
+            workers = list(self._workers)
+        for worker in workers:
+            worker.channel.send(
+                "clear_caches", session_id if worker is session_worker else None
+            )
+
+    def invalidate_sources(self) -> None:
+        """Tell every worker that the app's source files changed on disk."""
+        self._broadcast("invalidate_sources")
+
+    def _broadcast(self, *msg: Any) -> None:
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.channel.send(*msg)
+
+    def _get_worker_for_session(self, session_id: str) -> _WorkerHandle:
+        """Return the worker that owns the given session, assigning one if
+        necessary.
+
+        Thread safety: callers must hold `self._lock`.
+        """
+        worker = self._worker_by_session.get(session_id)
+        if worker is not None and worker.alive:
+            return worker
+
+        for index, existing in enumerate(self._workers):
+            if not existing.alive and not self._is_shut_down:
+                self._workers[index] = self._spawn_worker(index)
+
+        worker = min(self._workers, key=lambda w: len(w.session_ids))
+        worker.session_ids.add(session_id)
+        self._worker_by_session[session_id] = worker
+        return worker
+
+    def _spawn_worker(self, index: int) -> _WorkerHandle:
+        mp_context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = mp_context.Pipe(duplex=True)
+
+        process = mp_context.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                _get_config_snapshot(),
+                self._main_script_path,
+                self._command_line,
+                self._dataframe_window_mgr is not None,
+            ),
+            name=f"ScriptWorker-{index}",
+        )
+        with _bare_main_module():
+            process.start()
+        child_conn.close()
+
+        worker = _WorkerHandle(
+            index, process, _Channel(parent_conn, f"ScriptWorkerPool.{index}")
+        )
+        worker.reader = threading.Thread(
+            target=self._read_loop,
+            args=(worker,),
+            name=f"ScriptWorkerPool.{index}.reader",
+            daemon=True,
+        )
+        worker.reader.start()
+        _LOGGER.debug("Started script worker %s (pid=%s)", index, process.pid)
+        return worker
+
+    def _release_runner(self, worker: _WorkerHandle, runner_id: int) -> None:
+        with self._lock:
+            worker.runners.pop(runner_id, None)
+        worker.channel.send("release", runner_id)
+
+    def _read_loop(self, worker: _WorkerHandle) -> None:
+        """Dispatch the messages a worker sends us. Runs on a reader thread."""
+        while True:
+            try:
+                msg = worker.channel.recv()
+            except (EOFError, OSError):
+                break
+
+            try:
+                self._handle_worker_msg(worker, msg)
+            except Exception as ex:
+                _LOGGER.error(
+                    "Error handling %s from script worker", msg[0], exc_info=ex
+                )
+
+        self._on_worker_died(worker)
+
+    def _handle_worker_msg(self, worker: _WorkerHandle, msg: Tuple[Any, ...]) -> None:
+        kind = msg[0]
+        if kind == "event":
+            _, runner_id, generation, event_name, payload = msg
+            runner = worker.runners.get(runner_id)
+            if runner is not None:
+                runner._on_worker_event(generation, event_name, payload)
+        elif kind == "rerun_ack":
+            _, runner_id, generation = msg
+            runner = worker.runners.get(runner_id)
+            if runner is not None:
+                runner._on_rerun_ack(generation)
+        elif kind == "rpc":
+            _, call_id, method, args = msg
+            try:
+                result = self._handle_rpc(worker, method, args)
+            except Exception as ex:
+                worker.channel.send("rpc_result", call_id, False, ex)
+            else:
+                worker.channel.send("rpc_result", call_id, True, result)
+        elif kind == "notify":
+            _, method, args = msg
+            self._handle_rpc(worker, method, args)
+        else:
+            _LOGGER.warning("Unknown message from script worker: %s", kind)
+
+    def _handle_rpc(
+        self, worker: _WorkerHandle, method: str, args: Tuple[Any, ...]
+    ) -> Any:
+        if method == "media_load":
+            path_or_data, mimetype, kind_value, filename = args
+            file_id = self._media_file_storage.load_and_get_id(
+                path_or_data, mimetype, MediaFileKind(kind_value), filename
+            )
+            with self._lock:
+                self._media_holders.setdefault(file_id, set()).add(worker.index)
+            return file_id
+
+        if method == "media_get_url":
+            (file_id,) = args
+            return self._media_file_storage.get_url(file_id)
+
+        if method == "media_delete":
+            (file_id,) = args
+            with self._lock:
+                holders = self._media_holders.get(file_id, set())
+                holders.discard(worker.index)
+                if holders:
+                    return None
+                self._media_holders.pop(file_id, None)
+            self._media_file_storage.delete_file(file_id)
+            return None
+
+        if method == "dataframe_window_add":
+            session_id, table, coordinates = args
+            assert self._dataframe_window_mgr is not None
+            return self._dataframe_window_mgr.add(table, coordinates, session_id)
+
+        if method == "dataframe_window_clear_session_refs":
+            (session_id,) = args
+            if self._dataframe_window_mgr is not None:
+                self._dataframe_window_mgr.clear_session_refs(session_id)
+            return None
+
+        if method == "dataframe_window_remove_orphaned":
+            if self._dataframe_window_mgr is not None:
+                self._dataframe_window_mgr.remove_orphaned_windows()
+            return None
+
+        if method == "get_files":
+            session_id, file_ids = args
+            # Memory maps can't be sent to workers, so the content of large
+            # files is sent as bytes.
+            return [
+                file
+                if isinstance(file.data, bytes)
+                else file._replace(data=file.data[:])
+                for file in self._uploaded_file_mgr.get_files(session_id, file_ids)
+            ]
+
+        if method == "get_upload_urls":
+            session_id, file_names = args
+            return self._uploaded_file_mgr.get_upload_urls(session_id, file_names)
+
+        if method == "register_component":
+            name, path, url = args
+            ComponentRegistry.instance().register_component(
+                CustomComponent(name=name, path=path, url=url)
+            )
+            return None
+
+        raise ValueError(f"Unknown script worker request: {method}")
+
+    def _on_worker_died(self, worker: _WorkerHandle) -> None:
+        with self._lock:
+            worker.alive = False
+            runners = list(worker.runners.values())
+            worker.runners.clear()
+            for session_id in worker.session_ids:
+                self._worker_by_session.pop(session_id, None)
+            worker.session_ids.clear()
+            orphaned_file_ids = []
+            for file_id, holders in self._media_holders.items():
+                holders.discard(worker.index)
+                if not holders:
+                    orphaned_file_ids.append(file_id)
+            for file_id in orphaned_file_ids:
+                del self._media_holders[file_id]
+            is_shut_down = self._is_shut_down
+
+        # The dead worker can't release its files anymore, so the ones that
+        # no other worker holds are deleted here.
+        for file_id in orphaned_file_ids:
+            self._media_file_storage.delete_file(file_id)
+
+        if not is_shut_down:
+            _LOGGER.error(
+                "Script worker %s exited unexpectedly (exitcode=%s). "
+                "Its sessions' state has been lost.",
+                worker.index,
+                worker.process.exitcode,
+            )
+
+        for runner in runners:
+            runner._on_worker_died()
+
+
+@contextmanager
+def _bare_main_module() -> Iterator[None]:
+    """Hide the server's `__main__` module from `multiprocessing`.
+
+    "spawn" children re-import the parent's `__main__` module by path. Workers
+    have no use for it (it's the `streamlit` CLI, or whatever embeds the
+    server), and while a ScriptRunner runs in this process `__main__` is the
+    user's script, which must not run as a side effect of starting a worker.
+    """
+    main_module = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main_module
+
+
+def _get_config_snapshot() -> Dict[str, Any]:
+    """Return the config options that differ from their defaults, so that
+    workers see the same configuration as the server process.
+    """
+    return {
+        key: option.value
+        for key, option in config.get_config_options().items()
+        if option.where_defined != ConfigOption.DEFAULT_DEFINITION
+        and not option.deprecated
+    }
+
+
+# ---------------------------------------------------------------------------
+# Worker-process side
+# ---------------------------------------------------------------------------
+
+
+class _RPCClient:
+    """Makes blocking requests to the server process. Thread-safe."""
+
+    def __init__(self, channel: _Channel):
+        self._channel = channel
+        self._call_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Tuple[threading.Event, List[Any]]] = {}
+
+    def call(self, method: str, *args: Any) -> Any:
+        done = threading.Event()
+        result: List[Any] = []
+        with self._lock:
+            call_id = next(self._call_ids)
+            self._pending[call_id] = (done, result)
+        self._channel.send("rpc", call_id, method, args)
+        done.wait()
+
+        ok, value = result
+        if not ok:
+            raise value
+        return value
+
+    def notify(self, method: str, *args: Any) -> None:
+        self._channel.send("notify", method, args)
+
+    def on_result(self, call_id: int, ok: bool, value: Any) -> None:
+        with self._lock:
+            done, result = self._pending.pop(call_id)
+        result.extend((ok, value))
+        done.set()
+
+    def fail_pending(self) -> None:
+        """Unblock every caller still waiting for a result."""
+        with self._lock:
+            pending = list(self._pending.keys())
+        for call_id in pending:
+            self.on_result(
+                call_id, False, RuntimeError("The Streamlit server went away")
+            )
+
+
+class _ProxyMediaFileStorage(MediaFileStorage):
+    """MediaFileStorage that stores files in the server process's storage."""
+
+    def __init__(self, rpc: _RPCClient):
+        self._rpc = rpc
+
+    def load_and_get_id(
+        self,
+        path_or_data: Union[str, bytes],
+        mimetype: str,
+        kind: MediaFileKind,
+        filename: Optional[str] = None,
+    ) -> str:
+        file_id: str = self._rpc.call(
+            "media_load", path_or_data, mimetype, kind.value, filename
+        )
+        return file_id
+
+    def get_url(self, file_id: str) -> str:
+        url: str = self._rpc.call("media_get_url", file_id)
+        return url
+
+    def delete_file(self, file_id: str) -> None:
+        self._rpc.notify("media_delete", file_id)
+
+
+class _ProxyUploadedFileManager(UploadedFileManager):
+    """UploadedFileManager that reads files from the server process.
+
+    Uploads are always received and stored by the server process; workers
+    only ever need to read them.
+    """
+
+    def __init__(self, rpc: _RPCClient):
+        self._rpc = rpc
+
+    def get_files(
+        self, session_id: str, file_ids: Sequence[str]
+    ) -> List[UploadedFileRec]:
+        files: List[UploadedFileRec] = self._rpc.call(
+            "get_files", session_id, list(file_ids)
+        )
+        return files
+
+    def remove_session_files(self, session_id: str) -> None:
+        # The server process removes the files when it closes the session.
+        pass
+
+    def get_upload_urls(
+        self, session_id: str, file_names: Sequence[str]
+    ) -> List[UploadFileUrlInfo]:
+        urls: List[UploadFileUrlInfo] = self._rpc.call(
+            "get_upload_urls", session_id, list(file_names)
+        )
+        return urls
+
+    def get_stats(self) -> List[CacheStat]:
+        return []
+
+
+class _ProxyDataframeWindowManager(DataframeWindowManager):
+    """DataframeWindowManager that leaves tables with the server process's
+    manager, which serves their pages.
+    """
+
+    def __init__(self, rpc: _RPCClient):
+        self._rpc = rpc
+
+    def add(
+        self, table: pa.Table, coordinates: str, session_id: Optional[str] = None
+    ) -> str:
+        if session_id is None:
+            session_id = _get_session_id()
+        url: str = self._rpc.call(
+            "dataframe_window_add", session_id, table, coordinates
+        )
+        return url
+
+    def clear_session_refs(self, session_id: Optional[str] = None) -> None:
+        if session_id is None:
+            session_id = _get_session_id()
+        self._rpc.notify("dataframe_window_clear_session_refs", session_id)
+
+    def remove_orphaned_windows(self) -> None:
+        self._rpc.notify("dataframe_window_remove_orphaned")
+
+    def get_stats(self) -> List[CacheStat]:
+        return []
+
+
+class _WorkerRunner:
+    """A WorkerScriptRunner's counterpart inside the worker process."""
+
+    def __init__(
+        self,
+        runner_id: int,
+        session_id: str,
+        main_script_path: str,
+        user_info: Dict[str, Optional[str]],
+    ):
+        self.runner_id = runner_id
+        self.session_id = session_id
+        self.main_script_path = main_script_path
+        self.user_info = user_info
+        self.generation = -1
+        self.scriptrunner: Optional[ScriptRunner] = None
+
+
+class _Worker:
+    """The main object of a worker process."""
+
+    def __init__(
+        self,
+        channel: _Channel,
+        main_script_path: str,
+        command_line: str,
+        serve_dataframe_windows: bool,
+    ):
+        from streamlit.runtime.runtime import Runtime, RuntimeConfig
+        from streamlit.web.cache_storage_manager_config import (
+            create_default_cache_storage_manager,
+        )
+
+        self._channel = channel
+        self._rpc = _RPCClient(channel)
+        self._runners: Dict[int, _WorkerRunner] = {}
+        self._session_states: Dict[str, SessionState] = {}
+
+        # Traces start and end with the session's messages, which the server
+        # process sends, so scripts are only traced in that process.
+        tracing.disable_tracing()
+        # Likewise, profiles are only served from the server process.
+        config.set_option("runner.profile", False)
+
+        # Elements look up the MediaFileManager through the Runtime
+        # singleton, so the worker needs a (never started) Runtime of its own.
+        self._runtime = Runtime(
+            RuntimeConfig(
+                script_path=main_script_path,
+                command_line=command_line,
+                media_file_storage=_ProxyMediaFileStorage(self._rpc),
+                uploaded_file_manager=_ProxyUploadedFileManager(self._rpc),
+                cache_storage_manager=create_default_cache_storage_manager(),
+                dataframe_window_manager=(
+                    _ProxyDataframeWindowManager(self._rpc)
+                    if serve_dataframe_windows
+                    else None
+                ),
+            )
+        )
+        self._script_cache = self._runtime._script_cache
+
+        ComponentRegistry._instance = _ForwardingComponentRegistry(self._rpc)
+
+    def run(self) -> None:
+        while True:
+            try:
+                msg = self._channel.recv()
+            except (EOFError, OSError):
+                break
+
+            if msg[0] == "shutdown":
+                break
+
+            try:
+                self._handle_msg(msg)
+            except Exception as ex:
+                _LOGGER.error("Error handling %s in script worker", msg[0], exc_info=ex)
+
+        self._rpc.fail_pending()
+        for runner in self._runners.values():
+            if runner.scriptrunner is not None:
+                runner.scriptrunner.request_stop()
+
+    def _handle_msg(self, msg: Tuple[Any, ...]) -> None:
+        from streamlit.runtime import caching, legacy_caching
+        from streamlit.runtime.secrets import secrets_singleton
+
+        kind = msg[0]
+        if kind == "start":
+            _, runner_id, session_id, main_script_path, user_info, rerun_payload = msg
+            new_runner = _WorkerRunner(
+                runner_id, session_id, main_script_path, user_info
+            )
+            self._runners[runner_id] = new_runner
+            self._start_scriptrunner(new_runner, _deserialize_rerun_data(rerun_payload))
+        elif kind == "rerun":
+            _, runner_id, rerun_payload = msg
+            runner = self._runners.get(runner_id)
+            if runner is None:
+                # The runner was released after the request was sent.
+                return
+            rerun_data = _deserialize_rerun_data(rerun_payload)
+            if runner.scriptrunner is None or not runner.scriptrunner.request_rerun(
+                rerun_data
+            ):
+                # The ScriptRunner finished before the request arrived. Start
+                # a new one, as AppSession would have done in-process.
+                self._start_scriptrunner(runner, rerun_data)
+            self._channel.send("rerun_ack", runner_id, runner.generation)
+        elif kind == "stop":
+            _, runner_id = msg
+            runner = self._runners.get(runner_id)
+            if runner is not None and runner.scriptrunner is not None:
+                runner.scriptrunner.request_stop()
+        elif kind == "release":
+            _, runner_id = msg
+            self._runners.pop(runner_id, None)
+        elif kind == "close_session":
+            _, session_id = msg
+            self._session_states.pop(session_id, None)
+            for runner_id, runner in list(self._runners.items()):
+                if runner.session_id == session_id:
+                    if runner.scriptrunner is not None:
+                        runner.scriptrunner.request_stop()
+                    del self._runners[runner_id]
+            media_file_mgr = self._runtime.media_file_mgr
+            media_file_mgr.clear_session_refs(session_id)
+            media_file_mgr.remove_orphaned_files()
+        elif kind == "clear_caches":
+            _, session_id = msg
+            legacy_caching.clear_cache()
+            caching.cache_data.clear()
+            caching.cache_resource.clear()
+            if session_id in self._session_states:
+                self._session_states[session_id].clear()
+        elif kind == "invalidate_sources":
+            self._script_cache.clear()
+            with secrets_singleton._lock:
+                secrets_singleton._reset()
+        elif kind == "invalidate_pages":
+            source_util.invalidate_pages_cache()
+        elif kind == "rpc_result":
+            _, call_id, ok, value = msg
+            self._rpc.on_result(call_id, ok, value)
+        else:
+            _LOGGER.warning("Unknown message for script worker: %s", kind)
+
+    def _get_session_state(self, session_id: str) -> SessionState:
+        session_state = self._session_states.get(session_id)
+        if session_state is None:
+            session_state = SessionState()
+            self._session_states[session_id] = session_state
+        return session_state
+
+    def _start_scriptrunner(self, runner: _WorkerRunner, rerun_data: RerunData) -> None:
+        runner.generation += 1
+        generation = runner.generation
+        session_state = self._get_session_state(runner.session_id)
+
+        scriptrunner = ScriptRunner(
+            session_id=runner.session_id,
+            main_script_path=runner.main_script_path,
+            session_state=session_state,
+            uploaded_file_mgr=self._runtime.uploaded_file_mgr,
+            script_cache=self._script_cache,
+            initial_rerun_data=rerun_data,
+            user_info=runner.user_info,
+        )
+
+        def on_event(
+            sender: ScriptRunner,
+            event: ScriptRunnerEvent,
+            forward_msg: Optional[ForwardMsg] = None,
+            exception: Optional[BaseException] = None,
+            client_state: Optional[ClientState] = None,
+            page_script_hash: Optional[str] = None,
+        ) -> None:
+            self._channel.send(
+                "event",
+                runner.runner_id,
+                generation,
+                event.value,
+                _event_payload(
+                    session_state,
+                    event,
+                    forward_msg,
+                    exception,
+                    client_state,
+                    page_script_hash,
+                ),
+            )
+
+        # Keep a strong reference to the receiver for the runner's lifetime.
+        scriptrunner._worker_on_event = on_event  # type: ignore[attr-defined]
+        scriptrunner.on_event.connect(on_event)
+        runner.scriptrunner = scriptrunner
+        scriptrunner.start()
+
+
+def _event_payload(
+    session_state: SessionState,
+    event: ScriptRunnerEvent,
+    forward_msg: Optional[ForwardMsg],
+    exception: Optional[BaseException],
+    client_state: Optional[ClientState],
+    page_script_hash: Optional[str],
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
+        assert forward_msg is not None
+        payload["forward_msg"] = forward_msg.SerializeToString()
+    elif event == ScriptRunnerEvent.SCRIPT_STARTED:
+        payload["page_script_hash"] = page_script_hash
+    elif event == ScriptRunnerEvent.SHUTDOWN:
+        assert client_state is not None
+        payload["client_state"] = client_state.SerializeToString()
+    elif event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR:
+        payload["exception"] = _picklable_exception(exception)
+
+    if event in (
+        ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+        ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR,
+    ) and session_state.is_new_state_value(SCRIPT_RUN_WITHOUT_ERRORS_KEY):
+        payload["script_run_ok"] = session_state[SCRIPT_RUN_WITHOUT_ERRORS_KEY]
+
+    return payload
+
+
+def _picklable_exception(exception: Optional[BaseException]) -> BaseException:
+    if exception is None:
+        return RuntimeError("Unknown script compilation error")
+    try:
+        pickle.dumps(exception)
+        return exception
+    except Exception:
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
+
+
+class _ForwardingComponentRegistry(ComponentRegistry):
+    """Registers declared components with the server process too, since
+    that's where component assets are served from.
+    """
+
+    def __init__(self, rpc: _RPCClient):
+        super().__init__()
+        self._rpc = rpc
+
+    def register_component(self, component: CustomComponent) -> None:
+        super().register_component(component)
+        self._rpc.notify(
+            "register_component", component.name, component.path, component.url
+        )
+
+
+def _worker_main(
+    conn: Connection,
+    config_snapshot: Dict[str, Any],
+    main_script_path: str,
+    command_line: str,
+    serve_dataframe_windows: bool,
+) -> None:
+    """Entry point of a worker process."""
+    from streamlit import logger
+
+    # Ctrl-C is delivered to the whole process group. The server process
+    # shuts us down itself when it stops, so ignore it here.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    config_snapshot = dict(config_snapshot)
+    # Never start a pool from inside a worker.
+    config_snapshot["runner.workerProcesses"] = 0
+    # The server process watches the app's files and tells us about changes.
+    config_snapshot["server.fileWatcherType"] = "none"
+    config.get_config_options(force_reparse=True, options_from_flags=config_snapshot)
+    logger.set_log_level(config.get_option("logger.level").upper())
+    logger.update_formatter()
+
+    channel = _Channel(conn, "ScriptWorker")
+    worker = _Worker(channel, main_script_path, command_line, serve_dataframe_windows)
+    worker.run()
+    channel.close()
@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import hashlib
+import threading
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from typing import (
@@ -24,13 +25,16 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
     Optional,
     Sequence,
     Tuple,
     TypeVar,
     Union,
+    cast,
 )
 
+from cachetools import LRUCache
 from google.protobuf.message import Message
 from typing_extensions import Final, TypeAlias
 
@@ -119,6 +123,11 @@ class WidgetMetadata(Generic[T]):
     callback_args: WidgetArgs | None = None
     callback_kwargs: WidgetKwargs | None = None
 
+    # How long the reruns that changes to the widget's value request are held
+    # for, in seconds, so that bursts of changes are coalesced. If None,
+    # "runner.rerunDebounceDelay" is used.
+    debounce: float | None = None
+
     def __repr__(self) -> str:
         return util.repr_(self)
 
@@ -171,6 +180,73 @@ SAFE_VALUES = Union[
 ]
 
 
+class FormattedOptions(Tuple[str, ...]):
+    """The labels of a widget's options, as shown in the frontend.
+
+    Also carries a digest of the labels, which compute_widget_id uses instead
+    of hashing the labels' string representation. Use format_options to
+    create one.
+    """
+
+    digest: bytes
+
+    def __new__(cls, labels: Iterable[str]) -> FormattedOptions:
+        # mypy can't type tuple.__new__ for subclasses of Tuple[str, ...].
+        self = cast(FormattedOptions, tuple.__new__(cast(Any, cls), labels))
+        self.digest = _digest_labels(self)
+        return self
+
+
+def _digest_labels(labels: Tuple[str, ...]) -> bytes:
+    joined = "\0".join(labels)
+    if joined.count("\0") != len(labels) - 1:
+        # There are no labels, or some label contains our separator, so the
+        # joined labels are ambiguous.
+        joined = repr(labels)
+    return hashlib.md5(joined.encode("utf-8", "surrogatepass")).digest()
+
+
+# Scalar types whose str() can't change.
+_IMMUTABLE_OPTION_TYPES: Final = frozenset({str, int, float, bool, type(None)})
+
+# FormattedOptions for options that can't change, keyed by the options' id().
+# Each entry holds a reference to its options, so that their id isn't reused
+# while the entry exists.
+_formatted_options_cache: LRUCache[int, Tuple[Any, FormattedOptions]] = LRUCache(
+    maxsize=64
+)
+_formatted_options_cache_lock = threading.Lock()
+
+
+def format_options(
+    options: Sequence[Any], format_func: Callable[[Any], Any]
+) -> FormattedOptions:
+    """Return the labels of a widget's options, as shown in the frontend.
+
+    Formatting and digesting a large options list on every script run is
+    expensive. So when the options can't change (a tuple of scalars, or a
+    range) and are formatted with `str`, the result is cached for as long as
+    the same options object is used. This happens when options come from
+    st.cache_resource, or from a module that's imported by the script.
+    """
+    if format_func is not str or type(options) not in (tuple, range):
+        return FormattedOptions(str(format_func(option)) for option in options)
+
+    cached: Optional[Tuple[Any, FormattedOptions]]
+    with _formatted_options_cache_lock:
+        cached = _formatted_options_cache.get(id(options))
+    if cached is not None and cached[0] is options:
+        return cached[1]
+
+    formatted = FormattedOptions(str(option) for option in options)
+    if type(options) is range or all(
+        type(option) in _IMMUTABLE_OPTION_TYPES for option in options
+    ):
+        with _formatted_options_cache_lock:
+            _formatted_options_cache[id(options)] = (options, formatted)
+    return formatted
+
+
 def compute_widget_id(
     element_type: str,
     user_key: str | None = None,
@@ -195,7 +271,10 @@ def compute_widget_id(
     # consistent order; dicts are always in insertion order.
     for k, v in kwargs.items():
         h.update(str(k).encode("utf-8"))
-        h.update(str(v).encode("utf-8"))
+        if isinstance(v, FormattedOptions):
+            h.update(v.digest)
+        else:
+            h.update(str(v).encode("utf-8"))
     return f"{GENERATED_WIDGET_ID_PREFIX}-{h.hexdigest()}-{user_key}"
 
 
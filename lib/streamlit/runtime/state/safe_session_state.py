@@ -67,6 +67,12 @@ class SafeSessionState:
         with self._lock:
             return self._state.get_widget_states()
 
+    def get_widget_server_state(
+        self, widget_id: str, default_factory: Callable[[], T]
+    ) -> T:
+        with self._lock:
+            return self._state.get_widget_server_state(widget_id, default_factory)
+
     def is_new_state_value(self, user_key: str) -> bool:
         with self._lock:
             return self._state.is_new_state_value(user_key)
@@ -20,6 +20,7 @@ from dataclasses import dataclass, field, replace
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Iterator,
     KeysView,
     List,
@@ -43,7 +44,7 @@ from streamlit.runtime.state.common import (
     is_widget_id,
 )
 from streamlit.runtime.stats import CacheStat, CacheStatsProvider
-from streamlit.type_util import ValueFieldName, is_array_value_field_name
+from streamlit.type_util import ValueFieldName, is_array_value_field_name, is_type
 from streamlit.vendor.pympler.asizeof import asizeof
 
 if TYPE_CHECKING:
@@ -55,6 +56,18 @@ SCRIPT_RUN_WITHOUT_ERRORS_KEY: Final = (
     f"{STREAMLIT_INTERNAL_KEY_PREFIX}_SCRIPT_RUN_WITHOUT_ERRORS"
 )
 
+# The value types of trigger widgets, mapped to the value they're reset to
+# after each script run.
+_TRIGGER_VALUE_TYPES: Final[dict[ValueFieldName | None, Any]] = {
+    "trigger_value": False,
+    "string_trigger_value": None,
+}
+
+# Types whose instances are always picklable and can't be changed in place.
+_IMMUTABLE_SCALAR_TYPES: Final = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, range}
+)
+
 
 @dataclass(frozen=True)
 class Serialized:
@@ -82,6 +95,10 @@ class WStates(MutableMapping[str, Any]):
 
     states: dict[str, WState] = field(default_factory=dict)
     widget_metadata: dict[str, WidgetMetadata[Any]] = field(default_factory=dict)
+    # IDs of the widgets whose metadata has a trigger value type. Kept in sync
+    # with widget_metadata so that triggers can be reset without visiting
+    # every widget.
+    trigger_widget_ids: set[str] = field(default_factory=set)
 
     def __repr__(self):
         return util.repr_(self)
@@ -146,6 +163,10 @@ class WStates(MutableMapping[str, Any]):
     def __len__(self) -> int:
         return len(self.states)
 
+    def clear(self) -> None:
+        """Remove all widget values. Widget metadata is kept."""
+        self.states.clear()
+
     def __iter__(self):
         # For this and many other methods, we can't simply delegate to the
         # states field, because we need to invoke `__getitem__` for any
@@ -167,7 +188,8 @@ class WStates(MutableMapping[str, Any]):
         overwriting any data in this mapping that's also present in 'other'.
         """
         self.states.update(other.states)
-        self.widget_metadata.update(other.widget_metadata)
+        for widget_meta in other.widget_metadata.values():
+            self.set_widget_metadata(widget_meta)
 
     def set_widget_from_proto(self, widget_state: WidgetStateProto) -> None:
         """Set a widget's serialized value, overwriting any existing value it has."""
@@ -180,12 +202,18 @@ class WStates(MutableMapping[str, Any]):
     def set_widget_metadata(self, widget_meta: WidgetMetadata[Any]) -> None:
         """Set a widget's metadata, overwriting any existing metadata it has."""
         self.widget_metadata[widget_meta.id] = widget_meta
+        if widget_meta.value_type in _TRIGGER_VALUE_TYPES:
+            self.trigger_widget_ids.add(widget_meta.id)
+        else:
+            self.trigger_widget_ids.discard(widget_meta.id)
 
     def remove_stale_widgets(self, active_widget_ids: set[str]) -> None:
         """Remove widget state for widgets whose ids aren't in `active_widget_ids`."""
         # TODO(vdonato / kajarenc): Remove files corresponding to an inactive file
         # uploader.
-        self.states = {k: v for k, v in self.states.items() if k in active_widget_ids}
+        stale_widget_ids = [k for k in self.states if k not in active_widget_ids]
+        for k in stale_widget_ids:
+            del self.states[k]
 
     def get_serialized(self, k: str) -> WidgetStateProto | None:
         """Get the serialized value of the widget with the given id.
@@ -298,6 +326,17 @@ class SessionState:
     # Keys used for widgets will be eagerly converted to the matching widget id
     _key_id_mapping: dict[str, str] = field(default_factory=dict)
 
+    # The values that passed the last serializability check and can't be made
+    # unpicklable by mutating them in place, so that they aren't pickled again
+    # until they're replaced or reassigned. The values themselves are held,
+    # rather than their ids, so that an id can't be reused by another object in
+    # the meantime.
+    _serializable_values: dict[str, Any] = field(default_factory=dict)
+
+    # Data that widgets keep on the server between script runs, keyed by widget
+    # id. It's removed together with the widget's value when the widget is stale.
+    _widget_server_states: dict[str, Any] = field(default_factory=dict)
+
     def __repr__(self):
         return util.repr_(self)
 
@@ -307,13 +346,26 @@ class SessionState:
         _old_state dict, and then clear our current session_state and
         widget_state.
         """
-        for key_or_wid in self:
+        # Values that were set via session state before their widget was
+        # created are kept under the widget's ID too, unless the widget
+        # already has an old value of its own.
+        for user_key, widget_id in self._key_id_mapping.items():
+            if user_key in self._old_state and widget_id not in self._old_state:
+                self._old_state[widget_id] = self._old_state[user_key]
+
+        for widget_id in self._new_widget_state:
             try:
-                self._old_state[key_or_wid] = self[key_or_wid]
+                self._old_state[widget_id] = self._new_widget_state[widget_id]
             except KeyError:
                 # handle key errors from widget state not having metadata gracefully
                 # https://github.com/streamlit/streamlit/issues/7206
                 pass
+
+        # Values set via session state take precedence over widget values, so
+        # they're copied last.
+        for user_key, value in self._new_session_state.items():
+            self._old_state[self._get_widget_id(user_key)] = value
+
         self._new_session_state.clear()
         self._new_widget_state.clear()
 
@@ -323,6 +375,8 @@ class SessionState:
         self._new_session_state.clear()
         self._new_widget_state.clear()
         self._key_id_mapping.clear()
+        self._serializable_values.clear()
+        self._widget_server_states.clear()
 
     @property
     def filtered_state(self) -> dict[str, Any]:
@@ -460,6 +514,7 @@ class SessionState:
                 )
 
         self._new_session_state[user_key] = value
+        self._forget_serializable(user_key)
 
     def __delitem__(self, key: str) -> None:
         widget_id = self._get_widget_id(key)
@@ -482,6 +537,8 @@ class SessionState:
         if widget_id in self._old_state:
             del self._old_state[widget_id]
 
+        self._forget_serializable(key)
+
     def set_widgets_from_proto(self, widget_states: WidgetStatesProto) -> None:
         """Set the value of all widgets represented in the given WidgetStatesProto."""
         for state in widget_states.widgets:
@@ -505,8 +562,16 @@ class SessionState:
         """
         from streamlit.runtime.scriptrunner import RerunException
 
+        # Only widgets with a callback need to be compared, which spares
+        # deserializing the values of all other widgets until the script
+        # actually reads them.
+        widget_metadata = self._new_widget_state.widget_metadata
         changed_widget_ids = [
-            wid for wid in self._new_widget_state if self._widget_changed(wid)
+            wid
+            for wid in self._new_widget_state
+            if wid in widget_metadata
+            and widget_metadata[wid].callback is not None
+            and self._widget_changed(wid)
         ]
         for wid in changed_widget_ids:
             try:
@@ -539,21 +604,15 @@ class SessionState:
 
     def _reset_triggers(self) -> None:
         """Set all trigger values in our state dictionary to False."""
-        for state_id in self._new_widget_state:
-            metadata = self._new_widget_state.widget_metadata.get(state_id)
-            if metadata is not None:
-                if metadata.value_type == "trigger_value":
-                    self._new_widget_state[state_id] = Value(False)
-                elif metadata.value_type == "string_trigger_value":
-                    self._new_widget_state[state_id] = Value(None)
-
-        for state_id in self._old_state:
-            metadata = self._new_widget_state.widget_metadata.get(state_id)
-            if metadata is not None:
-                if metadata.value_type == "trigger_value":
-                    self._old_state[state_id] = False
-                elif metadata.value_type == "string_trigger_value":
-                    self._old_state[state_id] = None
+        widget_states = self._new_widget_state
+        for widget_id in widget_states.trigger_widget_ids:
+            metadata = widget_states.widget_metadata[widget_id]
+            reset_value = _TRIGGER_VALUE_TYPES[metadata.value_type]
+
+            if widget_id in widget_states.states:
+                widget_states[widget_id] = Value(reset_value)
+            if widget_id in self._old_state:
+                self._old_state[widget_id] = reset_value
 
     def _remove_stale_widgets(self, active_widget_ids: set[str]) -> None:
         """Remove widget state for widgets whose ids aren't in `active_widget_ids`."""
@@ -561,21 +620,45 @@ class SessionState:
 
         # Remove entries from _old_state corresponding to
         # widgets not in widget_ids.
-        self._old_state = {
-            k: v
-            for k, v in self._old_state.items()
-            if (k in active_widget_ids or not is_widget_id(k))
-        }
+        stale_widget_ids = [
+            k for k in self._old_state if k not in active_widget_ids and is_widget_id(k)
+        ]
+        for k in stale_widget_ids:
+            del self._old_state[k]
+
+        stale_widget_ids = [
+            k for k in self._widget_server_states if k not in active_widget_ids
+        ]
+        for k in stale_widget_ids:
+            del self._widget_server_states[k]
 
     def _set_widget_metadata(self, widget_metadata: WidgetMetadata[Any]) -> None:
         """Set a widget's metadata."""
-        widget_id = widget_metadata.id
-        self._new_widget_state.widget_metadata[widget_id] = widget_metadata
+        self._new_widget_state.set_widget_metadata(widget_metadata)
+
+    def get_widget_debounce(self, widget_id: str) -> float | None:
+        """Return the debounce delay of a widget's reruns, in seconds, or None
+        if the widget doesn't set one.
+        """
+        metadata = self._new_widget_state.widget_metadata.get(widget_id)
+        return metadata.debounce if metadata is not None else None
 
     def get_widget_states(self) -> list[WidgetStateProto]:
         """Return a list of serialized widget values for each widget with a value."""
         return self._new_widget_state.as_widget_states()
 
+    def get_widget_server_state(
+        self, widget_id: str, default_factory: Callable[[], T]
+    ) -> T:
+        """Return the data that a widget keeps on the server between script
+        runs, creating it with `default_factory` if the widget has none yet.
+        """
+        server_state = self._widget_server_states.get(widget_id)
+        if server_state is None:
+            server_state = default_factory()
+            self._widget_server_states[widget_id] = server_state
+        return cast(T, server_state)
+
     def _get_widget_id(self, k: str) -> str:
         """Turns a value that might be a widget id or a user provided key into
         an appropriate widget id.
@@ -636,20 +719,40 @@ class SessionState:
         stat = CacheStat("st_session_state", "", asizeof(self))
         return [stat]
 
+    def _forget_serializable(self, user_key: str) -> None:
+        """Make the next serializability check pickle the value of the given
+        key again, even if it's the same object that passed the last check.
+        """
+        self._serializable_values.pop(user_key, None)
+        self._serializable_values.pop(self._get_widget_id(user_key), None)
+
     def _check_serializable(self) -> None:
         """Verify that everything added to session state can be serialized.
         We use pickleability as the metric for serializability, and test for
         pickleability by just trying it.
+
+        A value that passed the last check is skipped if it's still the same
+        object, its key hasn't been assigned to since, and mutating it in place
+        can't have made it unpicklable (see `_cannot_become_unpicklable`). All
+        other values, including mutable containers, are pickled on every check.
         """
+        serializable_values: dict[str, Any] = {}
         for k in self:
-            try:
-                pickle.dumps(self[k])
-            except Exception as e:
-                err_msg = f"""Cannot serialize the value (of type `{type(self[k])}`) of '{k}' in st.session_state.
-                Streamlit has been configured to use [pickle](https://docs.python.org/3/library/pickle.html) to
-                serialize session_state values. Please convert the value to a pickle-serializable type. To learn
-                more about this behavior, see [our docs](https://docs.streamlit.io/knowledge-base/using-streamlit/serializable-session-state). """
-                raise UnserializableSessionStateError(err_msg) from e
+            value = self[k]
+            if not (
+                k in self._serializable_values and self._serializable_values[k] is value
+            ):
+                try:
+                    _check_picklable(value)
+                except Exception as e:
+                    err_msg = f"""Cannot serialize the value (of type `{type(value)}`) of '{k}' in st.session_state.
+                    Streamlit has been configured to use [pickle](https://docs.python.org/3/library/pickle.html) to
+                    serialize session_state values. Please convert the value to a pickle-serializable type. To learn
+                    more about this behavior, see [our docs](https://docs.streamlit.io/knowledge-base/using-streamlit/serializable-session-state). """
+                    raise UnserializableSessionStateError(err_msg) from e
+            if _cannot_become_unpicklable(value):
+                serializable_values[k] = value
+        self._serializable_values = serializable_values
 
     def maybe_check_serializable(self) -> None:
         """Verify that session state can be serialized, if the relevant config
@@ -660,6 +763,41 @@ class SessionState:
             self._check_serializable()
 
 
+class _NullWriter:
+    """A write-only file object that discards everything written to it."""
+
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+def _check_picklable(value: Any) -> None:
+    """Pickle the given value, raising an exception if it can't be pickled.
+
+    The pickled bytes are streamed to a sink that discards them, so checking a
+    large value doesn't materialize a copy of it in memory.
+    """
+    pickle.Pickler(_NullWriter()).dump(value)
+
+
+def _cannot_become_unpicklable(value: Any) -> bool:
+    """True if the given picklable value can't be made unpicklable by mutating
+    it in place.
+
+    That's the case for immutable scalars, for tuples and frozensets of such
+    values, and for numpy arrays that can't hold Python objects. Subclasses of
+    these types may carry mutable attributes, so they don't qualify.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_SCALAR_TYPES:
+        return True
+    if value_type is tuple or value_type is frozenset:
+        return all(_cannot_become_unpicklable(item) for item in value)
+    if is_type(value, "numpy.ndarray"):
+        # numpy doesn't allow viewing a non-object array as an object array.
+        return not value.dtype.hasobject
+    return False
+
+
 def _is_internal_key(key: str) -> bool:
     return key.startswith(STREAMLIT_INTERNAL_KEY_PREFIX)
 
@@ -92,6 +92,7 @@ def register_widget(
     on_change_handler: Optional[WidgetCallback] = None,
     args: Optional[WidgetArgs] = None,
     kwargs: Optional[WidgetKwargs] = None,
+    debounce: Optional[float] = None,
 ) -> RegisterWidgetResult[T]:
     """Register a widget with Streamlit, and return its current value.
     NOTE: This function should be called after the proto has been filled.
@@ -123,6 +124,9 @@ def register_widget(
         args to pass to on_change_handler when invoked
     kwargs : Optional[WidgetKwargs]
         kwargs to pass to on_change_handler when invoked
+    debounce : Optional[float]
+        How long the reruns that changes to the widget's value request are
+        held for, in seconds. If None, "runner.rerunDebounceDelay" is used.
 
     Returns
     -------
@@ -157,6 +161,7 @@ def register_widget(
         callback=on_change_handler,
         callback_args=args,
         callback_kwargs=kwargs,
+        debounce=debounce,
     )
     return register_widget_from_metadata(metadata, ctx, widget_func_name, element_type)
 
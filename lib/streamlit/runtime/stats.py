@@ -12,12 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+import threading
 from abc import abstractmethod
-from typing import List, NamedTuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from typing_extensions import Protocol, runtime_checkable
+from typing_extensions import Final, Protocol, runtime_checkable
 
+from streamlit.proto.openmetrics_data_model_pb2 import COUNTER, GAUGE, HISTOGRAM
 from streamlit.proto.openmetrics_data_model_pb2 import Metric as MetricProto
+from streamlit.proto.openmetrics_data_model_pb2 import MetricFamily as MetricFamilyProto
+from streamlit.proto.openmetrics_data_model_pb2 import MetricPoint as MetricPointProto
+from streamlit.proto.openmetrics_data_model_pb2 import MetricType
+
+# The default buckets of duration histograms, in seconds.
+DEFAULT_DURATION_BUCKETS: Final = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
 
 
 class CacheStat(NamedTuple):
@@ -69,9 +103,259 @@ class CacheStatsProvider(Protocol):
         raise NotImplementedError
 
 
+class Metric:
+    """A family of metrics that are exported in the OpenMetrics format.
+
+    A metric has a value for each combination of values of its labels, which
+    are given positionally, in the order of `labelnames`. Label values should
+    come from a small, fixed set (e.g. page or function names), since each
+    combination is exported as a separate series.
+
+    Metrics can be updated safely from any thread.
+    """
+
+    metric_type: "MetricType.ValueType"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        unit: str = "",
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.help = help
+        self.unit = unit
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _get_key(self, labelvalues: Sequence[str]) -> Tuple[str, ...]:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.labelnames}, "
+                f"got {tuple(labelvalues)}"
+            )
+        return tuple(labelvalues)
+
+    def marshall_metric_family(self, metric_family: MetricFamilyProto) -> None:
+        """Fill an OpenMetrics `MetricFamily` protobuf object."""
+        metric_family.name = self.name
+        metric_family.type = self.metric_type
+        metric_family.unit = self.unit
+        metric_family.help = self.help
+
+        for labelvalues, value in self._get_values():
+            metric = metric_family.metrics.add()
+            for name, label_value in zip(self.labelnames, labelvalues):
+                label = metric.labels.add()
+                label.name = name
+                label.value = label_value
+            self._marshall_metric_point(metric.metric_points.add(), value)
+
+    @abstractmethod
+    def _get_values(self) -> List[Tuple[Tuple[str, ...], object]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _marshall_metric_point(self, metric_point: MetricPointProto, value) -> None:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A total that only ever increases, e.g. the number of sent messages."""
+
+    metric_type = COUNTER
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increase the counter for the given label values by `amount`."""
+        key = self._get_key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get_value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._values.get(self._get_key(labelvalues), 0)
+
+    def _get_values(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return list(self._values.items())
+
+    def _marshall_metric_point(self, metric_point: MetricPointProto, value) -> None:
+        metric_point.counter_value.double_value = value
+
+
+class Gauge(Metric):
+    """A value that can go up and down, e.g. the number of active sessions.
+
+    Gauges that are created with a `callback` take the value it returns
+    whenever they're exported, and have no labels.
+    """
+
+    metric_type = GAUGE
+
+    def __init__(self, *args, callback: Optional[Callable[[], float]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if callback is not None and self.labelnames:
+            raise ValueError("Gauges with a callback can't have labels")
+        self._callback = callback
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        """Set the gauge for the given label values."""
+        key = self._get_key(labelvalues)
+        with self._lock:
+            self._values[key] = value
+
+    def get_value(self, *labelvalues: str) -> float:
+        if self._callback is not None:
+            return self._callback()
+        with self._lock:
+            return self._values.get(self._get_key(labelvalues), 0)
+
+    def _get_values(self) -> List[Tuple[Tuple[str, ...], object]]:
+        if self._callback is not None:
+            return [((), self._callback())]
+        with self._lock:
+            return list(self._values.items())
+
+    def _marshall_metric_point(self, metric_point: MetricPointProto, value) -> None:
+        metric_point.gauge_value.double_value = value
+
+
+class _HistogramValue:
+    def __init__(self, num_buckets: int):
+        self.bucket_counts = [0] * num_buckets
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    """The distribution of observed values, e.g. durations, in buckets."""
+
+    metric_type = HISTOGRAM
+
+    def __init__(
+        self, *args, buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets or self.buckets[-1] != math.inf:
+            self.buckets += (math.inf,)
+        self._values: Dict[Tuple[str, ...], _HistogramValue] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Add a value to the histogram of the given label values."""
+        key = self._get_key(labelvalues)
+        with self._lock:
+            histogram_value = self._values.get(key)
+            if histogram_value is None:
+                histogram_value = _HistogramValue(len(self.buckets))
+                self._values[key] = histogram_value
+
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    histogram_value.bucket_counts[index] += 1
+                    break
+            histogram_value.count += 1
+            histogram_value.sum += value
+
+    def get_count(self, *labelvalues: str) -> int:
+        """Return the number of values observed for the given label values."""
+        with self._lock:
+            histogram_value = self._values.get(self._get_key(labelvalues))
+            return histogram_value.count if histogram_value is not None else 0
+
+    def _get_values(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return [
+                (key, (list(value.bucket_counts), value.count, value.sum))
+                for key, value in self._values.items()
+            ]
+
+    def _marshall_metric_point(self, metric_point: MetricPointProto, value) -> None:
+        bucket_counts, count, sum_ = value
+        histogram_value = metric_point.histogram_value
+        histogram_value.double_value = sum_
+        histogram_value.count = count
+
+        # OpenMetrics buckets are cumulative.
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+            cumulative_count += bucket_count
+            bucket = histogram_value.buckets.add()
+            bucket.upper_bound = upper_bound
+            bucket.count = cumulative_count
+
+
+_M = TypeVar("_M", bound=Metric)
+
+
+class MetricsRegistry:
+    """Holds the metrics that instrument Streamlit's code.
+
+    Metrics are created once, usually at import time, by the modules that
+    update them. Creating a metric with the name of an existing one returns
+    the existing metric.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames=labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames=labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        unit: str = "",
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, help, unit=unit, labelnames=labelnames, buckets=buckets
+        )
+
+    def get_metrics(self) -> List[Metric]:
+        """Return all registered metrics, in the order they were created."""
+        with self._lock:
+            return list(self._metrics.values())
+
+    def _get_or_create(
+        self, metric_class: Type[_M], name: str, help: str, **kwargs: Any
+    ) -> _M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, help, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"Metric '{name}' is already registered")
+            return metric
+
+
+_metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the MetricsRegistry that Streamlit's metrics are registered with."""
+    return _metrics_registry
+
+
 class StatsManager:
     def __init__(self):
         self._cache_stats_providers: List[CacheStatsProvider] = []
+        # Metrics that belong to this manager's Runtime, in addition to the
+        # global ones.
+        self._metrics: List[Metric] = []
 
     def register_provider(self, provider: CacheStatsProvider) -> None:
         """Register a CacheStatsProvider with the manager.
@@ -86,3 +370,14 @@ class StatsManager:
         for provider in self._cache_stats_providers:
             all_stats.extend(provider.get_stats())
         return all_stats
+
+    def register_metric(self, metric: Metric) -> None:
+        """Register a Metric that is exported along with the global metrics.
+        This function is not thread-safe. Call it immediately after
+        creation.
+        """
+        self._metrics.append(metric)
+
+    def get_metrics(self) -> List[Metric]:
+        """Return all global metrics, and the ones registered with the manager."""
+        return get_metrics_registry().get_metrics() + self._metrics
@@ -0,0 +1,423 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in tracing of script reruns.
+
+Each traced rerun is a trace whose root "rerun" span starts when the rerun is
+requested, and ends when the run's last ForwardMsg (its script_finished
+message) is sent. Its child spans are:
+
+- "queued": the time between the request and the start of the run.
+- "script_run": the run itself, with child spans for each st command, and
+  for cached function lookups and computations.
+- "send_message": each ForwardMsg that the run sent.
+
+Traces are sampled when their rerun is requested, with the probability set by
+"runner.traceSampleRate", and exported on a background thread in the
+OpenTelemetry (OTLP) JSON format, to the file or OTLP/HTTP collector set by
+"runner.traceExportTarget". Only scripts that run in the server's process are
+traced.
+"""
+
+import contextlib
+import json
+import random
+import threading
+import time
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any, ContextManager, Deque, Dict, Iterator, List, Optional, Tuple
+
+from typing_extensions import Final, Protocol
+
+from streamlit import config
+from streamlit.logger import get_logger
+
+_LOGGER: Final = get_logger(__name__)
+
+# The timeout of requests to an OTLP/HTTP collector, in seconds.
+_EXPORT_TIMEOUT: Final = 10
+
+# The max number of runs per session whose messages are still being sent.
+# Older runs are dropped, e.g. if their session's client went away.
+_MAX_RUNNING_TRACES: Final = 8
+
+# OpenTelemetry status codes.
+_STATUS_CODE_OK: Final = 1
+_STATUS_CODE_ERROR: Final = 2
+# OpenTelemetry span kinds.
+_SPAN_KIND_INTERNAL: Final = 1
+_SPAN_KIND_SERVER: Final = 2
+
+
+class Span:
+    """A timed operation within a trace.
+
+    Spans are created by a Tracer, and are exported with the rest of their
+    trace when the trace's root span ends.
+    """
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.parent = parent
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        # The finished spans of the trace, if this is its root span.
+        self._trace_spans: List["Span"] = []
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> "Span":
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Mark the span as failed with the given exception."""
+        self.error = f"{type(exception).__name__}: {exception}"
+        self.attributes["exception.type"] = type(exception).__name__
+
+    def start_child(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> "Span":
+        return Span(self.tracer, name, self.trace_id, self, attributes)
+
+    def end(self) -> None:
+        """End the span. Ending the root span exports the whole trace.
+
+        Safe to call from any thread.
+        """
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = time.time_ns()
+
+        root = self.root
+        with root._lock:
+            root._trace_spans.append(self)
+            if self is not root:
+                return
+            spans = root._trace_spans
+            root._trace_spans = []
+        self.tracer.export(spans)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span in the OTLP JSON format."""
+        result: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND_SERVER if self.parent is None else _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns),
+            "attributes": [
+                {"key": key, "value": _to_any_value(value)}
+                for key, value in self.attributes.items()
+            ],
+        }
+        if self.parent is not None:
+            result["parentSpanId"] = self.parent.span_id
+        if self.error is not None:
+            result["status"] = {"code": _STATUS_CODE_ERROR, "message": self.error}
+        else:
+            result["status"] = {"code": _STATUS_CODE_OK}
+        return result
+
+
+def _to_any_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP JSON encodes 64-bit integers as strings.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: List[Span]) -> None:
+        """Export the spans of a finished trace."""
+
+
+def to_otlp_json(spans: List[Span]) -> Dict[str, Any]:
+    """Return an OTLP ExportTraceServiceRequest, in JSON, with the given spans."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": "streamlit"}}
+                    ]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "streamlit"},
+                        "spans": [span.to_dict() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class FileSpanExporter:
+    """Appends each trace to a file, as a line of OTLP JSON."""
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def export(self, spans: List[Span]) -> None:
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(to_otlp_json(spans)) + "\n")
+
+
+class HttpSpanExporter:
+    """Posts each trace to an OTLP/HTTP collector, as OTLP JSON."""
+
+    def __init__(self, url: str):
+        self._url = url
+
+    def export(self, spans: List[Span]) -> None:
+        request = urllib.request.Request(
+            self._url,
+            data=json.dumps(to_otlp_json(spans)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=_EXPORT_TIMEOUT):
+            pass
+
+
+class Tracer:
+    """Samples and tracks the traces of each session's reruns.
+
+    This class can be used safely from multiple threads simultaneously.
+    """
+
+    def __init__(self, sample_rate: float, exporter: SpanExporter):
+        self._sample_rate = sample_rate
+        self._exporter = exporter
+        # Exports happen on a single thread, so that they never slow down
+        # reruns, and so that exporters never write concurrently.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="StreamlitTraceExporter"
+        )
+        self._lock = threading.Lock()
+        # The root and "queued" spans of the rerun that each session
+        # requested, and that hasn't started yet. None if the rerun isn't
+        # sampled.
+        self._requested: Dict[str, Optional[Tuple[Span, Span]]] = {}
+        # The root spans of the runs whose messages are still being sent,
+        # from the oldest to the newest.
+        self._running: Dict[str, Deque[Span]] = defaultdict(
+            lambda: deque(maxlen=_MAX_RUNNING_TRACES)
+        )
+
+    def start_trace(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Optional[Span]:
+        """Return the root span of a new trace, or None if it isn't sampled."""
+        if random.random() >= self._sample_rate:
+            return None
+        return Span(self, name, "%032x" % random.getrandbits(128), None, attributes)
+
+    def on_rerun_requested(self, session_id: str) -> None:
+        """Start a trace for a rerun that the session requested.
+
+        Reruns that are requested before the previous request is handled are
+        coalesced into the same trace.
+        """
+        with self._lock:
+            if session_id in self._requested:
+                return
+            root = self.start_trace("rerun", {"session_id": session_id})
+            self._requested[session_id] = (
+                (root, root.start_child("queued")) if root is not None else None
+            )
+
+    def on_script_started(self, session_id: str, page_name: str) -> Optional[Span]:
+        """Return the span of a script run that's starting, or None if the
+        run isn't sampled.
+
+        Runs that weren't requested, e.g. the reruns of st.experimental_rerun,
+        start a new trace.
+        """
+        queued: Optional[Span] = None
+        with self._lock:
+            if session_id in self._requested:
+                requested = self._requested.pop(session_id)
+                if requested is None:
+                    return None
+                root, queued = requested
+            else:
+                new_root = self.start_trace("rerun", {"session_id": session_id})
+                if new_root is None:
+                    return None
+                root = new_root
+            self._running[session_id].append(root)
+
+        if queued is not None:
+            queued.end()
+        root.set_attribute("page", page_name)
+        return root.start_child("script_run")
+
+    def on_message_sent(
+        self, session_id: str, msg_type: Optional[str]
+    ) -> Optional[Span]:
+        """Return a span for sending a ForwardMsg of the session, or None if
+        the message's run isn't traced.
+
+        The caller must end the span, and then call `on_run_messages_sent` if
+        the message was the last one of its run.
+        """
+        with self._lock:
+            running = self._running.get(session_id)
+            if not running:
+                return None
+            root = running[0]
+        return root.start_child("send_message", {"message_type": msg_type})
+
+    def on_run_messages_sent(self, session_id: str) -> None:
+        """End the trace of the session's oldest run, whose last message was
+        sent."""
+        with self._lock:
+            running = self._running.get(session_id)
+            if not running:
+                return
+            root = running.popleft()
+            if not running:
+                del self._running[session_id]
+        root.end()
+
+    def on_session_closed(self, session_id: str) -> None:
+        """Drop the traces of a session, without exporting them."""
+        with self._lock:
+            self._requested.pop(session_id, None)
+            self._running.pop(session_id, None)
+
+    def export(self, spans: List[Span]) -> None:
+        self._executor.submit(self._export, spans)
+
+    def _export(self, spans: List[Span]) -> None:
+        try:
+            self._exporter.export(spans)
+        except Exception:
+            _LOGGER.warning("Failed to export trace", exc_info=True)
+
+
+def _create_tracer() -> Optional[Tracer]:
+    sample_rate: float = config.get_option("runner.traceSampleRate")
+    target: str = config.get_option("runner.traceExportTarget")
+    if sample_rate <= 0 or not target:
+        return None
+
+    exporter: SpanExporter
+    if target.startswith(("http://", "https://")):
+        exporter = HttpSpanExporter(target)
+    else:
+        exporter = FileSpanExporter(target)
+    return Tracer(sample_rate, exporter)
+
+
+_tracer: Optional[Tracer] = None
+_tracer_created = False
+_tracer_lock = threading.Lock()
+
+
+def disable_tracing() -> None:
+    """Disable tracing in this process, regardless of the config options."""
+    global _tracer, _tracer_created
+    with _tracer_lock:
+        _tracer = None
+        _tracer_created = True
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the Tracer, or None if tracing is disabled.
+
+    The Tracer is created from the config options when this is first called.
+    """
+    global _tracer, _tracer_created
+    if not _tracer_created:
+        with _tracer_lock:
+            if not _tracer_created:
+                _tracer = _create_tracer()
+                _tracer_created = True
+    return _tracer
+
+
+# The span that spans created in the current context are children of.
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "streamlit_current_span", default=None
+)
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def use_span(span: Optional[Span]) -> Iterator[Optional[Span]]:
+    """Make `span` the parent of the spans created in this context, and end
+    it when the context exits.
+    """
+    if span is None:
+        yield None
+        return
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except Exception as ex:
+        span.record_exception(ex)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+_NO_SPAN: Final[ContextManager[Optional[Span]]] = contextlib.nullcontext()
+
+
+def span(
+    name: str, attributes: Optional[Dict[str, Any]] = None
+) -> ContextManager[Optional[Span]]:
+    """Return a context that's traced as a child of the current span.
+
+    The context's value is the new span, or None if there's no current span,
+    i.e. if the current script run isn't traced. This is cheap when tracing
+    is disabled.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return _NO_SPAN
+    return use_span(parent.start_child(name, attributes))
@@ -12,8 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import io
+import mmap
 from abc import abstractmethod
-from typing import List, NamedTuple, Sequence
+from typing import (
+    Any,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 from typing_extensions import Protocol
 
@@ -23,12 +34,16 @@ from streamlit.runtime.stats import CacheStatsProvider
 
 
 class UploadedFileRec(NamedTuple):
-    """Metadata and raw bytes for an uploaded file. Immutable."""
+    """Metadata and raw bytes for an uploaded file. Immutable.
+
+    The content of large files is a read-only memory map of the file that
+    they're stored in, rather than bytes.
+    """
 
     file_id: str
     name: str
     type: str
-    data: bytes
+    data: Union[bytes, mmap.mmap]
 
 
 class UploadFileUrlInfo(NamedTuple):
@@ -56,15 +71,24 @@ class UploadedFile(io.BytesIO):
     """A mutable uploaded file.
 
     This class extends BytesIO, which has copy-on-write semantics when
-    initialized with `bytes`.
+    initialized with `bytes`. Files whose content is memory-mapped are read
+    straight from the map, and are only copied into memory when they're
+    written to.
     """
 
     def __init__(self, record: UploadedFileRec, file_urls: FileURLsProto):
-        # BytesIO's copy-on-write semantics doesn't seem to be mentioned in
-        # the Python docs - possibly because it's a CPython-only optimization
-        # and not guaranteed to be in other Python runtimes. But it's detailed
-        # here: https://hg.python.org/cpython/rev/79a5fbe2c78f
-        super().__init__(record.data)
+        if isinstance(record.data, mmap.mmap):
+            super().__init__()
+            self._mapped: Optional[mmap.mmap] = record.data
+        else:
+            # BytesIO's copy-on-write semantics doesn't seem to be mentioned in
+            # the Python docs - possibly because it's a CPython-only
+            # optimization and not guaranteed to be in other Python runtimes.
+            # But it's detailed here:
+            # https://hg.python.org/cpython/rev/79a5fbe2c78f
+            super().__init__(record.data)
+            self._mapped = None
+        self._mapped_pos = 0
         self.file_id = record.file_id
         self.name = record.name
         self.type = record.type
@@ -79,6 +103,137 @@ class UploadedFile(io.BytesIO):
     def __repr__(self) -> str:
         return util.repr_(self)
 
+    # The methods below read memory-mapped content from the map. Writing to
+    # the file copies its content into the BytesIO's buffer first, after
+    # which everything is handled by BytesIO.
+
+    def _read_mapped(self, size: Optional[int], end: Optional[int] = None) -> bytes:
+        assert self._mapped is not None
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        start = min(self._mapped_pos, len(self._mapped))
+        if end is None:
+            end = len(self._mapped)
+        if size is not None and size >= 0:
+            end = min(end, start + size)
+        self._mapped_pos = max(start, end)
+        return self._mapped[start:end]
+
+    def _copy_mapped(self) -> None:
+        if self._mapped is not None:
+            pos = self._mapped_pos
+            super().__init__(self._mapped[:])
+            super().seek(pos)
+            self._mapped = None
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if self._mapped is None:
+            return super().read(size)
+        return self._read_mapped(size)
+
+    def read1(self, size: Optional[int] = -1) -> bytes:
+        if self._mapped is None:
+            return super().read1(size)
+        return self._read_mapped(size)
+
+    def readinto(self, buffer: Any) -> int:
+        if self._mapped is None:
+            return super().readinto(buffer)
+        with memoryview(buffer) as view, view.cast("B") as byte_view:
+            data = self._read_mapped(len(byte_view))
+            byte_view[: len(data)] = data
+        return len(data)
+
+    def readinto1(self, buffer: Any) -> int:
+        return self.readinto(buffer)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        if self._mapped is None:
+            return super().readline(size)
+        newline = self._mapped.find(b"\n", self._mapped_pos)
+        return self._read_mapped(size, None if newline < 0 else newline + 1)
+
+    def readlines(self, hint: Optional[int] = -1) -> List[bytes]:
+        if self._mapped is None:
+            return super().readlines(-1 if hint is None else hint)
+        lines: List[bytes] = []
+        total = 0
+        for line in self:
+            lines.append(line)
+            total += len(line)
+            if hint is not None and 0 < hint <= total:
+                break
+        return lines
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._mapped is None:
+            return super().__iter__()
+        return self
+
+    def __next__(self) -> bytes:
+        if self._mapped is None:
+            return super().__next__()
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if self._mapped is None:
+            return super().seek(pos, whence)
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if whence == io.SEEK_CUR:
+            pos += self._mapped_pos
+        elif whence == io.SEEK_END:
+            pos += len(self._mapped)
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"negative seek value {pos}")
+        self._mapped_pos = pos
+        return pos
+
+    def tell(self) -> int:
+        if self._mapped is None:
+            return super().tell()
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        return self._mapped_pos
+
+    def getvalue(self) -> bytes:
+        if self._mapped is None:
+            return super().getvalue()
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        return self._mapped[:]
+
+    def getbuffer(self) -> memoryview:
+        if self._mapped is None:
+            return super().getbuffer()
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        return memoryview(self._mapped)
+
+    def write(self, buffer: Any) -> int:
+        self._copy_mapped()
+        return super().write(buffer)
+
+    def writelines(self, lines: Any) -> None:
+        self._copy_mapped()
+        super().writelines(lines)
+
+    def truncate(self, size: Optional[int] = None) -> int:
+        self._copy_mapped()
+        return super().truncate(size)
+
+    def __getstate__(self) -> Tuple[bytes, int, Any]:
+        if self._mapped is None:
+            return cast(Tuple[bytes, int, Any], super().__getstate__())
+        # Memory maps can't be pickled, so the content is pickled as bytes.
+        state = dict(self.__dict__, _mapped=None, _mapped_pos=0)
+        return self.getvalue(), self._mapped_pos, state
+
 
 class UploadedFileManager(CacheStatsProvider, Protocol):
     """UploadedFileManager protocol, that should be implemented by the concrete
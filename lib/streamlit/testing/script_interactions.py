@@ -63,6 +63,9 @@ class InteractiveScriptTests(unittest.TestCase):
             MemoryMediaFileStorage("/mock/media")
         )
         mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        # Dataframes are always sent whole, since there's no server to page
+        # through them.
+        mock_runtime.dataframe_window_mgr = None
         Runtime._instance = mock_runtime
 
         with source_util._pages_cache_lock:
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import contextlib
 import copy
+import functools
 import re
 import types
 from enum import Enum, auto
@@ -672,6 +673,25 @@ def is_pandas_version_less_than(v: str) -> bool:
     return version.parse(pd.__version__) < version.parse(v)
 
 
+def is_altair_version_less_than(v: str) -> bool:
+    """Return True if the current Altair version is less than the input version.
+
+    Parameters
+    ----------
+    v : str
+        Version string, e.g. "5.0.0"
+
+    Returns
+    -------
+    bool
+
+    """
+    import altair as alt
+    from packaging import version
+
+    return version.parse(alt.__version__) < version.parse(v)
+
+
 def pyarrow_table_to_bytes(table: pa.Table) -> bytes:
     """Serialize pyarrow.Table to bytes using Apache Arrow.
 
@@ -682,12 +702,49 @@ def pyarrow_table_to_bytes(table: pa.Table) -> bytes:
 
     """
     sink = pa.BufferOutputStream()
-    writer = pa.RecordBatchStreamWriter(sink, table.schema)
+    writer = pa.RecordBatchStreamWriter(
+        sink, table.schema, options=_get_ipc_write_options(table)
+    )
     writer.write_table(table)
     writer.close()
     return cast(bytes, sink.getvalue().to_pybytes())
 
 
+# Tables smaller than this are never compressed, since compressing their
+# buffers saves little to nothing over the size of the IPC framing.
+_MIN_COMPRESSED_TABLE_BYTES: Final = 64 * 1024
+
+# The frontend only decodes LZ4 frames.
+_ARROW_COMPRESSION_CODECS: Final = ("lz4",)
+
+
+def _get_ipc_write_options(table: pa.Table) -> Optional[pa.ipc.IpcWriteOptions]:
+    """Return the IPC options to serialize the given table with, according to
+    the `server.arrowCompression` config option. None means the defaults.
+    """
+    from streamlit import config
+
+    codec = config.get_option("server.arrowCompression")
+    if codec == "none" or table.nbytes < _MIN_COMPRESSED_TABLE_BYTES:
+        return None
+
+    if codec not in _ARROW_COMPRESSION_CODECS or not pa.Codec.is_available(codec):
+        _warn_unavailable_arrow_codec(codec)
+        return None
+
+    return pa.ipc.IpcWriteOptions(compression=codec)
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_unavailable_arrow_codec(codec: str) -> None:
+    _LOGGER.warning(
+        'server.arrowCompression is "%s", which is either unknown or not '
+        "supported by this pyarrow installation. Arrow data will be sent "
+        "uncompressed.",
+        codec,
+    )
+
+
 def is_colum_type_arrow_incompatible(column: Union[Series[Any], Index]) -> bool:
     """Return True if the column type is known to cause issues during Arrow conversion."""
     if column.dtype.kind in [
@@ -787,6 +844,19 @@ def fix_arrow_incompatible_column_types(
 def data_frame_to_bytes(df: DataFrame) -> bytes:
     """Serialize pandas.DataFrame to bytes using Apache Arrow.
 
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe to convert.
+
+    """
+    return pyarrow_table_to_bytes(data_frame_to_arrow_table(df))
+
+
+def data_frame_to_arrow_table(df: DataFrame) -> pa.Table:
+    """Convert pandas.DataFrame to a pyarrow.Table, fixing column types that
+    Arrow can't represent if necessary.
+
     Parameters
     ----------
     df : pandas.DataFrame
@@ -803,7 +873,7 @@ def data_frame_to_bytes(df: DataFrame) -> bytes:
         )
         df = fix_arrow_incompatible_column_types(df)
         table = pa.Table.from_pandas(df)
-    return pyarrow_table_to_bytes(table)
+    return table
 
 
 def bytes_to_data_frame(source: bytes) -> DataFrame:
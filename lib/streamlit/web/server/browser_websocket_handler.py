@@ -31,10 +31,25 @@ from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime, SessionClient, SessionClientDisconnectedError
 from streamlit.runtime.runtime_util import serialize_forward_msg
+from streamlit.runtime.stats import get_metrics_registry
 from streamlit.web.server.server_util import is_url_from_allowed_origins
 
 _LOGGER: Final = get_logger(__name__)
 
+_FORWARD_MSGS_SENT: Final = get_metrics_registry().counter(
+    "forward_msgs_sent", "ForwardMsgs written to browser connections."
+)
+_FORWARD_MSG_BYTES_SENT: Final = get_metrics_registry().counter(
+    "forward_msg_bytes_sent",
+    "Bytes of serialized ForwardMsgs written to browser connections, before "
+    "compression.",
+)
+
+
+def _record_sent_msg(data: bytes) -> None:
+    _FORWARD_MSGS_SENT.inc()
+    _FORWARD_MSG_BYTES_SENT.inc(amount=len(data))
+
 
 class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
     """Handles a WebSocket connection from the browser"""
@@ -57,9 +72,11 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
     def write_forward_msg(self, msg: ForwardMsg) -> None:
         """Send a ForwardMsg to the browser."""
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            data = serialize_forward_msg(msg)
+            self.write_message(data, binary=True)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
+        _record_sent_msg(data)
 
     def select_subprotocol(self, subprotocols: List[str]) -> Optional[str]:
         """Return the first subprotocol in the given list.
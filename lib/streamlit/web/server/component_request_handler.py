@@ -12,23 +12,189 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 import mimetypes
 import os
+import threading
+from typing import Dict, NamedTuple, Optional, Set
 
+import tornado.ioloop
 import tornado.web
+from cachetools import LRUCache
+from typing_extensions import Final
 
 import streamlit.web.server.routes
+from streamlit import util
 from streamlit.components.v1.components import ComponentRegistry
 from streamlit.logger import get_logger
+from streamlit.watcher import watch_file
+from streamlit.web.server.server_util import select_content_encoding
+from streamlit.web.server.static_asset_index import get_compressed_variants
 
 _LOGGER = get_logger(__name__)
 
+# The default max total size, in bytes, of the cached component files and
+# their compressed variants.
+DEFAULT_ASSET_CACHE_SIZE: Final = 32 * 1024 * 1024
+
+
+class ComponentAsset(NamedTuple):
+    """The content of a component's file, as it was when it was read."""
+
+    content: bytes
+    version: str
+    # The compressed variants of the content, by content-coding, in order of
+    # preference.
+    variants: Dict[str, bytes]
+    # The file's modification time, in nanoseconds, or None if it couldn't
+    # be determined.
+    mtime_ns: Optional[int] = None
+
+    @property
+    def last_modified(self) -> Optional[datetime.datetime]:
+        if self.mtime_ns is None:
+            return None
+        return datetime.datetime.fromtimestamp(
+            self.mtime_ns / 1e9, tz=datetime.timezone.utc
+        )
+
+    @property
+    def memory_size(self) -> int:
+        return len(self.content) + sum(len(v) for v in self.variants.values())
+
+
+class ComponentAssetCache:
+    """Keeps recently served component files in memory, along with their
+    compressed variants.
+
+    A cached file is used as long as its modification time and size don't
+    change. When the file watcher is enabled, cached files are also watched,
+    and dropped as soon as they change.
+
+    This class can be used safely from multiple threads simultaneously.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_ASSET_CACHE_SIZE):
+        """Create a new ComponentAssetCache.
+
+        Parameters
+        ----------
+        max_size
+            The max total size, in bytes, of the cached files and their
+            compressed variants. The least recently used files are dropped to
+            stay within it. If 0, nothing is cached.
+        """
+        self._max_size = max_size
+        self._assets: "LRUCache[str, ComponentAsset]" = LRUCache(
+            maxsize=max(max_size, 1), getsizeof=lambda asset: asset.memory_size
+        )
+        self._watched_paths: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return util.repr_(self)
+
+    def get_cached(self, abspath: str) -> Optional[ComponentAsset]:
+        """Return the file at the given path if it's in the cache and still
+        up to date there, or None otherwise.
+        """
+        try:
+            stat_result = os.stat(abspath)
+        except OSError:
+            return None
+        return self._get_cached(abspath, stat_result)
+
+    def get(self, abspath: str) -> ComponentAsset:
+        """Return the file at the given path, from the cache if it's still
+        up to date there.
+
+        On a cache miss, the file is read and compressed, which can take a
+        while for large files; `get_cached` never does either.
+
+        Raises an OSError if the file can't be read.
+        """
+        try:
+            stat_result: Optional[os.stat_result] = os.stat(abspath)
+        except OSError:
+            # Files that can't be stat'ed aren't cached. Reading them
+            # raises the error, if there is one.
+            stat_result = None
+
+        if stat_result is not None:
+            cached = self._get_cached(abspath, stat_result)
+            if cached is not None:
+                return cached
+
+        with open(abspath, "rb") as file:
+            content = file.read()
+
+        is_cacheable = (
+            stat_result is not None
+            and len(content) == stat_result.st_size
+            and len(content) <= self._max_size
+        )
+        asset = ComponentAsset(
+            content=content,
+            version=util.calc_md5(content),
+            # Files that can't be cached would be compressed again on every
+            # request, so they're served uncompressed.
+            variants=get_compressed_variants(abspath, content) if is_cacheable else {},
+            mtime_ns=stat_result.st_mtime_ns if stat_result is not None else None,
+        )
+        if is_cacheable:
+            if asset.memory_size > self._max_size:
+                # Cache the file without its compressed variants, rather than
+                # compressing it again on every request.
+                asset = asset._replace(variants={})
+            with self._lock:
+                self._assets[abspath] = asset
+            self._maybe_watch(abspath)
+
+        return asset
+
+    def _get_cached(
+        self, abspath: str, stat_result: os.stat_result
+    ) -> Optional[ComponentAsset]:
+        cached: Optional[ComponentAsset]
+        with self._lock:
+            cached = self._assets.get(abspath)
+        if (
+            cached is not None
+            and cached.mtime_ns == stat_result.st_mtime_ns
+            and len(cached.content) == stat_result.st_size
+        ):
+            return cached
+        return None
+
+    def invalidate(self, abspath: str) -> None:
+        """Drop the file at the given path from the cache."""
+        with self._lock:
+            self._assets.pop(abspath, None)
+
+    def _maybe_watch(self, abspath: str) -> None:
+        with self._lock:
+            if abspath in self._watched_paths:
+                return
+            self._watched_paths.add(abspath)
+
+        # This is a no-op when the file watcher is disabled, as it usually is
+        # in production.
+        watch_file(abspath, lambda _: self.invalidate(abspath))
+
 
 class ComponentRequestHandler(tornado.web.RequestHandler):
-    def initialize(self, registry: ComponentRegistry):
+    def initialize(
+        self,
+        registry: ComponentRegistry,
+        asset_cache: Optional[ComponentAssetCache] = None,
+    ):
         self._registry = registry
+        # Without a shared cache, files are read on every request.
+        self._asset_cache = (
+            asset_cache if asset_cache is not None else ComponentAssetCache(max_size=0)
+        )
 
-    def get(self, path: str) -> None:
+    async def get(self, path: str) -> None:
         parts = path.split("/")
         component_name = parts[0]
         component_root = self._registry.get_component_path(component_name)
@@ -52,9 +218,14 @@ class ComponentRequestHandler(tornado.web.RequestHandler):
             self.set_status(403)
             return
         try:
-            with open(abspath, "rb") as file:
-                contents = file.read()
-        except (OSError) as e:
+            asset = self._asset_cache.get_cached(abspath)
+            if asset is None:
+                # Reading and compressing a file can take a while, so it's
+                # done off the event loop.
+                asset = await tornado.ioloop.IOLoop.current().run_in_executor(
+                    None, self._asset_cache.get, abspath
+                )
+        except OSError as e:
             _LOGGER.error(
                 "ComponentRequestHandler: GET %s read error", abspath, exc_info=e
             )
@@ -62,11 +233,33 @@ class ComponentRequestHandler(tornado.web.RequestHandler):
             self.set_status(404)
             return
 
-        self.write(contents)
+        encoding = select_content_encoding(
+            self.request.headers.get("Accept-Encoding", ""), list(asset.variants)
+        )
+
         self.set_header("Content-Type", self.get_content_type(abspath))
+        if encoding is None:
+            self.set_header("Etag", f'"{asset.version}"')
+        else:
+            self.set_header("Etag", f'"{asset.version}-{encoding}"')
+        if asset.last_modified is not None:
+            self.set_header("Last-Modified", asset.last_modified)
+        if asset.variants and not self.settings.get("compress_response"):
+            # With `compress_response`, Tornado adds this header itself.
+            self.set_header("Vary", "Accept-Encoding")
 
         self.set_extra_headers(path)
 
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        if encoding is None:
+            self.write(asset.content)
+        else:
+            self.set_header("Content-Encoding", encoding)
+            self.write(asset.variants[encoding])
+
     def set_extra_headers(self, path) -> None:
         """Disable cache for HTML files.
 
@@ -0,0 +1,98 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+
+import pyarrow as pa
+import tornado.ioloop
+import tornado.web
+
+from streamlit.logger import get_logger
+from streamlit.runtime.dataframe_window_manager import (
+    DataframePage,
+    DataframeWindowManager,
+    DataframeWindowNotFoundError,
+)
+from streamlit.web.server import allow_cross_origin_requests
+
+_LOGGER = get_logger(__name__)
+
+# The number of rows returned if a request doesn't specify a limit.
+DEFAULT_PAGE_ROWS = 1000
+
+
+class DataframeWindowHandler(tornado.web.RequestHandler):
+    """Serves pages of rows of windowed dataframes.
+
+    Query arguments:
+    - offset, limit: The range of rows to return.
+    - sort: The name of the column to sort by.
+    - order: "asc" (the default) or "desc".
+    - filter_column, filter: Only return rows whose value in `filter_column`
+      contains `filter`, ignoring case.
+
+    The response is an Arrow IPC stream, and the number of rows in the
+    sorted and filtered view is returned in the X-Streamlit-Num-Rows header.
+    """
+
+    def initialize(self, dataframe_window_mgr: DataframeWindowManager) -> None:
+        self._dataframe_window_mgr = dataframe_window_mgr
+
+    def set_default_headers(self) -> None:
+        self.set_header("Cache-Control", "no-cache")
+        if allow_cross_origin_requests():
+            self.set_header("Access-Control-Allow-Origin", "*")
+            self.set_header("Access-Control-Expose-Headers", "X-Streamlit-Num-Rows")
+
+    def options(self) -> None:
+        """/OPTIONS handler for preflight CORS checks."""
+        self.set_status(204)
+        self.finish()
+
+    async def get(self, window_id: str) -> None:
+        try:
+            offset = int(self.get_argument("offset", "0"))
+            limit = int(self.get_argument("limit", str(DEFAULT_PAGE_ROWS)))
+        except ValueError:
+            raise tornado.web.HTTPError(400, "offset and limit must be integers")
+
+        sort_column: Optional[str] = self.get_argument("sort", None)
+        ascending = self.get_argument("order", "asc") != "desc"
+        filter_column: Optional[str] = self.get_argument("filter_column", None)
+        filter_value: Optional[str] = self.get_argument("filter", None)
+
+        # Sorting and filtering a large table takes a while, so it's done
+        # off the eventloop.
+        try:
+            page: DataframePage = await tornado.ioloop.IOLoop.current().run_in_executor(
+                None,
+                lambda: self._dataframe_window_mgr.get_page(
+                    window_id,
+                    offset,
+                    limit,
+                    sort_column=sort_column,
+                    ascending=ascending,
+                    filter_column=filter_column,
+                    filter_value=filter_value,
+                ),
+            )
+        except DataframeWindowNotFoundError:
+            raise tornado.web.HTTPError(404, "not found")
+        except (KeyError, ValueError, pa.ArrowException) as ex:
+            _LOGGER.debug("Bad dataframe page request: %s", ex)
+            raise tornado.web.HTTPError(400, "invalid request")
+
+        self.set_header("Content-Type", "application/vnd.apache.arrow.stream")
+        self.set_header("X-Streamlit-Num-Rows", str(page.num_rows))
+        self.write(page.data)
@@ -12,28 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional
+import os
+from typing import Optional, Tuple, Union
 from urllib.parse import quote
 
 import tornado.web
+from typing_extensions import Final
 
 from streamlit.logger import get_logger
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
 from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
 from streamlit.runtime.memory_media_file_storage import (
     MemoryMediaFileStorage,
     get_extension_for_mimetype,
 )
 from streamlit.web.server import allow_cross_origin_requests
+from streamlit.web.server.server_util import (
+    IMMUTABLE_CACHE_CONTROL,
+    select_content_encoding,
+)
 
 _LOGGER = get_logger(__name__)
 
+# The MediaFileStorage implementations that MediaFileHandler can serve files
+# from.
+ServableMediaFileStorage = Union[MemoryMediaFileStorage, DiskMediaFileStorage]
+
+# The suffix of the absolute paths of requests that are served a file's
+# gzip-compressed content.
+_COMPRESSED_PATH_SUFFIX: Final = ".gz"
+
+
+def _split_compressed_path(abspath: str) -> Tuple[str, bool]:
+    """Return the filename of an absolute path, and whether the file's
+    compressed content is served.
+    """
+    if abspath.endswith(_COMPRESSED_PATH_SUFFIX):
+        return abspath[: -len(_COMPRESSED_PATH_SUFFIX)], True
+    return abspath, False
+
 
 class MediaFileHandler(tornado.web.StaticFileHandler):
-    _storage: MemoryMediaFileStorage
+    _storage: ServableMediaFileStorage
 
     @classmethod
-    def initialize_storage(cls, storage: MemoryMediaFileStorage) -> None:
-        """Set the MemoryMediaFileStorage object used by instances of this
+    def initialize_storage(cls, storage: ServableMediaFileStorage) -> None:
+        """Set the MediaFileStorage object used by instances of this
         handler. Must be called on server startup.
         """
         # This is a class method, rather than an instance method, because
@@ -46,7 +70,8 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
             self.set_header("Access-Control-Allow-Origin", "*")
 
     def set_extra_headers(self, path: str) -> None:
-        """Add Content-Disposition header for downloadable files.
+        """Add Content-Disposition header for downloadable files, and
+        caching and encoding headers.
 
         Set header value to "attachment" indicating that file should be saved
         locally instead of displaying inline in browser.
@@ -57,6 +82,16 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
         """
         media_file = self._storage.get_file(path)
 
+        if media_file.compressed_size is not None:
+            if self._is_compressed():
+                self.set_header("Content-Encoding", "gzip")
+            # With `compress_response`, Tornado adds this header itself.
+            if not self.settings.get("compress_response"):
+                self.set_header("Vary", "Accept-Encoding")
+
+        if media_file.kind == MediaFileKind.MEDIA:
+            self.set_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+
         if media_file and media_file.kind == MediaFileKind.DOWNLOADABLE:
             filename = media_file.filename
 
@@ -84,19 +119,63 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
     # `validate_absolute_path`.
     def validate_absolute_path(self, root: str, absolute_path: str) -> str:
         try:
-            self._storage.get_file(absolute_path)
+            media_file = self._storage.get_file(absolute_path)
         except MediaFileStorageError:
             _LOGGER.error("MediaFileHandler: Missing file %s", absolute_path)
             raise tornado.web.HTTPError(404, "not found")
 
+        # Files that are stored compressed are served compressed to clients
+        # that accept it, except for range requests, whose ranges refer to
+        # the uncompressed content.
+        if (
+            select_content_encoding(
+                self.request.headers.get("Accept-Encoding", ""), ["gzip"]
+            )
+            and "Range" not in self.request.headers
+        ):
+            if media_file.compressed_size is not None:
+                return absolute_path + _COMPRESSED_PATH_SUFFIX
+            # Text-like files are compressed when they're first requested.
+            # Until that's done, Tornado compresses their responses on the
+            # fly.
+            self._storage.compress_in_background(absolute_path)
+
         return absolute_path
 
+    def _is_compressed(self) -> bool:
+        """True if this request is served the file's compressed content."""
+        if self.absolute_path is None:
+            return False
+        return _split_compressed_path(self.absolute_path)[1]
+
+    def compute_etag(self) -> Optional[str]:
+        """Return the file's ID as its ETag, rather than hashing its content.
+
+        File IDs are hashes of the files' content already.
+        """
+        if self.absolute_path is None:
+            return None
+
+        filename, compressed = _split_compressed_path(self.absolute_path)
+        file_id = os.path.splitext(filename)[0]
+        if compressed:
+            return f'"{file_id}-gzip"'
+        return f'"{file_id}"'
+
+    def get_content_type(self) -> str:
+        assert self.absolute_path is not None
+        filename, _ = _split_compressed_path(self.absolute_path)
+        return self._storage.get_file(filename).mimetype
+
     def get_content_size(self) -> int:
         abspath = self.absolute_path
         if abspath is None:
             return 0
 
-        media_file = self._storage.get_file(abspath)
+        filename, compressed = _split_compressed_path(abspath)
+        media_file = self._storage.get_file(filename)
+        if compressed and media_file.compressed_size is not None:
+            return media_file.compressed_size
         return media_file.content_size
 
     def get_modified_time(self) -> None:
@@ -106,8 +185,8 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
 
     @classmethod
     def get_absolute_path(cls, root: str, path: str) -> str:
-        # All files are stored in memory, so the absolute path is just the
-        # path itself. In the MediaFileHandler, it's just the filename
+        # All files are looked up in the storage, so the absolute path is
+        # just the path itself. In the MediaFileHandler, it's just the filename
         return path
 
     @classmethod
@@ -116,9 +195,15 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
     ):
         _LOGGER.debug("MediaFileHandler: GET %s", abspath)
 
+        filename, compressed = _split_compressed_path(abspath)
         try:
             # abspath is the hash as used `get_absolute_path`
-            media_file = cls._storage.get_file(abspath)
+            media_file = cls._storage.get_file(filename)
+            # Parts of files are returned in chunks, rather than copied as a
+            # whole, so that range requests for large videos stay cheap.
+            content = cls._storage.get_content(
+                filename, start, end, compressed=compressed
+            )
         except Exception:
             _LOGGER.error("MediaFileHandler: Missing file %s", abspath)
             return None
@@ -127,14 +212,4 @@ class MediaFileHandler(tornado.web.StaticFileHandler):
             "MediaFileHandler: Sending %s file %s", media_file.mimetype, abspath
         )
 
-        # If there is no start and end, just return the full content
-        if start is None and end is None:
-            return media_file.content
-
-        if start is None:
-            start = 0
-        if end is None:
-            end = len(media_file.content)
-
-        # content is bytes that work just by slicing supplied by start and end
-        return media_file.content[start:end]
+        return content
@@ -12,17 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mimetypes
 import os
+import re
+from typing import Optional
 
 import tornado.web
+from typing_extensions import Final
 
 from streamlit import config, file_util
 from streamlit.logger import get_logger
 from streamlit.runtime.runtime_util import serialize_forward_msg
-from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
+from streamlit.web.server.server_util import (
+    IMMUTABLE_CACHE_CONTROL,
+    emit_endpoint_deprecation_notice,
+    select_content_encoding,
+)
+from streamlit.web.server.static_asset_index import StaticAsset, StaticAssetIndex
 
 _LOGGER = get_logger(__name__)
 
+# Matches the names of the frontend's files that are suffixed with their hash,
+# like "main.0a1b2c3d.js" or "123.0a1b2c3d.chunk.js".
+_HASHED_FILENAME_RE: Final = re.compile(r"\.[0-9a-f]{8,}\.")
+
 
 def allow_cross_origin_requests():
     """True if cross-origin requests are allowed.
@@ -38,6 +51,23 @@ def allow_cross_origin_requests():
 
 
 class StaticFileHandler(tornado.web.StaticFileHandler):
+    _asset_index: Optional[StaticAssetIndex] = None
+
+    @classmethod
+    def initialize_asset_index(cls, asset_index: Optional[StaticAssetIndex]) -> None:
+        """Set the StaticAssetIndex that instances of this handler serve
+        files from, when they're in it. Files that aren't are read from disk.
+        """
+        # This is a class method, rather than an instance method, because
+        # `get_content()` is a class method and needs to access the index.
+        cls._asset_index = asset_index
+
+    @classmethod
+    def _get_asset(cls, abspath: str) -> Optional[StaticAsset]:
+        if cls._asset_index is None:
+            return None
+        return cls._asset_index.get(abspath)
+
     def initialize(self, path, default_filename, get_pages):
         self._pages = get_pages()
 
@@ -53,9 +83,76 @@ class StaticFileHandler(tornado.web.StaticFileHandler):
 
         if is_index_url or path.endswith(".html"):
             self.set_header("Cache-Control", "no-cache")
+        elif _HASHED_FILENAME_RE.search(os.path.basename(path)):
+            self.set_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
         else:
             self.set_header("Cache-Control", "public")
 
+        asset = self._get_asset(self.absolute_path) if self.absolute_path else None
+        if asset is None:
+            return
+        if asset.encoding is not None:
+            self.set_header("Content-Encoding", asset.encoding)
+        if (asset.encoding is not None or asset.encodings) and not self.settings.get(
+            "compress_response"
+        ):
+            # With `compress_response`, Tornado adds this header itself.
+            self.set_header("Vary", "Accept-Encoding")
+
+    # Files in the asset index are served from memory, in the encoding that
+    # the client prefers. Everything else is left to Tornado's
+    # StaticFileHandler.
+    def validate_absolute_path(self, root: str, absolute_path: str) -> Optional[str]:
+        absolute_path = super().validate_absolute_path(root, absolute_path)
+        if absolute_path is None or self._asset_index is None:
+            return absolute_path
+
+        asset = self._asset_index.get(absolute_path)
+        if asset is None or not asset.encodings:
+            return absolute_path
+
+        # Range requests refer to the unencoded content.
+        if "Range" in self.request.headers:
+            return absolute_path
+
+        encoding = select_content_encoding(
+            self.request.headers.get("Accept-Encoding", ""), asset.encodings
+        )
+        return self._asset_index.get_encoded_path(absolute_path, encoding)
+
+    @classmethod
+    def get_content(
+        cls, abspath: str, start: Optional[int] = None, end: Optional[int] = None
+    ):
+        asset = cls._get_asset(abspath)
+        if asset is None:
+            return super().get_content(abspath, start, end)
+        if start is None and end is None:
+            return asset.content
+        return asset.content[start:end]
+
+    @classmethod
+    def get_content_version(cls, abspath: str) -> str:
+        asset = cls._get_asset(abspath)
+        if asset is None:
+            return super().get_content_version(abspath)
+        return asset.version
+
+    def get_content_size(self) -> int:
+        asset = self._get_asset(self.absolute_path) if self.absolute_path else None
+        if asset is None:
+            return super().get_content_size()
+        return len(asset.content)
+
+    def get_content_type(self) -> str:
+        asset = self._get_asset(self.absolute_path) if self.absolute_path else None
+        if asset is None or asset.encoding is None:
+            return super().get_content_type()
+        # Compressed variants have the type of the file they're compressed
+        # from.
+        mimetype, _ = mimetypes.guess_type(asset.path)
+        return mimetype or "application/octet-stream"
+
     def parse_url_path(self, url_path: str) -> str:
         url_parts = url_path.split("/")
 
@@ -0,0 +1,68 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import tornado.web
+
+from streamlit.runtime.scriptrunner.script_profiler import ScriptProfileStore
+from streamlit.web.server import allow_cross_origin_requests
+
+
+class ScriptProfileHandler(tornado.web.RequestHandler):
+    """Serves the profiles of a session's latest script runs.
+
+    Query arguments:
+    - format: "json" (the default) returns a summary of each of the session's
+      profiles, from the oldest to the latest, with the time spent in each st
+      command. "speedscope" and "collapsed" return the session's latest
+      profile as a flamegraph file to download.
+    """
+
+    def initialize(self, script_profile_store: ScriptProfileStore) -> None:
+        self._script_profile_store = script_profile_store
+
+    def set_default_headers(self) -> None:
+        self.set_header("Cache-Control", "no-cache")
+        if allow_cross_origin_requests():
+            self.set_header("Access-Control-Allow-Origin", "*")
+
+    def options(self) -> None:
+        """/OPTIONS handler for preflight CORS checks."""
+        self.set_status(204)
+        self.finish()
+
+    def get(self, session_id: str) -> None:
+        profiles = self._script_profile_store.get_profiles(session_id)
+        output_format = self.get_argument("format", "json")
+
+        if output_format == "json":
+            self.write({"profiles": [profile.to_dict() for profile in profiles]})
+            return
+
+        if output_format not in ("speedscope", "collapsed"):
+            raise tornado.web.HTTPError(400, "invalid format")
+        if not profiles:
+            raise tornado.web.HTTPError(404, "not found")
+
+        profile = profiles[-1]
+        if output_format == "speedscope":
+            self.set_header("Content-Type", "application/json")
+            filename = "streamlit-profile.speedscope.json"
+            self.write(json.dumps(profile.to_speedscope()))
+        else:
+            self.set_header("Content-Type", "text/plain; charset=utf-8")
+            filename = "streamlit-profile.folded"
+            self.write(profile.to_collapsed())
+        self.set_header("Content-Disposition", f'attachment; filename="{filename}"')
@@ -35,6 +35,9 @@ from streamlit.components.v1.components import ComponentRegistry
 from streamlit.config_option import ConfigOption
 from streamlit.logger import get_logger
 from streamlit.runtime import Runtime, RuntimeConfig, RuntimeState
+from streamlit.runtime.dataframe_window_manager import DataframeWindowManager
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
+from streamlit.runtime.disk_uploaded_file_manager import DiskUploadedFileManager
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.runtime_util import get_max_message_size_bytes
@@ -43,7 +46,11 @@ from streamlit.web.cache_storage_manager_config import (
 )
 from streamlit.web.server.app_static_file_handler import AppStaticFileHandler
 from streamlit.web.server.browser_websocket_handler import BrowserWebSocketHandler
-from streamlit.web.server.component_request_handler import ComponentRequestHandler
+from streamlit.web.server.component_request_handler import (
+    ComponentAssetCache,
+    ComponentRequestHandler,
+)
+from streamlit.web.server.dataframe_window_handler import DataframeWindowHandler
 from streamlit.web.server.media_file_handler import MediaFileHandler
 from streamlit.web.server.routes import (
     AddSlashHandler,
@@ -52,7 +59,9 @@ from streamlit.web.server.routes import (
     MessageCacheHandler,
     StaticFileHandler,
 )
+from streamlit.web.server.script_profile_handler import ScriptProfileHandler
 from streamlit.web.server.server_util import make_url_path_regex
+from streamlit.web.server.static_asset_index import StaticAssetIndex
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 from streamlit.web.server.upload_file_request_handler import UploadFileRequestHandler
 
@@ -81,6 +90,8 @@ MAX_PORT_SEARCH_RETRIES = 100
 UNIX_SOCKET_PREFIX = "unix://"
 
 MEDIA_ENDPOINT: Final = "/media"
+DATAFRAME_WINDOW_ENDPOINT: Final = "/_stcore/dataframe"
+SCRIPT_PROFILE_ENDPOINT: Final = "/_stcore/profile"
 UPLOAD_FILE_ENDPOINT: Final = "/_stcore/upload_file"
 STREAM_ENDPOINT: Final = r"_stcore/stream"
 METRIC_ENDPOINT: Final = r"(?:st-metrics|_stcore/metrics)"
@@ -224,10 +235,12 @@ class Server:
         self._main_script_path = main_script_path
 
         # Initialize MediaFileStorage and its associated endpoint
-        media_file_storage = MemoryMediaFileStorage(MEDIA_ENDPOINT)
+        media_file_storage = _create_media_file_storage()
         MediaFileHandler.initialize_storage(media_file_storage)
 
-        uploaded_file_mgr = MemoryUploadedFileManager(UPLOAD_FILE_ENDPOINT)
+        uploaded_file_mgr = _create_uploaded_file_manager()
+
+        dataframe_window_mgr = DataframeWindowManager(DATAFRAME_WINDOW_ENDPOINT)
 
         self._runtime = Runtime(
             RuntimeConfig(
@@ -236,6 +249,7 @@ class Server:
                 media_file_storage=media_file_storage,
                 uploaded_file_manager=uploaded_file_mgr,
                 cache_storage_manager=create_default_cache_storage_manager(),
+                dataframe_window_manager=dataframe_window_mgr,
             ),
         )
 
@@ -314,10 +328,18 @@ class Server:
                 MediaFileHandler,
                 {"path": ""},
             ),
+            (
+                make_url_path_regex(base, f"{DATAFRAME_WINDOW_ENDPOINT}/([^/]+)"),
+                DataframeWindowHandler,
+                dict(dataframe_window_mgr=self._runtime.dataframe_window_mgr),
+            ),
             (
                 make_url_path_regex(base, "component/(.*)"),
                 ComponentRequestHandler,
-                dict(registry=ComponentRegistry.instance()),
+                dict(
+                    registry=ComponentRegistry.instance(),
+                    asset_cache=ComponentAssetCache(),
+                ),
             ),
         ]
 
@@ -334,6 +356,15 @@ class Server:
                 ]
             )
 
+        if config.get_option("runner.profile"):
+            routes.append(
+                (
+                    make_url_path_regex(base, f"{SCRIPT_PROFILE_ENDPOINT}/([^/]+)"),
+                    ScriptProfileHandler,
+                    dict(script_profile_store=self._runtime.script_profile_store),
+                )
+            )
+
         if config.get_option("server.enableStaticServing"):
             routes.extend(
                 [
@@ -350,6 +381,9 @@ class Server:
         else:
             static_path = file_util.get_static_dir()
             LOGGER.debug("Serving static content from %s", static_path)
+            # Load the frontend's files into memory, and compress them, once,
+            # rather than on every request.
+            StaticFileHandler.initialize_asset_index(StaticAssetIndex(static_path))
 
             routes.extend(
                 [
@@ -397,6 +431,56 @@ class Server:
         self._runtime.stop()
 
 
+def _create_media_file_storage() -> Union[MemoryMediaFileStorage, DiskMediaFileStorage]:
+    """Create the MediaFileStorage that server.mediaFileStorage asks for."""
+    storage_type = config.get_option("server.mediaFileStorage")
+    if storage_type == "disk":
+        return DiskMediaFileStorage(
+            MEDIA_ENDPOINT,
+            directory=config.get_option("server.mediaFileDirectory"),
+            memory_cache_max_size=(
+                config.get_option("server.mediaFileMemoryCacheSize") * 1024 * 1024
+            ),
+        )
+
+    if storage_type != "memory":
+        LOGGER.warning(
+            'server.mediaFileStorage is "%s", which is not supported. '
+            "Media files will be stored in memory.",
+            storage_type,
+        )
+    return MemoryMediaFileStorage(MEDIA_ENDPOINT)
+
+
+def _create_uploaded_file_manager() -> (
+    Union[MemoryUploadedFileManager, DiskUploadedFileManager]
+):
+    """Create the UploadedFileManager that server.uploadedFileStorage asks
+    for.
+    """
+    max_session_size = config.get_option("server.maxSessionUploadSize") * 1024 * 1024
+    storage_type = config.get_option("server.uploadedFileStorage")
+    if storage_type == "disk":
+        return DiskUploadedFileManager(
+            UPLOAD_FILE_ENDPOINT,
+            directory=config.get_option("server.uploadedFileDirectory"),
+            max_size=(
+                config.get_option("server.maxUploadedFileStorageSize") * 1024 * 1024
+            ),
+            max_session_size=max_session_size,
+        )
+
+    if storage_type != "memory":
+        LOGGER.warning(
+            'server.uploadedFileStorage is "%s", which is not supported. '
+            "Uploaded files will be stored in memory.",
+            storage_type,
+        )
+    return MemoryUploadedFileManager(
+        UPLOAD_FILE_ENDPOINT, max_session_size=max_session_size
+    )
+
+
 def _set_tornado_log_levels() -> None:
     if not config.get_option("global.developmentMode"):
         # Hide logs unless they're super important.
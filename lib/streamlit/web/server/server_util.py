@@ -14,13 +14,18 @@
 
 """Server related utility functions"""
 
-from typing import Optional
+from typing import Dict, Optional, Sequence
 from urllib.parse import urljoin
 
 import tornado.web
+from typing_extensions import Final
 
 from streamlit import config, net_util, url_util
 
+# The Cache-Control header of responses that never change, like files whose
+# URLs are derived from their content.
+IMMUTABLE_CACHE_CONTROL: Final = "public, max-age=31536000, immutable"
+
 
 def is_url_from_allowed_origins(url: str) -> bool:
     """Return True if URL is from allowed origins (for CORS purpose).
@@ -124,3 +129,46 @@ def emit_endpoint_deprecation_notice(
     handler.set_header("Deprecation", True)
     new_url = urljoin(f"{handler.request.protocol}://{handler.request.host}", new_path)
     handler.set_header("Link", f'<{new_url}>; rel="alternate"')
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Return the quality values of the codings in an Accept-Encoding header,
+    by coding.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    return qualities
+
+
+def select_content_encoding(
+    accept_encoding: str, encodings: Sequence[str]
+) -> Optional[str]:
+    """Return the content-coding, out of the given ones, that a client with the
+    given Accept-Encoding header prefers, or None if it accepts none of them.
+
+    Ties go to the coding that comes first in `encodings`.
+    """
+    qualities = _parse_accept_encoding(accept_encoding)
+    best_encoding = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best_encoding = encoding
+            best_quality = quality
+    return best_encoding
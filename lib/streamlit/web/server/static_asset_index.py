@@ -0,0 +1,183 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-memory index of the frontend's static files."""
+
+import gzip
+import mimetypes
+import os
+from typing import Dict, NamedTuple, Optional, Tuple, cast
+
+from typing_extensions import Final
+
+from streamlit.logger import get_logger
+from streamlit.runtime.memory_media_file_storage import (
+    MIN_COMPRESSED_FILE_SIZE,
+    is_compressible_mimetype,
+)
+from streamlit.util import calc_md5
+
+try:
+    import brotli
+
+    brotli_available = True
+except ImportError:
+    brotli_available = False
+
+LOGGER = get_logger(__name__)
+
+# Files that are larger than this aren't kept in memory.
+MAX_INDEXED_FILE_SIZE: Final = 16 * 1024 * 1024
+
+# Source maps are large, and only requested by browsers' developer tools.
+_UNINDEXED_EXTENSIONS: Final = frozenset([".map"])
+
+GZIP_LEVEL: Final = 9
+# Brotli's highest quality levels are much slower, for little gain.
+BROTLI_QUALITY: Final = 9
+
+# The suffixes of the paths of compressed variants, by content-coding.
+ENCODING_SUFFIXES: Final = {"br": ".br", "gzip": ".gz"}
+
+
+class StaticAsset(NamedTuple):
+    """A static file, or a compressed variant of one, kept in memory."""
+
+    # The resolved path of the file. Compressed variants share it.
+    path: str
+    content: bytes
+    # The version of the content, as StaticFileHandler.get_content_version
+    # would compute it.
+    version: str
+    # The content-coding of a compressed variant, or None.
+    encoding: Optional[str] = None
+    # The content-codings of the file's compressed variants, in order of
+    # preference.
+    encodings: Tuple[str, ...] = ()
+
+
+def _compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return cast(bytes, brotli.compress(content, quality=BROTLI_QUALITY))
+    # A fixed mtime keeps the compressed content of a file stable.
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _get_available_encodings() -> Tuple[str, ...]:
+    """The content-codings that assets are compressed with, in order of
+    preference.
+    """
+    return ("br", "gzip") if brotli_available else ("gzip",)
+
+
+def get_compressed_variants(path: str, content: bytes) -> Dict[str, bytes]:
+    """Return the compressed variants of a file's content, by content-coding,
+    in order of preference.
+
+    Only text-like files are compressed, and only the variants that are
+    smaller than the file are returned.
+    """
+    mimetype, encoding = mimetypes.guess_type(path)
+    if (
+        mimetype is None
+        or encoding is not None
+        or len(content) < MIN_COMPRESSED_FILE_SIZE
+        or not is_compressible_mimetype(mimetype)
+    ):
+        return {}
+
+    variants = {}
+    for variant_encoding in _get_available_encodings():
+        compressed = _compress(content, variant_encoding)
+        if len(compressed) < len(content):
+            variants[variant_encoding] = compressed
+    return variants
+
+
+class StaticAssetIndex:
+    """Keeps the files of a static directory in memory, along with their
+    compressed variants, so that serving them reads no files and compresses
+    nothing.
+
+    The index is built once, when it's created; files that are added to the
+    directory later aren't in it.
+    """
+
+    def __init__(self, static_dir: str):
+        # Assets, and their compressed variants, by the absolute paths they're
+        # served from. Compressed variants are served from their file's path,
+        # plus the suffix of their encoding.
+        self._assets: Dict[str, StaticAsset] = {}
+        self._size = 0
+
+        for dirpath, _, filenames in os.walk(static_dir):
+            for filename in filenames:
+                # StaticFileHandler serves files from their resolved paths.
+                path = os.path.realpath(os.path.join(dirpath, filename))
+                try:
+                    self._add_file(path)
+                except OSError as ex:
+                    LOGGER.warning("Failed to index static file %s: %s", path, ex)
+
+        LOGGER.debug(
+            "Indexed %s static assets (%s bytes)", len(self._assets), self._size
+        )
+
+    @property
+    def size(self) -> int:
+        """The total size, in bytes, of the indexed assets and variants."""
+        return self._size
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        """Return the asset served from the given absolute path, or None if
+        it isn't indexed.
+        """
+        return self._assets.get(path)
+
+    def get_encoded_path(self, path: str, encoding: Optional[str]) -> str:
+        """Return the absolute path of the file's variant with the given
+        content-coding, or the file's own path if there's no such variant.
+        """
+        if encoding is None:
+            return path
+        encoded_path = path + ENCODING_SUFFIXES[encoding]
+        return encoded_path if encoded_path in self._assets else path
+
+    def _add_file(self, path: str) -> None:
+        if os.path.splitext(path)[1] in _UNINDEXED_EXTENSIONS:
+            return
+        if os.path.getsize(path) > MAX_INDEXED_FILE_SIZE:
+            return
+
+        with open(path, "rb") as f:
+            content = f.read()
+        version = calc_md5(content)
+
+        variants = get_compressed_variants(path, content)
+        for encoding, compressed in variants.items():
+            self._assets[path + ENCODING_SUFFIXES[encoding]] = StaticAsset(
+                path=path,
+                content=compressed,
+                version=f"{version}-{encoding}",
+                encoding=encoding,
+            )
+            self._size += len(compressed)
+
+        self._assets[path] = StaticAsset(
+            path=path,
+            content=content,
+            version=version,
+            encodings=tuple(variants),
+        )
+        self._size += len(content)
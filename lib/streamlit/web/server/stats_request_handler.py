@@ -12,13 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List
+import math
+from typing import Dict, Iterable, List, Tuple
 
 import tornado.web
+from google.protobuf.message import Message
 
 from streamlit.proto.openmetrics_data_model_pb2 import GAUGE
+from streamlit.proto.openmetrics_data_model_pb2 import Label as LabelProto
+from streamlit.proto.openmetrics_data_model_pb2 import MetricPoint as MetricPointProto
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-from streamlit.runtime.stats import CacheStat, StatsManager
+from streamlit.proto.openmetrics_data_model_pb2 import MetricType
+from streamlit.runtime.stats import CacheStat, Metric, StatsManager
 from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
 
@@ -42,35 +47,25 @@ class StatsRequestHandler(tornado.web.RequestHandler):
         if self.request.uri and "_stcore/" not in self.request.uri:
             emit_endpoint_deprecation_notice(self, new_path="/_stcore/metrics")
 
-        stats = self._manager.get_stats()
+        metric_set = self._stats_to_proto(
+            self._manager.get_stats(), self._manager.get_metrics()
+        )
 
         # If the request asked for protobuf output, we return a serialized
         # protobuf. Else we return text.
         if "application/x-protobuf" in self.request.headers.get_list("Accept"):
-            self.write(self._stats_to_proto(stats).SerializeToString())
+            self.write(metric_set.SerializeToString())
             self.set_header("Content-Type", "application/x-protobuf")
             self.set_status(200)
         else:
-            self.write(self._stats_to_text(self._manager.get_stats()))
+            self.write(self._metric_set_to_text(metric_set))
             self.set_header("Content-Type", "application/openmetrics-text")
             self.set_status(200)
 
     @staticmethod
-    def _stats_to_text(stats: List[CacheStat]) -> str:
-        metric_type = "# TYPE cache_memory_bytes gauge"
-        metric_unit = "# UNIT cache_memory_bytes bytes"
-        metric_help = "# HELP Total memory consumed by a cache."
-        openmetrics_eof = "# EOF\n"
-
-        # Format: header, stats, EOF
-        result = [metric_type, metric_unit, metric_help]
-        result.extend(stat.to_metric_str() for stat in stats)
-        result.append(openmetrics_eof)
-
-        return "\n".join(result)
-
-    @staticmethod
-    def _stats_to_proto(stats: List[CacheStat]) -> MetricSetProto:
+    def _stats_to_proto(
+        stats: List[CacheStat], metrics: List[Metric]
+    ) -> MetricSetProto:
         metric_set = MetricSetProto()
 
         metric_family = metric_set.metric_families.add()
@@ -79,10 +74,101 @@ class StatsRequestHandler(tornado.web.RequestHandler):
         metric_family.unit = "bytes"
         metric_family.help = "Total memory consumed by a cache."
 
+        # Stats are reported per cache entry. We export the total of each
+        # cache, so that the number of series doesn't grow with the number of
+        # entries.
+        totals: Dict[Tuple[str, str], int] = {}
         for stat in stats:
+            key = (stat.category_name, stat.cache_name)
+            totals[key] = totals.get(key, 0) + stat.byte_length
+
+        for (category_name, cache_name), byte_length in totals.items():
             metric_proto = metric_family.metrics.add()
-            stat.marshall_metric_proto(metric_proto)
+            CacheStat(category_name, cache_name, byte_length).marshall_metric_proto(
+                metric_proto
+            )
+
+        for metric in metrics:
+            metric.marshall_metric_family(metric_set.metric_families.add())
 
-        metric_set = MetricSetProto()
-        metric_set.metric_families.append(metric_family)
         return metric_set
+
+    @staticmethod
+    def _metric_set_to_text(metric_set: MetricSetProto) -> str:
+        """Return the OpenMetrics text exposition of a MetricSet."""
+        result = []
+        for metric_family in metric_set.metric_families:
+            name = metric_family.name
+            metric_type = MetricType.Name(metric_family.type).lower()
+            result.append(f"# TYPE {name} {metric_type}")
+            if metric_family.unit:
+                result.append(f"# UNIT {name} {metric_family.unit}")
+            result.append(f"# HELP {name} {_escape(metric_family.help)}")
+
+            for metric in metric_family.metrics:
+                for point in metric.metric_points:
+                    result.extend(_metric_point_to_text(name, metric.labels, point))
+
+        result.append("# EOF\n")
+        return "\n".join(result)
+
+
+def _metric_point_to_text(
+    name: str, labels: Iterable[LabelProto], point: MetricPointProto
+) -> List[str]:
+    labels = list(labels)
+    value_type = point.WhichOneof("value")
+    if value_type == "gauge_value":
+        return [_sample(name, labels, _get_oneof_value(point.gauge_value, "value"))]
+
+    if value_type == "counter_value":
+        total = _get_oneof_value(point.counter_value, "total")
+        return [_sample(f"{name}_total", labels, total)]
+
+    if value_type == "histogram_value":
+        histogram = point.histogram_value
+        samples = [
+            _sample(
+                f"{name}_bucket",
+                labels
+                + [LabelProto(name="le", value=_format_value(bucket.upper_bound))],
+                bucket.count,
+            )
+            for bucket in histogram.buckets
+        ]
+        samples.append(_sample(f"{name}_count", labels, histogram.count))
+        samples.append(
+            _sample(f"{name}_sum", labels, _get_oneof_value(histogram, "sum"))
+        )
+        return samples
+
+    return []
+
+
+def _get_oneof_value(message: Message, oneof_group: str) -> float:
+    """Return the value of the field that's set in a numeric oneof group,
+    or 0 if none is.
+    """
+    field_name = message.WhichOneof(oneof_group)
+    if field_name is None:
+        return 0
+    value: float = getattr(message, field_name)
+    return value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(value)
+
+
+def _sample(name: str, labels: List[LabelProto], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+
+    label_str = ",".join(f'{label.name}="{_escape(label.value)}"' for label in labels)
+    return f"{name}{{{label_str}}} {_format_value(value)}"
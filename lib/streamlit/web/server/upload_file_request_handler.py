@@ -12,26 +12,274 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, List
+import email.message
+import mmap
+import os
+import tempfile
+from typing import IO, Callable, List, Optional, Union
 
 import tornado.httputil
 import tornado.web
+from typing_extensions import Final
 
 from streamlit import config
 from streamlit.logger import get_logger
+from streamlit.runtime.disk_uploaded_file_manager import DiskUploadedFileManager
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
-from streamlit.runtime.uploaded_file_manager import UploadedFileManager, UploadedFileRec
+from streamlit.runtime.uploaded_file_manager import UploadedFileRec
 from streamlit.web.server import routes, server_util
 
 LOGGER = get_logger(__name__)
 
+# Uploaded files up to this size are kept in memory. Larger ones are written
+# to temporary files, and memory-mapped.
+SPOOL_MAX_SIZE: Final = 1024 * 1024
 
+# The max size of the headers of a single part of a multipart body.
+_MAX_PART_HEADERS_SIZE: Final = 64 * 1024
+
+_PREAMBLE: Final = "preamble"
+_DELIMITER: Final = "delimiter"
+_HEADERS: Final = "headers"
+_BODY: Final = "body"
+_EPILOGUE: Final = "epilogue"
+
+
+class _UploadedFilePart:
+    """A file part of a multipart/form-data body, spooled to a temporary
+    file as it's received.
+    """
+
+    def __init__(
+        self, filename: str, content_type: str, directory: Optional[str] = None
+    ):
+        """
+        Parameters
+        ----------
+        filename : str
+            The part's filename.
+        content_type : str
+            The part's Content-Type.
+        directory : str or None
+            If given, the part is written to a named file in this directory
+            right away, so that the file can be moved rather than copied once
+            the part is received; see `detach_path`. Otherwise, the part is
+            kept in memory while it's small.
+        """
+        self.filename = filename
+        self.content_type = content_type
+        self.size = 0
+        self.path: Optional[str] = None
+        self.file: IO[bytes]
+        if directory is None:
+            self.file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        else:
+            self.file = tempfile.NamedTemporaryFile(
+                dir=directory, prefix="upload-", delete=False
+            )
+            self.path = self.file.name
+
+    def get_data(self) -> Union[bytes, mmap.mmap]:
+        """Return the part's content, as bytes if it's small enough to have
+        been kept in memory, and as a memory map of its file otherwise.
+        """
+        if self.size <= SPOOL_MAX_SIZE:
+            self.file.seek(0)
+            return self.file.read()
+        # The map stays valid after the file is closed (and removed).
+        self.file.flush()
+        return mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def detach_path(self) -> str:
+        """Close the part's named file, and return its path. The caller takes
+        over the file, which isn't removed when the part is closed anymore.
+        """
+        assert self.path is not None, "The part isn't written to a named file"
+        path = self.path
+        self.file.close()
+        self.path = None
+        return path
+
+    def close(self) -> None:
+        """Close the part's file, and remove it unless it's been detached."""
+        self.file.close()
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except OSError:
+                LOGGER.warning("Failed to remove uploaded file part %s", self.path)
+            self.path = None
+
+
+class _MultipartFileParser:
+    """Parses a multipart/form-data body as it's received.
+
+    The content of the body's file parts is written to temporary files, so
+    that neither the body nor the files are ever held in memory as a whole.
+    Only the first file part is kept; the other ones are just counted. Parts
+    that aren't files are skipped.
+    """
+
+    def __init__(
+        self,
+        boundary: bytes,
+        max_file_size: Optional[int] = None,
+        directory: Optional[str] = None,
+    ):
+        """
+        Parameters
+        ----------
+        boundary : bytes
+            The boundary parameter of the body's Content-Type.
+        max_file_size : int or None
+            The max size of the kept file part. Bodies whose file part is
+            larger fail with a 413 error. None means no limit.
+        directory : str or None
+            The directory to write the kept file part to a named file in.
+            See `_UploadedFilePart`.
+        """
+        self._delimiter = b"--" + boundary
+        self._max_file_size = max_file_size
+        self._directory = directory
+        self._buffer = bytearray()
+        self._state = _PREAMBLE
+        self._part: Optional[_UploadedFilePart] = None
+        self.files: List[_UploadedFilePart] = []
+        self.num_files = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the body.
+
+        Raises a tornado.web.HTTPError if the body can't be accepted.
+        """
+        self._buffer += chunk
+        while self._parse_next():
+            pass
+
+    def finish(self) -> None:
+        """Check that the whole body has been parsed."""
+        if self._state != _EPILOGUE:
+            raise tornado.web.HTTPError(400, reason="Incomplete multipart body")
+
+    def close(self) -> None:
+        """Close the files of the body's file parts."""
+        for part in self.files:
+            part.close()
+
+    def _parse_next(self) -> bool:
+        """Parse as much of the buffer as possible in the current state, and
+        return True if the state changed.
+        """
+        buffer = self._buffer
+
+        if self._state == _PREAMBLE:
+            index = buffer.find(self._delimiter)
+            if index < 0:
+                # Keep the bytes that may be the start of the delimiter.
+                del buffer[: max(0, len(buffer) - len(self._delimiter) + 1)]
+                return False
+            del buffer[: index + len(self._delimiter)]
+            self._state = _DELIMITER
+            return True
+
+        if self._state == _DELIMITER:
+            if len(buffer) < 2:
+                return False
+            if buffer[:2] == b"--":
+                # This was the closing delimiter.
+                self._state = _EPILOGUE
+            else:
+                self._state = _HEADERS
+            del buffer[:2]
+            return True
+
+        if self._state == _HEADERS:
+            index = buffer.find(b"\r\n\r\n")
+            if index < 0:
+                if len(buffer) > _MAX_PART_HEADERS_SIZE:
+                    raise tornado.web.HTTPError(400, reason="Invalid multipart body")
+                return False
+            headers = tornado.httputil.HTTPHeaders.parse(buffer[:index].decode("utf-8"))
+            del buffer[: index + 4]
+            self._start_part(headers)
+            self._state = _BODY
+            return True
+
+        if self._state == _BODY:
+            # Part contents end with a CRLF, followed by the delimiter.
+            index = buffer.find(b"\r\n" + self._delimiter)
+            if index < 0:
+                # Keep the bytes that may be the start of the delimiter.
+                self._write_part(max(0, len(buffer) - len(self._delimiter) - 1))
+                return False
+            self._write_part(index)
+            del buffer[: 2 + len(self._delimiter)]
+            self._part = None
+            self._state = _DELIMITER
+            return True
+
+        # Anything after the closing delimiter is ignored.
+        buffer.clear()
+        return False
+
+    def _start_part(self, headers: tornado.httputil.HTTPHeaders) -> None:
+        disposition = email.message.Message()
+        disposition["Content-Disposition"] = headers.get("Content-Disposition", "")
+        filename = disposition.get_filename()
+        if filename is None:
+            return
+
+        self.num_files += 1
+        if self.num_files == 1:
+            self._part = _UploadedFilePart(
+                filename,
+                headers.get("Content-Type", "application/unknown"),
+                self._directory,
+            )
+            self.files.append(self._part)
+
+    def _write_part(self, size: int) -> None:
+        """Write the first `size` bytes of the buffer to the current part."""
+        if size == 0:
+            return
+        if self._part is not None:
+            self._part.size += size
+            if (
+                self._max_file_size is not None
+                and self._part.size > self._max_file_size
+            ):
+                raise tornado.web.HTTPError(
+                    413, reason="The file is larger than the upload limit"
+                )
+            self._part.file.write(self._buffer[:size])
+        del self._buffer[:size]
+
+
+def _get_multipart_boundary(content_type: str) -> bytes:
+    """Return the boundary of a multipart/form-data Content-Type.
+
+    Raises a tornado.web.HTTPError if it's not one.
+    """
+    fields = content_type.split(";")
+    if fields[0].strip() == "multipart/form-data":
+        for field in fields[1:]:
+            key, _, value = field.strip().partition("=")
+            if key == "boundary" and value:
+                return value.strip('"').encode("latin1")
+    raise tornado.web.HTTPError(400, reason="Expected a multipart/form-data body")
+
+
+@tornado.web.stream_request_body
 class UploadFileRequestHandler(tornado.web.RequestHandler):
-    """Implements the POST /upload_file endpoint."""
+    """Implements the PUT /upload_file endpoint.
+
+    Request bodies are streamed, and the uploaded file is written to a
+    temporary file as it's received, rather than buffered in memory.
+    """
 
     def initialize(
         self,
-        file_mgr: MemoryUploadedFileManager,
+        file_mgr: Union[MemoryUploadedFileManager, DiskUploadedFileManager],
         is_active_session: Callable[[str], bool],
     ):
         """
@@ -46,6 +294,7 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
         """
         self._file_mgr = file_mgr
         self._is_active_session = is_active_session
+        self._parser: Optional[_MultipartFileParser] = None
 
     def set_default_headers(self):
         self.set_header("Access-Control-Allow-Methods", "PUT, OPTIONS, DELETE")
@@ -81,51 +330,104 @@ class UploadFileRequestHandler(tornado.web.RequestHandler):
         self.set_status(204)
         self.finish()
 
-    def put(self, **kwargs):
-        """Receive an uploaded file and add it to our UploadedFileManager."""
-
-        args: Dict[str, List[bytes]] = {}
-        files: Dict[str, List[Any]] = {}
+    def prepare(self) -> None:
+        """Set up the parsing of PUT request bodies, before they're received."""
+        if self.request.method != "PUT":
+            return
 
         session_id = self.path_kwargs["session_id"]
-        file_id = self.path_kwargs["file_id"]
-
-        tornado.httputil.parse_body_arguments(
-            content_type=self.request.headers["Content-Type"],
-            body=self.request.body,
-            arguments=args,
-            files=files,
-        )
 
         try:
             if not self._is_active_session(session_id):
                 raise Exception(f"Invalid session_id")
+            boundary = _get_multipart_boundary(
+                self.request.headers.get("Content-Type", "")
+            )
+        except tornado.web.HTTPError as e:
+            self.send_error(e.status_code, reason=e.reason)
+            return
         except Exception as e:
             self.send_error(400, reason=str(e))
             return
 
-        uploaded_files: List[UploadedFileRec] = []
-
-        for _, flist in files.items():
-            for file in flist:
-                uploaded_files.append(
-                    UploadedFileRec(
-                        file_id=file_id,
-                        name=file["filename"],
-                        type=file["content_type"],
-                        data=file["body"],
-                    )
-                )
+        self._parser = _MultipartFileParser(
+            boundary,
+            self._file_mgr.get_max_upload_size(session_id),
+            # Files that are stored on disk are written to the directory
+            # they're stored in, so that storing them doesn't copy them.
+            self._file_mgr.directory
+            if isinstance(self._file_mgr, DiskUploadedFileManager)
+            else None,
+        )
 
-        if len(uploaded_files) != 1:
-            self.send_error(
-                400, reason=f"Expected 1 file, but got {len(uploaded_files)}"
+    def data_received(self, chunk: bytes) -> None:
+        if self._parser is None:
+            # The request has already failed.
+            return
+
+        try:
+            self._parser.feed(chunk)
+        except tornado.web.HTTPError as e:
+            self._fail(e)
+
+    def put(self, **kwargs):
+        """Receive an uploaded file and add it to our UploadedFileManager."""
+        if self._parser is None:
+            return
+
+        session_id = self.path_kwargs["session_id"]
+        file_id = self.path_kwargs["file_id"]
+
+        try:
+            self._parser.finish()
+        except tornado.web.HTTPError as e:
+            self._fail(e)
+            return
+
+        if self._parser.num_files != 1:
+            self._fail(
+                tornado.web.HTTPError(
+                    400, reason=f"Expected 1 file, but got {self._parser.num_files}"
+                )
             )
             return
 
-        self._file_mgr.add_file(session_id=session_id, file=uploaded_files[0])
+        part = self._parser.files[0]
+        if isinstance(self._file_mgr, DiskUploadedFileManager):
+            self._file_mgr.move_file(
+                session_id=session_id,
+                file_id=file_id,
+                name=part.filename,
+                type=part.content_type,
+                path=part.detach_path(),
+            )
+        else:
+            self._file_mgr.add_file(
+                session_id=session_id,
+                file=UploadedFileRec(
+                    file_id=file_id,
+                    name=part.filename,
+                    type=part.content_type,
+                    data=part.get_data(),
+                ),
+            )
         self.set_status(204)
 
+    def on_finish(self) -> None:
+        if self._parser is not None:
+            self._parser.close()
+
+    def on_connection_close(self) -> None:
+        if self._parser is not None:
+            self._parser.close()
+
+    def _fail(self, error: tornado.web.HTTPError) -> None:
+        """Send an error response, and skip the rest of the request body."""
+        assert self._parser is not None
+        self._parser.close()
+        self._parser = None
+        self.send_error(error.status_code, reason=error.reason)
+
     def delete(self, **kwargs):
         """Delete file request handler."""
         session_id = self.path_kwargs["session_id"]
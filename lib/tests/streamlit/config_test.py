@@ -366,9 +366,15 @@ class ConfigTest(unittest.TestCase):
                 "runner.enforceSerializableSessionState",
                 "runner.magicEnabled",
                 "runner.installTracer",
+                "runner.asyncInterrupt",
                 "runner.fixMatplotlib",
                 "runner.postScriptGC",
                 "runner.fastReruns",
+                "runner.workerProcesses",
+                "runner.traceSampleRate",
+                "runner.traceExportTarget",
+                "runner.profile",
+                "runner.rerunDebounceDelay",
                 "magic.displayRootDocString",
                 "magic.displayLastExprIfNoSemicolon",
                 "mapbox.token",
@@ -377,6 +383,8 @@ class ConfigTest(unittest.TestCase):
                 "server.cookieSecret",
                 "server.scriptHealthCheckEnabled",
                 "server.enableWebsocketCompression",
+                "server.messageOffloadSize",
+                "server.arrowCompression",
                 "server.enableXsrfProtection",
                 "server.fileWatcherType",
                 "server.folderWatchBlacklist",
@@ -386,7 +394,15 @@ class ConfigTest(unittest.TestCase):
                 "server.port",
                 "server.runOnSave",
                 "server.maxUploadSize",
+                "server.maxSessionUploadSize",
+                "server.uploadedFileStorage",
+                "server.uploadedFileDirectory",
+                "server.maxUploadedFileStorageSize",
                 "server.maxMessageSize",
+                "server.mediaFileStorage",
+                "server.mediaFileDirectory",
+                "server.mediaFileMemoryCacheSize",
+                "server.dataframePreviewRows",
                 "server.enableStaticServing",
                 "server.sslCertFile",
                 "server.sslKeyFile",
@@ -16,9 +16,12 @@ import json
 from datetime import date
 from functools import reduce
 from typing import Any, Callable
+from unittest.mock import patch
 
 import altair as alt
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from parameterized import parameterized
 
@@ -26,7 +29,7 @@ import streamlit as st
 from streamlit.elements import arrow_altair as altair
 from streamlit.elements.arrow_altair import ChartType
 from streamlit.errors import StreamlitAPIException
-from streamlit.type_util import bytes_to_data_frame
+from streamlit.type_util import bytes_to_data_frame, is_altair_version_less_than
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit import pyspark_mocks, snowpark_mocks
 
@@ -130,7 +133,7 @@ class ArrowAltairTest(DeltaGeneratorTestCase):
             st.altair_chart(chart, theme="bad_theme")
 
         self.assertEqual(
-            f'You set theme="bad_theme" while Streamlit charts only support theme=”streamlit” or theme=None to fallback to the default library theme.',
+            'You set theme="bad_theme" while Streamlit charts only support theme=”streamlit” or theme=None to fallback to the default library theme.',
             str(exc.exception),
         )
 
@@ -669,6 +672,129 @@ class ArrowChartsTest(DeltaGeneratorTestCase):
                 "This does not look like a valid color argument" in str(exc.exception)
             )
 
+    @parameterized.expand(
+        [
+            (chart_command, method)
+            for chart_command in [st.area_chart, st.line_chart, st.scatter_chart]
+            for method in ["lttb", "minmax"]
+        ]
+    )
+    def test_chart_with_downsample(self, chart_command: Callable, method: str):
+        """Test that each series is downsampled to about the chart's width,
+        keeping its extent."""
+        df = pd.DataFrame(
+            {
+                "x": np.arange(5000),
+                "a": np.sin(np.arange(5000) / 100),
+                "b": np.random.default_rng(0).normal(size=5000),
+            }
+        )
+
+        chart_command(df, x="x", y=["a", "b"], width=100, downsample=method)
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        for column, series in output_df.groupby(altair.MELTED_COLOR_COLUMN_NAME):
+            self.assertLessEqual(len(series), 2 * 100 + 2)
+            self.assertEqual([0, 4999], [series["x"].min(), series["x"].max()])
+            y = series[altair.MELTED_Y_COLUMN_NAME]
+            self.assertEqual(df[column].min(), y.min())
+            self.assertEqual(df[column].max(), y.max())
+
+    def test_chart_without_downsample(self):
+        """Test that all points are drawn by default."""
+        df = pd.DataFrame({"x": np.arange(5000), "y": np.arange(5000)})
+
+        st.line_chart(df, x="x", y="y", width=100)
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        self.assertEqual(5000, len(bytes_to_data_frame(proto.datasets[0].data.data)))
+
+    def test_chart_with_bad_downsample(self):
+        df = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
+
+        with self.assertRaises(StreamlitAPIException) as exc:
+            st.line_chart(df, downsample="average")
+
+        self.assertIn('Invalid downsample method "average"', str(exc.exception))
+
+    @parameterized.expand(
+        [
+            (st.line_chart, {}),
+            (st.line_chart, {"x": "a", "y": ["b", "c"]}),
+            (st.area_chart, {"y": "b"}),
+            (st.bar_chart, {"x": "a", "y": "b", "color": "d"}),
+            (st.scatter_chart, {"x": "a", "y": "b", "size": "c"}),
+            (st.scatter_chart, {"x": "a", "y": ["b", "c"], "size": "c"}),
+        ]
+    )
+    def test_chart_with_pyarrow_table(self, chart_command: Callable, kwargs):
+        """Test that pyarrow tables are charted like the equivalent dataframes."""
+        df = pd.DataFrame(
+            {
+                "a": [1, 2, 3],
+                "b": [4.0, 5.0, 6.0],
+                "c": [7.0, 8.0, 9.0],
+                "d": ["x", "y", "z"],
+            }
+        )
+        if not kwargs:
+            df = df[["b", "c"]]
+
+        chart_command(df, **kwargs)
+        df_proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+
+        chart_command(pa.Table.from_pandas(df, preserve_index=False), **kwargs)
+        table_proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(df_proto.datasets[0].data.data),
+            bytes_to_data_frame(table_proto.datasets[0].data.data),
+        )
+        df_spec = json.loads(df_proto.spec)
+        table_spec = json.loads(table_proto.spec)
+        self.assertEqual(df_spec["mark"], table_spec["mark"])
+        self.assertEqual(df_spec["encoding"], table_spec["encoding"])
+
+    def test_chart_with_mixed_type_pyarrow_table(self):
+        """Test that y columns of different types are melted like in pandas."""
+        table = pa.table({"a": [1, 2], "b": [3, 4], "c": [5.5, 6.5]})
+
+        st.line_chart(table, x="a", y=["b", "c"])
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        self.assertEqual(
+            [3.0, 4.0, 5.5, 6.5], list(output_df[altair.MELTED_Y_COLUMN_NAME])
+        )
+
+    def test_pyarrow_table_chart_data(self):
+        """Test that pyarrow tables are passed to Altair as they are, except
+        with Altair 4, which only takes pandas dataframes."""
+        table = pa.table({"a": [1, 2], "b": [3.0, 4.0]})
+
+        chart, _ = altair._generate_chart(ChartType.LINE, table, "a", "b")
+
+        if is_altair_version_less_than("5"):
+            self.assertIsInstance(chart.data, pd.DataFrame)
+            self.assertEqual([3.0, 4.0], list(chart.data["b"]))
+        else:
+            self.assertIsInstance(chart.data, pa.Table)
+            self.assertEqual([3.0, 4.0], chart.data.column("b").to_pylist())
+
+    def test_chart_data_is_not_copied(self):
+        """Test that the input dataframe isn't copied or modified."""
+        df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "c": [7, 8, 9]})
+        orig_df = df.copy()
+
+        with patch.object(
+            pd.DataFrame, "copy", wraps=df.copy, autospec=True
+        ) as copy_mock:
+            st.line_chart(df, y=["b", "c"])
+
+        copy_mock.assert_not_called()
+        pd.testing.assert_frame_equal(orig_df, df)
+
     def assert_output_df_is_correct_and_input_is_untouched(
         self, orig_df, expected_df, chart_proto
     ):
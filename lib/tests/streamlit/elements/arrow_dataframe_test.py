@@ -15,7 +15,7 @@
 """Arrow DataFrame tests."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -26,9 +26,11 @@ from pandas.io.formats.style_render import StylerRenderer as Styler
 import streamlit as st
 from streamlit.elements.lib.column_config_utils import INDEX_IDENTIFIER
 from streamlit.errors import StreamlitAPIException
+from streamlit.runtime import Runtime
+from streamlit.runtime.dataframe_window_manager import DataframeWindowManager
 from streamlit.type_util import bytes_to_data_frame, pyarrow_table_to_bytes
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
-from tests.testutil import create_snowpark_session
+from tests.testutil import create_snowpark_session, patch_config_options
 
 
 def mock_data_frame():
@@ -71,6 +73,57 @@ class ArrowDataFrameProtoTest(DeltaGeneratorTestCase):
         proto = self.get_delta_from_queue().new_element.arrow_data_frame
         self.assertEqual(proto.data, pyarrow_table_to_bytes(table))
 
+    def test_large_dataframe_is_windowed(self):
+        """With server.dataframePreviewRows set, only the first rows of a
+        larger dataframe are sent, and the rest are left with the
+        DataframeWindowManager.
+        """
+        Runtime._instance.dataframe_window_mgr = DataframeWindowManager(
+            "/mock/dataframe"
+        )
+        df = pd.DataFrame({"a": range(10)}, index=pd.RangeIndex(5, 15))
+
+        with patch_config_options({"server.dataframePreviewRows": 3}):
+            st.dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertTrue(proto.data_url.startswith("/mock/dataframe/"))
+        self.assertEqual(10, proto.num_rows)
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.data), df.iloc[:3], check_index_type=False
+        )
+
+    def test_small_dataframe_is_not_windowed(self):
+        Runtime._instance.dataframe_window_mgr = DataframeWindowManager(
+            "/mock/dataframe"
+        )
+        df = pd.DataFrame({"a": range(10)})
+
+        with patch_config_options({"server.dataframePreviewRows": 10}):
+            st.dataframe(df)
+            st.dataframe(df.style)
+
+        for proto in (
+            self.get_delta_from_queue(-2).new_element.arrow_data_frame,
+            self.get_delta_from_queue(-1).new_element.arrow_data_frame,
+        ):
+            self.assertEqual("", proto.data_url)
+            pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df)
+
+    def test_styled_dataframe_is_not_windowed(self):
+        """A Styler's styles cover all rows, so it's always sent whole."""
+        Runtime._instance.dataframe_window_mgr = DataframeWindowManager(
+            "/mock/dataframe"
+        )
+        df = pd.DataFrame({"a": range(10)})
+
+        with patch_config_options({"server.dataframePreviewRows": 3}):
+            st.dataframe(df.style)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual("", proto.data_url)
+        pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df)
+
     def test_hide_index_true(self):
         """Test that it can be called with hide_index=True param."""
         data_df = pd.DataFrame(
@@ -161,18 +214,15 @@ class ArrowDataFrameProtoTest(DeltaGeneratorTestCase):
             st.dataframe(df.style.format("{:03d}"))
         pd.reset_option("styler.render.max_elements")
 
-    @patch(
-        "streamlit.type_util.is_pandas_version_less_than",
-        MagicMock(return_value=False),
-    )
     @patch.object(Styler, "_translate")
-    def test_pandas_version_1_3_0_and_above(self, mock_styler_translate):
-        """Tests that `styler._translate` is called with correct arguments in Pandas >= 1.3.0"""
+    def test_styler_is_not_translated(self, mock_styler_translate):
+        """Tests that styles and display values are read from the computed
+        Styler, without translating it into its HTML render context."""
         df = mock_data_frame()
-        styler = df.style.set_uuid("FAKE_UUID")
+        styler = df.style.set_uuid("FAKE_UUID").highlight_max(axis=None)
 
         st.dataframe(styler)
-        mock_styler_translate.assert_called_once_with(False, False)
+        mock_styler_translate.assert_not_called()
 
     @pytest.mark.require_snowflake
     def test_snowpark_uncollected(self):
@@ -14,7 +14,7 @@
 
 """Arrow marshalling unit tests."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -114,15 +114,12 @@ class ArrowTest(DeltaGeneratorTestCase):
             bytes_to_data_frame(proto.styler.display_values), expected
         )
 
-    @patch(
-        "streamlit.type_util.is_pandas_version_less_than",
-        MagicMock(return_value=False),
-    )
     @patch.object(Styler, "_translate")
-    def test_pandas_version_1_3_0_and_above(self, mock_styler_translate):
-        """Tests that `styler._translate` is called with correct arguments in Pandas >= 1.3.0"""
+    def test_styler_is_not_translated(self, mock_styler_translate):
+        """Tests that styles and display values are read from the computed
+        Styler, without translating it into its HTML render context."""
         df = mock_data_frame()
-        styler = df.style.set_uuid("FAKE_UUID")
+        styler = df.style.set_uuid("FAKE_UUID").highlight_max(axis=None)
 
         st.table(styler)
-        mock_styler_translate.assert_called_once_with(False, False)
+        mock_styler_translate.assert_not_called()
@@ -35,16 +35,23 @@ from streamlit.elements.lib.column_config_utils import (
     determine_dataframe_schema,
 )
 from streamlit.elements.widgets.data_editor import (
+    AppliedEdits,
+    DataEditorSerde,
     _apply_cell_edits,
     _apply_dataframe_edits,
     _apply_row_additions,
     _apply_row_deletions,
     _check_column_names,
     _check_type_compatibilities,
+    _get_edited_dataframe,
     _parse_value,
+    _parse_values,
 )
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+from streamlit.proto.WidgetStates_pb2 import WidgetState as WidgetStateProto
+from streamlit.proto.WidgetStates_pb2 import WidgetStates as WidgetStatesProto
+from streamlit.runtime.state import SafeSessionState, SessionState
 from streamlit.type_util import (
     DataFormat,
     bytes_to_data_frame,
@@ -59,6 +66,10 @@ def _get_arrow_schema(df: pd.DataFrame) -> pa.Schema:
     return pa.Table.from_pandas(df).schema
 
 
+def _empty_state() -> Dict[str, Any]:
+    return {"edited_rows": {}, "added_rows": [], "deleted_rows": []}
+
+
 class DataEditorUtilTest(unittest.TestCase):
     @parameterized.expand(
         [
@@ -199,11 +210,95 @@ class DataEditorUtilTest(unittest.TestCase):
             {"col1": 11, "col2": "bar", "col3": True, "col4": "2023-03-20T14:28:23"},
         ]
 
-        _apply_row_additions(
+        df = _apply_row_additions(
             df, added_rows, determine_dataframe_schema(df, _get_arrow_schema(df))
         )
 
         self.assertEqual(len(df), 5)
+        self.assertEqual(list(df.index), [0, 1, 2, 3, 4])
+        self.assertEqual(df.iat[4, 1], "bar")
+        self.assertEqual(df.iat[3, 3], pd.Timestamp("2020-03-20T14:28:23"))
+
+    def test_apply_row_additions_continues_range_index(self):
+        """Test that added rows continue the range index of a DataFrame."""
+        df = pd.DataFrame({"col1": [1, 2]}, index=pd.RangeIndex(0, 20, 10))
+
+        df = _apply_row_additions(
+            df,
+            [{"col1": 3}, {}],
+            determine_dataframe_schema(df, _get_arrow_schema(df)),
+        )
+
+        pd.testing.assert_index_equal(df.index, pd.RangeIndex(0, 40, 10))
+        # Like for cell edits, missing values turn integer columns into floats.
+        self.assertEqual(df["col1"].dtype, np.float64)
+        self.assertEqual(df["col1"].to_list()[:3], [1, 2, 3])
+        self.assertTrue(np.isnan(df.iat[3, 0]))
+
+    def test_apply_row_additions_with_index_values(self):
+        """Test that added rows with an existing index value overwrite the existing
+        row, and rows without an index value are skipped."""
+        df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}, index=["x", "y"])
+
+        df = _apply_row_additions(
+            df,
+            [
+                {INDEX_IDENTIFIER: "z", "col1": 3, "col2": "c"},
+                {INDEX_IDENTIFIER: "x", "col1": 10, "col2": "foo"},
+                {"col1": 11, "col2": "bar"},
+            ],
+            determine_dataframe_schema(df, _get_arrow_schema(df)),
+        )
+
+        self.assertEqual(
+            df.to_dict(orient="index"),
+            {
+                "x": {"col1": 10, "col2": "foo"},
+                "y": {"col1": 2, "col2": "b"},
+                "z": {"col1": 3, "col2": "c"},
+            },
+        )
+
+    def test_apply_row_additions_keeps_extension_dtypes(self):
+        """Test that added rows keep the extension dtypes of a DataFrame."""
+        df = pd.DataFrame({"col1": pd.Series([1, 2], dtype="Int64")})
+
+        df = _apply_row_additions(
+            df,
+            [{"col1": None}, {"col1": 4}],
+            determine_dataframe_schema(df, _get_arrow_schema(df)),
+        )
+
+        self.assertEqual(df["col1"].dtype, pd.Int64Dtype())
+        self.assertEqual(df["col1"].to_list(), [1, 2, pd.NA, 4])
+
+    def test_apply_cell_edits_in_numeric_column(self):
+        """Test that cell edits of a column are applied together, and that missing
+        values turn integer columns into floats."""
+        df = pd.DataFrame({"col1": [1, 2, 3, 4]})
+
+        _apply_cell_edits(
+            df,
+            {0: {"col1": 10}, 2: {"col1": None}, 3: {"col1": 12}},
+            determine_dataframe_schema(df, _get_arrow_schema(df)),
+        )
+
+        self.assertEqual(df["col1"].dtype, np.float64)
+        self.assertEqual(df["col1"].to_list()[:2], [10, 2])
+        self.assertTrue(np.isnan(df.iat[2, 0]))
+        self.assertEqual(df.iat[3, 0], 12)
+
+    def test_parse_values(self):
+        """Test that _parse_values parses the values of a column."""
+        self.assertEqual(
+            _parse_values(["2020-03-20T14:28:23", None], ColumnDataKind.DATETIME),
+            [pd.Timestamp("2020-03-20T14:28:23"), None],
+        )
+        self.assertEqual(
+            _parse_values(["1", 2, None], ColumnDataKind.INTEGER), [1, 2, None]
+        )
+        values = [1, None]
+        self.assertIs(_parse_values(values, ColumnDataKind.INTEGER), values)
 
     def test_apply_row_deletions(self):
         """Test applying row deletions to a DataFrame."""
@@ -244,7 +339,7 @@ class DataEditorUtilTest(unittest.TestCase):
             }
         }
 
-        _apply_dataframe_edits(
+        df = _apply_dataframe_edits(
             df,
             {
                 "deleted_rows": deleted_rows,
@@ -263,6 +358,138 @@ class DataEditorUtilTest(unittest.TestCase):
             },
         )
 
+    def test_get_edited_dataframe(self):
+        """Test that only the cells edited since the last call are applied to the
+        kept DataFrame, and that added and deleted rows are applied to a copy."""
+        df = pd.DataFrame({"col1": [1, 2, 3]})
+        dataframe_schema = determine_dataframe_schema(df, _get_arrow_schema(df))
+        applied_edits = AppliedEdits()
+        applied_edits.replace(
+            {"edited_rows": {0: {"col1": 10}}, "added_rows": [], "deleted_rows": []},
+            1,
+        )
+
+        with patch(
+            "streamlit.elements.widgets.data_editor._apply_cell_edits",
+            wraps=_apply_cell_edits,
+        ) as apply_cell_edits:
+            first = _get_edited_dataframe(applied_edits, df.copy(), dataframe_schema)
+            first.iat[0, 0] = 100
+            self.assertEqual(applied_edits.cells_df["col1"].to_list(), [10, 2, 3])
+
+            applied_edits.update(
+                {
+                    "edited_rows": {1: {"col1": 20}},
+                    "added_rows": [{"col1": 4}],
+                    "deleted_rows": [2],
+                },
+                2,
+            )
+            second = _get_edited_dataframe(applied_edits, df.copy(), dataframe_schema)
+            self.assertEqual(second["col1"].to_list(), [10, 20, 4])
+            self.assertEqual(
+                apply_cell_edits.call_args_list[-1].args[1], {1: {"col1": 20}}
+            )
+
+            # Without new edits, no cells are applied again.
+            third = _get_edited_dataframe(applied_edits, df.copy(), dataframe_schema)
+            self.assertEqual(third["col1"].to_list(), [10, 20, 4])
+            self.assertEqual(apply_cell_edits.call_count, 2)
+
+        # Without edits, the DataFrame is returned as it is.
+        applied_edits.replace(
+            {"edited_rows": {}, "added_rows": [], "deleted_rows": []}, 3
+        )
+        self.assertIs(_get_edited_dataframe(applied_edits, df, dataframe_schema), df)
+        self.assertIsNone(applied_edits.cells_df)
+
+
+class DataEditorSerdeTest(unittest.TestCase):
+    def test_deserialize_complete_state(self):
+        """Test that a widget value without a version replaces all edits."""
+        serde = DataEditorSerde()
+        state = serde.deserialize(
+            json.dumps({"edited_rows": {"1": {"col1": 10}}, "deleted_rows": [0]})
+        )
+        self.assertEqual(
+            state,
+            {"edited_rows": {1: {"col1": 10}}, "added_rows": [], "deleted_rows": [0]},
+        )
+        self.assertEqual(serde.deserialize(None), _empty_state())
+
+    def test_deserialize_updates(self):
+        """Test that updates are applied on top of the applied edits."""
+        serde = DataEditorSerde()
+        serde.deserialize(
+            json.dumps(
+                {
+                    "version": 2,
+                    "base_version": 0,
+                    "edited_rows": {"0": {"col1": 1}, "1": {"col1": 2}},
+                    "added_rows": [],
+                    "deleted_rows": [],
+                }
+            )
+        )
+        first_state = serde.applied_edits.editing_state
+
+        state = serde.deserialize(
+            json.dumps(
+                {
+                    "version": 4,
+                    "base_version": 2,
+                    "edited_rows": {"0": {"col2": "a"}, "2": {"col1": 3}},
+                    "added_rows": [{"col1": 4}],
+                    "deleted_rows": [1],
+                }
+            )
+        )
+        self.assertEqual(
+            state,
+            {
+                "edited_rows": {0: {"col1": 1, "col2": "a"}, 2: {"col1": 3}},
+                "added_rows": [{"col1": 4}],
+                "deleted_rows": [1],
+            },
+        )
+        self.assertEqual(serde.applied_edits.version, 4)
+        # Previously returned states don't change.
+        self.assertEqual(first_state["edited_rows"], {0: {"col1": 1}, 1: {"col1": 2}})
+
+    def test_deserialize_applied_version(self):
+        """Test that updates that were already applied are skipped."""
+        serde = DataEditorSerde()
+        value = json.dumps(
+            {"version": 1, "base_version": 0, "edited_rows": {"0": {"col1": 1}}}
+        )
+        state = serde.deserialize(value)
+        self.assertIs(serde.deserialize(value), state)
+
+    def test_deserialize_unknown_base_version(self):
+        """Test that updates based on edits that the server doesn't have are
+        skipped, so that the frontend sends all edits again."""
+        serde = DataEditorSerde()
+        state = serde.deserialize(
+            json.dumps(
+                {"version": 5, "base_version": 3, "edited_rows": {"0": {"col1": 1}}}
+            )
+        )
+        self.assertEqual(state, _empty_state())
+        self.assertEqual(serde.applied_edits.version, 0)
+
+    def test_serialize(self):
+        """Test that serialized values are deserialized to the same edits."""
+        serde = DataEditorSerde()
+        state = serde.deserialize(
+            json.dumps(
+                {"version": 3, "base_version": 0, "edited_rows": {"0": {"col1": 1}}}
+            )
+        )
+
+        other_serde = DataEditorSerde()
+        self.assertEqual(other_serde.deserialize(serde.serialize(state)), state)
+        self.assertEqual(other_serde.applied_edits.version, 3)
+
 
 class DataEditorTest(DeltaGeneratorTestCase):
     def test_just_disabled_true(self):
@@ -644,3 +871,85 @@ class DataEditorTest(DeltaGeneratorTestCase):
 
         # no exception should be raised here
         _check_column_names(df)
+
+    def test_applies_edit_updates(self):
+        """Test that the data editor applies the edits that the frontend sent
+        since the version the server has applied, and sends that version."""
+        df = pd.DataFrame({"col1": [1, 2, 3]})
+        st.data_editor(df)
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual(proto.edits_version, 0)
+
+        def rerun(value: Dict[str, Any]) -> pd.DataFrame:
+            widget_state = WidgetStateProto(id=proto.id, string_value=json.dumps(value))
+            self.script_run_ctx.session_state.on_script_will_rerun(
+                WidgetStatesProto(widgets=[widget_state])
+            )
+            self.script_run_ctx.reset()
+            return st.data_editor(df)
+
+        edited_df = rerun(
+            {"version": 1, "base_version": 0, "edited_rows": {"0": {"col1": 10}}}
+        )
+        self.assertEqual(edited_df["col1"].to_list(), [10, 2, 3])
+        self.assertEqual(
+            self.get_delta_from_queue().new_element.arrow_data_frame.edits_version, 1
+        )
+
+        edited_df = rerun(
+            {"version": 2, "base_version": 1, "edited_rows": {"2": {"col1": 30}}}
+        )
+        self.assertEqual(edited_df["col1"].to_list(), [10, 2, 30])
+        self.assertEqual(
+            self.get_delta_from_queue().new_element.arrow_data_frame.edits_version, 2
+        )
+        # The input data isn't changed.
+        self.assertEqual(df["col1"].to_list(), [1, 2, 3])
+
+    def test_resends_edits_after_server_restart(self):
+        """Test that an update based on edits the server doesn't have, e.g.
+        after a restart, is skipped, and that the frontend's resend of all its
+        edits is applied."""
+        df = pd.DataFrame({"col1": [1, 2, 3]})
+        st.data_editor(df)
+        widget_id = self.get_delta_from_queue().new_element.arrow_data_frame.id
+
+        def rerun(value: Dict[str, Any]) -> pd.DataFrame:
+            widget_state = WidgetStateProto(
+                id=widget_id, string_value=json.dumps(value)
+            )
+            self.script_run_ctx.session_state.on_script_will_rerun(
+                WidgetStatesProto(widgets=[widget_state])
+            )
+            self.script_run_ctx.reset()
+            return st.data_editor(df)
+
+        rerun({"version": 2, "base_version": 0, "edited_rows": {"0": {"col1": 10}}})
+
+        # A restarted server has a new session without the applied edits.
+        self.script_run_ctx.session_state = SafeSessionState(
+            SessionState(), lambda: None
+        )
+        self.script_run_ctx.reset()
+        st.data_editor(df)
+
+        edited_df = rerun(
+            {"version": 3, "base_version": 2, "edited_rows": {"2": {"col1": 30}}}
+        )
+        self.assertEqual(edited_df["col1"].to_list(), [1, 2, 3])
+        self.assertEqual(
+            self.get_delta_from_queue().new_element.arrow_data_frame.edits_version, 0
+        )
+
+        # The frontend gets version 0 back, and sends all of its edits.
+        edited_df = rerun(
+            {
+                "version": 4,
+                "base_version": 0,
+                "edited_rows": {"0": {"col1": 10}, "2": {"col1": 30}},
+            }
+        )
+        self.assertEqual(edited_df["col1"].to_list(), [10, 2, 30])
+        self.assertEqual(
+            self.get_delta_from_queue().new_element.arrow_data_frame.edits_version, 4
+        )
@@ -16,6 +16,7 @@
 
 import io
 import random
+import threading
 from unittest import mock
 
 import cv2
@@ -23,7 +24,7 @@ import numpy as np
 import PIL.Image as Image
 import pytest
 from parameterized import parameterized
-from PIL import ImageDraw
+from PIL import ImageDraw, JpegImagePlugin
 
 import streamlit as st
 import streamlit.elements.image as image
@@ -454,3 +455,115 @@ class ImageProtoTest(DeltaGeneratorTestCase):
             st.image("does/not/exist", width=-1234)
 
         self.assertTrue("Image width must be positive." in str(ctx.exception))
+
+
+class ImageTranscodeTest(DeltaGeneratorTestCase):
+    """Test that st.image transcodes images once, and in parallel."""
+
+    def setUp(self):
+        super().setUp()
+        image._transcode_cache.clear()
+
+    def tearDown(self):
+        image._transcode_cache.clear()
+        super().tearDown()
+
+    def test_transcoded_images_are_cached(self):
+        """Images are only transcoded again if they're shown differently."""
+        data = _PIL_to_bytes(create_image(64, add_alpha=False), format="PNG")
+
+        with mock.patch(
+            "streamlit.elements.image._ensure_image_size_and_format",
+            wraps=image._ensure_image_size_and_format,
+        ) as ensure_mock:
+            st.image(data, width=32)
+            st.image(data, width=32)
+            self.assertEqual(1, ensure_mock.call_count)
+
+            st.image(data, width=16)
+            st.image(data, width=32, output_format="JPEG")
+            self.assertEqual(3, ensure_mock.call_count)
+
+        # Cached images are still added to the MediaFileManager.
+        first = self.get_delta_from_queue(-4).new_element.imgs.imgs[0].url
+        second = self.get_delta_from_queue(-3).new_element.imgs.imgs[0].url
+        self.assertTrue(first.startswith(MEDIA_ENDPOINT))
+        self.assertEqual(first, second)
+
+    def test_np_arrays_are_cached_by_content(self):
+        array = np.array(create_image(32, add_alpha=False))
+
+        with mock.patch(
+            "streamlit.elements.image._np_array_to_bytes",
+            wraps=image._np_array_to_bytes,
+        ) as to_bytes_mock:
+            st.image(array)
+            st.image(array.copy())
+            self.assertEqual(1, to_bytes_mock.call_count)
+
+            array[:8] = 0
+            st.image(array)
+            st.image(array, channels="BGR")
+            self.assertEqual(3, to_bytes_mock.call_count)
+
+    def test_transcode_cache_is_size_bounded(self):
+        data = _PIL_to_bytes(create_image(64, add_alpha=False), format="PNG")
+        small_data = _PIL_to_bytes(create_image(8, add_alpha=False), format="PNG")
+        cache = image.LRUCache(
+            maxsize=len(data) - 1, getsizeof=lambda value: len(value[0])
+        )
+
+        with mock.patch("streamlit.elements.image._transcode_cache", cache):
+            st.image(data, output_format="PNG")
+            self.assertEqual(0, len(cache))
+
+            st.image(small_data, output_format="PNG")
+            self.assertEqual(1, len(cache))
+
+    def test_large_jpegs_are_downscaled_while_decoding(self):
+        data = _PIL_to_bytes(Image.new("RGB", (2000, 1000), "red"), format="JPEG")
+
+        with mock.patch(
+            "PIL.JpegImagePlugin.JpegImageFile.draft",
+            autospec=True,
+            side_effect=JpegImagePlugin.JpegImageFile.draft,
+        ) as draft_mock:
+            resized = image._ensure_image_size_and_format(data, 300, "JPEG")
+
+        draft_mock.assert_called_once_with(mock.ANY, "RGB", (300, 150))
+        self.assertEqual((300, 150), Image.open(io.BytesIO(resized)).size)
+
+    def test_image_list_is_transcoded_in_parallel(self):
+        """Lists of images are transcoded on a thread pool, and still added
+        to the MediaFileManager in order, from the script thread."""
+        colors = ["red", "lime", "blue", "white", "black"]
+        images = [np.array(Image.new("RGB", (8, 8), color)) for color in colors]
+
+        transcoding_threads = set()
+        transcode_np_array = image._transcode_np_array
+
+        def record_thread(*args, **kwargs):
+            transcoding_threads.add(threading.current_thread().name)
+            return transcode_np_array(*args, **kwargs)
+
+        with mock.patch(
+            "streamlit.elements.image._transcode_np_array", side_effect=record_thread
+        ), mock.patch(
+            "streamlit.runtime.media_file_manager.MediaFileManager.add",
+            return_value="https://mockoutputurl.com",
+        ) as add_mock:
+            st.image(images, caption=colors, output_format="PNG")
+
+        self.assertTrue(
+            all(name.startswith("ImageTranscoder") for name in transcoding_threads)
+        )
+        self.assertEqual(
+            [f"{i}" for i in range(len(colors))],
+            [call.args[2].rsplit("-", 1)[1] for call in add_mock.call_args_list],
+        )
+        for color, call in zip(colors, add_mock.call_args_list):
+            added_image = Image.open(io.BytesIO(call.args[0]))
+            self.assertEqual(
+                Image.new("RGB", (1, 1), color).getpixel((0, 0)),
+                added_image.getpixel((0, 0)),
+            )
@@ -0,0 +1,115 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from parameterized import parameterized
+
+from streamlit.elements.lib.downsampling import (
+    downsample_series,
+    lttb_indices,
+    minmax_indices,
+)
+
+
+class DownsamplingTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = np.arange(10_000, dtype=float)
+        self.y = rng.normal(size=10_000)
+
+    def test_lttb_indices(self):
+        indices = lttb_indices(self.x, self.y, 100)
+
+        self.assertLessEqual(len(indices), 100 + 4)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertEqual([0, 9999], [indices[0], indices[-1]])
+        self.assertIn(np.argmin(self.y), indices)
+        self.assertIn(np.argmax(self.y), indices)
+
+    def test_lttb_picks_spikes(self):
+        y = np.zeros(1000)
+        y[500] = 1
+        self.assertIn(500, lttb_indices(np.arange(1000.0), y, 10))
+
+    def test_minmax_indices(self):
+        indices = minmax_indices(self.y, 100)
+
+        self.assertLessEqual(len(indices), 2 * 100 + 2)
+        self.assertEqual([0, 9999], [indices[0], indices[-1]])
+        # Every bucket keeps its smallest and largest value.
+        buckets = self.y.reshape(100, 100)
+        np.testing.assert_array_equal(
+            np.sort(np.concatenate([buckets.min(axis=1), buckets.max(axis=1)])),
+            np.sort(self.y[indices][1:-1]),
+        )
+
+    @parameterized.expand([("lttb",), ("minmax",)])
+    def test_short_series_are_kept(self, method: str):
+        x = pd.Series(np.arange(10))
+        np.testing.assert_array_equal(
+            np.arange(10), downsample_series(x, x, method, 100)
+        )
+
+    @parameterized.expand([("lttb",), ("minmax",)])
+    def test_downsample_series(self, method: str):
+        """Points are picked in the order of x, and returned in their
+        original order."""
+        rng = np.random.default_rng(1)
+        x = pd.Series(pd.date_range("2020-01-01", periods=10_000, freq="s"))
+        y = pd.Series(self.y)
+        shuffled = rng.permutation(10_000)
+
+        positions = downsample_series(x[shuffled], y[shuffled], method, 100)
+
+        self.assertTrue(np.all(np.diff(positions) > 0))
+        picked = shuffled[positions]
+        self.assertIn(0, picked)
+        self.assertIn(9999, picked)
+        self.assertIn(y.idxmin(), picked)
+        self.assertIn(y.idxmax(), picked)
+
+    @parameterized.expand([("lttb",), ("minmax",)])
+    def test_gaps_are_kept(self, method: str):
+        """The first missing point of each gap, and the points around it, are
+        kept, so that the line still breaks there."""
+        y = pd.Series(self.y)
+        y[[0, 1, 1234, 5000, 5001, 5002, 9999]] = np.nan
+        x = pd.Series(self.x)
+        x[7000] = np.nan
+
+        positions = downsample_series(x, y, method, 100)
+
+        for gap_bounds in [
+            [0, 2],
+            [1233, 1234, 1235],
+            [4999, 5000, 5003],
+            [9998, 9999],
+        ]:
+            for position in gap_bounds:
+                self.assertIn(position, positions)
+        for position in [1, 5001, 5002]:
+            self.assertNotIn(position, positions)
+        # Points without an x are left as they are.
+        self.assertIn(7000, positions)
+        self.assertLess(len(positions), 2 * 100 + 20)
+
+    def test_non_numeric_series_are_kept(self):
+        y = pd.Series(["a"] * 1000)
+        np.testing.assert_array_equal(
+            np.arange(1000), downsample_series(pd.Series(range(1000)), y, "lttb", 10)
+        )
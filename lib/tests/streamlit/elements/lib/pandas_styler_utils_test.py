@@ -0,0 +1,107 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import pandas as pd
+
+from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+from streamlit.type_util import bytes_to_data_frame
+
+
+def _marshall(styler) -> ArrowProto:
+    proto = ArrowProto()
+    marshall_styler(proto, styler.set_uuid("FAKE_UUID"), "default_uuid")
+    return proto
+
+
+class PandasStylerUtilsTest(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "float": [1.5, -2.25, 3.0],
+                "int": [1, 2, 3],
+                "date": pd.date_range("2020-01-01", periods=3),
+            }
+        )
+
+    def test_display_values(self):
+        """Formatters apply to their subset, and other cells use the
+        default formatter."""
+        styler = self.df.style.format("{:.1%}", subset=(1, "float"))
+        display_values = bytes_to_data_frame(_marshall(styler).styler.display_values)
+
+        expected = pd.DataFrame(
+            {
+                "float": ["1.500000", "-225.0%", "3.000000"],
+                "int": ["1", "2", "3"],
+                "date": [
+                    "2020-01-01 00:00:00",
+                    "2020-01-02 00:00:00",
+                    "2020-01-03 00:00:00",
+                ],
+            }
+        )
+        pd.testing.assert_frame_equal(expected, display_values)
+
+    def test_hidden_rows_are_not_formatted(self):
+        styler = self.df.style.format(precision=1).hide([1])
+        display_values = bytes_to_data_frame(_marshall(styler).styler.display_values)
+        self.assertEqual(["1.5", "-2.25", "3.0"], list(display_values["float"]))
+
+    def test_trimmed_cells_are_not_formatted(self):
+        styler = self.df.style.format(precision=1)
+        with pd.option_context(
+            "styler.render.max_rows", 2, "styler.render.max_columns", 1
+        ):
+            display_values = bytes_to_data_frame(
+                _marshall(styler).styler.display_values
+            )
+        self.assertEqual(["1.5", "-2.2", "3.0"], list(display_values["float"]))
+        self.assertEqual(["1", "2", "3"], list(display_values["int"]))
+
+    def test_identical_styles_share_a_rule(self):
+        styler = self.df.style.map(
+            lambda v: "color: red" if v < 0 else "color:  green ;", subset=["float"]
+        )
+        self.assertEqual(
+            "#T_FAKE_UUIDrow0_col0, #T_FAKE_UUIDrow2_col0 { color: green }\n"
+            "#T_FAKE_UUIDrow1_col0 { color: red }",
+            _marshall(styler).styler.styles,
+        )
+
+    def test_hidden_cells_are_not_styled(self):
+        styler = (
+            self.df.style.map(lambda _: "color: red")
+            .hide([0])
+            .hide(["int", "date"], axis=1)
+        )
+        self.assertEqual(
+            "#T_FAKE_UUIDrow1_col0, #T_FAKE_UUIDrow2_col0 { color: red }",
+            _marshall(styler).styler.styles,
+        )
+
+    def test_table_styles(self):
+        styler = self.df.style.set_table_styles(
+            [
+                {"selector": "td, th", "props": "color: red"},
+                {"selector": "", "props": [("", "")]},
+            ]
+        )
+        self.assertEqual(
+            "#T_FAKE_UUID td { color: red }\n#T_FAKE_UUID  th { color: red }",
+            _marshall(styler).styler.styles,
+        )
@@ -24,6 +24,7 @@ from parameterized import parameterized
 import streamlit as st
 from streamlit.elements.map import _DEFAULT_MAP, _DEFAULT_ZOOM_LEVEL
 from streamlit.errors import StreamlitAPIException
+from streamlit.type_util import bytes_to_data_frame
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit import pyspark_mocks
 from tests.streamlit.snowpark_mocks import DataFrame as MockedSnowparkDataFrame
@@ -36,6 +37,11 @@ df1 = pd.DataFrame({"lat": [1, 2, 3, 4], "lon": [10, 20, 30, 40]})
 class StMapTest(DeltaGeneratorTestCase):
     """Test ability to marshall deck_gl_json_chart protos via st.map."""
 
+    def _get_layer_data(self) -> pd.DataFrame:
+        """Returns the data of the map's layer, which is sent as Arrow."""
+        (dataset,) = self.get_delta_from_queue().new_element.deck_gl_json_chart.datasets
+        return bytes_to_data_frame(dataset.data.data)
+
     def test_no_args(self):
         """Test that it can be called with no args."""
         st.map()
@@ -59,6 +65,12 @@ class StMapTest(DeltaGeneratorTestCase):
         self.assertEqual(c.get("initialViewState").get("pitch"), 0)
         self.assertEqual(c.get("layers")[0].get("@@type"), "ScatterplotLayer")
 
+        # The data is sent as Arrow instead of inside the json.
+        self.assertNotIn("data", c.get("layers")[0])
+        (dataset,) = self.get_delta_from_queue().new_element.deck_gl_json_chart.datasets
+        self.assertEqual(c.get("layers")[0].get("id"), dataset.name)
+        pd.testing.assert_frame_equal(self._get_layer_data(), df1.astype(float))
+
     @parameterized.expand(
         itertools.product(
             {"lat", "latitude", "LAT", "LATITUDE"},
@@ -68,10 +80,9 @@ class StMapTest(DeltaGeneratorTestCase):
     def test_alternative_names_columns(self, lat_column_name, lon_column_name):
         """Test that it can be called with alternative names of lat/lon columns."""
         df = df1.rename(columns={"lat": lat_column_name, "lon": lon_column_name})
-        st.map(df1)
+        st.map(df)
 
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")), 4)
+        self.assertEqual(len(self._get_layer_data()), 4)
 
     def test_main_kwargs(self):
         """Test that latitude, longitude, color and size propagate correctly."""
@@ -160,14 +171,10 @@ class StMapTest(DeltaGeneratorTestCase):
 
             else:
                 st.map(df, color=color_column)
-                c = json.loads(
-                    self.get_delta_from_queue().new_element.deck_gl_json_chart.json
-                )
-
-                rows = c.get("layers")[0].get("data")
+                colors = self._get_layer_data()[color_column]
 
-                for i, row in enumerate(rows):
-                    self.assertEqual(row[color_column], expected_color_values[i])
+                for i, color in enumerate(colors):
+                    self.assertEqual(list(color), expected_color_values[i])
 
     def test_unused_columns_get_dropped(self):
         """Test that unused columns don't get transmitted."""
@@ -183,24 +190,19 @@ class StMapTest(DeltaGeneratorTestCase):
         )
 
         st.map(df)
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")[0]), 2)
+        self.assertEqual(len(self._get_layer_data().columns), 2)
 
         st.map(df, latitude="xlat", longitude="xlon")
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")[0]), 2)
+        self.assertEqual(len(self._get_layer_data().columns), 2)
 
         st.map(df, latitude="xlat", longitude="xlon", color="int_color")
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")[0]), 3)
+        self.assertEqual(len(self._get_layer_data().columns), 3)
 
         st.map(df, latitude="xlat", longitude="xlon", size="size")
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")[0]), 3)
+        self.assertEqual(len(self._get_layer_data().columns), 3)
 
         st.map(df, latitude="xlat", longitude="xlon", color="int_color", size="size")
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")[0]), 4)
+        self.assertEqual(len(self._get_layer_data().columns), 4)
 
     def test_original_df_is_untouched(self):
         """Test that when we modify the outgoing DF we don't mutate the input DF."""
@@ -213,8 +215,7 @@ class StMapTest(DeltaGeneratorTestCase):
         )
 
         st.map(df)
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-        self.assertEqual(len(c.get("layers")[0].get("data")[0]), 2)
+        self.assertEqual(len(self._get_layer_data().columns), 2)
         self.assertEqual(len(df.columns), 3)
 
     # This test was turned off while we investigate issues with the feature.
@@ -305,7 +306,7 @@ class StMapTest(DeltaGeneratorTestCase):
         self.assertEqual(c.get("layers")[0].get("@@type"), "ScatterplotLayer")
 
         """Check if map data was cut to 10k rows"""
-        self.assertEqual(len(c["layers"][0]["data"]), 10000)
+        self.assertEqual(len(self._get_layer_data()), 10000)
 
     @pytest.mark.require_snowflake
     def test_unevaluated_snowpark_table_integration(self):
@@ -321,10 +322,8 @@ class StMapTest(DeltaGeneratorTestCase):
             ).cache_result()
             st.map(table)
 
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-
         """Check if map data have 4 rows"""
-        self.assertEqual(len(c["layers"][0]["data"]), 4)
+        self.assertEqual(len(self._get_layer_data()), 4)
 
     def test_unevaluated_snowpark_dataframe_mock(self):
         """Test st.map with unevaluated Snowpark DataFrame based on mock data"""
@@ -343,7 +342,7 @@ class StMapTest(DeltaGeneratorTestCase):
         self.assertEqual(c.get("layers")[0].get("@@type"), "ScatterplotLayer")
 
         """Check if map data was cut to 10k rows"""
-        self.assertEqual(len(c["layers"][0]["data"]), 10000)
+        self.assertEqual(len(self._get_layer_data()), 10000)
 
     @pytest.mark.require_snowflake
     def test_unevaluated_snowpark_dataframe_integration(self):
@@ -359,10 +358,8 @@ class StMapTest(DeltaGeneratorTestCase):
             )
             st.map(df)
 
-        c = json.loads(self.get_delta_from_queue().new_element.deck_gl_json_chart.json)
-
         """Check if map data have 4 rows"""
-        self.assertEqual(len(c["layers"][0]["data"]), 4)
+        self.assertEqual(len(self._get_layer_data()), 4)
 
     def test_pyspark_dataframe(self):
         """Test st.map with pyspark.sql.DataFrame"""
@@ -381,7 +378,7 @@ class StMapTest(DeltaGeneratorTestCase):
         self.assertEqual(c.get("layers")[0].get("@@type"), "ScatterplotLayer")
 
         """Check if map data has 5 rows"""
-        self.assertEqual(len(c["layers"][0]["data"]), 5)
+        self.assertEqual(len(self._get_layer_data()), 5)
 
     def test_id_changes_when_data_changes(self):
         st.map()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import json
 from unittest import mock
 
@@ -20,6 +21,7 @@ import pydeck as pdk
 
 import streamlit as st
 import streamlit.elements.deck_gl_json_chart as deck_gl_json_chart
+from streamlit.type_util import bytes_to_data_frame
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 
 df1 = pd.DataFrame({"lat": [1, 2, 3, 4], "lon": [10, 20, 30, 40]})
@@ -41,16 +43,89 @@ class PyDeckTest(DeltaGeneratorTestCase):
         actual = json.loads(el.deck_gl_json_chart.json)
 
         self.assertEqual(actual["layers"][0]["@@type"], "ScatterplotLayer")
+        self.assertNotIn("data", actual["layers"][0])
+        self.assertEqual(el.deck_gl_json_chart.tooltip, "")
+
+        # The layer's data is sent as Arrow, with integers as floats.
+        (dataset,) = el.deck_gl_json_chart.datasets
+        self.assertEqual(actual["layers"][0]["id"], dataset.name)
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(dataset.data.data), df1.astype(float)
+        )
+
+    def test_deck_is_untouched(self):
+        """Test that the layers' data isn't removed from the given deck."""
+        deck = pdk.Deck(layers=[pdk.Layer("ScatterplotLayer", data=df1)])
+        st.pydeck_chart(deck)
+
+        self.assertEqual(4, len(deck.layers[0].data))
+        self.assertIn('"data"', deck.to_json())
+
+    def test_data_that_stays_in_json(self):
+        """Test that data that can't be sent as Arrow is kept in the json."""
+        records = [
+            # Records with different keys.
+            [{"lat": 1, "lon": 10}, {"lat": 2, "lon": 20, "size": 3}],
+            # Nested objects.
+            [{"position": {"lat": 1, "lon": 10}}],
+        ]
+        st.pydeck_chart(
+            pdk.Deck(
+                layers=[pdk.Layer("ScatterplotLayer", data=data) for data in records]
+                + [pdk.Layer("ScatterplotLayer", data="https://example.com/data.json")]
+            )
+        )
+
+        el = self.get_delta_from_queue().new_element
+        actual = json.loads(el.deck_gl_json_chart.json)
+
         self.assertEqual(
-            actual["layers"][0]["data"],
-            [
-                {"lat": 1, "lon": 10},
-                {"lat": 2, "lon": 20},
-                {"lat": 3, "lon": 30},
-                {"lat": 4, "lon": 40},
-            ],
+            records + ["https://example.com/data.json"],
+            [layer["data"] for layer in actual["layers"]],
         )
-        self.assertEqual(el.deck_gl_json_chart.tooltip, "")
+        self.assertEqual(0, len(el.deck_gl_json_chart.datasets))
+
+    def test_binary_transport(self):
+        """Test that layers with binary data read it from Arrow columns."""
+        df = pd.DataFrame(
+            {"position": [[1.0, 10.0], [2.0, 20.0]], "radius": [5.0, 6.0]}
+        )
+        st.pydeck_chart(
+            pdk.Deck(
+                layers=[
+                    pdk.Layer(
+                        "ScatterplotLayer",
+                        data=df,
+                        get_position="position",
+                        get_radius="radius",
+                        use_binary_transport=True,
+                    )
+                ]
+            )
+        )
+
+        el = self.get_delta_from_queue().new_element
+        layer = json.loads(el.deck_gl_json_chart.json)["layers"][0]
+        self.assertEqual("@@=position", layer["getPosition"])
+        self.assertEqual("@@=radius", layer["getRadius"])
+
+        (dataset,) = el.deck_gl_json_chart.datasets
+        data = bytes_to_data_frame(dataset.data.data)
+        self.assertEqual([2.0, 20.0], list(data["position"][1]))
+        self.assertEqual([5.0, 6.0], list(data["radius"]))
+
+    def test_id_changes_when_data_changes(self):
+        """Test that the id covers the data that is sent as Arrow."""
+        ids = []
+        for lat in [1, 2]:
+            st.pydeck_chart(
+                pdk.Deck(
+                    layers=[pdk.Layer("ScatterplotLayer", id="layer", data=df1 * lat)]
+                )
+            )
+            ids.append(self.get_delta_from_queue().new_element.deck_gl_json_chart.id)
+
+        self.assertNotEqual(ids[0], ids[1])
 
     def test_with_tooltip(self):
         """Test that pydeck object with tooltip works."""
@@ -122,3 +197,8 @@ class PyDeckTest(DeltaGeneratorTestCase):
         actual = json.loads(el.deck_gl_json_chart.json)
 
         self.assertEqual(actual, deck_gl_json_chart.EMPTY_MAP)
+        # Empty maps are given an id like all other maps, rather than "".
+        self.assertEqual(
+            hashlib.md5(el.deck_gl_json_chart.json.encode("utf-8")).hexdigest(),
+            el.deck_gl_json_chart.id,
+        )
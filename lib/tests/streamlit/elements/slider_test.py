@@ -52,6 +52,16 @@ class SliderTest(DeltaGeneratorTestCase):
         c = self.get_delta_from_queue().new_element.slider
         self.assertEqual(c.disabled, True)
 
+    def test_debounce(self):
+        """The slider's debounce delay is kept with its widget metadata, and
+        doesn't change its ID."""
+        st.slider("the label", key="slider", debounce=0.5)
+
+        c = self.get_delta_from_queue().new_element.slider
+        session_state = self.script_run_ctx.session_state._state
+        self.assertEqual(0.5, session_state.get_widget_debounce(c.id))
+        self.assertIsNone(session_state.get_widget_debounce("other_id"))
+
     PST = timezone(timedelta(hours=-8), "PST")
     AWARE_DT = datetime(2020, 1, 1, tzinfo=PST)
     AWARE_DT_END = datetime(2020, 1, 5, tzinfo=PST)
@@ -17,7 +17,7 @@ import gc
 import threading
 import unittest
 from asyncio import AbstractEventLoop
-from typing import Any, Callable, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, cast
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, patch
 
@@ -27,6 +27,7 @@ import streamlit.runtime.app_session as app_session
 from streamlit import config
 from streamlit.proto.AppPage_pb2 import AppPage
 from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ClientState_pb2 import ClientState
 from streamlit.proto.Common_pb2 import FileURLs, FileURLsRequest, FileURLsResponse
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime
@@ -785,6 +786,117 @@ class AppSessionScriptEventTest(IsolatedAsyncioTestCase):
         self.assertEqual(session._debug_last_backmsg_id, "some backmsg")
 
 
+def _rerun_msg(**widget_values: Any) -> BackMsg:
+    """Create a rerun_script BackMsg with the given widget values. Booleans
+    are button presses."""
+    client_state = ClientState()
+    for widget_id, value in widget_values.items():
+        widget_state = client_state.widget_states.widgets.add(id=widget_id)
+        if isinstance(value, bool):
+            widget_state.trigger_value = value
+        else:
+            widget_state.double_value = value
+    return BackMsg(rerun_script=client_state)
+
+
+def _get_widget_values(client_state: ClientState) -> Dict[str, Any]:
+    return {
+        widget_state.id: getattr(widget_state, widget_state.WhichOneof("value"))
+        for widget_state in client_state.widget_states.widgets
+    }
+
+
+class AppSessionRerunDebounceTest(IsolatedAsyncioTestCase):
+    """Tests for the debouncing of rerun requests."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.session = _create_test_session(asyncio.get_running_loop())
+        patcher = patch.object(self.session, "request_rerun")
+        self.request_rerun = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_rerun_widget_values(self) -> List[Dict[str, Any]]:
+        return [
+            _get_widget_values(client_state)
+            for (client_state,), _ in self.request_rerun.call_args_list
+        ]
+
+    async def test_burst_is_coalesced(self):
+        """The first request of a burst reruns immediately, and the rest are
+        coalesced into one rerun with the latest widget values."""
+        with patch_config_options({"runner.rerunDebounceDelay": 0.05}):
+            num_coalesced = app_session._COALESCED_RERUN_REQUESTS.get_value()
+
+            for value in [1, 2, 3]:
+                self.session.handle_backmsg(_rerun_msg(slider=value))
+            self.assertEqual([{"slider": 1}], self._get_rerun_widget_values())
+
+            await asyncio.sleep(0.1)
+            self.assertEqual(
+                [{"slider": 1}, {"slider": 3}], self._get_rerun_widget_values()
+            )
+            self.assertEqual(
+                num_coalesced + 1, app_session._COALESCED_RERUN_REQUESTS.get_value()
+            )
+
+    async def test_button_presses_are_not_held(self):
+        """Button presses rerun immediately, and aren't lost when they're
+        coalesced with a held request."""
+        with patch_config_options({"runner.rerunDebounceDelay": 0.05}):
+            self.session.handle_backmsg(_rerun_msg(slider=1, button=False))
+            self.session.handle_backmsg(_rerun_msg(slider=2, button=False))
+            self.session.handle_backmsg(_rerun_msg(slider=2, button=True))
+            self.assertEqual(
+                [{"slider": 1, "button": False}, {"slider": 2, "button": True}],
+                self._get_rerun_widget_values(),
+            )
+
+            # A press that's sent with a new slider value isn't held either,
+            # but the slider's next value is.
+            self.session.handle_backmsg(_rerun_msg(slider=3, button=True))
+            self.session.handle_backmsg(_rerun_msg(slider=4, button=False))
+            self.assertEqual(
+                {"slider": 3, "button": True}, self._get_rerun_widget_values()[-1]
+            )
+            self.assertEqual(3, self.request_rerun.call_count)
+
+            await asyncio.sleep(0.1)
+            self.assertEqual(
+                {"slider": 4, "button": False}, self._get_rerun_widget_values()[-1]
+            )
+
+    async def test_unchanged_widgets_are_not_held(self):
+        with patch_config_options({"runner.rerunDebounceDelay": 0.05}):
+            self.session.handle_backmsg(_rerun_msg(slider=1))
+            self.session.handle_backmsg(_rerun_msg(slider=1))
+            self.assertEqual(2, self.request_rerun.call_count)
+
+    async def test_widget_debounce(self):
+        """Widgets can set their own debounce delay."""
+        with patch.object(
+            self.session._session_state,
+            "get_widget_debounce",
+            side_effect=lambda widget_id: 0.05 if widget_id == "slider" else None,
+        ):
+            self.session.handle_backmsg(_rerun_msg(slider=1, other=1))
+            self.session.handle_backmsg(_rerun_msg(slider=1, other=2))
+            self.session.handle_backmsg(_rerun_msg(slider=2, other=2))
+            self.assertEqual(2, self.request_rerun.call_count)
+
+            await asyncio.sleep(0.1)
+            self.assertEqual(3, self.request_rerun.call_count)
+
+    async def test_stop_drops_held_rerun(self):
+        with patch_config_options({"runner.rerunDebounceDelay": 0.05}):
+            self.session.handle_backmsg(_rerun_msg(slider=1))
+            self.session.handle_backmsg(_rerun_msg(slider=2))
+            self.session.handle_backmsg(BackMsg(stop_script=True))
+
+            await asyncio.sleep(0.1)
+            self.request_rerun.assert_called_once()
+
+
 class PopulateCustomThemeMsgTest(unittest.TestCase):
     @patch("streamlit.runtime.app_session.config")
     def test_no_custom_theme_prop_if_no_theme(self, patched_config):
@@ -33,7 +33,12 @@ from streamlit.runtime.caching import (
 )
 from streamlit.runtime.caching.cache_errors import CacheReplayClosureError
 from streamlit.runtime.caching.cache_type import CacheType
-from streamlit.runtime.caching.cache_utils import CachedResult
+from streamlit.runtime.caching.cache_utils import (
+    _CACHED_FUNC_COMPUTE_DURATION,
+    _CACHED_FUNC_HITS,
+    _CACHED_FUNC_MISSES,
+    CachedResult,
+)
 from streamlit.runtime.caching.cached_message_replay import (
     MultiCacheResults,
     _make_widget_key,
@@ -113,6 +118,34 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         self.assertEqual(foo(), 42)
         self.assertEqual(foo(), 42)
 
+    @parameterized.expand(
+        [
+            ("cache_data", cache_data, "st_cache_data"),
+            ("cache_resource", cache_resource, "st_cache_resource"),
+        ]
+    )
+    def test_metrics(self, _, cache_decorator, cache_type):
+        """Hits, misses and compute times are recorded per function."""
+
+        @cache_decorator
+        def metrics_func(x):
+            return x
+
+        labels = (cache_type, f"{__name__}.{metrics_func.__qualname__}")
+        num_hits = _CACHED_FUNC_HITS.get_value(*labels)
+        num_misses = _CACHED_FUNC_MISSES.get_value(*labels)
+        num_computes = _CACHED_FUNC_COMPUTE_DURATION.get_count(*labels)
+
+        metrics_func(1)
+        metrics_func(1)
+        metrics_func(2)
+
+        self.assertEqual(num_hits + 1, _CACHED_FUNC_HITS.get_value(*labels))
+        self.assertEqual(num_misses + 2, _CACHED_FUNC_MISSES.get_value(*labels))
+        self.assertEqual(
+            num_computes + 2, _CACHED_FUNC_COMPUTE_DURATION.get_count(*labels)
+        )
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
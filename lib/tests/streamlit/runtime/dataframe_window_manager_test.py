@@ -0,0 +1,172 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for DataframeWindowManager."""
+
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+
+from streamlit.runtime.dataframe_window_manager import (
+    MAX_PAGE_ROWS,
+    DataframeWindowManager,
+    DataframeWindowNotFoundError,
+    materialize_range_index,
+)
+from streamlit.type_util import bytes_to_data_frame
+
+
+def _window_id(url: str) -> str:
+    return url.rsplit("/", 1)[1]
+
+
+@mock.patch(
+    "streamlit.runtime.dataframe_window_manager._get_session_id",
+    mock.MagicMock(return_value="mock_session"),
+)
+class DataframeWindowManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.mgr = DataframeWindowManager("/mock/dataframe")
+        self.df = pd.DataFrame(
+            {
+                "num": [3, 1, 4, 1, 5, 9, 2, 6],
+                "name": ["c", "a", "D", None, "e", "dd", "b", "f"],
+            }
+        )
+        table = materialize_range_index(pa.Table.from_pandas(self.df))
+        self.window_id = _window_id(
+            self.mgr.add(table, "coords", session_id="mock_session")
+        )
+
+    def _get_page(self, *args, **kwargs) -> pd.DataFrame:
+        page = self.mgr.get_page(self.window_id, *args, **kwargs)
+        return bytes_to_data_frame(page.data)
+
+    def test_add_returns_url(self):
+        url = self.mgr.add(pa.table({"a": [1]}), "coords2")
+        self.assertTrue(url.startswith("/mock/dataframe/"))
+
+    def test_get_page(self):
+        page = self.mgr.get_page(self.window_id, 2, 3)
+        self.assertEqual(8, page.num_rows)
+        pd.testing.assert_frame_equal(self.df.iloc[2:5], bytes_to_data_frame(page.data))
+
+    def test_get_page_past_end(self):
+        pd.testing.assert_frame_equal(self.df.iloc[6:], self._get_page(6, 10))
+
+    def test_get_page_sorted(self):
+        pd.testing.assert_frame_equal(
+            self.df.sort_values("num", kind="stable").iloc[:3],
+            self._get_page(0, 3, sort_column="num"),
+        )
+        self.assertEqual(
+            [9, 6, 5],
+            list(self._get_page(0, 3, sort_column="num", ascending=False)["num"]),
+        )
+
+    def test_get_page_filtered(self):
+        """Filtering matches substrings, ignores case and skips nulls."""
+        page = self.mgr.get_page(
+            self.window_id, 0, 10, filter_column="name", filter_value="d"
+        )
+        self.assertEqual(2, page.num_rows)
+        pd.testing.assert_frame_equal(
+            self.df.iloc[[2, 5]], bytes_to_data_frame(page.data)
+        )
+
+    def test_get_page_filtered_non_string_column(self):
+        self.assertEqual(
+            [1, 1],
+            list(self._get_page(0, 10, filter_column="num", filter_value="1")["num"]),
+        )
+
+    def test_get_page_filtered_and_sorted(self):
+        df = self._get_page(
+            0,
+            10,
+            sort_column="num",
+            ascending=False,
+            filter_column="name",
+            filter_value="d",
+        )
+        pd.testing.assert_frame_equal(self.df.iloc[[5, 2]], df)
+
+    def test_get_page_limit_is_capped(self):
+        table = pa.table({"a": range(MAX_PAGE_ROWS + 1)})
+        window_id = _window_id(self.mgr.add(table, "big"))
+        page = self.mgr.get_page(window_id, 0, MAX_PAGE_ROWS + 1)
+        self.assertEqual(MAX_PAGE_ROWS, len(bytes_to_data_frame(page.data)))
+
+    def test_get_page_errors(self):
+        with self.assertRaises(DataframeWindowNotFoundError):
+            self.mgr.get_page("nonexistent", 0, 1)
+        with self.assertRaises(KeyError):
+            self.mgr.get_page(self.window_id, 0, 1, sort_column="nonexistent")
+        with self.assertRaises(ValueError):
+            self.mgr.get_page(self.window_id, -1, 1)
+
+    def test_remove_orphaned_windows(self):
+        """Windows are removed once no session references them."""
+        self.mgr.add(pa.table({"a": [1]}), "coords", session_id="other_session")
+        self.assertEqual(2, len(self.mgr._windows))
+
+        # Replacing the window at the same coordinates orphans the old one.
+        new_window_id = _window_id(self.mgr.add(pa.table({"a": [1]}), "coords"))
+        self.mgr.remove_orphaned_windows()
+        self.assertEqual(2, len(self.mgr._windows))
+        with self.assertRaises(DataframeWindowNotFoundError):
+            self.mgr.get_page(self.window_id, 0, 1)
+
+        self.mgr.clear_session_refs()
+        self.mgr.remove_orphaned_windows()
+        self.assertEqual(1, len(self.mgr._windows))
+        with self.assertRaises(DataframeWindowNotFoundError):
+            self.mgr.get_page(new_window_id, 0, 1)
+
+        self.mgr.clear_session_refs("other_session")
+        self.mgr.remove_orphaned_windows()
+        self.assertEqual({}, self.mgr._windows)
+
+    def test_get_stats(self):
+        stats = self.mgr.get_stats()
+        self.assertEqual(1, len(stats))
+        self.assertEqual("st_dataframe_windows", stats[0].category_name)
+        self.assertGreater(stats[0].byte_length, 0)
+
+
+class MaterializeRangeIndexTest(unittest.TestCase):
+    def test_range_index(self):
+        df = pd.DataFrame({"a": [1, 2, 3]}, index=pd.RangeIndex(10, 16, 2))
+        table = materialize_range_index(pa.Table.from_pandas(df))
+
+        self.assertEqual(
+            ["__index_level_0__"], table.schema.pandas_metadata["index_columns"]
+        )
+        # Slices keep their original row labels.
+        pd.testing.assert_frame_equal(
+            df.iloc[1:],
+            table.slice(1).to_pandas(),
+            check_index_type=False,
+        )
+
+    def test_other_indexes_are_unchanged(self):
+        df = pd.DataFrame({"a": [1, 2]}, index=["x", "y"])
+        table = pa.Table.from_pandas(df)
+        self.assertIs(table, materialize_range_index(table))
+
+        table = pa.table({"a": [1, 2]})
+        self.assertIs(table, materialize_range_index(table))
@@ -0,0 +1,265 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for DiskMediaFileStorage"""
+
+import gzip
+import os
+import tempfile
+import unittest
+from unittest import mock
+from unittest.mock import MagicMock
+
+from parameterized import parameterized
+
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
+from streamlit.runtime.memory_media_file_storage import (
+    CONTENT_CHUNK_SIZE,
+    MemoryMediaFileStorage,
+)
+
+
+def _read(content) -> bytes:
+    if isinstance(content, bytes):
+        return content
+    return b"".join(content)
+
+
+class DiskMediaFileStorageTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = DiskMediaFileStorage(
+            media_endpoint="/mock/media", directory=self.temp_dir.name
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _load(self, data: bytes, **kwargs) -> str:
+        return self.storage.load_and_get_id(
+            data, mimetype="video/mp4", kind=MediaFileKind.MEDIA, **kwargs
+        )
+
+    def test_load_with_bytes(self):
+        """Adding a file with bytes writes it to the storage's directory."""
+        file_id = self._load(b"mock_bytes", filename="file.mp4")
+
+        media_file = self.storage.get_file(file_id)
+        self.assertEqual(os.path.join(self.storage.directory, file_id), media_file.path)
+        self.assertEqual("video/mp4", media_file.mimetype)
+        self.assertEqual(MediaFileKind.MEDIA, media_file.kind)
+        self.assertEqual("file.mp4", media_file.filename)
+        self.assertEqual(len(b"mock_bytes"), media_file.content_size)
+        with open(media_file.path, "rb") as f:
+            self.assertEqual(b"mock_bytes", f.read())
+
+        # Only the stored file is left in the directory.
+        self.assertEqual([file_id], os.listdir(self.storage.directory))
+
+    def test_load_with_path(self):
+        """Adding a file by path copies it, and gives it the same ID as
+        adding its content would."""
+        data = os.urandom(3 * CONTENT_CHUNK_SIZE + 1)
+        path = os.path.join(self.temp_dir.name, "source.mp4")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        file_id = self.storage.load_and_get_id(
+            path, mimetype="video/mp4", kind=MediaFileKind.MEDIA, filename="file.mp4"
+        )
+
+        self.assertEqual(file_id, self._load(data, filename="file.mp4"))
+        self.assertEqual(
+            file_id,
+            MemoryMediaFileStorage("/mock/media").load_and_get_id(
+                data,
+                mimetype="video/mp4",
+                kind=MediaFileKind.MEDIA,
+                filename="file.mp4",
+            ),
+        )
+        self.assertEqual(data, _read(self.storage.get_content(file_id)))
+
+    def test_load_with_bad_path(self):
+        """Adding a file by path raises a MediaFileStorageError if the file
+        can't be read, and leaves nothing behind."""
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.load_and_get_id(
+                "mock/file/path", mimetype="video/mp4", kind=MediaFileKind.MEDIA
+            )
+        self.assertEqual([], os.listdir(self.storage.directory))
+
+    def test_identical_files_are_stored_once(self):
+        file_id1 = self._load(b"mock_bytes")
+        file_id2 = self._load(b"mock_bytes")
+        self.assertEqual(file_id1, file_id2)
+        self.assertNotEqual(file_id1, self._load(b"mock_bytes_2"))
+        self.assertEqual(2, len(os.listdir(self.storage.directory)))
+
+    @parameterized.expand(
+        [
+            (None, None),
+            (0, 10),
+            (5, None),
+            (None, 5),
+            (CONTENT_CHUNK_SIZE - 1, 2 * CONTENT_CHUNK_SIZE + 3),
+        ]
+    )
+    def test_get_content(self, start, end):
+        """Whole files and parts of them are read from the mapped file."""
+        data = os.urandom(3 * CONTENT_CHUNK_SIZE)
+        file_id = self._load(data)
+
+        content = self.storage.get_content(f"{file_id}.mp4", start, end)
+
+        self.assertNotIsInstance(content, bytes)
+        chunks = list(content)
+        self.assertTrue(all(len(chunk) <= CONTENT_CHUNK_SIZE for chunk in chunks))
+        self.assertEqual(data[start:end], b"".join(chunks))
+
+    def test_get_content_of_empty_file(self):
+        file_id = self._load(b"")
+        self.assertEqual(b"", _read(self.storage.get_content(file_id)))
+
+    def test_get_content_invalid_file(self):
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_content("not_a_file_id.mp4")
+
+    def test_compressed_file(self):
+        """Text-like files are also stored compressed, next to the file, once
+        they're compressed in the background, and the compressed copy is
+        removed with it."""
+        data = b"1,2,3\n" * 1000
+        file_id = self.storage.load_and_get_id(
+            data, mimetype="text/csv", kind=MediaFileKind.DOWNLOADABLE
+        )
+        self.assertEqual([file_id], os.listdir(self.storage.directory))
+
+        self.storage.compress_in_background(file_id).result()
+        media_file = self.storage.get_file(file_id)
+
+        self.assertEqual(
+            sorted([file_id, f"{file_id}.gz"]),
+            sorted(os.listdir(self.storage.directory)),
+        )
+        compressed = _read(self.storage.get_content(file_id, compressed=True))
+        self.assertEqual(media_file.compressed_size, len(compressed))
+        self.assertEqual(data, gzip.decompress(compressed))
+
+        self.storage.delete_file(file_id)
+        self.assertEqual([], os.listdir(self.storage.directory))
+
+    def test_uncompressed_file(self):
+        file_id = self._load(b"x" * 2048)
+        self.assertIsNone(self.storage.compress_in_background(file_id))
+        self.assertIsNone(self.storage.get_file(file_id).compressed_size)
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_content(file_id, compressed=True)
+
+    def test_memory_cache(self):
+        """Recently added files are served from memory, until they're evicted."""
+        storage = DiskMediaFileStorage(
+            "/mock/media", directory=self.temp_dir.name, memory_cache_max_size=10
+        )
+        file_id1 = storage.load_and_get_id(b"123456", "video/mp4", MediaFileKind.MEDIA)
+
+        with mock.patch("streamlit.runtime.disk_media_file_storage.mmap") as mock_mmap:
+            self.assertEqual(b"123456", storage.get_content(file_id1))
+            self.assertEqual(b"2345", _read(storage.get_content(file_id1, 1, 5)))
+            mock_mmap.mmap.assert_not_called()
+        self.assertEqual(6, sum(stat.byte_length for stat in storage.get_stats()))
+
+        # Adding another file evicts the first one, which is read from disk.
+        file_id2 = storage.load_and_get_id(b"7890", "video/mp4", MediaFileKind.MEDIA)
+        file_id3 = storage.load_and_get_id(b"abcd", "video/mp4", MediaFileKind.MEDIA)
+        self.assertEqual(8, sum(stat.byte_length for stat in storage.get_stats()))
+        self.assertEqual(b"123456", _read(storage.get_content(file_id1)))
+
+        # Files larger than the cache are never kept in memory.
+        storage.load_and_get_id(b"x" * 11, "video/mp4", MediaFileKind.MEDIA)
+        self.assertEqual(2, len(storage.get_stats()))
+
+        storage.delete_file(file_id2)
+        storage.delete_file(file_id3)
+        self.assertEqual([], storage.get_stats())
+
+    def test_get_stats_without_memory_cache(self):
+        """Files on disk don't count towards the memory usage."""
+        self._load(b"mock_bytes")
+        self.assertEqual([], self.storage.get_stats())
+
+    @parameterized.expand(
+        [
+            ("video/mp4", ".mp4"),
+            ("audio/wav", ".wav"),
+            ("image/png", ".png"),
+        ]
+    )
+    def test_get_url(self, mimetype, extension):
+        file_id = self.storage.load_and_get_id(
+            b"mock_bytes", mimetype=mimetype, kind=MediaFileKind.MEDIA
+        )
+        self.assertEqual(
+            f"/mock/media/{file_id}{extension}", self.storage.get_url(file_id)
+        )
+
+    def test_get_url_invalid_fileid(self):
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_url("not_a_file_id")
+
+    def test_delete_file(self):
+        """delete_file removes the file from disk, and files that are being
+        served stay readable."""
+        data = os.urandom(2 * CONTENT_CHUNK_SIZE)
+        file_id = self._load(data)
+        content = self.storage.get_content(file_id)
+
+        self.storage.delete_file(file_id)
+
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_file(file_id)
+        self.assertEqual([], os.listdir(self.storage.directory))
+        self.assertEqual(data, _read(content))
+
+    def test_delete_invalid_file_is_a_noop(self):
+        self.storage.delete_file("mock_file_id")
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_remove_orphaned_files(self):
+        """MediaFileManager removes orphaned files from disk."""
+        media_file_manager = MediaFileManager(self.storage)
+        media_file_manager.add(b"mock_bytes_1", "video/mp4", "mock_coords")
+        media_file_manager.add(b"mock_bytes_2", "video/mp4", "mock_coords2")
+        self.assertEqual(2, len(os.listdir(self.storage.directory)))
+
+        media_file_manager.clear_session_refs()
+        media_file_manager.remove_orphaned_files()
+
+        self.assertEqual([], os.listdir(self.storage.directory))
+
+    def test_directory_is_removed_with_storage(self):
+        directory = self.storage.directory
+        self._load(b"mock_bytes")
+
+        del self.storage
+
+        self.assertFalse(os.path.exists(directory))
+        self.assertEqual([], os.listdir(self.temp_dir.name))
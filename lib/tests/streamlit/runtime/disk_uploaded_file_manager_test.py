@@ -0,0 +1,215 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for DiskUploadedFileManager"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from streamlit.proto.Common_pb2 import FileURLs as FileURLsProto
+from streamlit.runtime.disk_uploaded_file_manager import DiskUploadedFileManager
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
+from tests.exception_capturing_thread import call_on_threads
+
+
+def _file(file_id: str, data: bytes) -> UploadedFileRec:
+    return UploadedFileRec(
+        file_id=file_id, name=f"{file_id}.txt", type="type", data=data
+    )
+
+
+FILE_1 = _file("url1", b"file1")
+FILE_2 = _file("url2", b"file222")
+
+
+class DiskUploadedFileManagerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mgr = DiskUploadedFileManager("/mock/upload", directory=self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _get_data(self, session_id, file_ids):
+        return [rec.data[:] for rec in self.mgr.get_files(session_id, file_ids)]
+
+    def test_retrieve_added_file(self):
+        """Added files are written to disk, and read back from memory maps."""
+        self.mgr.add_file("session", FILE_1)
+        self.mgr.add_file("session", FILE_2)
+        self.assertEqual(2, len(os.listdir(self.mgr.directory)))
+
+        rec1, rec2 = self.mgr.get_files("session", ["url1", "url2", "url3"])
+        self.assertEqual(
+            (FILE_1.file_id, FILE_1.name, FILE_1.type),
+            (rec1.file_id, rec1.name, rec1.type),
+        )
+        self.assertEqual(FILE_1.data, rec1.data[:])
+        self.assertEqual(FILE_2.data, rec2.data[:])
+
+        uploaded_file = UploadedFile(rec2, FileURLsProto())
+        self.assertEqual(FILE_2.data, uploaded_file.read())
+        self.assertEqual(len(FILE_2.data), uploaded_file.size)
+
+    def test_move_file(self):
+        """Files can be moved into the manager's directory, rather than copied."""
+        fd, path = tempfile.mkstemp(dir=self.mgr.directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"moved")
+
+        self.mgr.move_file("session", "url1", "url1.txt", "type", path)
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(1, len(os.listdir(self.mgr.directory)))
+        (rec,) = self.mgr.get_files("session", ["url1"])
+        self.assertEqual(
+            ("url1.txt", "type", b"moved"), (rec.name, rec.type, rec.data[:])
+        )
+        self.assertEqual(5, self.mgr.get_session_size("session"))
+
+    def test_empty_file(self):
+        self.mgr.add_file("session", _file("empty", b""))
+        self.assertEqual([b""], self._get_data("session", ["empty"]))
+
+    def test_replace_file(self):
+        self.mgr.add_file("session", FILE_1)
+        self.mgr.add_file("session", FILE_1._replace(data=b"new"))
+
+        self.assertEqual([b"new"], self._get_data("session", ["url1"]))
+        self.assertEqual(3, self.mgr.get_session_size("session"))
+        self.assertEqual(1, len(os.listdir(self.mgr.directory)))
+
+    def test_remove_file(self):
+        # This should not error.
+        self.mgr.remove_file("non-session", "non-file-id")
+
+        self.mgr.add_file("session", FILE_1)
+        self.mgr.add_file("session", FILE_2)
+        self.mgr.remove_file("session", FILE_1.file_id)
+
+        self.assertEqual([FILE_2.data], self._get_data("session", ["url1", "url2"]))
+        self.assertEqual(1, len(os.listdir(self.mgr.directory)))
+
+    def test_remove_session_files(self):
+        self.mgr.add_file("session1", FILE_1)
+        self.mgr.add_file("session1", FILE_2)
+        self.mgr.add_file("session2", FILE_1)
+
+        self.mgr.remove_session_files("session1")
+
+        self.assertEqual([], self.mgr.get_files("session1", ["url1", "url2"]))
+        self.assertEqual([FILE_1.data], self._get_data("session2", ["url1"]))
+        self.assertEqual(0, self.mgr.get_session_size("session1"))
+        self.assertEqual(1, len(os.listdir(self.mgr.directory)))
+
+    def test_removed_files_stay_readable(self):
+        self.mgr.add_file("session", FILE_1)
+        (rec,) = self.mgr.get_files("session", ["url1"])
+
+        self.mgr.remove_file("session", "url1")
+
+        self.assertEqual(FILE_1.data, rec.data[:])
+
+    def test_session_size_limit(self):
+        """The session's least recently used files are removed to stay within
+        its limit."""
+        mgr = DiskUploadedFileManager(
+            "/mock/upload", directory=self.temp_dir.name, max_session_size=10
+        )
+        self.assertEqual(10, mgr.get_max_upload_size("session"))
+
+        mgr.add_file("session", _file("a", b"1234"))
+        mgr.add_file("session", _file("b", b"1234"))
+        mgr.add_file("other_session", _file("c", b"1234"))
+        # Reading a file makes it the most recently used one.
+        mgr.get_files("session", ["a"])
+        mgr.add_file("session", _file("d", b"1234"))
+
+        self.assertEqual(
+            ["a", "d"],
+            [rec.file_id for rec in mgr.get_files("session", ["a", "b", "d"])],
+        )
+        self.assertEqual(8, mgr.get_session_size("session"))
+        self.assertEqual(1, len(mgr.get_files("other_session", ["c"])))
+
+    def test_total_size_limit(self):
+        """The least recently used files of all sessions are removed to stay
+        within the total limit."""
+        mgr = DiskUploadedFileManager(
+            "/mock/upload", directory=self.temp_dir.name, max_size=10
+        )
+        mgr.add_file("session1", _file("a", b"1234"))
+        mgr.add_file("session2", _file("b", b"1234"))
+        mgr.add_file("session2", _file("c", b"1234"))
+
+        self.assertEqual([], mgr.get_files("session1", ["a"]))
+        self.assertEqual(2, len(mgr.get_files("session2", ["b", "c"])))
+        self.assertEqual(8, sum(stat.byte_length for stat in mgr.get_stats()))
+
+        # Files that are larger than the limit are never kept.
+        mgr.add_file("session1", _file("d", b"x" * 11))
+        self.assertEqual([], mgr.get_stats())
+        self.assertEqual([], os.listdir(mgr.directory))
+
+    def test_get_max_upload_size(self):
+        self.assertIsNone(self.mgr.get_max_upload_size("session"))
+        mgr = DiskUploadedFileManager(
+            "/mock/upload",
+            directory=self.temp_dir.name,
+            max_size=10,
+            max_session_size=20,
+        )
+        self.assertEqual(10, mgr.get_max_upload_size("session"))
+
+    def test_get_stats(self):
+        """Stats are the sizes of the stored files, which are never read."""
+        self.assertEqual([], self.mgr.get_stats())
+
+        self.mgr.add_file("session1", FILE_1)
+        self.mgr.add_file("session2", FILE_2)
+
+        with mock.patch("streamlit.runtime.disk_uploaded_file_manager.open") as m:
+            stats = self.mgr.get_stats()
+            m.assert_not_called()
+
+        self.assertEqual(
+            [len(FILE_1.data), len(FILE_2.data)], [stat.byte_length for stat in stats]
+        )
+        self.assertEqual("DiskUploadedFileManager", stats[0].category_name)
+
+    def test_directory_is_removed_with_manager(self):
+        directory = self.mgr.directory
+        self.mgr.add_file("session", FILE_1)
+
+        del self.mgr
+
+        self.assertFalse(os.path.exists(directory))
+
+    def test_add_file_from_threads(self):
+        """`add_file` is thread-safe."""
+        mgr = DiskUploadedFileManager(
+            "/mock/upload", directory=self.temp_dir.name, max_size=100
+        )
+
+        def add_file(index: int) -> None:
+            mgr.add_file("session", _file(f"id_{index}", b"1234567890"))
+
+        call_on_threads(add_file, num_threads=50)
+
+        self.assertEqual(100, mgr.get_session_size("session"))
+        self.assertEqual(10, len(os.listdir(mgr.directory)))
@@ -14,6 +14,8 @@
 
 """Unit tests for MemoryMediaFileStorage"""
 
+import gzip
+import os
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, mock_open
@@ -22,9 +24,12 @@ from parameterized import parameterized
 
 from streamlit.runtime.media_file_storage import MediaFileKind, MediaFileStorageError
 from streamlit.runtime.memory_media_file_storage import (
+    CONTENT_CHUNK_SIZE,
+    MAX_COMPRESSED_MEMORY_FILE_SIZE,
     MemoryFile,
     MemoryMediaFileStorage,
     get_extension_for_mimetype,
+    is_compressible_mimetype,
 )
 
 
@@ -144,6 +149,108 @@ class MemoryMediaFileStorageTest(unittest.TestCase):
         url = self.storage.get_url(file_id)
         self.assertEqual(f"/mock/media/{file_id}{extension}", url)
 
+    def test_get_content(self):
+        """Whole files are returned as they are, and parts of them in chunks."""
+        data = b"x" * (2 * CONTENT_CHUNK_SIZE + 1)
+        file_id = self.storage.load_and_get_id(
+            data, mimetype="video/mp4", kind=MediaFileKind.MEDIA
+        )
+
+        self.assertIs(data, self.storage.get_content(f"{file_id}.mp4"))
+
+        chunks = list(self.storage.get_content(file_id, 1, 2 * CONTENT_CHUNK_SIZE))
+        self.assertEqual(
+            [CONTENT_CHUNK_SIZE, CONTENT_CHUNK_SIZE - 1], [len(c) for c in chunks]
+        )
+        self.assertEqual(data[1 : 2 * CONTENT_CHUNK_SIZE], b"".join(chunks))
+
+    def test_get_compressed_content(self):
+        """Text-like files are also stored compressed once they're compressed
+        in the background, if that makes them smaller."""
+        data = b"1,2,3\n" * 1000
+        file_id = self.storage.load_and_get_id(
+            data, mimetype="text/csv", kind=MediaFileKind.DOWNLOADABLE
+        )
+        self.assertIsNone(self.storage.get_file(file_id).compressed_size)
+
+        self.storage.compress_in_background(file_id).result()
+        # Files are compressed only once.
+        self.assertIsNone(self.storage.compress_in_background(file_id))
+
+        compressed = self.storage.get_content(file_id, compressed=True)
+        self.assertEqual(data, gzip.decompress(compressed))
+        self.assertEqual(
+            len(compressed), self.storage.get_file(file_id).compressed_size
+        )
+        self.assertEqual(
+            len(data) + len(compressed),
+            sum(stat.byte_length for stat in self.storage.get_stats()),
+        )
+
+    @parameterized.expand(
+        [
+            ("video/mp4", b"x" * 2048),
+            ("text/csv", b"x" * 100),
+            ("text/csv", os.urandom(2048)),
+        ]
+    )
+    def test_content_not_compressed(self, mimetype, data):
+        """Media, small files, and files that don't get smaller aren't
+        compressed."""
+        file_id = self.storage.load_and_get_id(
+            data, mimetype=mimetype, kind=MediaFileKind.MEDIA
+        )
+
+        future = self.storage.compress_in_background(file_id)
+        if future is not None:
+            future.result()
+        self.assertIsNone(self.storage.get_file(file_id).compressed_size)
+        with self.assertRaises(MediaFileStorageError):
+            self.storage.get_content(file_id, compressed=True)
+
+    @mock.patch(
+        "streamlit.runtime.memory_media_file_storage.MAX_COMPRESSED_MEMORY_FILE_SIZE",
+        4096,
+    )
+    def test_large_file_not_compressed(self):
+        """Files larger than MAX_COMPRESSED_MEMORY_FILE_SIZE aren't stored
+        compressed."""
+        file_id = self.storage.load_and_get_id(
+            b"1,2,3\n" * 1000, mimetype="text/csv", kind=MediaFileKind.DOWNLOADABLE
+        )
+
+        self.assertIsNone(self.storage.compress_in_background(file_id))
+        self.assertIsNone(self.storage.get_file(file_id).compressed_size)
+
+    def test_deleted_file_compressed_again(self):
+        """A file that's deleted and added again is compressed again."""
+        data = b"1,2,3\n" * 1000
+        file_id = self.storage.load_and_get_id(
+            data, mimetype="text/csv", kind=MediaFileKind.DOWNLOADABLE
+        )
+        self.storage.compress_in_background(file_id).result()
+        self.storage.delete_file(file_id)
+
+        self.storage.load_and_get_id(
+            data, mimetype="text/csv", kind=MediaFileKind.DOWNLOADABLE
+        )
+        self.assertIsNone(self.storage.get_file(file_id).compressed_size)
+        self.storage.compress_in_background(file_id).result()
+        self.assertIsNotNone(self.storage.get_file(file_id).compressed_size)
+
+    @parameterized.expand(
+        [
+            ("text/plain", True),
+            ("text/csv; charset=utf-8", True),
+            ("application/json", True),
+            ("image/svg+xml", True),
+            ("image/png", False),
+            ("application/octet-stream", False),
+        ]
+    )
+    def test_is_compressible_mimetype(self, mimetype, expected):
+        self.assertEqual(expected, is_compressible_mimetype(mimetype))
+
     def test_get_url_invalid_fileid(self):
         """get_url raises if it gets a bad file_id."""
         with self.assertRaises(MediaFileStorageError):
@@ -16,6 +16,7 @@ import asyncio
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 from typing import List
 from unittest.mock import ANY, MagicMock, call, patch
@@ -37,7 +38,13 @@ from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
-from streamlit.runtime.runtime import AsyncObjects, RuntimeStoppedError
+from streamlit.runtime.runtime import (
+    _FORWARD_MSG_CACHE_HITS,
+    _FORWARD_MSG_CACHE_MISSES,
+    AsyncObjects,
+    RuntimeStoppedError,
+)
+from streamlit.runtime.tracing import Tracer
 from streamlit.runtime.websocket_session_manager import WebsocketSessionManager
 from streamlit.watcher import event_based_path_watcher
 from tests.streamlit.message_mocks import (
@@ -427,6 +434,33 @@ class RuntimeTest(RuntimeTestCase):
         received = client.forward_msgs.pop()
         self.assertEqual(populate_hash_if_needed(msg), received.hash)
 
+    async def test_large_forwardmsg_hashing_is_offloaded(self):
+        """Large ForwardMsgs are hashed off the event loop's thread."""
+        await self.runtime.start()
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+
+        hashing_threads = []
+
+        def populate_hash(msg):
+            hashing_threads.append(threading.current_thread())
+            return populate_hash_if_needed(msg)
+
+        msg = create_dataframe_msg([1, 2, 3])
+        msg.ClearField("hash")
+        with patch_config_options({"server.messageOffloadSize": 1e-6}), patch(
+            "streamlit.runtime.runtime.populate_hash_if_needed",
+            side_effect=populate_hash,
+        ):
+            self.enqueue_forward_msg(session_id, msg)
+            await self.tick_runtime_loop()
+
+        received = client.forward_msgs.pop()
+        self.assertNotEqual("", received.hash)
+        self.assertEqual(1, len(hashing_threads))
+        self.assertIsNot(threading.current_thread(), hashing_threads[0])
+
     async def test_forwardmsg_cacheable_flag(self):
         """Test that the metadata.cacheable flag is set properly on outgoing
         ForwardMsgs."""
@@ -457,6 +491,8 @@ class RuntimeTest(RuntimeTestCase):
         """Test that duplicate ForwardMsgs are sent only once."""
         with patch_config_options({"global.minCachedMessageSize": 0}):
             await self.runtime.start()
+            num_hits = _FORWARD_MSG_CACHE_HITS.get_value()
+            num_misses = _FORWARD_MSG_CACHE_MISSES.get_value()
 
             client = MockSessionClient()
             session_id = self.runtime.connect_session(
@@ -486,6 +522,57 @@ class RuntimeTest(RuntimeTestCase):
             # And the same *metadata* as msg2:
             self.assertEqual(msg2.metadata, cached.metadata)
 
+            self.assertEqual(num_hits + 1, _FORWARD_MSG_CACHE_HITS.get_value())
+            self.assertEqual(num_misses + 1, _FORWARD_MSG_CACHE_MISSES.get_value())
+
+    async def test_runtime_metrics(self):
+        """The runtime's gauges are evaluated when its metrics are read."""
+        await self.runtime.start()
+        metrics = {
+            metric.name: metric for metric in self.runtime.stats_mgr.get_metrics()
+        }
+
+        session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        self.runtime.connect_session(client=MockSessionClient(), user_info=MagicMock())
+        self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
+
+        self.assertEqual(2, metrics["active_sessions"].get_value())
+        self.assertEqual(1, metrics["forward_msg_queue_depth"].get_value())
+
+        await self.tick_runtime_loop()
+        self.assertEqual(0, metrics["forward_msg_queue_depth"].get_value())
+
+    async def test_traced_message_sends(self):
+        """Sending a run's script_finished message ends its trace."""
+        exporter = MagicMock()
+        tracer = Tracer(sample_rate=1.0, exporter=exporter)
+        await self.runtime.start()
+        session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+
+        with patch("streamlit.runtime.tracing.get_tracer", return_value=tracer):
+            tracer.on_script_started(session_id, "page").end()
+            self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
+            self.enqueue_forward_msg(
+                session_id,
+                create_script_finished_message(ForwardMsg.FINISHED_SUCCESSFULLY),
+            )
+            await self.tick_runtime_loop()
+
+        tracer._executor.submit(lambda: None).result()
+        (spans,), _ = exporter.export.call_args
+        self.assertEqual(
+            ["script_run", "send_message", "send_message", "rerun"],
+            [span.name for span in spans],
+        )
+        self.assertEqual(
+            ["delta", "script_finished"],
+            [span.attributes["message_type"] for span in spans[1:3]],
+        )
+
     async def test_forwardmsg_cache_clearing(self):
         """Test that the ForwardMsgCache gets properly cleared when scripts
         finish running.
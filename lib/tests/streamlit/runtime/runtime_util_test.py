@@ -18,7 +18,12 @@ import unittest
 
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import runtime_util
-from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
+from streamlit.runtime.runtime_util import (
+    get_message_executor,
+    is_cacheable_msg,
+    is_offloaded_msg,
+    serialize_forward_msg,
+)
 from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
 
@@ -32,6 +37,22 @@ class RuntimeUtilTest(unittest.TestCase):
         with patch_config_options({"global.minCachedMessageSize": 1000}):
             self.assertFalse(is_cacheable_msg(create_dataframe_msg([1, 2, 3])))
 
+    def test_is_offloaded_msg(self):
+        msg = create_dataframe_msg([1, 2, 3])
+
+        with patch_config_options({"server.messageOffloadSize": 1e-6}):
+            self.assertTrue(is_offloaded_msg(msg))
+
+        with patch_config_options({"server.messageOffloadSize": 1}):
+            self.assertFalse(is_offloaded_msg(msg))
+
+        with patch_config_options({"server.messageOffloadSize": 0}):
+            self.assertFalse(is_offloaded_msg(msg))
+
+    def test_get_message_executor(self):
+        """The message executor is created once."""
+        self.assertIs(get_message_executor(), get_message_executor())
+
     def test_should_limit_msg_size(self):
         max_message_size_mb = 50
 
@@ -0,0 +1,129 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""script_profiler unit tests."""
+
+import time
+import unittest
+
+from streamlit.runtime.scriptrunner.script_profiler import (
+    ProfileFrame,
+    ScriptProfile,
+    ScriptProfiler,
+    ScriptProfileStore,
+    profile_run,
+)
+
+
+def _busy_wait(seconds: float) -> None:
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+def _run_script() -> None:
+    _busy_wait(0.05)
+
+
+def _make_profile(page_name: str = "page") -> ScriptProfile:
+    frame_a = ProfileFrame("<module>", "app.py", 3)
+    frame_b = ProfileFrame("load", "app.py", 10)
+    return ScriptProfile(
+        page_name=page_name,
+        start_time=0.0,
+        duration=0.5,
+        sample_interval=0.01,
+        samples={(frame_a,): 2, (frame_a, frame_b): 3},
+        command_timings=[],
+    )
+
+
+class ScriptProfilerTest(unittest.TestCase):
+    def test_samples(self):
+        """The current thread's stack is sampled, starting below the
+        profiler's root function."""
+        profiler = ScriptProfiler(
+            "page", root_code=_run_script.__code__, sample_interval=0.001
+        )
+        with profile_run(profiler):
+            _run_script()
+
+        profile = profiler.get_profile()
+        self.assertEqual("page", profile.page_name)
+        self.assertGreater(profile.num_samples, 0)
+        self.assertGreaterEqual(profile.duration, 0.05)
+        for stack in profile.samples:
+            self.assertEqual("_busy_wait", stack[0].name)
+            self.assertEqual(__file__, stack[0].file)
+
+    def test_command_timings(self):
+        """Only the outermost commands are timed, and timings are sorted by
+        their total time."""
+        profiler = ScriptProfiler("page")
+        for name, duration in [("text", 1.0), ("dataframe", 2.0), ("text", 3.0)]:
+            profiler.start_command()
+            # Commands called by other commands aren't timed.
+            profiler.start_command()
+            profiler.end_command("markdown", duration)
+            profiler.end_command(name, duration)
+
+        command_timings = profiler.get_profile().command_timings
+        self.assertEqual(
+            [("text", 2, 4.0, 3.0), ("dataframe", 1, 2.0, 2.0)],
+            [
+                (timing.name, timing.count, timing.total_time, timing.max_time)
+                for timing in command_timings
+            ],
+        )
+
+
+class ScriptProfileTest(unittest.TestCase):
+    def test_to_collapsed(self):
+        self.assertEqual(
+            "<module> (app.py:3) 2\n<module> (app.py:3);load (app.py:10) 3\n",
+            _make_profile().to_collapsed(),
+        )
+
+    def test_to_speedscope(self):
+        speedscope = _make_profile().to_speedscope()
+
+        self.assertEqual(
+            [
+                {"name": "<module>", "file": "app.py", "line": 3},
+                {"name": "load", "file": "app.py", "line": 10},
+            ],
+            speedscope["shared"]["frames"],
+        )
+        (profile,) = speedscope["profiles"]
+        self.assertEqual("sampled", profile["type"])
+        self.assertEqual([[0], [0, 1]], profile["samples"])
+        self.assertEqual([0.02, 0.03], profile["weights"])
+        self.assertAlmostEqual(0.05, profile["endValue"])
+
+
+class ScriptProfileStoreTest(unittest.TestCase):
+    def test_latest_profiles_are_kept(self):
+        store = ScriptProfileStore(max_profiles_per_session=2)
+        for page_name in ["a", "b", "c"]:
+            store.add("session", _make_profile(page_name))
+        store.add("other_session", _make_profile("d"))
+
+        self.assertEqual(
+            ["b", "c"],
+            [profile.page_name for profile in store.get_profiles("session")],
+        )
+
+        store.clear_session("session")
+        self.assertEqual([], store.get_profiles("session"))
+        self.assertEqual(1, len(store.get_profiles("other_session")))
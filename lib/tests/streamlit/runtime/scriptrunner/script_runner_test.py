@@ -45,12 +45,21 @@ from streamlit.runtime.scriptrunner import (
     StopException,
 )
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.scriptrunner.script_profiler import ScriptProfileStore
 from streamlit.runtime.scriptrunner.script_requests import (
     ScriptRequest,
     ScriptRequests,
     ScriptRequestType,
 )
+from streamlit.runtime.scriptrunner.script_runner import (
+    _SCRIPT_RERUNS,
+    _SCRIPT_RUN_DURATION,
+    _SCRIPT_STOPS,
+    _WASTED_SCRIPT_RUN_SECONDS,
+    InterruptException,
+)
 from streamlit.runtime.state.session_state import SessionState
+from streamlit.runtime.tracing import Tracer
 from tests import testutil
 
 text_utf = "complete! 👨‍🎤"
@@ -530,6 +539,68 @@ class ScriptRunnerTest(AsyncTestCase):
         )
         self._assert_text_deltas(scriptrunner, ["loop_forever"])
 
+    def test_script_run_metrics(self):
+        """Script runs are timed, and reruns and stops are counted, per page."""
+        num_runs = _SCRIPT_RUN_DURATION.get_count("infinite_loop")
+        num_reruns = _SCRIPT_RERUNS.get_value("infinite_loop")
+        wasted_seconds = _WASTED_SCRIPT_RUN_SECONDS.get_value("infinite_loop")
+        num_stops = _SCRIPT_STOPS.get_value("infinite_loop")
+
+        scriptrunner = TestScriptRunner("infinite_loop.py")
+        scriptrunner.request_rerun(RerunData())
+        scriptrunner.start()
+        time.sleep(0.1)
+        scriptrunner.request_rerun(RerunData())
+        time.sleep(0.1)
+        scriptrunner.request_stop()
+        scriptrunner.join()
+
+        self._assert_no_exceptions(scriptrunner)
+        self.assertEqual(num_runs + 2, _SCRIPT_RUN_DURATION.get_count("infinite_loop"))
+        self.assertEqual(num_reruns + 1, _SCRIPT_RERUNS.get_value("infinite_loop"))
+        # The interrupted run took about 0.1s.
+        self.assertGreater(
+            _WASTED_SCRIPT_RUN_SECONDS.get_value("infinite_loop"), wasted_seconds + 0.05
+        )
+        self.assertEqual(num_stops + 1, _SCRIPT_STOPS.get_value("infinite_loop"))
+
+    def test_traced_run(self):
+        """Traced runs have spans for the commands they run."""
+        exporter = MagicMock()
+        tracer = Tracer(sample_rate=1.0, exporter=exporter)
+        with patch("streamlit.runtime.tracing.get_tracer", return_value=tracer):
+            scriptrunner = TestScriptRunner("good_script.py")
+            scriptrunner.request_rerun(RerunData())
+            scriptrunner.start()
+            scriptrunner.join()
+
+        self._assert_no_exceptions(scriptrunner)
+        tracer.on_run_messages_sent("test session id")
+        tracer._executor.submit(lambda: None).result()
+
+        (spans,), _ = exporter.export.call_args
+        self.assertEqual(["text", "script_run", "rerun"], [span.name for span in spans])
+        self.assertEqual("good_script", spans[-1].attributes["page"])
+
+    def test_profiled_run(self):
+        """With runner.profile, each run's profile is stored, with the time
+        spent in its commands."""
+        script_profile_store = ScriptProfileStore()
+        Runtime._instance.script_profile_store = script_profile_store
+
+        with testutil.patch_config_options({"runner.profile": True}):
+            scriptrunner = TestScriptRunner("good_script.py")
+            scriptrunner.request_rerun(RerunData())
+            scriptrunner.start()
+            scriptrunner.join()
+
+        self._assert_no_exceptions(scriptrunner)
+        (profile,) = script_profile_store.get_profiles("test session id")
+        self.assertEqual("good_script", profile.page_name)
+        (command_timing,) = profile.command_timings
+        self.assertEqual(("text", 1), (command_timing.name, command_timing.count))
+        self.assertGreater(command_timing.total_time, 0)
+
     def test_shutdown(self):
         """Test that we can shutdown while a script is running."""
         scriptrunner = TestScriptRunner("infinite_loop.py")
@@ -551,6 +622,132 @@ class ScriptRunnerTest(AsyncTestCase):
         )
         self._assert_text_deltas(scriptrunner, ["loop_forever"])
 
+    def test_async_interrupt_stop(self):
+        """With runner.asyncInterrupt, we can stop a script that never calls
+        a Streamlit command.
+        """
+        with testutil.patch_config_options({"runner.asyncInterrupt": True}):
+            scriptrunner = TestScriptRunner("busy_loop.py")
+        scriptrunner.request_rerun(RerunData())
+        scriptrunner.start()
+
+        time.sleep(0.1)
+        scriptrunner.request_stop()
+        scriptrunner._script_thread.join(timeout=5)
+        self.assertFalse(scriptrunner._script_thread.is_alive())
+
+        self._assert_no_exceptions(scriptrunner)
+        self._assert_control_events(
+            scriptrunner,
+            [
+                ScriptRunnerEvent.SCRIPT_STARTED,
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+        )
+        self._assert_text_deltas(scriptrunner, ["looping"])
+
+    def test_async_interrupt_rerun(self):
+        """With runner.asyncInterrupt, we can rerun a script that never calls
+        a Streamlit command, and the rerun gets the newest RerunData.
+        """
+        with testutil.patch_config_options({"runner.asyncInterrupt": True}):
+            scriptrunner = TestScriptRunner("busy_loop.py")
+        scriptrunner.request_rerun(RerunData())
+        scriptrunner.start()
+
+        time.sleep(0.1)
+        scriptrunner.request_rerun(RerunData(query_string="foo=bar"))
+        time.sleep(0.1)
+        scriptrunner.request_stop()
+        scriptrunner._script_thread.join(timeout=5)
+        self.assertFalse(scriptrunner._script_thread.is_alive())
+
+        self._assert_no_exceptions(scriptrunner)
+        self._assert_control_events(
+            scriptrunner,
+            [
+                ScriptRunnerEvent.SCRIPT_STARTED,
+                ScriptRunnerEvent.SCRIPT_STOPPED_FOR_RERUN,
+                ScriptRunnerEvent.SCRIPT_STARTED,
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+        )
+        shutdown_data = scriptrunner.event_data[-1]
+        self.assertEqual("foo=bar", shutdown_data["client_state"].query_string)
+
+    @patch("streamlit.runtime.scriptrunner.script_runner._drop_pending_interrupt")
+    @patch("streamlit.runtime.scriptrunner.script_runner._raise_in_thread")
+    def test_async_interrupt_only_while_interruptible(
+        self, patched_raise_in_thread, patched_drop_pending_interrupt
+    ):
+        """Requests only interrupt the script thread while it's running a
+        script, and not while it's handling another request.
+        """
+        with testutil.patch_config_options({"runner.asyncInterrupt": True}):
+            runner = TestScriptRunner("not_a_script.py")
+        runner._script_thread = MagicMock()
+
+        # Not executing yet.
+        runner.request_rerun(RerunData())
+        patched_raise_in_thread.assert_not_called()
+
+        with runner._set_execing_flag():
+            # The pending request is delivered when we start executing.
+            patched_raise_in_thread.assert_called_once_with(
+                runner._script_thread, InterruptException
+            )
+            runner._requests.on_scriptrunner_yield()
+            patched_raise_in_thread.reset_mock()
+            patched_drop_pending_interrupt.reset_mock()
+
+            with runner._mask_interrupts():
+                patched_drop_pending_interrupt.assert_called_once()
+                runner.request_rerun(RerunData())
+                patched_raise_in_thread.assert_not_called()
+
+            # The request made while masked is delivered on unmasking.
+            patched_raise_in_thread.assert_called_once_with(
+                runner._script_thread, InterruptException
+            )
+            patched_raise_in_thread.reset_mock()
+
+            runner._requests.on_scriptrunner_yield()
+            runner.request_stop()
+            patched_raise_in_thread.assert_called_once_with(
+                runner._script_thread, InterruptException
+            )
+            patched_raise_in_thread.reset_mock()
+            patched_drop_pending_interrupt.reset_mock()
+
+        # Leaving the exec drops undelivered interrupts, and no more are sent.
+        patched_drop_pending_interrupt.assert_called_once()
+        runner.request_stop()
+        patched_raise_in_thread.assert_not_called()
+
+    @patch("streamlit.runtime.scriptrunner.script_runner._raise_in_thread")
+    def test_async_interrupt_while_leaving_exec(self, _):
+        """An InterruptException that lands while the execing flag is being
+        reset doesn't leave the flag set.
+        """
+        with testutil.patch_config_options({"runner.asyncInterrupt": True}):
+            runner = TestScriptRunner("not_a_script.py")
+
+        with patch(
+            "streamlit.runtime.scriptrunner.script_runner._drop_pending_interrupt",
+            side_effect=[None, InterruptException(), None],
+        ) as patched_drop_pending_interrupt:
+            with runner._set_execing_flag():
+                pass
+        self.assertEqual(3, patched_drop_pending_interrupt.call_count)
+        self.assertFalse(runner._execing)
+        self.assertFalse(runner._interruptible)
+
+        # The next run can set the flag again.
+        with runner._set_execing_flag():
+            self.assertTrue(runner._execing)
+
     def test_widgets(self):
         """Tests that widget values behave as expected."""
         scriptrunner = TestScriptRunner("widgets_script.py")
@@ -609,6 +806,7 @@ class ScriptRunnerTest(AsyncTestCase):
             return_value={
                 "hash1": {
                     "page_script_hash": "hash1",
+                    "page_name": "good_script",
                     "script_path": os.path.join(
                         os.path.dirname(__file__), "test_data", "good_script.py"
                     ),
@@ -822,7 +1020,11 @@ class ScriptRunnerTest(AsyncTestCase):
         "streamlit.source_util.get_pages",
         MagicMock(
             return_value={
-                "hash2": {"page_script_hash": "hash2", "script_path": "script2"},
+                "hash2": {
+                    "page_script_hash": "hash2",
+                    "page_name": "script2",
+                    "script_path": "script2",
+                },
             }
         ),
     )
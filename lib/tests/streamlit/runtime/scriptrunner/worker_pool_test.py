@@ -0,0 +1,379 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""ScriptWorkerPool unit tests."""
+
+import os
+import threading
+import unittest
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+
+from streamlit.proto.ClientState_pb2 import ClientState
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetStates
+from streamlit.runtime.dataframe_window_manager import (
+    DataframeWindowManager,
+    DataframeWindowNotFoundError,
+)
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.scriptrunner import RerunData, ScriptRunnerEvent
+from streamlit.runtime.scriptrunner.worker_pool import (
+    ScriptWorkerPool,
+    WorkerScriptRunner,
+    _deserialize_rerun_data,
+    _serialize_rerun_data,
+    _Worker,
+)
+from streamlit.runtime.state import SCRIPT_RUN_WITHOUT_ERRORS_KEY, SessionState
+
+
+def _test_data_path(filename: str) -> str:
+    return os.path.join(os.path.dirname(__file__), "test_data", filename)
+
+
+class _EventRecorder:
+    def __init__(self):
+        self.events: List[Tuple[ScriptRunnerEvent, Dict[str, Any]]] = []
+        self.shutdown = threading.Event()
+
+    def __call__(self, sender, event: ScriptRunnerEvent, **kwargs) -> None:
+        self.events.append((event, kwargs))
+        if event == ScriptRunnerEvent.SHUTDOWN:
+            self.shutdown.set()
+
+    @property
+    def event_types(self) -> List[ScriptRunnerEvent]:
+        return [event for event, _ in self.events]
+
+    @property
+    def text_deltas(self) -> List[str]:
+        return [
+            kwargs["forward_msg"].delta.new_element.text.body
+            for event, kwargs in self.events
+            if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG
+            and kwargs["forward_msg"].delta.new_element.HasField("text")
+        ]
+
+
+def _create_runner(session_state: SessionState) -> WorkerScriptRunner:
+    worker = MagicMock()
+    return WorkerScriptRunner(
+        pool=MagicMock(),
+        worker=worker,
+        runner_id=0,
+        session_id="session",
+        main_script_path="app.py",
+        session_state=session_state,
+        initial_rerun_data=RerunData(),
+        user_info={},
+    )
+
+
+def _shutdown_payload() -> Dict[str, Any]:
+    return {"client_state": ClientState().SerializeToString()}
+
+
+class RerunDataSerializationTest(unittest.TestCase):
+    def test_roundtrip(self):
+        widget_states = WidgetStates()
+        widget_state = widget_states.widgets.add()
+        widget_state.id = "widget"
+        widget_state.int_value = 5
+
+        rerun_data = RerunData(
+            query_string="a=b",
+            widget_states=widget_states,
+            page_script_hash="hash",
+            page_name="page",
+        )
+        self.assertEqual(
+            rerun_data, _deserialize_rerun_data(_serialize_rerun_data(rerun_data))
+        )
+
+    def test_roundtrip_without_widget_states(self):
+        rerun_data = RerunData(query_string="a=b")
+        self.assertEqual(
+            rerun_data, _deserialize_rerun_data(_serialize_rerun_data(rerun_data))
+        )
+
+
+class WorkerScriptRunnerTest(unittest.TestCase):
+    def test_translates_forward_msgs(self):
+        runner = _create_runner(SessionState())
+        recorder = _EventRecorder()
+        runner.on_event.connect(recorder)
+
+        msg = ForwardMsg()
+        msg.delta.new_element.text.body = "hello"
+        runner._on_worker_event(
+            0,
+            ScriptRunnerEvent.ENQUEUE_FORWARD_MSG.value,
+            {"forward_msg": msg.SerializeToString()},
+        )
+
+        self.assertEqual(["hello"], recorder.text_deltas)
+
+    def test_request_rerun_after_stop(self):
+        """A stopped WorkerScriptRunner rejects reruns, like ScriptRunner."""
+        runner = _create_runner(SessionState())
+        self.assertTrue(runner.request_rerun(RerunData()))
+        runner.request_stop()
+        self.assertFalse(runner.request_rerun(RerunData()))
+
+    def test_request_rerun_after_shutdown(self):
+        runner = _create_runner(SessionState())
+        runner._on_worker_event(
+            0, ScriptRunnerEvent.SHUTDOWN.value, _shutdown_payload()
+        )
+        self.assertFalse(runner.request_rerun(RerunData()))
+
+    def test_drops_shutdown_with_rerun_in_flight(self):
+        """If the worker's ScriptRunner shuts down while a rerun request is
+        on its way to the worker, the worker will start a replacement, so
+        the SHUTDOWN must not reach the AppSession.
+        """
+        runner = _create_runner(SessionState())
+        recorder = _EventRecorder()
+        runner.on_event.connect(recorder)
+
+        self.assertTrue(runner.request_rerun(RerunData()))
+        runner._on_worker_event(
+            0, ScriptRunnerEvent.SHUTDOWN.value, _shutdown_payload()
+        )
+        self.assertEqual([], recorder.event_types)
+
+        runner._on_rerun_ack(1)
+        runner._on_worker_event(
+            1, ScriptRunnerEvent.SCRIPT_STARTED.value, {"page_script_hash": "hash"}
+        )
+        self.assertEqual([ScriptRunnerEvent.SCRIPT_STARTED], recorder.event_types)
+
+    def test_drops_events_from_old_generations(self):
+        runner = _create_runner(SessionState())
+        recorder = _EventRecorder()
+        runner.on_event.connect(recorder)
+
+        runner.request_rerun(RerunData())
+        runner._on_rerun_ack(1)
+        runner._on_worker_event(
+            0, ScriptRunnerEvent.SHUTDOWN.value, _shutdown_payload()
+        )
+        self.assertEqual([], recorder.event_types)
+
+        runner._on_worker_event(
+            1, ScriptRunnerEvent.SHUTDOWN.value, _shutdown_payload()
+        )
+        self.assertEqual([ScriptRunnerEvent.SHUTDOWN], recorder.event_types)
+
+    def test_mirrors_script_run_result(self):
+        session_state = SessionState()
+        runner = _create_runner(session_state)
+
+        runner._on_worker_event(
+            0,
+            ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS.value,
+            {"script_run_ok": True},
+        )
+        self.assertTrue(session_state[SCRIPT_RUN_WITHOUT_ERRORS_KEY])
+
+    def test_worker_died(self):
+        """If its worker dies, a runner reports that it stopped."""
+        runner = _create_runner(SessionState())
+        recorder = _EventRecorder()
+        runner.on_event.connect(recorder)
+
+        runner._on_worker_died()
+
+        self.assertEqual(
+            [
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+            recorder.event_types,
+        )
+        self.assertFalse(runner.request_rerun(RerunData()))
+
+
+class WorkerTest(unittest.TestCase):
+    def test_rerun_after_release(self):
+        """A rerun request for a runner that was released in the meantime is
+        dropped."""
+        worker = _Worker.__new__(_Worker)
+        worker._runners = {}
+        worker._channel = MagicMock()
+
+        worker._handle_msg(("rerun", 1, _serialize_rerun_data(RerunData())))
+        worker._channel.send.assert_not_called()
+
+
+class ScriptWorkerPoolTest(unittest.TestCase):
+    """Runs scripts in real worker processes."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.media_file_storage = MemoryMediaFileStorage("/mock/media")
+        self.uploaded_file_mgr = MemoryUploadedFileManager("/mock/upload")
+        self.dataframe_window_mgr = DataframeWindowManager("/mock/dataframe")
+
+        # Run workers with the default config, regardless of what other tests
+        # have left behind in this process's config.
+        config_patcher = patch(
+            "streamlit.runtime.scriptrunner.worker_pool._get_config_snapshot",
+            return_value={},
+        )
+        config_patcher.start()
+        self.addCleanup(config_patcher.stop)
+
+    def _create_pool(self, num_workers: int) -> ScriptWorkerPool:
+        pool = ScriptWorkerPool(
+            num_workers=num_workers,
+            main_script_path=_test_data_path("good_script.py"),
+            command_line="",
+            media_file_storage=self.media_file_storage,
+            uploaded_file_manager=self.uploaded_file_mgr,
+            dataframe_window_manager=self.dataframe_window_mgr,
+        )
+        pool.start()
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def _run_script(
+        self, pool: ScriptWorkerPool, session_id: str, script: str
+    ) -> _EventRecorder:
+        recorder = _EventRecorder()
+        runner = pool.create_scriptrunner(
+            session_id=session_id,
+            main_script_path=_test_data_path(script),
+            session_state=SessionState(),
+            initial_rerun_data=RerunData(),
+            user_info={"email": "test@test.com"},
+        )
+        runner.on_event.connect(recorder)
+        runner.start()
+        self.assertTrue(recorder.shutdown.wait(60), "Script run timed out")
+        return recorder
+
+    def test_runs_script_in_worker(self):
+        pool = self._create_pool(1)
+        recorder = self._run_script(pool, "session", "good_script.py")
+
+        self.assertEqual(ScriptRunnerEvent.SCRIPT_STARTED, recorder.event_types[0])
+        self.assertEqual(
+            [
+                ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS,
+                ScriptRunnerEvent.SHUTDOWN,
+            ],
+            recorder.event_types[-2:],
+        )
+        self.assertEqual(["complete! 👨‍🎤"], recorder.text_deltas)
+
+    def test_sessions_are_pinned_to_workers(self):
+        pool = self._create_pool(2)
+        self._run_script(pool, "session1", "good_script.py")
+        self._run_script(pool, "session2", "good_script.py")
+
+        worker1 = pool._worker_by_session["session1"]
+        worker2 = pool._worker_by_session["session2"]
+        self.assertIsNot(worker1, worker2)
+
+        self._run_script(pool, "session1", "good_script.py")
+        self.assertIs(worker1, pool._worker_by_session["session1"])
+
+        pool.close_session("session1")
+        self.assertNotIn("session1", pool._worker_by_session)
+        self.assertEqual(set(), worker1.session_ids)
+
+    def test_compile_error(self):
+        pool = self._create_pool(1)
+        recorder = self._run_script(pool, "session", "compile_error.py.txt")
+
+        self.assertIn(
+            ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR, recorder.event_types
+        )
+        _, kwargs = next(
+            (event, kwargs)
+            for event, kwargs in recorder.events
+            if event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_COMPILE_ERROR
+        )
+        self.assertIsInstance(kwargs["exception"], SyntaxError)
+
+    def test_shared_media_files_are_refcounted(self):
+        """A file that two workers use is only deleted when neither does."""
+        pool = self._create_pool(2)
+        worker1, worker2 = pool._workers
+
+        file_id = pool._handle_rpc(
+            worker1, "media_load", (b"data", "image/png", "media", None)
+        )
+        pool._handle_rpc(worker2, "media_load", (b"data", "image/png", "media", None))
+
+        pool._handle_rpc(worker1, "media_delete", (file_id,))
+        self.assertIsNotNone(self.media_file_storage.get_file(file_id))
+
+        pool._handle_rpc(worker2, "media_delete", (file_id,))
+        with self.assertRaises(Exception):
+            self.media_file_storage.get_file(file_id)
+
+    def test_dead_workers_media_files_are_deleted(self):
+        """A dead worker's files are deleted, unless another worker holds them."""
+        pool = self._create_pool(2)
+        worker1, worker2 = pool._workers
+
+        private_id = pool._handle_rpc(
+            worker1, "media_load", (b"private", "image/png", "media", None)
+        )
+        shared_id = pool._handle_rpc(
+            worker1, "media_load", (b"shared", "image/png", "media", None)
+        )
+        pool._handle_rpc(worker2, "media_load", (b"shared", "image/png", "media", None))
+
+        pool._on_worker_died(worker1)
+
+        with self.assertRaises(Exception):
+            self.media_file_storage.get_file(private_id)
+        self.assertNotIn(private_id, pool._media_holders)
+        self.assertIsNotNone(self.media_file_storage.get_file(shared_id))
+        self.assertEqual({worker2.index}, pool._media_holders[shared_id])
+
+    def test_dataframe_windows_are_kept_by_the_server(self):
+        pool = self._create_pool(1)
+        (worker,) = pool._workers
+
+        url = pool._handle_rpc(
+            worker,
+            "dataframe_window_add",
+            ("session", pa.table({"a": [1, 2, 3]}), "coords"),
+        )
+        window_id = url.rsplit("/", 1)[1]
+        self.assertEqual(
+            3, self.dataframe_window_mgr.get_page(window_id, 0, 1).num_rows
+        )
+
+        pool._handle_rpc(worker, "dataframe_window_clear_session_refs", ("session",))
+        pool._handle_rpc(worker, "dataframe_window_remove_orphaned", ())
+        with self.assertRaises(DataframeWindowNotFoundError):
+            self.dataframe_window_mgr.get_page(window_id, 0, 1)
+
+    def test_upload_urls_are_issued_by_the_server(self):
+        pool = self._create_pool(1)
+        (worker,) = pool._workers
+
+        (url_info,) = pool._handle_rpc(worker, "get_upload_urls", ("session", ["f"]))
+        self.assertEqual(
+            f"/mock/upload/session/{url_info.file_id}", url_info.upload_url
+        )
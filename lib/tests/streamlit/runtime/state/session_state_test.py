@@ -19,13 +19,14 @@ from datetime import date, datetime, timedelta
 from typing import Any, List, Tuple
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as hst
 
 import streamlit as st
 import tests.streamlit.runtime.state.strategies as stst
-from streamlit.errors import StreamlitAPIException
+from streamlit.errors import StreamlitAPIException, UnserializableSessionStateError
 from streamlit.proto.Common_pb2 import FileURLs as FileURLsProto
 from streamlit.proto.WidgetStates_pb2 import WidgetState as WidgetStateProto
 from streamlit.runtime.scriptrunner import get_script_run_ctx
@@ -36,6 +37,7 @@ from streamlit.runtime.state.session_state import (
     Value,
     WidgetMetadata,
     WStates,
+    _check_picklable,
 )
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from streamlit.testing.script_interactions import InteractiveScriptTests
@@ -554,6 +556,24 @@ class SessionStateMethodTests(unittest.TestCase):
         assert self.session_state._new_session_state == {}
         assert self.session_state._new_widget_state == WStates()
 
+    def test_compact_keeps_old_values_under_widget_ids(self):
+        """A value set via session state before its widget existed is kept
+        under the widget's ID too, once the widget has the value's key."""
+        widget_id = f"{GENERATED_WIDGET_ID_PREFIX}-corge-corge"
+        self.session_state._key_id_mapping["corge"] = widget_id
+        self.session_state._compact_state()
+
+        assert self.session_state._old_state["corge"] == "grault"
+        assert self.session_state._old_state[widget_id] == "grault"
+
+    def test_compact_keeps_widget_values_over_old_session_state(self):
+        widget_id = f"{GENERATED_WIDGET_ID_PREFIX}-corge-corge"
+        self.session_state._old_state[widget_id] = "garply"
+        self.session_state._key_id_mapping["corge"] = widget_id
+        self.session_state._compact_state()
+
+        assert self.session_state._old_state[widget_id] == "garply"
+
     # https://github.com/streamlit/streamlit/issues/7206
     def test_ignore_key_error_within_compact_state(self):
         wstates = WStates()
@@ -677,6 +697,20 @@ class SessionStateMethodTests(unittest.TestCase):
         assert generated_widget_key not in self.session_state
         assert self.session_state["val_set_via_state"] == 5
 
+    def test_widget_server_state(self):
+        widget_id = f"{GENERATED_WIDGET_ID_PREFIX}-server_state"
+        server_state = self.session_state.get_widget_server_state(widget_id, dict)
+        server_state["foo"] = "bar"
+        self.assertIs(
+            server_state, self.session_state.get_widget_server_state(widget_id, dict)
+        )
+
+        # The server state is removed together with the widget's state.
+        self.session_state._remove_stale_widgets({"existing_widget"})
+        self.assertEqual(
+            {}, self.session_state.get_widget_server_state(widget_id, dict)
+        )
+
     def test_should_set_frontend_state_value_new_widget(self):
         # The widget is being registered for the first time, so there's no need
         # to have the frontend update with a new value.
@@ -710,17 +744,84 @@ class SessionStateMethodTests(unittest.TestCase):
         with pytest.raises(Exception):
             self.session_state._check_serializable()
 
+    @patch(
+        "streamlit.runtime.state.session_state._check_picklable",
+        wraps=_check_picklable,
+    )
+    def test_check_serializable_skips_checked_values(self, check_picklable):
+        """Values that can't be made unpicklable in place are only pickled again
+        once they're replaced or reassigned."""
+        self.session_state._check_serializable()
+        self.assertEqual(len(self.session_state._keys()), check_picklable.call_count)
+
+        self.session_state["foo"] = ("a", 1, frozenset({2.0}))
+        self.session_state["arr"] = np.arange(3)
+        self.session_state._check_serializable()
+
+        check_picklable.reset_mock()
+        self.session_state._check_serializable()
+        check_picklable.assert_not_called()
+
+        # Reassigning the same object checks it again.
+        value = self.session_state["foo"]
+        self.session_state["foo"] = value
+        self.session_state._check_serializable()
+        check_picklable.assert_called_once_with(value)
+
+    @patch(
+        "streamlit.runtime.state.session_state._check_picklable",
+        wraps=_check_picklable,
+    )
+    def test_check_serializable_rechecks_mutable_values(self, check_picklable):
+        """Values that can be mutated in place are pickled on every check."""
+        for value in [[1, 2], ([1, 2],), np.array([1, "a"], dtype=object)]:
+            self.session_state["foo"] = value
+            self.session_state._check_serializable()
+
+            check_picklable.reset_mock()
+            self.session_state._check_serializable()
+            check_picklable.assert_called_once_with(value)
+
+    def test_detect_unserializable_after_mutation(self):
+        value = []
+        self.session_state["foo"] = value
+        self.session_state._check_serializable()
+
+        value.append(lambda x: x)
+        with pytest.raises(UnserializableSessionStateError):
+            self.session_state._check_serializable()
+
+    def test_detect_unserializable_after_reassignment(self):
+        value = []
+        self.session_state["foo"] = value
+        self.session_state._check_serializable()
+
+        value.append(lambda x: x)
+        self.session_state["foo"] = value
+        with pytest.raises(UnserializableSessionStateError):
+            self.session_state._check_serializable()
+
+    def test_check_picklable(self):
+        _check_picklable({"a": [1, 2, 3], "b": b"x" * 1_000_000})
+        with pytest.raises(Exception):
+            _check_picklable(lambda x: x)
+
 
+# Large generated states can take longer to copy than Hypothesis's default
+# deadline, which made these tests flaky on busy machines.
+@settings(deadline=None)
 @given(state=stst.session_state())
 def test_compact_idempotent(state):
     assert _compact_copy(state) == _compact_copy(_compact_copy(state))
 
 
+@settings(deadline=None)
 @given(state=stst.session_state())
 def test_compact_len(state):
     assert len(state) >= len(_compact_copy(state))
 
 
+@settings(deadline=None)
 @given(state=stst.session_state())
 def test_compact_presence(state):
     assert _sorted_items(state) == _sorted_items(_compact_copy(state))
@@ -26,7 +26,12 @@ from streamlit.proto.Common_pb2 import StringTriggerValue as StringTriggerValueP
 from streamlit.proto.WidgetStates_pb2 import WidgetStates
 from streamlit.runtime.scriptrunner.script_run_context import get_script_run_ctx
 from streamlit.runtime.state import coalesce_widget_states
-from streamlit.runtime.state.common import GENERATED_WIDGET_ID_PREFIX, compute_widget_id
+from streamlit.runtime.state.common import (
+    GENERATED_WIDGET_ID_PREFIX,
+    FormattedOptions,
+    compute_widget_id,
+    format_options,
+)
 from streamlit.runtime.state.session_state import SessionState, WidgetMetadata
 from streamlit.runtime.state.widgets import user_key_from_widget_id
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
@@ -208,6 +213,69 @@ class WidgetManagerTests(unittest.TestCase):
         self.assertIsNone(session_state["string_trigger"])
         self.assertEqual(123, session_state["int"])
 
+    def test_reset_triggers_in_old_state(self):
+        """Triggers are also reset in the previous run's compacted state."""
+        states = WidgetStates()
+        session_state = SessionState()
+
+        _create_widget("trigger", states).trigger_value = True
+        session_state.set_widgets_from_proto(states)
+        session_state._set_widget_metadata(create_metadata("trigger", "trigger_value"))
+        session_state._compact_state()
+        self.assertTrue(session_state._old_state["trigger"])
+
+        session_state._reset_triggers()
+
+        self.assertFalse(session_state._old_state["trigger"])
+
+    def test_trigger_widget_ids_follow_metadata(self):
+        session_state = SessionState()
+        widget_states = session_state._new_widget_state
+
+        session_state._set_widget_metadata(create_metadata("trigger", "trigger_value"))
+        session_state._set_widget_metadata(
+            create_metadata("string_trigger", "string_trigger_value")
+        )
+        session_state._set_widget_metadata(create_metadata("int", "int_value"))
+        self.assertEqual(
+            {"trigger", "string_trigger"}, widget_states.trigger_widget_ids
+        )
+
+        # A widget whose metadata changes type is no longer tracked.
+        session_state._set_widget_metadata(create_metadata("trigger", "int_value"))
+        self.assertEqual({"string_trigger"}, widget_states.trigger_widget_ids)
+
+    def test_call_callbacks_only_deserializes_widgets_with_callbacks(self):
+        """Widgets without a callback aren't deserialized before the script
+        run, only when the script reads their value.
+        """
+        session_state = SessionState()
+        deserializer = MagicMock(side_effect=lambda x, s: x)
+        mock_callback = MagicMock()
+        session_state._set_widget_metadata(
+            WidgetMetadata("plain", deserializer, identity, "int_value")
+        )
+        session_state._set_widget_metadata(
+            WidgetMetadata(
+                "with_callback",
+                lambda x, s: x,
+                identity,
+                "int_value",
+                callback=mock_callback,
+            )
+        )
+
+        states = WidgetStates()
+        _create_widget("plain", states).int_value = 1
+        _create_widget("with_callback", states).int_value = 1
+        session_state.on_script_will_rerun(states)
+
+        deserializer.assert_not_called()
+        mock_callback.assert_called_once()
+
+        self.assertEqual(1, session_state["plain"])
+        deserializer.assert_called_once()
+
     def test_coalesce_widget_states(self):
         session_state = SessionState()
 
@@ -304,6 +372,41 @@ class WidgetHelperTests(unittest.TestCase):
         id = compute_widget_id("button", label="the label")
         assert id.startswith(GENERATED_WIDGET_ID_PREFIX)
 
+    def test_compute_widget_id_with_formatted_options(self):
+        """Widget ids depend on the widget's option labels."""
+        id1 = compute_widget_id("selectbox", options=format_options(["a", "b"], str))
+        id2 = compute_widget_id("selectbox", options=format_options(["a", "b"], str))
+        id3 = compute_widget_id("selectbox", options=format_options(["ab"], str))
+        id4 = compute_widget_id("selectbox", options=format_options(["a\0", "b"], str))
+        id5 = compute_widget_id("selectbox", options=format_options(["a", "\0b"], str))
+        id6 = compute_widget_id("selectbox", options=format_options([], str))
+        id7 = compute_widget_id("selectbox", options=format_options([""], str))
+
+        self.assertEqual(id1, id2)
+        self.assertEqual(7 - 1, len({id1, id3, id4, id5, id6, id7}))
+
+    def test_format_options(self):
+        formatted = format_options([1, "b", None], lambda x: f"option {x}")
+        self.assertIsInstance(formatted, FormattedOptions)
+        self.assertEqual(("option 1", "option b", "option None"), formatted)
+
+    @parameterized.expand(
+        [
+            ("tuple", ("a", 1, 1.5, True, None), str, True),
+            ("range", range(100), str, True),
+            ("list", ["a", "b"], str, False),
+            ("tuple with mutable option", ("a", ["b"]), str, False),
+            ("custom format_func", ("a", "b"), lambda x: x, False),
+        ]
+    )
+    def test_format_options_cache(self, _, options, format_func, cached):
+        """Options that can't change, formatted with `str`, are only formatted
+        once.
+        """
+        formatted = format_options(options, format_func)
+        self.assertEqual(tuple(str(option) for option in options), formatted)
+        self.assertEqual(cached, format_options(options, format_func) is formatted)
+
 
 class ComputeWidgetIdTests(DeltaGeneratorTestCase):
     """Enforce that new arguments added to the signature of a widget function are taken
@@ -326,6 +429,8 @@ class ComputeWidgetIdTests(DeltaGeneratorTestCase):
             "on_change",
             "on_click",
             "on_submit",
+            # Rerun scheduling.
+            "debounce",
         }
 
         kwargs = {
@@ -435,7 +540,7 @@ class ComputeWidgetIdTests(DeltaGeneratorTestCase):
 
     def test_widget_id_computation_data_editor(self):
         with patch(
-            f"streamlit.elements.widgets.data_editor.compute_widget_id",
+            "streamlit.elements.widgets.data_editor.compute_widget_id",
             wraps=compute_widget_id,
         ) as patched_compute_widget_id:
             st.data_editor(data=[])
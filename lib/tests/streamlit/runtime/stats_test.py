@@ -12,10 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import unittest
 from typing import List
 
-from streamlit.runtime.stats import CacheStat, CacheStatsProvider, StatsManager
+from google.protobuf.json_format import MessageToDict
+
+from streamlit.proto.openmetrics_data_model_pb2 import MetricFamily as MetricFamilyProto
+from streamlit.runtime.stats import (
+    CacheStat,
+    CacheStatsProvider,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    StatsManager,
+    get_metrics_registry,
+)
+from tests.exception_capturing_thread import call_on_threads
 
 
 class MockStatsProvider(CacheStatsProvider):
@@ -50,3 +64,123 @@ class StatsManagerTest(unittest.TestCase):
         ]
 
         self.assertEqual(provider1.stats + provider2.stats, manager.get_stats())
+
+    def test_get_metrics(self):
+        """StatsManager.get_metrics returns the global metrics, followed by
+        the manager's own."""
+        manager = StatsManager()
+        gauge = Gauge("mock_gauge", "A gauge.", callback=lambda: 1)
+        manager.register_metric(gauge)
+
+        metrics = manager.get_metrics()
+        self.assertEqual(gauge, metrics[-1])
+        self.assertEqual(get_metrics_registry().get_metrics(), metrics[:-1])
+
+
+def _to_dict(metric) -> dict:
+    metric_family = MetricFamilyProto()
+    metric.marshall_metric_family(metric_family)
+    return MessageToDict(metric_family)
+
+
+class MetricsTest(unittest.TestCase):
+    def test_counter(self):
+        counter = Counter("requests", "Requests.", labelnames=("page",))
+        counter.inc("main")
+        counter.inc("main", amount=2)
+        counter.inc("other")
+
+        self.assertEqual(3, counter.get_value("main"))
+        self.assertEqual(0, counter.get_value("missing"))
+        self.assertEqual(
+            {
+                "name": "requests",
+                "type": "COUNTER",
+                "help": "Requests.",
+                "metrics": [
+                    {
+                        "labels": [{"name": "page", "value": "main"}],
+                        "metricPoints": [{"counterValue": {"doubleValue": 3.0}}],
+                    },
+                    {
+                        "labels": [{"name": "page", "value": "other"}],
+                        "metricPoints": [{"counterValue": {"doubleValue": 1.0}}],
+                    },
+                ],
+            },
+            _to_dict(counter),
+        )
+
+    def test_wrong_labels(self):
+        counter = Counter("requests", "Requests.", labelnames=("page",))
+        with self.assertRaises(ValueError):
+            counter.inc()
+        with self.assertRaises(ValueError):
+            counter.inc("main", "extra")
+
+    def test_gauge(self):
+        gauge = Gauge("temperature", "Temperature.")
+        gauge.set(5)
+        gauge.set(3)
+        self.assertEqual(3, gauge.get_value())
+
+        callback_gauge = Gauge("sessions", "Sessions.", callback=lambda: 7)
+        self.assertEqual(
+            [{"metricPoints": [{"gaugeValue": {"doubleValue": 7.0}}]}],
+            _to_dict(callback_gauge)["metrics"],
+        )
+
+        with self.assertRaises(ValueError):
+            Gauge("sessions", "Sessions.", labelnames=("page",), callback=lambda: 7)
+
+    def test_histogram(self):
+        """Histogram buckets are exported cumulatively, with a final +Inf
+        bucket."""
+        histogram = Histogram(
+            "duration_seconds", "Durations.", unit="seconds", buckets=(1, 0.1)
+        )
+        self.assertEqual((0.1, 1, math.inf), histogram.buckets)
+
+        for value in (0.05, 0.1, 0.5, 5):
+            histogram.observe(value)
+
+        self.assertEqual(4, histogram.get_count())
+        self.assertEqual(
+            {
+                "histogramValue": {
+                    "doubleValue": 5.65,
+                    "count": "4",
+                    "buckets": [
+                        {"count": "2", "upperBound": 0.1},
+                        {"count": "3", "upperBound": 1.0},
+                        {"count": "4", "upperBound": "Infinity"},
+                    ],
+                }
+            },
+            _to_dict(histogram)["metrics"][0]["metricPoints"][0],
+        )
+
+    def test_counter_from_threads(self):
+        """Metrics can be updated from multiple threads."""
+        counter = Counter("requests", "Requests.")
+
+        def inc(_: int) -> None:
+            for _ in range(100):
+                counter.inc()
+
+        call_on_threads(inc, num_threads=10)
+        self.assertEqual(1000, counter.get_value())
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def test_get_or_create(self):
+        """Metrics are created once per name."""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests", "Requests.")
+        histogram = registry.histogram("duration_seconds", "Durations.")
+
+        self.assertIs(counter, registry.counter("requests", "Requests."))
+        self.assertEqual([counter, histogram], registry.get_metrics())
+
+        with self.assertRaises(ValueError):
+            registry.gauge("requests", "Requests.")
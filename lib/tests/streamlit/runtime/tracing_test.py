@@ -0,0 +1,195 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""tracing unit tests."""
+
+import json
+import os
+import tempfile
+import unittest
+from typing import Dict, List
+from unittest.mock import patch
+
+from streamlit.runtime import tracing
+from streamlit.runtime.tracing import FileSpanExporter, Span, Tracer
+from tests.testutil import patch_config_options
+
+
+class MockSpanExporter:
+    def __init__(self):
+        self.traces: List[List[Span]] = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.traces.append(spans)
+
+
+def _wait_for_exports(tracer: Tracer) -> None:
+    tracer._executor.submit(lambda: None).result()
+
+
+def _by_name(spans: List[Span]) -> Dict[str, Span]:
+    return {span.name: span for span in spans}
+
+
+class TracerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.exporter = MockSpanExporter()
+        self.tracer = Tracer(sample_rate=1.0, exporter=self.exporter)
+
+    def test_rerun_trace(self):
+        """A rerun's trace has spans for its queueing, its run, the commands
+        it ran, and the messages it sent, and is exported when its last
+        message was sent."""
+        self.tracer.on_rerun_requested("session")
+        # Reruns that are requested before the run starts are coalesced.
+        self.tracer.on_rerun_requested("session")
+
+        run_span = self.tracer.on_script_started("session", "main_page")
+        with tracing.use_span(run_span):
+            with tracing.span("text", {"arg": 1}) as span:
+                self.assertIsNotNone(span)
+                with tracing.span("markdown"):
+                    pass
+        self.assertIsNone(tracing.get_current_span())
+
+        send_span = self.tracer.on_message_sent("session", "delta")
+        send_span.end()
+        self.assertEqual([], self.exporter.traces)
+
+        self.tracer.on_run_messages_sent("session")
+        _wait_for_exports(self.tracer)
+
+        (spans,) = self.exporter.traces
+        spans_by_name = _by_name(spans)
+        self.assertEqual(
+            ["queued", "markdown", "text", "script_run", "send_message", "rerun"],
+            [span.name for span in spans],
+        )
+        self.assertEqual(1, len({span.trace_id for span in spans}))
+
+        root = spans_by_name["rerun"]
+        self.assertIsNone(root.parent)
+        self.assertEqual("main_page", root.attributes["page"])
+        for name in ("queued", "script_run", "send_message"):
+            self.assertIs(root, spans_by_name[name].parent)
+        self.assertIs(run_span, spans_by_name["text"].parent)
+        self.assertIs(spans_by_name["text"], spans_by_name["markdown"].parent)
+
+    def test_messages_are_attributed_to_the_oldest_run(self):
+        """Runs can start before the messages of earlier runs are sent."""
+        first_run_span = self.tracer.on_script_started("session", "page")
+        second_run_span = self.tracer.on_script_started("session", "page")
+
+        self.assertIs(
+            first_run_span.parent, self.tracer.on_message_sent("session", "").parent
+        )
+        self.tracer.on_run_messages_sent("session")
+        self.assertIs(
+            second_run_span.parent, self.tracer.on_message_sent("session", "").parent
+        )
+
+    def test_unsampled_rerun(self):
+        tracer = Tracer(sample_rate=0.0, exporter=self.exporter)
+        tracer.on_rerun_requested("session")
+
+        self.assertIsNone(tracer.on_script_started("session", "page"))
+        self.assertIsNone(tracer.on_message_sent("session", "delta"))
+        with tracing.span("text") as span:
+            self.assertIsNone(span)
+
+    def test_exception(self):
+        """Spans record the exceptions that were raised in them."""
+        run_span = self.tracer.on_script_started("session", "page")
+        with self.assertRaises(ValueError):
+            with tracing.use_span(run_span):
+                raise ValueError("bad value")
+
+        span_dict = run_span.to_dict()
+        self.assertEqual(
+            {"code": 2, "message": "ValueError: bad value"}, span_dict["status"]
+        )
+        self.assertEqual(run_span.parent.span_id, span_dict["parentSpanId"])
+
+    def test_session_closed(self):
+        self.tracer.on_script_started("session", "page")
+        self.tracer.on_session_closed("session")
+
+        self.assertIsNone(self.tracer.on_message_sent("session", "delta"))
+        self.tracer.on_run_messages_sent("session")
+        _wait_for_exports(self.tracer)
+        self.assertEqual([], self.exporter.traces)
+
+
+class FileSpanExporterTest(unittest.TestCase):
+    def test_export(self):
+        """Each trace is appended to the file as a line of OTLP JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "traces.jsonl")
+            tracer = Tracer(sample_rate=1.0, exporter=FileSpanExporter(path))
+            for _ in range(2):
+                root = tracer.start_trace("rerun", {"count": 1, "name": "x"})
+                root.end()
+            _wait_for_exports(tracer)
+
+            with open(path) as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(2, len(lines))
+        (resource_spans,) = json.loads(lines[0])["resourceSpans"]
+        (span,) = resource_spans["scopeSpans"][0]["spans"]
+        self.assertEqual("rerun", span["name"])
+        self.assertEqual(32, len(span["traceId"]))
+        self.assertEqual(16, len(span["spanId"]))
+        self.assertNotIn("parentSpanId", span)
+        self.assertEqual(
+            [
+                {"key": "count", "value": {"intValue": "1"}},
+                {"key": "name", "value": {"stringValue": "x"}},
+            ],
+            span["attributes"],
+        )
+
+
+class GetTracerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch.multiple(tracing, _tracer=None, _tracer_created=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(tracing.get_tracer())
+
+    @patch_config_options(
+        {
+            "runner.traceSampleRate": 0.5,
+            "runner.traceExportTarget": "http://localhost:4318/v1/traces",
+        }
+    )
+    def test_enabled(self):
+        tracer = tracing.get_tracer()
+        self.assertIsInstance(tracer._exporter, tracing.HttpSpanExporter)
+        self.assertIs(tracer, tracing.get_tracer())
+
+    @patch_config_options({"runner.traceSampleRate": 1.0})
+    def test_disabled_without_export_target(self):
+        self.assertIsNone(tracing.get_tracer())
+
+    @patch_config_options(
+        {"runner.traceSampleRate": 1.0, "runner.traceExportTarget": "traces.jsonl"}
+    )
+    def test_disable_tracing(self):
+        tracing.disable_tracing()
+        self.assertIsNone(tracing.get_tracer())
@@ -14,11 +14,16 @@
 
 """Unit tests for UploadedFileManager"""
 
+import io
+import mmap
+import pickle
+import tempfile
 import unittest
 
+from streamlit.proto.Common_pb2 import FileURLs as FileURLsProto
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.runtime.stats import CacheStat
-from streamlit.runtime.uploaded_file_manager import UploadedFileRec
+from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from tests.exception_capturing_thread import call_on_threads
 
 FILE_1 = UploadedFileRec(file_id="url1", name="file1", type="type", data=b"file1")
@@ -89,6 +94,27 @@ class UploadedFileManagerTest(unittest.TestCase):
         )
         self.assertEqual([FILE_1], self.mgr.get_files("session2", [FILE_1.file_id]))
 
+    def test_get_session_size(self):
+        self.assertEqual(0, self.mgr.get_session_size("session1"))
+
+        self.mgr.add_file("session1", FILE_1)
+        self.mgr.add_file("session1", FILE_2)
+        self.mgr.add_file("session2", FILE_1)
+
+        self.assertEqual(
+            len(FILE_1.data) + len(FILE_2.data), self.mgr.get_session_size("session1")
+        )
+        self.assertEqual(len(FILE_1.data), self.mgr.get_session_size("session2"))
+
+    def test_get_max_upload_size(self):
+        self.assertIsNone(self.mgr.get_max_upload_size("session"))
+
+        mgr = MemoryUploadedFileManager("/mock/upload", max_session_size=10)
+        mgr.add_file("session", FILE_1)
+        self.assertEqual(10 - len(FILE_1.data), mgr.get_max_upload_size("session"))
+        mgr.add_file("session", FILE_2)
+        self.assertEqual(0, mgr.get_max_upload_size("session"))
+
     def test_cache_stats_provider(self):
         """Test CacheStatsProvider implementation."""
 
@@ -114,6 +140,72 @@ class UploadedFileManagerTest(unittest.TestCase):
         self.assertEqual(expected, self.mgr.get_stats())
 
 
+class MappedUploadedFileTest(unittest.TestCase):
+    """Tests UploadedFiles whose content is memory-mapped."""
+
+    DATA = b"line 1\nline 2\n\nlast line"
+
+    def setUp(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(self.DATA)
+            f.flush()
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        record = UploadedFileRec(
+            file_id="id", name="name", type="type", data=self.mapped
+        )
+        self.file = UploadedFile(record, FileURLsProto())
+        self.expected = io.BytesIO(self.DATA)
+
+    def test_read(self):
+        self.assertEqual(len(self.DATA), self.file.size)
+        for size in [3, -1, 4]:
+            self.assertEqual(self.expected.read(size), self.file.read(size))
+            self.assertEqual(self.expected.tell(), self.file.tell())
+        self.assertEqual(self.DATA, self.file.getvalue())
+        self.assertEqual(self.DATA, bytes(self.file.getbuffer()))
+
+    def test_readinto(self):
+        buffer = bytearray(5)
+        self.assertEqual(5, self.file.readinto(buffer))
+        self.assertEqual(self.DATA[:5], buffer)
+
+    def test_readline(self):
+        self.assertEqual(self.expected.readline(3), self.file.readline(3))
+        self.assertEqual(self.expected.readline(), self.file.readline())
+        self.assertEqual(self.expected.readlines(), self.file.readlines())
+
+        self.file.seek(0)
+        self.assertEqual(self.DATA.splitlines(keepends=True), list(self.file))
+
+    def test_seek(self):
+        for pos, whence in [(2, io.SEEK_SET), (3, io.SEEK_CUR), (-4, io.SEEK_END)]:
+            self.assertEqual(
+                self.expected.seek(pos, whence), self.file.seek(pos, whence)
+            )
+            self.assertEqual(self.expected.read(), self.file.read())
+        with self.assertRaises(ValueError):
+            self.file.seek(-1)
+
+    def test_write_copies_content(self):
+        """Writing to a file doesn't change the memory map."""
+        self.file.seek(5)
+        self.file.write(b"X")
+        self.assertEqual(b"line X\nline 2", self.file.getvalue()[:13])
+        self.assertEqual(self.DATA, self.mapped[:])
+
+    def test_closed(self):
+        self.file.close()
+        with self.assertRaises(ValueError):
+            self.file.read()
+
+    def test_pickle(self):
+        self.file.seek(3)
+        unpickled = pickle.loads(pickle.dumps(self.file))
+        self.assertEqual(3, unpickled.tell())
+        self.assertEqual(self.DATA, unpickled.getvalue())
+        self.assertEqual("name", unpickled.name)
+
+
 class UploadedFileManagerThreadingTest(unittest.TestCase):
     # The number of threads to run our tests on
     NUM_THREADS = 50
@@ -29,6 +29,7 @@ from parameterized import parameterized
 from streamlit import type_util
 from streamlit.type_util import (
     DataFormat,
+    bytes_to_data_frame,
     convert_anything_to_df,
     data_frame_to_bytes,
     fix_arrow_incompatible_column_types,
@@ -51,7 +52,7 @@ from tests.streamlit.data_mocks import (
 )
 from tests.streamlit.snowpark_mocks import DataFrame as SnowparkDataFrame
 from tests.streamlit.snowpark_mocks import Row as SnowparkRow
-from tests.testutil import create_snowpark_session
+from tests.testutil import create_snowpark_session, patch_config_options
 
 
 class TypeUtilTest(unittest.TestCase):
@@ -130,6 +131,34 @@ class TypeUtilTest(unittest.TestCase):
         except Exception as ex:
             self.fail(f"Converting dtype dataframes to Arrow should not fail: {ex}")
 
+    def test_pyarrow_table_to_bytes_compression(self):
+        """Large tables are compressed with LZ4."""
+        df = pd.DataFrame({"a": np.arange(100_000) % 10, "b": ["foo"] * 100_000})
+        uncompressed = data_frame_to_bytes(df)
+
+        with patch_config_options({"server.arrowCompression": "lz4"}):
+            compressed = data_frame_to_bytes(df)
+
+        self.assertLess(len(compressed), len(uncompressed) / 2)
+        pd.testing.assert_frame_equal(df, bytes_to_data_frame(compressed))
+
+    def test_pyarrow_table_to_bytes_skips_compressing_small_tables(self):
+        df = pd.DataFrame({"a": [1, 2, 3]})
+        uncompressed = data_frame_to_bytes(df)
+        with patch_config_options({"server.arrowCompression": "lz4"}):
+            self.assertEqual(uncompressed, data_frame_to_bytes(df))
+
+    def test_pyarrow_table_to_bytes_unsupported_codec(self):
+        """An unsupported codec logs a warning and sends data uncompressed."""
+        df = pd.DataFrame({"a": np.arange(100_000)})
+        uncompressed = data_frame_to_bytes(df)
+        with patch_config_options({"server.arrowCompression": "zstd"}), patch(
+            "streamlit.type_util._LOGGER"
+        ) as mock_logger:
+            type_util._warn_unavailable_arrow_codec.cache_clear()
+            self.assertEqual(uncompressed, data_frame_to_bytes(df))
+            mock_logger.warning.assert_called_once()
+
     @parameterized.expand(
         SHARED_TEST_CASES,
     )
@@ -22,6 +22,11 @@ import tornado.websocket
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime, SessionClientDisconnectedError
+from streamlit.runtime.runtime_util import serialize_forward_msg
+from streamlit.web.server.browser_websocket_handler import (
+    _FORWARD_MSG_BYTES_SENT,
+    _FORWARD_MSGS_SENT,
+)
 from streamlit.web.server.server import BrowserWebSocketHandler
 from tests.streamlit.web.server.server_test_case import ServerTestCase
 from tests.testutil import patch_config_options
@@ -92,6 +97,36 @@ class BrowserWebSocketHandlerTest(ServerTestCase):
 
                 write_message_mock.assert_called_once()
 
+    @tornado.testing.gen_test
+    async def test_sent_msgs_are_counted(self):
+        """Sent messages are counted, with their uncompressed sizes."""
+        with self._patch_app_session():
+            await self.server.start()
+            ws_client = await tornado.websocket.websocket_connect(
+                self.get_ws_url("/_stcore/stream"),
+                subprotocols=["streamlit"],
+            )
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler = session_info.client
+
+            msg = ForwardMsg()
+            msg.delta.new_element.markdown.body = "X" * 10000
+            num_msgs = _FORWARD_MSGS_SENT.get_value()
+            num_bytes = _FORWARD_MSG_BYTES_SENT.get_value()
+
+            websocket_handler.write_forward_msg(msg)
+            received = await self.read_forward_msg(ws_client)
+            self.assertEqual(
+                msg.delta.new_element.markdown.body,
+                received.delta.new_element.markdown.body,
+            )
+
+            self.assertEqual(num_msgs + 1, _FORWARD_MSGS_SENT.get_value())
+            self.assertEqual(
+                num_bytes + len(serialize_forward_msg(msg)),
+                _FORWARD_MSG_BYTES_SENT.get_value(),
+            )
+
     @tornado.testing.gen_test
     async def test_backmsg_deserialization_exception(self):
         """If BackMsg deserialization raises an Exception, we should call the Runtime's
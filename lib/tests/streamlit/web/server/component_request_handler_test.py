@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import os
+import tempfile
 from unittest import mock
 
 import tornado.testing
@@ -19,6 +22,7 @@ import tornado.web
 
 from streamlit.components.v1.components import ComponentRegistry, declare_component
 from streamlit.web.server import ComponentRequestHandler
+from streamlit.web.server.component_request_handler import ComponentAssetCache
 
 URL = "http://not.a.real.url:3001"
 PATH = "not/a/real/path"
@@ -176,3 +180,151 @@ class ComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
             payload,
             response.body,
         )
+
+
+class CachedComponentRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    """Test /component endpoint with an asset cache."""
+
+    JS_DATA = b"console.log('component');\n" * 100
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._component_dir = os.path.realpath(self._tmpdir.name)
+        self._write("index.html", b"<html></html>")
+        self._write("main.js", self.JS_DATA)
+
+        watch_file_patcher = mock.patch(
+            "streamlit.web.server.component_request_handler.watch_file"
+        )
+        self.watch_file = watch_file_patcher.start()
+        self.addCleanup(watch_file_patcher.stop)
+
+        self.asset_cache = ComponentAssetCache()
+        super().setUp()
+        declare_component("test", path=self._component_dir)
+
+    def tearDown(self) -> None:
+        ComponentRegistry._instance = None
+        super().tearDown()
+        self._tmpdir.cleanup()
+
+    def _write(self, filename: str, data: bytes) -> None:
+        with open(os.path.join(self._component_dir, filename), "wb") as f:
+            f.write(data)
+
+    def get_app(self):
+        ComponentRegistry._instance = None
+        return tornado.web.Application(
+            [
+                (
+                    "/component/(.*)",
+                    ComponentRequestHandler,
+                    dict(
+                        registry=ComponentRegistry.instance(),
+                        asset_cache=self.asset_cache,
+                    ),
+                )
+            ]
+        )
+
+    def _request_component(self, filename: str, **headers):
+        return self.fetch(
+            "/component/tests.streamlit.web.server.component_request_handler_test.test/"
+            + filename,
+            headers=headers,
+            decompress_response=False,
+        )
+
+    def test_cached_file(self):
+        """Files are read once, and then served from the cache."""
+        response = self._request_component("main.js")
+        self.assertEqual(200, response.code)
+        self.assertEqual(self.JS_DATA, response.body)
+        self.assertIn("Last-Modified", response.headers)
+
+        with mock.patch("streamlit.web.server.component_request_handler.open") as m:
+            response = self._request_component("main.js")
+            m.assert_not_called()
+        self.assertEqual(self.JS_DATA, response.body)
+
+    def test_modified_file(self):
+        """Files are read again when their modification time changes."""
+        self._request_component("main.js")
+
+        self._write("main.js", b"modified")
+        path = os.path.join(self._component_dir, "main.js")
+        os.utime(path, ns=(0, 0))
+
+        self.assertEqual(b"modified", self._request_component("main.js").body)
+
+    def test_watched_file(self):
+        """Cached files are dropped when the file watcher reports a change."""
+        self._request_component("main.js")
+        self._request_component("main.js")
+
+        path = os.path.join(self._component_dir, "main.js")
+        self.watch_file.assert_called_once_with(path, mock.ANY)
+        on_changed = self.watch_file.call_args[0][1]
+
+        with mock.patch(
+            "streamlit.web.server.component_request_handler.open",
+            mock.mock_open(read_data=b"changed"),
+        ):
+            on_changed(path)
+            self.assertEqual(b"changed", self._request_component("main.js").body)
+
+    def test_conditional_request(self):
+        """Files get an ETag, which gets a 304."""
+        response = self._request_component("main.js")
+        etag = response.headers["Etag"]
+
+        response = self._request_component("main.js", **{"If-None-Match": etag})
+        self.assertEqual(304, response.code)
+        self.assertEqual(b"", response.body)
+
+    def test_compressed_file(self):
+        """Clients that accept gzip get the compressed variant."""
+        response = self._request_component("main.js", **{"Accept-Encoding": "gzip"})
+
+        self.assertEqual(200, response.code)
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual(self.JS_DATA, gzip.decompress(response.body))
+
+        response = self._request_component("index.html", **{"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual("no-cache", response.headers["Cache-Control"])
+
+    def test_uncached_asset_cache(self):
+        """Caches with no size never cache or watch files."""
+        cache = ComponentAssetCache(max_size=0)
+        path = os.path.join(self._component_dir, "main.js")
+
+        self.assertEqual(self.JS_DATA, cache.get(path).content)
+        self.assertEqual(self.JS_DATA, cache.get(path).content)
+        self.watch_file.assert_not_called()
+
+    def test_uncacheable_file_isnt_compressed(self):
+        """Files too large to cache aren't compressed, since that would be
+        done again on every request."""
+        cache = ComponentAssetCache(max_size=len(self.JS_DATA) - 1)
+        path = os.path.join(self._component_dir, "main.js")
+
+        with mock.patch(
+            "streamlit.web.server.component_request_handler.get_compressed_variants"
+        ) as get_compressed_variants:
+            asset = cache.get(path)
+        get_compressed_variants.assert_not_called()
+        self.assertEqual({}, asset.variants)
+        self.assertIsNone(cache.get_cached(path))
+
+    def test_variants_that_dont_fit_arent_cached(self):
+        """Files whose compressed variants don't fit are cached without them."""
+        cache = ComponentAssetCache(max_size=len(self.JS_DATA))
+        path = os.path.join(self._component_dir, "main.js")
+
+        cache.get(path)
+
+        cached = cache.get_cached(path)
+        self.assertIsNotNone(cached)
+        self.assertEqual(self.JS_DATA, cached.content)
+        self.assertEqual({}, cached.variants)
@@ -0,0 +1,74 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pyarrow as pa
+import tornado.testing
+import tornado.web
+from typing_extensions import Final
+
+from streamlit.runtime.dataframe_window_manager import DataframeWindowManager
+from streamlit.type_util import bytes_to_data_frame
+from streamlit.web.server.dataframe_window_handler import DataframeWindowHandler
+
+MOCK_ENDPOINT: Final = "/mock/dataframe"
+
+
+class DataframeWindowHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    def setUp(self) -> None:
+        self.dataframe_window_mgr = DataframeWindowManager(MOCK_ENDPOINT)
+        super().setUp()
+        self.url = self.dataframe_window_mgr.add(
+            pa.table({"a": [3, 1, 2], "b": ["x", "y", "z"]}),
+            "mock_coords",
+            session_id="mock_session_id",
+        )
+
+    def get_app(self) -> tornado.web.Application:
+        return tornado.web.Application(
+            [
+                (
+                    f"{MOCK_ENDPOINT}/([^/]+)",
+                    DataframeWindowHandler,
+                    dict(dataframe_window_mgr=self.dataframe_window_mgr),
+                )
+            ]
+        )
+
+    def test_get_page(self):
+        rsp = self.fetch(f"{self.url}?offset=1&limit=1", method="GET")
+
+        self.assertEqual(200, rsp.code)
+        self.assertEqual(
+            "application/vnd.apache.arrow.stream", rsp.headers["Content-Type"]
+        )
+        self.assertEqual("3", rsp.headers["X-Streamlit-Num-Rows"])
+        self.assertEqual([1], list(bytes_to_data_frame(rsp.body)["a"]))
+
+    def test_get_sorted_and_filtered_page(self):
+        rsp = self.fetch(
+            f"{self.url}?sort=a&order=desc&filter_column=b&filter=Y", method="GET"
+        )
+
+        self.assertEqual(200, rsp.code)
+        self.assertEqual("1", rsp.headers["X-Streamlit-Num-Rows"])
+        self.assertEqual(["y"], list(bytes_to_data_frame(rsp.body)["b"]))
+
+    def test_missing_window(self):
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/nonexistent", method="GET")
+        self.assertEqual(404, rsp.code)
+
+    def test_bad_requests(self):
+        for query in ["offset=foo", "offset=-1", "sort=nonexistent"]:
+            rsp = self.fetch(f"{self.url}?{query}", method="GET")
+            self.assertEqual(400, rsp.code, query)
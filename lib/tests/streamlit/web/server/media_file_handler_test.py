@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
+import tempfile
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -20,21 +22,25 @@ import tornado.web
 from parameterized import parameterized
 from typing_extensions import Final
 
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.web.server.media_file_handler import MediaFileHandler
+from streamlit.web.server.server_util import IMMUTABLE_CACHE_CONTROL
 
 MOCK_ENDPOINT: Final = "/mock/media"
 
+CSV_DATA: Final = b"a,b,c\n" + b"1,2,3\n" * 1000
+
 
 class MediaFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def setUp(self) -> None:
         super().setUp()
         # Create a new MediaFileManager and assign its storage to
         # MediaFileHandler.
-        storage = MemoryMediaFileStorage(MOCK_ENDPOINT)
-        self.media_file_manager = MediaFileManager(storage)
-        MediaFileHandler.initialize_storage(storage)
+        self.storage = MemoryMediaFileStorage(MOCK_ENDPOINT)
+        self.media_file_manager = MediaFileManager(self.storage)
+        MediaFileHandler.initialize_storage(self.storage)
 
     def get_app(self) -> tornado.web.Application:
         return tornado.web.Application(
@@ -105,3 +111,138 @@ class MediaFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
         url = f"{MOCK_ENDPOINT}/invalid_media_file.mp4"
         rsp = self.fetch(url, method="GET")
         self.assertEqual(404, rsp.code)
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_range_request(self) -> None:
+        """Range requests get the requested part of the file."""
+        url = self.media_file_manager.add(b"mock_data", "video/mp4", "mock_coords")
+        rsp = self.fetch(url, method="GET", headers={"Range": "bytes=2-5"})
+
+        self.assertEqual(206, rsp.code)
+        self.assertEqual(b"ck_d", rsp.body)
+        self.assertEqual("bytes 2-5/9", rsp.headers["Content-Range"])
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_conditional_request(self) -> None:
+        """Files get their ID as their ETag, and requests for files that the
+        client has already get a 304."""
+        url = self.media_file_manager.add(b"mock_data", "video/mp4", "mock_coords")
+        rsp = self.fetch(url, method="GET")
+        etag = rsp.headers["Etag"]
+        file_id = url.split("/")[-1].split(".")[0]
+        self.assertEqual(f'"{file_id}"', etag)
+
+        rsp = self.fetch(url, method="GET", headers={"If-None-Match": etag})
+        self.assertEqual(304, rsp.code)
+        self.assertEqual(b"", rsp.body)
+        self.assertEqual(etag, rsp.headers["Etag"])
+
+        rsp = self.fetch(url, method="GET", headers={"If-None-Match": '"other"'})
+        self.assertEqual(200, rsp.code)
+
+    @parameterized.expand([(False, IMMUTABLE_CACHE_CONTROL), (True, None)])
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_cache_control(self, is_for_static_download, cache_control) -> None:
+        """Media files are cached forever; downloadable files aren't."""
+        url = self.media_file_manager.add(
+            b"mock_data",
+            "video/mp4",
+            "mock_coords",
+            is_for_static_download=is_for_static_download,
+        )
+        rsp = self.fetch(url, method="GET")
+        self.assertEqual(cache_control, rsp.headers.get("Cache-Control"))
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_compressed_file(self) -> None:
+        """Text-like files are compressed when they're first requested, and
+        served compressed to clients that accept it from then on."""
+        url = self.media_file_manager.add(CSV_DATA, "text/csv", "mock_coords")
+
+        compress_in_background = self.storage.compress_in_background
+        futures = []
+
+        def compress_and_record(filename):
+            future = compress_in_background(filename)
+            futures.append(future)
+            return future
+
+        with mock.patch.object(
+            self.storage, "compress_in_background", side_effect=compress_and_record
+        ):
+            rsp = self.fetch(
+                url,
+                method="GET",
+                headers={"Accept-Encoding": "gzip"},
+                decompress_response=False,
+            )
+        self.assertEqual(200, rsp.code)
+        self.assertNotIn("Content-Encoding", rsp.headers)
+        self.assertEqual(CSV_DATA, rsp.body)
+
+        self.assertEqual(1, len(futures))
+        futures[0].result()
+
+        rsp = self.fetch(
+            url,
+            method="GET",
+            headers={"Accept-Encoding": "gzip"},
+            decompress_response=False,
+        )
+        self.assertEqual(200, rsp.code)
+        self.assertEqual("gzip", rsp.headers["Content-Encoding"])
+        self.assertEqual("Accept-Encoding", rsp.headers["Vary"])
+        self.assertEqual("text/csv", rsp.headers["Content-Type"])
+        self.assertEqual(str(len(rsp.body)), rsp.headers["Content-Length"])
+        self.assertLess(len(rsp.body), len(CSV_DATA))
+        self.assertEqual(CSV_DATA, gzip.decompress(rsp.body))
+        self.assertTrue(rsp.headers["Etag"].endswith('-gzip"'))
+
+        rsp = self.fetch(url, method="GET", decompress_response=False)
+        self.assertNotIn("Content-Encoding", rsp.headers)
+        self.assertEqual(CSV_DATA, rsp.body)
+
+    @mock.patch(
+        "streamlit.runtime.media_file_manager._get_session_id",
+        MagicMock(return_value="mock_session_id"),
+    )
+    def test_compressed_file_range_request(self) -> None:
+        """Range requests for compressed files get the uncompressed content."""
+        url = self.media_file_manager.add(CSV_DATA, "text/csv", "mock_coords")
+        rsp = self.fetch(
+            url,
+            method="GET",
+            headers={"Accept-Encoding": "gzip", "Range": "bytes=0-5"},
+            decompress_response=False,
+        )
+
+        self.assertEqual(206, rsp.code)
+        self.assertNotIn("Content-Encoding", rsp.headers)
+        self.assertEqual(CSV_DATA[:6], rsp.body)
+
+
+class DiskMediaFileHandlerTest(MediaFileHandlerTest):
+    """MediaFileHandler serves files from DiskMediaFileStorage too."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage = DiskMediaFileStorage(MOCK_ENDPOINT, directory=self.temp_dir.name)
+        self.media_file_manager = MediaFileManager(self.storage)
+        MediaFileHandler.initialize_storage(self.storage)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
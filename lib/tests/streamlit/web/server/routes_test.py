@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import json
 import os
 import tempfile
+from unittest import mock
 from unittest.mock import MagicMock
 
 import tornado.httpserver
@@ -34,6 +36,8 @@ from streamlit.web.server.server import (
     MessageCacheHandler,
     StaticFileHandler,
 )
+from streamlit.web.server.server_util import IMMUTABLE_CACHE_CONTROL
+from streamlit.web.server.static_asset_index import StaticAssetIndex
 from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
 
@@ -168,6 +172,104 @@ class StaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
             assert r.code == 404
 
 
+class IndexedStaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    """StaticFileHandler serves the files in its asset index from memory."""
+
+    JS_PATH = "static/js/main.0a1b2c3d.js"
+    JS_DATA = b"console.log('streamlit');\n" * 100
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._write("index.html", b"<html></html>")
+        self._write(self.JS_PATH, self.JS_DATA)
+        with mock.patch(
+            "streamlit.web.server.static_asset_index.brotli_available", False
+        ):
+            index = StaticAssetIndex(self._tmpdir.name)
+        StaticFileHandler.initialize_asset_index(index)
+
+        super().setUp()
+
+    def tearDown(self) -> None:
+        super().tearDown()
+
+        StaticFileHandler.initialize_asset_index(None)
+        self._tmpdir.cleanup()
+
+    def _write(self, path: str, data: bytes) -> None:
+        path = os.path.join(self._tmpdir.name, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def get_app(self):
+        return tornado.web.Application(
+            [
+                (
+                    r"/(.*)",
+                    StaticFileHandler,
+                    {
+                        "path": self._tmpdir.name,
+                        "default_filename": "index.html",
+                        "get_pages": lambda: {},
+                    },
+                )
+            ]
+        )
+
+    def _fetch(self, path: str, **headers):
+        return self.fetch(path, headers=headers, decompress_response=False)
+
+    def test_compressed_asset(self):
+        """Clients that accept gzip get the precompressed variant."""
+        with mock.patch("builtins.open") as mock_open:
+            rsp = self._fetch(f"/{self.JS_PATH}", **{"Accept-Encoding": "gzip"})
+            mock_open.assert_not_called()
+
+        self.assertEqual(200, rsp.code)
+        self.assertEqual("gzip", rsp.headers["Content-Encoding"])
+        self.assertIn("javascript", rsp.headers["Content-Type"])
+        self.assertEqual(str(len(rsp.body)), rsp.headers["Content-Length"])
+        self.assertEqual(self.JS_DATA, gzip.decompress(rsp.body))
+
+    def test_uncompressed_asset(self):
+        """Clients that don't accept gzip, and range requests, get the
+        file itself."""
+        rsp = self._fetch(f"/{self.JS_PATH}")
+        self.assertNotIn("Content-Encoding", rsp.headers)
+        self.assertEqual(self.JS_DATA, rsp.body)
+
+        rsp = self._fetch(
+            f"/{self.JS_PATH}", **{"Accept-Encoding": "gzip", "Range": "bytes=0-6"}
+        )
+        self.assertEqual(206, rsp.code)
+        self.assertNotIn("Content-Encoding", rsp.headers)
+        self.assertEqual(self.JS_DATA[:7], rsp.body)
+
+    def test_conditional_request(self):
+        """Each variant has its own ETag, which gets a 304."""
+        etags = set()
+        for accept_encoding in ["gzip", "identity"]:
+            headers = {"Accept-Encoding": accept_encoding}
+            rsp = self._fetch(f"/{self.JS_PATH}", **headers)
+            etags.add(rsp.headers["Etag"])
+
+            rsp = self._fetch(
+                f"/{self.JS_PATH}", **headers, **{"If-None-Match": rsp.headers["Etag"]}
+            )
+            self.assertEqual(304, rsp.code)
+        self.assertEqual(2, len(etags))
+
+    def test_cache_control(self):
+        """Hashed files are cached forever, and HTML files not at all."""
+        rsp = self._fetch(f"/{self.JS_PATH}")
+        self.assertEqual(IMMUTABLE_CACHE_CONTROL, rsp.headers["Cache-Control"])
+
+        rsp = self._fetch("/")
+        self.assertEqual("no-cache", rsp.headers["Cache-Control"])
+        self.assertEqual(b"<html></html>", rsp.body)
+
+
 class HostConfigHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def setUp(self):
         super(HostConfigHandlerTest, self).setUp()
@@ -0,0 +1,97 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import tornado.testing
+import tornado.web
+from typing_extensions import Final
+
+from streamlit.runtime.scriptrunner.script_profiler import (
+    CommandTiming,
+    ProfileFrame,
+    ScriptProfile,
+    ScriptProfileStore,
+)
+from streamlit.web.server.script_profile_handler import ScriptProfileHandler
+
+MOCK_ENDPOINT: Final = "/mock/profile"
+
+
+def _make_profile(page_name: str) -> ScriptProfile:
+    return ScriptProfile(
+        page_name=page_name,
+        start_time=0.0,
+        duration=0.5,
+        sample_interval=0.01,
+        samples={(ProfileFrame("<module>", "app.py", 3),): 2},
+        command_timings=[CommandTiming("text", count=1, total_time=0.1, max_time=0.1)],
+    )
+
+
+class ScriptProfileHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    def setUp(self) -> None:
+        self.script_profile_store = ScriptProfileStore()
+        super().setUp()
+        self.script_profile_store.add("session", _make_profile("first"))
+        self.script_profile_store.add("session", _make_profile("latest"))
+
+    def get_app(self) -> tornado.web.Application:
+        return tornado.web.Application(
+            [
+                (
+                    f"{MOCK_ENDPOINT}/([^/]+)",
+                    ScriptProfileHandler,
+                    dict(script_profile_store=self.script_profile_store),
+                )
+            ]
+        )
+
+    def test_get_profiles(self):
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/session")
+
+        self.assertEqual(200, rsp.code)
+        profiles = json.loads(rsp.body)["profiles"]
+        self.assertEqual(["first", "latest"], [p["pageName"] for p in profiles])
+        self.assertEqual(
+            [{"name": "text", "count": 1, "totalTime": 0.1, "maxTime": 0.1}],
+            profiles[0]["commands"],
+        )
+
+    def test_get_profiles_of_unknown_session(self):
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/unknown")
+        self.assertEqual({"profiles": []}, json.loads(rsp.body))
+
+    def test_download_speedscope(self):
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/session?format=speedscope")
+
+        self.assertEqual(200, rsp.code)
+        self.assertIn("attachment", rsp.headers["Content-Disposition"])
+        self.assertEqual("latest (", json.loads(rsp.body)["name"][:8])
+
+    def test_download_collapsed(self):
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/session?format=collapsed")
+
+        self.assertEqual(200, rsp.code)
+        self.assertEqual(b"<module> (app.py:3) 2\n", rsp.body)
+        self.assertIn(
+            'filename="streamlit-profile.folded"', rsp.headers["Content-Disposition"]
+        )
+
+    def test_bad_requests(self):
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/session?format=pdf")
+        self.assertEqual(400, rsp.code)
+
+        rsp = self.fetch(f"{MOCK_ENDPOINT}/unknown?format=collapsed")
+        self.assertEqual(404, rsp.code)
@@ -37,10 +37,16 @@ from streamlit import config
 from streamlit.logger import get_logger
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import Runtime, RuntimeState
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
+from streamlit.runtime.disk_uploaded_file_manager import DiskUploadedFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
 from streamlit.web.server.server import (
     MAX_PORT_SEARCH_RETRIES,
     RetriesExceeded,
     Server,
+    _create_media_file_storage,
+    _create_uploaded_file_manager,
     start_listening,
 )
 from tests.streamlit.message_mocks import create_dataframe_msg
@@ -495,6 +501,69 @@ class UnixSocketTest(unittest.TestCase):
             mock_server.add_socket.assert_called_with(some_socket)
 
 
+class MediaFileStorageTest(unittest.TestCase):
+    """Tests that the server stores media files where
+    server.mediaFileStorage asks for."""
+
+    def test_memory_storage(self):
+        self.assertIsInstance(_create_media_file_storage(), MemoryMediaFileStorage)
+
+    def test_disk_storage(self):
+        with tempfile.TemporaryDirectory() as directory, patch_config_options(
+            {
+                "server.mediaFileStorage": "disk",
+                "server.mediaFileDirectory": directory,
+                "server.mediaFileMemoryCacheSize": 2,
+            }
+        ):
+            storage = _create_media_file_storage()
+
+            self.assertIsInstance(storage, DiskMediaFileStorage)
+            self.assertEqual(directory, os.path.dirname(storage.directory))
+            self.assertEqual(2 * 1024 * 1024, storage._memory_cache.maxsize)
+
+    def test_unsupported_storage(self):
+        with patch_config_options({"server.mediaFileStorage": "s3"}), self.assertLogs(
+            "streamlit.web.server.server", level="WARNING"
+        ):
+            storage = _create_media_file_storage()
+        self.assertIsInstance(storage, MemoryMediaFileStorage)
+
+
+class UploadedFileManagerTest(unittest.TestCase):
+    """Tests that the server stores uploaded files where
+    server.uploadedFileStorage asks for."""
+
+    def test_memory_manager(self):
+        with patch_config_options({"server.maxSessionUploadSize": 2}):
+            mgr = _create_uploaded_file_manager()
+
+        self.assertIsInstance(mgr, MemoryUploadedFileManager)
+        self.assertEqual(2 * 1024 * 1024, mgr.get_max_upload_size("session"))
+
+    def test_disk_manager(self):
+        with tempfile.TemporaryDirectory() as directory, patch_config_options(
+            {
+                "server.uploadedFileStorage": "disk",
+                "server.uploadedFileDirectory": directory,
+                "server.maxUploadedFileStorageSize": 1,
+                "server.maxSessionUploadSize": 2,
+            }
+        ):
+            mgr = _create_uploaded_file_manager()
+
+            self.assertIsInstance(mgr, DiskUploadedFileManager)
+            self.assertEqual(directory, os.path.dirname(mgr.directory))
+            self.assertEqual(1024 * 1024, mgr.get_max_upload_size("session"))
+
+    def test_unsupported_manager(self):
+        with patch_config_options(
+            {"server.uploadedFileStorage": "s3"}
+        ), self.assertLogs("streamlit.web.server.server", level="WARNING"):
+            mgr = _create_uploaded_file_manager()
+        self.assertIsInstance(mgr, MemoryUploadedFileManager)
+
+
 class ScriptCheckEndpointExistsTest(tornado.testing.AsyncHTTPTestCase):
     async def does_script_run_without_error(self):
         return True, "test_message"
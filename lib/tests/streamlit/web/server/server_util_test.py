@@ -75,3 +75,25 @@ class ServerUtilTest(unittest.TestCase):
             actual_url = server_util.get_url("the_ip_address")
 
         self.assertEqual(expected_url, actual_url)
+
+    @parameterized.expand(
+        [
+            ("", None),
+            ("gzip", "gzip"),
+            ("gzip, deflate, br", "br"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("br;q=0, gzip;q=0", None),
+            ("BR, GZIP", "br"),
+            ("*", "br"),
+            ("*, br;q=0", "gzip"),
+            ("identity", None),
+            ("gzip;q=bad, br;q=0.1", "br"),
+        ]
+    )
+    def test_select_content_encoding(
+        self, accept_encoding: str, expected_encoding: Optional[str]
+    ):
+        self.assertEqual(
+            expected_encoding,
+            server_util.select_content_encoding(accept_encoding, ["br", "gzip"]),
+        )
@@ -0,0 +1,99 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for StaticAssetIndex"""
+
+import gzip
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from streamlit.util import calc_md5
+from streamlit.web.server.static_asset_index import StaticAssetIndex
+
+JS_DATA = b"console.log('streamlit');\n" * 100
+
+
+class StaticAssetIndexTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.static_dir = os.path.realpath(self.temp_dir.name)
+        self._write("index.html", b"<html></html>")
+        self._write("static/js/main.0a1b2c3d.js", JS_DATA)
+        self._write("static/js/main.0a1b2c3d.js.map", JS_DATA)
+        self._write("static/media/logo.png", os.urandom(2048))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _write(self, path: str, data: bytes) -> None:
+        path = os.path.join(self.static_dir, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _path(self, path: str) -> str:
+        return os.path.join(self.static_dir, path)
+
+    @mock.patch("streamlit.web.server.static_asset_index.brotli_available", False)
+    def test_index(self):
+        """Files are kept in memory, and compressible ones are also compressed."""
+        index = StaticAssetIndex(self.static_dir)
+
+        js_path = self._path("static/js/main.0a1b2c3d.js")
+        asset = index.get(js_path)
+        self.assertEqual(JS_DATA, asset.content)
+        self.assertEqual(calc_md5(JS_DATA), asset.version)
+        self.assertEqual(("gzip",), asset.encodings)
+
+        gzip_path = index.get_encoded_path(js_path, "gzip")
+        self.assertEqual(js_path + ".gz", gzip_path)
+        variant = index.get(gzip_path)
+        self.assertEqual(JS_DATA, gzip.decompress(variant.content))
+        self.assertEqual("gzip", variant.encoding)
+        self.assertEqual(js_path, variant.path)
+        self.assertNotEqual(asset.version, variant.version)
+
+        self.assertEqual(
+            sum(len(a.content) for a in [asset, variant])
+            + len(b"<html></html>")
+            + 2048,
+            index.size,
+        )
+
+    def test_small_and_binary_files_are_not_compressed(self):
+        index = StaticAssetIndex(self.static_dir)
+
+        for path in ["index.html", "static/media/logo.png"]:
+            self.assertEqual((), index.get(self._path(path)).encodings)
+            self.assertEqual(
+                self._path(path), index.get_encoded_path(self._path(path), "gzip")
+            )
+
+    def test_source_maps_are_not_indexed(self):
+        index = StaticAssetIndex(self.static_dir)
+        self.assertIsNone(index.get(self._path("static/js/main.0a1b2c3d.js.map")))
+
+    @mock.patch("streamlit.web.server.static_asset_index.MAX_INDEXED_FILE_SIZE", 100)
+    def test_large_files_are_not_indexed(self):
+        index = StaticAssetIndex(self.static_dir)
+        self.assertIsNone(index.get(self._path("static/js/main.0a1b2c3d.js")))
+        self.assertIsNotNone(index.get(self._path("index.html")))
+
+    def test_missing_directory(self):
+        index = StaticAssetIndex(os.path.join(self.static_dir, "missing"))
+        self.assertEqual(0, index.size)
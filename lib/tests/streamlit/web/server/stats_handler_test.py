@@ -20,7 +20,7 @@ from google.protobuf.json_format import MessageToDict
 from tornado.httputil import HTTPHeaders
 
 from streamlit.proto.openmetrics_data_model_pb2 import MetricSet as MetricSetProto
-from streamlit.runtime.stats import CacheStat
+from streamlit.runtime.stats import CacheStat, Counter, Gauge, Histogram
 from streamlit.web.server.server import METRIC_ENDPOINT
 from streamlit.web.server.stats_request_handler import StatsRequestHandler
 
@@ -28,8 +28,13 @@ from streamlit.web.server.stats_request_handler import StatsRequestHandler
 class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def get_app(self):
         self.mock_stats = []
+        self.mock_metrics = []
         mock_stats_manager = MagicMock()
         mock_stats_manager.get_stats = MagicMock(side_effect=lambda: self.mock_stats)
+        mock_stats_manager.get_metrics = MagicMock(
+            side_effect=lambda: self.mock_metrics
+        )
+        self.mock_stats_manager = mock_stats_manager
         return tornado.web.Application(
             [
                 (
@@ -48,7 +53,7 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
         expected_body = (
             "# TYPE cache_memory_bytes gauge\n"
             "# UNIT cache_memory_bytes bytes\n"
-            "# HELP Total memory consumed by a cache.\n"
+            "# HELP cache_memory_bytes Total memory consumed by a cache.\n"
             "# EOF\n"
         ).encode("utf-8")
 
@@ -87,7 +92,7 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
         expected_body = (
             "# TYPE cache_memory_bytes gauge\n"
             "# UNIT cache_memory_bytes bytes\n"
-            "# HELP Total memory consumed by a cache.\n"
+            "# HELP cache_memory_bytes Total memory consumed by a cache.\n"
             'cache_memory_bytes{cache_type="st.singleton",cache="foo"} 128\n'
             'cache_memory_bytes{cache_type="st.memo",cache="bar"} 256\n'
             "# EOF\n"
@@ -95,6 +100,69 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
 
         self.assertEqual(expected_body, response.body)
 
+    def test_stats_are_aggregated(self):
+        """Stats are exported as one series per cache, and are only collected
+        once."""
+        self.mock_stats = [
+            CacheStat(category_name="st.memo", cache_name="foo", byte_length=128),
+            CacheStat(category_name="st.memo", cache_name="bar", byte_length=64),
+            CacheStat(category_name="st.memo", cache_name="foo", byte_length=256),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+
+        self.assertIn(
+            (
+                'cache_memory_bytes{cache_type="st.memo",cache="foo"} 384\n'
+                'cache_memory_bytes{cache_type="st.memo",cache="bar"} 64\n'
+            ),
+            response.body.decode("utf-8"),
+        )
+        self.mock_stats_manager.get_stats.assert_called_once()
+
+    def test_has_metrics(self):
+        counter = Counter("script_reruns", "Reruns.", labelnames=("page",))
+        counter.inc("main", amount=2)
+        histogram = Histogram(
+            "script_run_duration_seconds",
+            "Durations.",
+            unit="seconds",
+            labelnames=("page",),
+            buckets=(0.5,),
+        )
+        histogram.observe(0.25, "main")
+        histogram.observe(1, "main")
+        self.mock_metrics = [
+            counter,
+            histogram,
+            Gauge("active_sessions", "Sessions.", callback=lambda: 3),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            "# TYPE cache_memory_bytes gauge\n"
+            "# UNIT cache_memory_bytes bytes\n"
+            "# HELP cache_memory_bytes Total memory consumed by a cache.\n"
+            "# TYPE script_reruns counter\n"
+            "# HELP script_reruns Reruns.\n"
+            'script_reruns_total{page="main"} 2.0\n'
+            "# TYPE script_run_duration_seconds histogram\n"
+            "# UNIT script_run_duration_seconds seconds\n"
+            "# HELP script_run_duration_seconds Durations.\n"
+            'script_run_duration_seconds_bucket{page="main",le="0.5"} 1\n'
+            'script_run_duration_seconds_bucket{page="main",le="+Inf"} 2\n'
+            'script_run_duration_seconds_count{page="main"} 2\n'
+            'script_run_duration_seconds_sum{page="main"} 1.25\n'
+            "# TYPE active_sessions gauge\n"
+            "# HELP active_sessions Sessions.\n"
+            "active_sessions 3.0\n"
+            "# EOF\n"
+        ).encode("utf-8")
+
+        self.assertEqual(expected_body, response.body)
+
     def test_new_metrics_endpoint_should_not_display_deprecation_warning(self):
         response = self.fetch("/_stcore/metrics")
         self.assertNotIn("link", response.headers)
@@ -14,18 +14,28 @@
 
 """UploadFileHandler.py unit tests"""
 
+import mmap
+import os
+import tempfile
+import unittest
 from typing import NamedTuple
+from unittest import mock
 
 import requests
 import tornado.testing
 import tornado.web
 import tornado.websocket
+from parameterized import parameterized
 
 from streamlit.logger import get_logger
+from streamlit.runtime.disk_uploaded_file_manager import DiskUploadedFileManager
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
-from streamlit.runtime.uploaded_file_manager import UploadedFileManager
 from streamlit.web.server.server import UPLOAD_FILE_ENDPOINT
-from streamlit.web.server.upload_file_request_handler import UploadFileRequestHandler
+from streamlit.web.server.upload_file_request_handler import (
+    SPOOL_MAX_SIZE,
+    UploadFileRequestHandler,
+    _MultipartFileParser,
+)
 
 LOGGER = get_logger(__name__)
 
@@ -89,11 +99,59 @@ class UploadFileRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertEqual(
             [(file.name, file.name, file.data)],
             [
-                (rec.file_id, rec.name, rec.data)
+                (rec.file_id, rec.name, rec.data[:])
                 for rec in self.file_mgr.get_files("test_session_id", [file.name])
             ],
         )
 
+    def test_upload_large_file(self):
+        """Large files are stored in temporary files, and memory-mapped."""
+        data = bytes(range(256)) * (SPOOL_MAX_SIZE // 128 + 1)
+        response = self._upload_files(
+            {"big.bin": data}, session_id="test_session_id", file_id="file_id"
+        )
+
+        self.assertEqual(204, response.code, response.reason)
+        (rec,) = self.file_mgr.get_files("test_session_id", ["file_id"])
+        self.assertEqual("big.bin", rec.name)
+        self.assertIsInstance(rec.data, mmap.mmap)
+        self.assertEqual(data, rec.data[:])
+
+    def test_upload_session_size_limit(self):
+        """Uploads that would take a session over its limit fail."""
+        data = b"x" * (512 * 1024)
+        with mock.patch.object(self.file_mgr, "_max_session_size", 1024 * 1024):
+            for file_id in ["file1", "file2"]:
+                response = self._upload_files(
+                    {"file": data}, session_id="test_session_id", file_id=file_id
+                )
+                self.assertEqual(204, response.code, response.reason)
+
+            response = self._upload_files(
+                {"file": b"x"}, session_id="test_session_id", file_id="file3"
+            )
+            self.assertEqual(413, response.code)
+
+            # Other sessions have their own limit.
+            response = self._upload_files(
+                {"file": b"x"}, session_id="other_session_id", file_id="file3"
+            )
+            self.assertEqual(204, response.code, response.reason)
+
+        self.assertEqual(
+            2 * len(data), self.file_mgr.get_session_size("test_session_id")
+        )
+
+    def test_upload_not_multipart_error(self):
+        response = self.fetch(
+            self.get_url(f"{UPLOAD_FILE_ENDPOINT}/session_id/file_id"),
+            method="PUT",
+            headers={"Content-Type": "application/octet-stream"},
+            body=b"123",
+        )
+        self.assertEqual(400, response.code)
+        self.assertIn("Expected a multipart/form-data body", response.reason)
+
     def test_upload_multiple_files_error(self):
         """Uploading multiple files will error"""
         file_1 = MockFile("file1", b"123")
@@ -142,6 +200,68 @@ class UploadFileRequestHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertIn("Expected 1 file, but got 0", response.reason)
 
 
+class DiskUploadFileRequestHandlerTest(UploadFileRequestHandlerTest):
+    """Tests the /upload_file endpoint with a DiskUploadedFileManager."""
+
+    def get_app(self):
+        app = super().get_app()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_mgr = DiskUploadedFileManager(
+            upload_endpoint=UPLOAD_FILE_ENDPOINT, directory=self.temp_dir.name
+        )
+        app.wildcard_router.rules[0].target_kwargs["file_mgr"] = self.file_mgr
+        return app
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_upload_is_moved_into_storage(self):
+        """Uploaded files are written to the manager's directory, and moved
+        rather than copied once they're received."""
+        data = bytes(range(256)) * (SPOOL_MAX_SIZE // 128 + 1)
+        with mock.patch.object(self.file_mgr, "add_file") as add_file:
+            response = self._upload_files(
+                {"big.bin": data}, session_id="test_session_id", file_id="file_id"
+            )
+        self.assertEqual(204, response.code, response.reason)
+        add_file.assert_not_called()
+
+        self.assertEqual(1, len(os.listdir(self.file_mgr.directory)))
+        (rec,) = self.file_mgr.get_files("test_session_id", ["file_id"])
+        self.assertEqual(data, rec.data[:])
+
+    def test_failed_upload_leaves_no_files(self):
+        with mock.patch.object(self.file_mgr, "_max_session_size", 4):
+            response = self._upload_files(
+                {"file": b"12345"}, session_id="session_id", file_id="file"
+            )
+        self.assertEqual(413, response.code)
+        self.assertEqual([], os.listdir(self.file_mgr.directory))
+
+    def test_upload_session_size_limit(self):
+        """Older files are removed to make room for new ones."""
+        with mock.patch.object(self.file_mgr, "_max_session_size", 4):
+            for file_id in ["file1", "file2"]:
+                response = self._upload_files(
+                    {"file": b"123"}, session_id="session_id", file_id=file_id
+                )
+                self.assertEqual(204, response.code, response.reason)
+
+            response = self._upload_files(
+                {"file": b"12345"}, session_id="session_id", file_id="file3"
+            )
+            self.assertEqual(413, response.code)
+
+        self.assertEqual(
+            ["file2"],
+            [
+                rec.file_id
+                for rec in self.file_mgr.get_files("session_id", ["file1", "file2"])
+            ],
+        )
+
+
 class UploadFileRequestHandlerInvalidSessionTest(tornado.testing.AsyncHTTPTestCase):
     """Tests the /upload_file endpoint."""
 
@@ -186,3 +306,54 @@ class UploadFileRequestHandlerInvalidSessionTest(tornado.testing.AsyncHTTPTestCa
         self.assertEqual(400, response.code)
         self.assertIn("Invalid session_id", response.reason)
         self.assertEqual(self.file_mgr.get_files("sessionId", ["fileId"]), [])
+
+
+class MultipartFileParserTest(unittest.TestCase):
+    """Tests parsing multipart bodies that are received in chunks."""
+
+    @staticmethod
+    def _make_body(files, data=None):
+        req = requests.Request(
+            method="PUT", url="http://localhost", files=files, data=data
+        ).prepare()
+        boundary = req.headers["Content-Type"].split("boundary=")[1].encode()
+        return boundary, req.body
+
+    @parameterized.expand([(1,), (7,), (100_000,)])
+    def test_parse_in_chunks(self, chunk_size):
+        content = b"a\r\n--b\r\n" * 1000
+        boundary, body = self._make_body(
+            {"file": ("image.png", content, "image/png")}, data={"field": "value"}
+        )
+
+        parser = _MultipartFileParser(boundary)
+        for start in range(0, len(body), chunk_size):
+            parser.feed(body[start : start + chunk_size])
+        parser.finish()
+
+        self.assertEqual(1, parser.num_files)
+        (part,) = parser.files
+        self.assertEqual("image.png", part.filename)
+        self.assertEqual("image/png", part.content_type)
+        self.assertEqual(content, part.get_data())
+        parser.close()
+
+    def test_incomplete_body(self):
+        boundary, body = self._make_body({"file": ("image.png", b"1234")})
+        parser = _MultipartFileParser(boundary)
+        parser.feed(body[:-10])
+        with self.assertRaises(tornado.web.HTTPError) as e:
+            parser.finish()
+        self.assertEqual(400, e.exception.status_code)
+
+    def test_max_file_size(self):
+        boundary, body = self._make_body({"file": ("image.png", b"12345")})
+
+        parser = _MultipartFileParser(boundary, max_file_size=5)
+        parser.feed(body)
+        parser.finish()
+
+        parser = _MultipartFileParser(boundary, max_file_size=4)
+        with self.assertRaises(tornado.web.HTTPError) as e:
+            parser.feed(body)
+        self.assertEqual(413, e.exception.status_code)
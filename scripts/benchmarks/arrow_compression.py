@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the values of server.arrowCompression on dataframes of a few shapes.
+
+For each, reports the size of the serialized Arrow data, the size after
+websocket compression (permessage-deflate, see
+server.enableWebsocketCompression), and the time that serialization takes.
+
+Usage: python scripts/benchmarks/arrow_compression.py
+"""
+
+import statistics
+import zlib
+from timeit import default_timer as timer
+from typing import Callable, Dict
+
+import click
+import numpy as np
+import pandas as pd
+
+from streamlit import config, logger, type_util
+
+CODECS = ["none", "lz4"]
+
+
+def _numeric_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": rng.integers(0, 1000, rows),
+            "float": rng.normal(size=rows),
+            "walk": rng.normal(size=rows).cumsum(),
+        }
+    )
+
+
+def _text_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "category": rng.choice(["apple", "banana", "cherry", "durian"], rows),
+            "id": [f"user-{i:08d}" for i in range(rows)],
+            "date": pd.date_range("2020-01-01", periods=rows, freq="min"),
+        }
+    )
+
+
+DATAFRAMES: Dict[str, Callable[[int], pd.DataFrame]] = {
+    "numeric": _numeric_df,
+    "text": _text_df,
+}
+
+
+def _deflate(data: bytes) -> int:
+    # Tornado's websocket compression uses zlib with its default level.
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return len(compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH))
+
+
+@click.command()
+@click.option("--rows", default=200_000, help="Number of rows per dataframe.")
+@click.option("--runs", default=5, help="Number of runs per codec.")
+def main(rows: int, runs: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    print(
+        f"{'dataframe':<12}{'codec':<8}{'bytes':>14}"
+        f"{'deflated bytes':>18}{'encode (ms)':>14}"
+    )
+    for name, make_df in DATAFRAMES.items():
+        table = type_util.data_frame_to_arrow_table(make_df(rows))
+        for codec in CODECS:
+            config.set_option("server.arrowCompression", codec)
+
+            times = []
+            for _ in range(runs):
+                start = timer()
+                data = type_util.pyarrow_table_to_bytes(table)
+                times.append(timer() - start)
+
+            print(
+                f"{name:<12}{codec:<8}{len(data):>14,}"
+                f"{_deflate(data):>18,}{statistics.median(times) * 1000:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
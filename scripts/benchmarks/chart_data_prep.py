@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how long it takes to build the chart spec of st.line_chart from wide
+dataframes and pyarrow tables that have many more columns than are charted.
+
+Usage: python scripts/benchmarks/chart_data_prep.py
+"""
+
+import statistics
+from timeit import default_timer as timer
+from typing import Callable
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit import config, logger
+from streamlit.elements.arrow_altair import ChartType, _generate_chart
+
+
+def _time(func: Callable[[], object], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = timer()
+        func()
+        times.append(timer() - start)
+    return statistics.median(times)
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows.")
+@click.option("--columns", default=50, help="Number of columns.")
+@click.option("--runs", default=3, help="Number of runs per input.")
+def main(rows: int, columns: int, runs: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(size=(rows, columns)), columns=[f"col{i}" for i in range(columns)]
+    )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    print(f"{'input':<16}{'y columns':>10}{'prep (s)':>12}")
+    for name, data in [("DataFrame", df), ("pyarrow.Table", table)]:
+        for num_y in [1, 3]:
+            y = [f"col{i}" for i in range(1, num_y + 1)]
+
+            def generate() -> None:
+                _generate_chart(ChartType.LINE, data, x_from_user="col0", y_from_user=y)
+
+            print(f"{name:<16}{num_y:>10}{_time(generate, runs):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how long it takes to apply the edits of a data editor to a dataframe
+(100k rows by default): cell edits in every column of many rows, and many
+added rows.
+
+Also measures a rerun after one more cell was edited, once with the complete
+editing state as the widget value, and once with only the new edit on top of
+the edits the server has applied.
+
+Usage: python scripts/benchmarks/data_editor_edits.py
+"""
+
+import json
+import statistics
+from timeit import default_timer as timer
+from typing import Any, Callable, Dict, List
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit import config, logger
+from streamlit.elements.lib.column_config_utils import determine_dataframe_schema
+from streamlit.elements.widgets.data_editor import (
+    DataEditorSerde,
+    _apply_dataframe_edits,
+    _get_edited_dataframe,
+)
+
+
+def _make_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "int": rng.integers(0, 1000, rows),
+            "float": rng.normal(size=rows),
+            "text": [f"item-{i}" for i in range(rows)],
+            "flag": rng.integers(0, 2, rows).astype(bool),
+            "date": pd.date_range("2020-01-01", periods=rows, freq="min"),
+        }
+    )
+
+
+def _row(i: int) -> Dict[str, Any]:
+    return {
+        "int": i,
+        "float": i / 2,
+        "text": f"edited-{i}",
+        "flag": i % 2 == 0,
+        "date": "2021-01-01T00:00:00",
+    }
+
+
+def _time(func: Callable[[], object], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = timer()
+        func()
+        times.append(timer() - start)
+    return statistics.median(times)
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows of the dataframe.")
+@click.option("--edits", default=10_000, help="Number of edited and added rows.")
+@click.option("--runs", default=3, help="Number of runs per kind of edit.")
+def main(rows: int, edits: int, runs: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    df = _make_df(rows)
+    schema = determine_dataframe_schema(df, pa.Table.from_pandas(df).schema)
+    step = max(rows // edits, 1)
+    added_rows: List[Dict[str, Any]] = [_row(i) for i in range(edits)]
+    states: Dict[str, Any] = {
+        "cell edits": {"edited_rows": {i * step: _row(i) for i in range(edits)}},
+        "added rows": {"added_rows": added_rows},
+    }
+
+    print(f"{'edits':<22}{'time (s)':>10}")
+    for name, state in states.items():
+        seconds = _time(lambda: _apply_dataframe_edits(df.copy(), state, schema), runs)
+        print(f"{name:<22}{seconds:>10.3f}")
+
+    # A rerun after one more cell edit.
+    edited_rows = {i * step: _row(i) for i in range(edits)}
+    full_value = json.dumps({"edited_rows": edited_rows, "version": 1})
+    edited_rows[1] = {"int": -1}
+    new_full_value = json.dumps({"edited_rows": edited_rows})
+    update_value = json.dumps(
+        {"edited_rows": {1: {"int": -1}}, "version": 2, "base_version": 1}
+    )
+
+    def rerun(serde: DataEditorSerde, value: str) -> None:
+        serde.deserialize(value)
+        _get_edited_dataframe(serde.applied_edits, df.copy(), schema)
+
+    def rerun_with_full_state() -> None:
+        rerun(DataEditorSerde(), new_full_value)
+
+    def rerun_with_update() -> None:
+        serde = DataEditorSerde()
+        rerun(serde, full_value)
+        start = timer()
+        rerun(serde, update_value)
+        update_times.append(timer() - start)
+
+    update_times: List[float] = []
+    for _ in range(runs):
+        rerun_with_update()
+    print(f"{'rerun (full state)':<22}{_time(rerun_with_full_state, runs):>10.3f}")
+    print(f"{'rerun (update)':<22}{statistics.median(update_times):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
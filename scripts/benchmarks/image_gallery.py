@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how long it takes to marshall a gallery of JPEG photos that are shown
+as thumbnails, on the first run and on reruns.
+
+Usage: python scripts/benchmarks/image_gallery.py
+"""
+
+import io
+from timeit import default_timer as timer
+
+import click
+import numpy as np
+from PIL import Image
+
+from streamlit import config, logger
+from streamlit.elements.image import marshall_images
+from streamlit.proto.Image_pb2 import ImageList as ImageListProto
+
+
+def _make_photo(seed: int, width: int, height: int) -> bytes:
+    rng = np.random.default_rng(seed)
+    # Smooth noise compresses like a photo, unlike white noise.
+    small = rng.integers(0, 256, (height // 16, width // 16, 3), dtype=np.uint8)
+    image = Image.fromarray(small).resize((width, height), Image.BICUBIC)
+    data = io.BytesIO()
+    image.save(data, format="JPEG", quality=90)
+    return data.getvalue()
+
+
+@click.command()
+@click.option("--photos", default=100, help="Number of photos in the gallery.")
+@click.option("--width", default=300, help="Width of the thumbnails.")
+@click.option("--reruns", default=3, help="Number of reruns.")
+def main(photos: int, width: int, reruns: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    gallery = [_make_photo(i, 3000, 2000) for i in range(photos)]
+
+    for run in range(reruns + 1):
+        start = timer()
+        marshall_images("gallery", gallery, None, width, ImageListProto(), False)
+        name = "first run" if run == 0 else f"rerun {run}"
+        print(f"{name:<12}{timer() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how long it takes to marshall st.map's proto, and how large it is,
+for maps of a few sizes with a size and a color column.
+
+Usage: python scripts/benchmarks/map_payload.py
+"""
+
+import statistics
+from timeit import default_timer as timer
+
+import click
+import numpy as np
+import pandas as pd
+
+from streamlit import config, logger
+from streamlit.elements import deck_gl_json_chart
+from streamlit.elements.map import to_deckgl_json
+from streamlit.proto.DeckGlJsonChart_pb2 import DeckGlJsonChart as DeckGlJsonChartProto
+
+
+def _make_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "lat": rng.uniform(37.7, 37.8, rows),
+            "lon": rng.uniform(-122.5, -122.4, rows),
+            "size": rng.integers(10, 100, rows),
+            "color": rng.choice(["#ff0000", "#00ff00", "#0000ff"], rows),
+        }
+    )
+
+
+@click.command()
+@click.option("--runs", default=3, help="Number of runs per map.")
+def main(runs: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    print(f"{'points':>10}{'marshall (s)':>14}{'bytes':>16}")
+    for rows in [10_000, 100_000, 1_000_000]:
+        df = _make_df(rows)
+        times = []
+        for _ in range(runs):
+            proto = DeckGlJsonChartProto()
+            start = timer()
+            spec, layer_data = to_deckgl_json(
+                df, None, None, "size", "color", None, None
+            )
+            deck_gl_json_chart.marshall_spec(proto, spec, layer_data, True)
+            times.append(timer() - start)
+
+        print(f"{rows:>10,}{statistics.median(times):>14.3f}{proto.ByteSize():>16,}")
+
+
+if __name__ == "__main__":
+    main()
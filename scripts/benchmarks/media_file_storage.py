@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares MemoryMediaFileStorage and DiskMediaFileStorage on a few large
+videos added by path, as st.video does with a filename.
+
+Reports the memory that the stored files take up, and the time and peak
+memory that serving the videos in 1 MB range requests (as browsers do while
+playing them) takes.
+
+Usage: python scripts/benchmarks/media_file_storage.py
+"""
+
+import os
+import tempfile
+import tracemalloc
+from timeit import default_timer as timer
+from typing import Callable, Dict, List
+
+import click
+
+from streamlit import config, logger
+from streamlit.runtime.disk_media_file_storage import DiskMediaFileStorage
+from streamlit.runtime.media_file_storage import MediaFileKind
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+STORAGES: Dict[str, Callable[[str], object]] = {
+    "memory": lambda directory: MemoryMediaFileStorage("/media"),
+    "disk": lambda directory: DiskMediaFileStorage("/media", directory=directory),
+}
+
+RANGE_SIZE = 1024 * 1024
+
+
+def _serve(storage, file_id: str, size: int) -> None:
+    for start in range(0, size, RANGE_SIZE):
+        content = storage.get_content(file_id, start, min(start + RANGE_SIZE, size))
+        for _ in [content] if isinstance(content, bytes) else content:
+            pass
+
+
+@click.command()
+@click.option("--videos", default=4, help="Number of videos.")
+@click.option("--size", default=64, help="Size of each video, in megabytes.")
+def main(videos: int, size: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    size_bytes = size * 1024 * 1024
+    with tempfile.TemporaryDirectory() as directory:
+        paths: List[str] = []
+        for i in range(videos):
+            path = os.path.join(directory, f"video{i}.mp4")
+            with open(path, "wb") as f:
+                f.write(os.urandom(size_bytes))
+            paths.append(path)
+
+        print(
+            f"{'storage':<10}{'stored (MB)':>14}{'serve (s)':>12}"
+            f"{'serve peak (MB)':>18}"
+        )
+        for name, make_storage in STORAGES.items():
+            tracemalloc.start()
+            storage = make_storage(directory)
+            file_ids = [
+                storage.load_and_get_id(path, "video/mp4", MediaFileKind.MEDIA)
+                for path in paths
+            ]
+            stored = tracemalloc.get_traced_memory()[0]
+
+            tracemalloc.reset_peak()
+            start = timer()
+            for file_id in file_ids:
+                _serve(storage, file_id, size_bytes)
+            serve_time = timer() - start
+            serve_peak = tracemalloc.get_traced_memory()[1] - stored
+            tracemalloc.stop()
+
+            print(
+                f"{name:<10}{stored / 2**20:>14.1f}{serve_time:>12.3f}"
+                f"{serve_peak / 2**20:>18.1f}"
+            )
+            del storage
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compares the ways a ScriptRunner can interrupt a running script:
+
+- default: at the script's next Streamlit command
+- runner.installTracer: a sys.settrace function checks before every line
+- runner.asyncInterrupt: an exception is raised in the script thread
+
+For each, reports how long a CPU-bound script takes to run to completion,
+and how long it takes to stop a script that's busy in a loop that doesn't
+call Streamlit.
+
+Usage: python scripts/benchmarks/script_interruption.py
+"""
+
+import os
+import statistics
+import tempfile
+import threading
+import time
+from timeit import default_timer as timer
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import click
+
+from streamlit import config, logger, source_util
+from streamlit.runtime import Runtime
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.state import SessionState
+
+MODES = {
+    "installTracer": {"runner.installTracer": True, "runner.asyncInterrupt": False},
+    "asyncInterrupt": {"runner.installTracer": False, "runner.asyncInterrupt": True},
+    "default": {"runner.installTracer": False, "runner.asyncInterrupt": False},
+}
+
+CPU_BOUND_SCRIPT = """
+import streamlit as st
+
+def fib(n):
+    return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+total = 0
+for i in range(300_000):
+    total += i % 7
+st.text(fib(22) + total)
+"""
+
+BUSY_LOOP_SCRIPT = """
+import streamlit as st
+
+st.text("looping")
+while True:
+    pass
+"""
+
+
+def _set_options(options: Dict[str, bool]) -> None:
+    for key, value in options.items():
+        config.set_option(key, value)
+
+
+def _create_scriptrunner(script_path: str) -> ScriptRunner:
+    # The pages cache assumes that there's only one main script.
+    source_util.invalidate_pages_cache()
+    return ScriptRunner(
+        session_id="benchmark",
+        main_script_path=script_path,
+        session_state=SessionState(),
+        uploaded_file_mgr=MemoryUploadedFileManager("/mock/upload"),
+        script_cache=ScriptCache(),
+        initial_rerun_data=RerunData(),
+        user_info={},
+    )
+
+
+def _time_script_run(script_path: str) -> float:
+    runner = _create_scriptrunner(script_path)
+    finished = threading.Event()
+
+    def on_event(sender, event: ScriptRunnerEvent, **kwargs) -> None:
+        if event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS:
+            finished.set()
+
+    runner.on_event.connect(on_event, weak=False)
+
+    start = timer()
+    runner.start()
+    finished.wait()
+    elapsed = timer() - start
+    runner.request_stop()
+    runner._script_thread.join()
+    return elapsed
+
+
+def _time_stop(script_path: str, timeout: float) -> Optional[float]:
+    runner = _create_scriptrunner(script_path)
+    looping = threading.Event()
+    stopped = threading.Event()
+    stop_times: List[float] = []
+
+    def on_event(sender, event: ScriptRunnerEvent, **kwargs) -> None:
+        if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
+            looping.set()
+        elif event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS:
+            # Timed here, rather than when we're woken up, which may be only
+            # after the ScriptRunner's post-script GC.
+            stop_times.append(timer())
+            stopped.set()
+
+    runner.on_event.connect(on_event, weak=False)
+    runner.start()
+    looping.wait()
+    time.sleep(0.1)
+
+    start = timer()
+    runner.request_stop()
+    if not stopped.wait(timeout):
+        # This script never yields, so it can't be stopped.
+        return None
+    runner._script_thread.join()
+    return stop_times[0] - start
+
+
+@click.command()
+@click.option("--runs", default=5, help="Number of runs per mode.")
+def main(runs: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    mock_runtime = MagicMock(spec=Runtime)
+    mock_runtime.media_file_mgr = MediaFileManager(
+        MemoryMediaFileStorage("/mock/media")
+    )
+    Runtime._instance = mock_runtime
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cpu_bound_path = os.path.join(tmpdir, "cpu_bound.py")
+        busy_loop_path = os.path.join(tmpdir, "busy_loop.py")
+        with open(cpu_bound_path, "w") as f:
+            f.write(CPU_BOUND_SCRIPT)
+        with open(busy_loop_path, "w") as f:
+            f.write(BUSY_LOOP_SCRIPT)
+
+        run_times: Dict[str, float] = {}
+        for mode, options in MODES.items():
+            _set_options(options)
+            run_times[mode] = statistics.median(
+                _time_script_run(cpu_bound_path) for _ in range(runs)
+            )
+
+        # A script that can't be stopped keeps running, and would slow down
+        # everything after it. So this comes last.
+        stop_latencies: Dict[str, Optional[float]] = {}
+        for mode, options in MODES.items():
+            _set_options(options)
+            stop_latencies[mode] = _time_stop(busy_loop_path, timeout=2)
+
+    print(f"{'mode':<16}{'run time (s)':>16}{'stop latency (ms)':>20}")
+    for mode in MODES:
+        latency = stop_latencies[mode]
+        latency_str = f"{latency * 1000:.2f}" if latency is not None else "never"
+        print(f"{mode:<16}{run_times[mode]:>16.3f}{latency_str:>20}")
+
+    # Scripts that can't be stopped are still running.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how long it takes to marshall styled dataframes (10k rows x 20
+columns by default) into an Arrow proto, with a few common kinds of styling.
+
+For comparison, also reports how long pandas takes to translate the same
+Styler into its HTML render context, which is what the display values and
+styles used to be read from.
+
+Usage: python scripts/benchmarks/styler_marshalling.py
+"""
+
+import statistics
+from timeit import default_timer as timer
+from typing import Callable, Dict
+
+import click
+import numpy as np
+import pandas as pd
+from pandas.io.formats.style import Styler
+
+from streamlit import config, logger
+from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+
+
+def _make_df(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        rng.normal(size=(rows, columns)), columns=[f"col{i}" for i in range(columns)]
+    )
+
+
+STYLERS: Dict[str, Callable[[pd.DataFrame], Styler]] = {
+    "plain": lambda df: df.style,
+    "format": lambda df: df.style.format("{:.2%}"),
+    "highlight_max": lambda df: df.style.highlight_max(axis=0),
+    "gradient": lambda df: df.style.background_gradient(),
+    "format+map": lambda df: df.style.format(precision=2).map(
+        lambda v: "color: red" if v < 0 else "color: green"
+    ),
+}
+
+
+def _time(func: Callable[[], object], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = timer()
+        func()
+        times.append(timer() - start)
+    return statistics.median(times)
+
+
+@click.command()
+@click.option("--rows", default=10_000, help="Number of rows per dataframe.")
+@click.option("--columns", default=20, help="Number of columns per dataframe.")
+@click.option("--runs", default=3, help="Number of runs per styler.")
+def main(rows: int, columns: int, runs: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    df = _make_df(rows, columns)
+    print(f"{'styler':<16}{'marshall (s)':>14}{'translate (s)':>16}{'css bytes':>12}")
+    for name, make_styler in STYLERS.items():
+        proto = ArrowProto()
+
+        def marshall() -> None:
+            marshall_styler(proto, make_styler(df), "uuid")
+
+        def translate() -> None:
+            styler = make_styler(df)
+            styler._compute()
+            styler._translate(False, False)
+
+        marshall_time = _time(marshall, runs)
+        translate_time = _time(translate, runs)
+        print(
+            f"{name:<16}{marshall_time:>14.3f}{translate_time:>16.3f}"
+            f"{len(proto.styler.styles):>12,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the rerun time of a page with many selectboxes and multiselects
+that have large option lists, which is dominated by formatting the options
+and computing the widgets' ids.
+
+The options are either a list that the script builds on every run, or a
+tuple from st.cache_resource that's the same object on every run.
+
+Usage: python scripts/benchmarks/widget_ids.py
+"""
+
+import os
+import statistics
+import tempfile
+import threading
+from timeit import default_timer as timer
+from typing import List
+from unittest.mock import MagicMock
+
+import click
+
+from streamlit import config, logger, source_util
+from streamlit.runtime import Runtime
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.runtime.state import SessionState
+
+SCRIPT = """
+import streamlit as st
+
+NUM_WIDGETS = {num_widgets}
+NUM_OPTIONS = {num_options}
+
+@st.cache_resource
+def cached_options():
+    return tuple(f"option {{i}}" for i in range(NUM_OPTIONS))
+
+if {cached}:
+    options = cached_options()
+else:
+    options = [f"option {{i}}" for i in range(NUM_OPTIONS)]
+
+for i in range(NUM_WIDGETS // 2):
+    st.selectbox(f"selectbox {{i}}", options)
+    st.multiselect(f"multiselect {{i}}", options)
+"""
+
+
+def _time_reruns(script_path: str, runs: int) -> float:
+    # The pages cache assumes that there's only one main script.
+    source_util.invalidate_pages_cache()
+    runner = ScriptRunner(
+        session_id="benchmark",
+        main_script_path=script_path,
+        session_state=SessionState(),
+        uploaded_file_mgr=MemoryUploadedFileManager("/mock/upload"),
+        script_cache=ScriptCache(),
+        initial_rerun_data=RerunData(),
+        user_info={},
+    )
+
+    finished = threading.Semaphore(0)
+    run_times: List[float] = []
+
+    def on_event(sender, event: ScriptRunnerEvent, **kwargs) -> None:
+        # Timed on the script thread, so that we measure just the script run.
+        if event == ScriptRunnerEvent.SCRIPT_STARTED:
+            run_times.append(-timer())
+        elif event == ScriptRunnerEvent.SCRIPT_STOPPED_WITH_SUCCESS:
+            run_times[-1] += timer()
+            finished.release()
+
+    runner.on_event.connect(on_event, weak=False)
+
+    # The first run compiles the script and fills caches.
+    runner.start()
+    finished.acquire()
+
+    for _ in range(runs):
+        runner.request_rerun(RerunData())
+        finished.acquire()
+
+    runner.request_stop()
+    runner._script_thread.join()
+    return statistics.median(run_times[1:])
+
+
+@click.command()
+@click.option("--runs", default=5, help="Number of reruns to time.")
+@click.option("--num-widgets", default=200, help="Number of widgets on the page.")
+@click.option("--num-options", default=10_000, help="Number of options per widget.")
+def main(runs: int, num_widgets: int, num_options: int) -> None:
+    # Parse the config now, so that it doesn't reset our log level later.
+    config.get_config_options()
+    logger.set_log_level("ERROR")
+
+    mock_runtime = MagicMock(spec=Runtime)
+    mock_runtime.media_file_mgr = MediaFileManager(
+        MemoryMediaFileStorage("/mock/media")
+    )
+    Runtime._instance = mock_runtime
+
+    print(f"{num_widgets} widgets with {num_options} options each")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for cached in (False, True):
+            script_path = os.path.join(tmpdir, f"widgets_{cached}.py")
+            with open(script_path, "w") as f:
+                f.write(
+                    SCRIPT.format(
+                        num_widgets=num_widgets, num_options=num_options, cached=cached
+                    )
+                )
+
+            options_kind = "cached tuple" if cached else "list"
+            run_time = _time_reruns(script_path, runs)
+            print(f"{options_kind:<16}{run_time:>10.3f} s/rerun")
+
+
+if __name__ == "__main__":
+    main()